@@ -373,7 +373,7 @@ function StatusIndicator({
   label,
   signalCount,
 }: {
-  status: "pending" | "running" | "completed" | "failed";
+  status: "pending" | "running" | "completed" | "failed" | "cancelled";
   label: string;
   signalCount?: number;
 }) {
@@ -398,6 +398,11 @@ function StatusIndicator({
       icon: AlertCircle,
       pulse: false,
     },
+    cancelled: {
+      color: "bg-amber-500/10 text-amber-600 border-amber-500/20",
+      icon: Clock,
+      pulse: false,
+    },
   };
 
   const config = statusConfig[status];
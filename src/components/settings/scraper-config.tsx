@@ -351,7 +351,7 @@ function StatusIndicator({
   label,
   signalCount,
 }: {
-  status: "pending" | "running" | "completed" | "failed";
+  status: "pending" | "running" | "completed" | "failed" | "cancelled";
   label: string;
   signalCount?: number;
 }) {
@@ -376,6 +376,11 @@ function StatusIndicator({
       icon: AlertCircle,
       pulse: false,
     },
+    cancelled: {
+      color: "bg-amber-500/10 text-amber-600 border-amber-500/20",
+      icon: Clock,
+      pulse: false,
+    },
   };
 
   const config = statusConfig[status];
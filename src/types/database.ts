@@ -404,9 +404,11 @@ export type Database = {
           error_message: string | null
           estimated_duration_seconds: number | null
           id: string
+          max_staleness_seconds: number | null
           progress: Json | null
           signals_by_source: Json | null
           started_at: string | null
+          stats: Json | null
           status: Database["public"]["Enums"]["scrape_status"] | null
           total_signals: number | null
           user_id: string | null
@@ -419,9 +421,11 @@ export type Database = {
           error_message?: string | null
           estimated_duration_seconds?: number | null
           id?: string
+          max_staleness_seconds?: number | null
           progress?: Json | null
           signals_by_source?: Json | null
           started_at?: string | null
+          stats?: Json | null
           status?: Database["public"]["Enums"]["scrape_status"] | null
           total_signals?: number | null
           user_id?: string | null
@@ -434,9 +438,11 @@ export type Database = {
           error_message?: string | null
           estimated_duration_seconds?: number | null
           id?: string
+          max_staleness_seconds?: number | null
           progress?: Json | null
           signals_by_source?: Json | null
           started_at?: string | null
+          stats?: Json | null
           status?: Database["public"]["Enums"]["scrape_status"] | null
           total_signals?: number | null
           user_id?: string | null
@@ -507,6 +513,7 @@ export type Database = {
       signals: {
         Row: {
           company_domain: string | null
+          company_id: string | null
           company_logo: string | null
           company_name: string
           created_at: string | null
@@ -526,6 +533,7 @@ export type Database = {
         }
         Insert: {
           company_domain?: string | null
+          company_id?: string | null
           company_logo?: string | null
           company_name: string
           created_at?: string | null
@@ -545,6 +553,7 @@ export type Database = {
         }
         Update: {
           company_domain?: string | null
+          company_id?: string | null
           company_logo?: string | null
           company_name?: string
           created_at?: string | null
@@ -676,7 +685,7 @@ export type Database = {
         | "apollo"
         | "attio"
       crm_sync_status: "pending" | "syncing" | "success" | "failed"
-      scrape_status: "pending" | "running" | "completed" | "failed"
+      scrape_status: "pending" | "running" | "completed" | "failed" | "cancelled"
     }
     CompositeTypes: {
       [_ in never]: never
@@ -813,7 +822,7 @@ export const Constants = {
         "attio",
       ],
       crm_sync_status: ["pending", "syncing", "success", "failed"],
-      scrape_status: ["pending", "running", "completed", "failed"],
+      scrape_status: ["pending", "running", "completed", "failed", "cancelled"],
     },
   },
 } as const
@@ -8,6 +8,7 @@ export interface Signal {
   id: string;
   company_name: string;
   company_domain: string | null;
+  company_id?: string | null; // Canonical company, once the worker has resolved it
   company_logo?: string | null;
   signal_type: SignalType;
   title: string;
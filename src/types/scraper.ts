@@ -1,4 +1,4 @@
-export type ScrapeStatus = "pending" | "running" | "completed" | "failed";
+export type ScrapeStatus = "pending" | "running" | "completed" | "failed" | "cancelled";
 
 export interface ScraperConfig {
   id: string;
@@ -17,12 +17,22 @@ export interface ScraperConfig {
 
 export interface ScraperProgress {
   [source: string]: {
-    status: "pending" | "running" | "completed" | "failed";
+    status: "pending" | "running" | "completed" | "failed" | "cancelled";
     signals: number;
     error?: string;
+    // Why a cancelled source stopped early ("deadline" or "run_cancelled")
+    reason?: string;
   };
 }
 
+export interface ScrapeRunStats {
+  // Requests allowed in flight per host when the run finished
+  host_concurrency?: Record<string, number>;
+  // Response bytes downloaded per source during the run
+  bytes_by_source?: Record<string, number>;
+  [key: string]: unknown;
+}
+
 export interface ScrapeRun {
   id: string;
   user_id: string | null;
@@ -36,6 +46,8 @@ export interface ScrapeRun {
   ai_enriched_count: number | null;
   error_message: string | null;
   error_details: Record<string, unknown> | null;
+  max_staleness_seconds: number | null;
+  stats: ScrapeRunStats | null;
   created_at: string | null;
 }
 
@@ -0,0 +1,297 @@
+-- Leased Scrape Task Queue
+-- Each unit of scrape work (one feed, or one company for a source) is a row.
+-- Worker replicas claim rows with FOR UPDATE SKIP LOCKED leases and keep them
+-- alive with heartbeats, so N replicas split a cycle between them and a
+-- crashed replica's tasks are picked up again once its lease expires.
+
+-- =====================
+-- SCRAPE TASKS
+-- =====================
+
+CREATE TABLE IF NOT EXISTS public.scrape_tasks (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    run_id uuid NOT NULL REFERENCES public.scrape_runs(id) ON DELETE CASCADE,
+    user_id uuid REFERENCES public.profiles(id) ON DELETE CASCADE,  -- NULL = shared signals
+
+    -- Unit of work: scraper name + unit (company, feed, subreddit, ...)
+    source text NOT NULL,
+    unit text NOT NULL,
+
+    status text NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'leased', 'completed', 'failed')),
+    attempts integer NOT NULL DEFAULT 0,
+    max_attempts integer NOT NULL DEFAULT 3,
+
+    -- Lease held by a worker replica; claimable again once expired
+    leased_by text,
+    lease_expires_at timestamptz,
+    heartbeat_at timestamptz,
+
+    -- Results
+    signals integer NOT NULL DEFAULT 0,
+    error text,
+
+    created_at timestamptz DEFAULT now(),
+    completed_at timestamptz
+);
+
+-- One open task per (user, source, unit): overlapping cycles and replicas
+-- enqueueing the same work collapse into a single row
+CREATE UNIQUE INDEX IF NOT EXISTS idx_scrape_tasks_open_unit
+ON public.scrape_tasks (source, unit, COALESCE(user_id, '00000000-0000-0000-0000-000000000000'::uuid))
+WHERE status IN ('queued', 'leased');
+
+CREATE INDEX IF NOT EXISTS idx_scrape_tasks_claimable
+ON public.scrape_tasks (created_at)
+WHERE status IN ('queued', 'leased');
+
+CREATE INDEX IF NOT EXISTS idx_scrape_tasks_run ON public.scrape_tasks(run_id);
+
+-- Only the worker (service role, which bypasses RLS) reads or writes tasks
+ALTER TABLE public.scrape_tasks ENABLE ROW LEVEL SECURITY;
+
+-- =====================
+-- RUN ROLLUP
+-- =====================
+
+-- Recompute a run's progress and totals from its tasks; completes the run
+-- once no task is open. Returns true when the run has nothing left to do.
+CREATE OR REPLACE FUNCTION refresh_scrape_run_from_tasks(p_run_id uuid)
+RETURNS boolean
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_open integer;
+    v_total integer;
+    v_by_source jsonb;
+    v_progress jsonb;
+BEGIN
+    SELECT COUNT(*) INTO v_open
+    FROM public.scrape_tasks
+    WHERE run_id = p_run_id AND status IN ('queued', 'leased');
+
+    SELECT
+        COALESCE(SUM(per_source.signals), 0),
+        COALESCE(jsonb_object_agg(per_source.source, per_source.signals), '{}'::jsonb),
+        COALESCE(jsonb_object_agg(
+            per_source.source,
+            jsonb_build_object('status', per_source.status, 'signals', per_source.signals)
+        ), '{}'::jsonb)
+    INTO v_total, v_by_source, v_progress
+    FROM (
+        SELECT
+            t.source,
+            SUM(t.signals)::integer AS signals,
+            CASE
+                WHEN bool_or(t.status IN ('queued', 'leased')) THEN 'running'
+                WHEN bool_or(t.status = 'failed') THEN 'failed'
+                ELSE 'completed'
+            END AS status
+        FROM public.scrape_tasks t
+        WHERE t.run_id = p_run_id
+        GROUP BY t.source
+    ) per_source;
+
+    UPDATE public.scrape_runs
+    SET
+        progress = v_progress,
+        signals_by_source = v_by_source,
+        total_signals = v_total,
+        status = CASE WHEN v_open = 0 THEN 'completed'::scrape_status ELSE status END,
+        completed_at = CASE WHEN v_open = 0 THEN now() ELSE completed_at END
+    WHERE id = p_run_id AND status = 'running';
+
+    RETURN v_open = 0;
+END;
+$$;
+
+-- =====================
+-- QUEUE FUNCTIONS
+-- =====================
+
+-- Enqueue units for a run. Units already open for the same user are skipped.
+-- p_tasks: [{"source": "googlenews", "unit": "Stripe"}, ...]
+CREATE OR REPLACE FUNCTION enqueue_scrape_tasks(
+    p_run_id uuid,
+    p_user_id uuid,
+    p_tasks jsonb,
+    p_max_attempts integer DEFAULT 3
+)
+RETURNS integer
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_inserted integer;
+BEGIN
+    INSERT INTO public.scrape_tasks (run_id, user_id, source, unit, max_attempts)
+    SELECT p_run_id, p_user_id, t.source, t.unit, p_max_attempts
+    FROM jsonb_to_recordset(p_tasks) AS t(source text, unit text)
+    ON CONFLICT DO NOTHING;
+
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+
+    -- A run whose units were all already queued elsewhere completes immediately
+    PERFORM refresh_scrape_run_from_tasks(p_run_id);
+    RETURN v_inserted;
+END;
+$$;
+
+-- Lease up to p_limit tasks: queued ones, or leased ones whose lease expired.
+-- Expired tasks that used up their attempts are failed instead of retried.
+CREATE OR REPLACE FUNCTION claim_scrape_tasks(
+    p_worker_id text,
+    p_limit integer,
+    p_lease_seconds integer
+)
+RETURNS SETOF public.scrape_tasks
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_run_id uuid;
+BEGIN
+    FOR v_run_id IN
+        UPDATE public.scrape_tasks
+        SET
+            status = 'failed',
+            error = COALESCE(error, 'lease expired'),
+            leased_by = NULL,
+            lease_expires_at = NULL,
+            completed_at = now()
+        WHERE status = 'leased'
+          AND lease_expires_at < now()
+          AND attempts >= max_attempts
+        RETURNING run_id
+    LOOP
+        PERFORM refresh_scrape_run_from_tasks(v_run_id);
+    END LOOP;
+
+    RETURN QUERY
+    UPDATE public.scrape_tasks t
+    SET
+        status = 'leased',
+        leased_by = p_worker_id,
+        lease_expires_at = now() + make_interval(secs => p_lease_seconds),
+        heartbeat_at = now(),
+        attempts = t.attempts + 1
+    WHERE t.id IN (
+        SELECT c.id
+        FROM public.scrape_tasks c
+        WHERE (c.status = 'queued' OR (c.status = 'leased' AND c.lease_expires_at < now()))
+          AND c.attempts < c.max_attempts
+        ORDER BY c.created_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING t.*;
+END;
+$$;
+
+-- Extend the leases a worker still holds; returns the ids it still owns
+CREATE OR REPLACE FUNCTION heartbeat_scrape_tasks(
+    p_worker_id text,
+    p_task_ids uuid[],
+    p_lease_seconds integer
+)
+RETURNS TABLE (id uuid)
+LANGUAGE sql
+SET search_path = public
+AS $$
+    UPDATE public.scrape_tasks t
+    SET
+        lease_expires_at = now() + make_interval(secs => p_lease_seconds),
+        heartbeat_at = now()
+    WHERE t.id = ANY(p_task_ids)
+      AND t.status = 'leased'
+      AND t.leased_by = p_worker_id
+    RETURNING t.id;
+$$;
+
+-- Finish a leased task. A failed task with attempts left goes back to the
+-- queue. Returns nothing if the lease was lost to another worker.
+CREATE OR REPLACE FUNCTION complete_scrape_task(
+    p_task_id uuid,
+    p_worker_id text,
+    p_signals integer,
+    p_error text DEFAULT NULL
+)
+RETURNS TABLE (source_done boolean, source_signals integer, run_done boolean)
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_task public.scrape_tasks;
+BEGIN
+    SELECT * INTO v_task FROM public.scrape_tasks WHERE scrape_tasks.id = p_task_id;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- Serialise completions per run so the last one reliably closes it
+    PERFORM 1 FROM public.scrape_runs WHERE scrape_runs.id = v_task.run_id FOR UPDATE;
+
+    UPDATE public.scrape_tasks t
+    SET
+        status = CASE
+            WHEN p_error IS NULL THEN 'completed'
+            WHEN t.attempts < t.max_attempts THEN 'queued'
+            ELSE 'failed'
+        END,
+        signals = t.signals + p_signals,
+        error = p_error,
+        leased_by = NULL,
+        lease_expires_at = NULL,
+        completed_at = CASE
+            WHEN p_error IS NULL OR t.attempts >= t.max_attempts THEN now()
+        END
+    WHERE t.id = p_task_id
+      AND t.status = 'leased'
+      AND t.leased_by = p_worker_id
+    RETURNING t.* INTO v_task;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY SELECT
+        NOT EXISTS (
+            SELECT 1 FROM public.scrape_tasks t
+            WHERE t.run_id = v_task.run_id
+              AND t.source = v_task.source
+              AND t.status IN ('queued', 'leased')
+        ),
+        (
+            SELECT COALESCE(SUM(t.signals), 0)::integer FROM public.scrape_tasks t
+            WHERE t.run_id = v_task.run_id AND t.source = v_task.source
+        ),
+        refresh_scrape_run_from_tasks(v_task.run_id);
+END;
+$$;
+
+-- Atomically take the oldest pending (UI-triggered) run so two replicas
+-- never process the same one
+CREATE OR REPLACE FUNCTION claim_pending_scrape_run()
+RETURNS SETOF public.scrape_runs
+LANGUAGE sql
+SET search_path = public
+AS $$
+    UPDATE public.scrape_runs r
+    SET status = 'running', started_at = now()
+    WHERE r.id = (
+        SELECT p.id
+        FROM public.scrape_runs p
+        WHERE p.status = 'pending'
+        ORDER BY p.created_at
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING r.*;
+$$;
+
+GRANT EXECUTE ON FUNCTION refresh_scrape_run_from_tasks(uuid) TO service_role;
+GRANT EXECUTE ON FUNCTION enqueue_scrape_tasks(uuid, uuid, jsonb, integer) TO service_role;
+GRANT EXECUTE ON FUNCTION claim_scrape_tasks(text, integer, integer) TO service_role;
+GRANT EXECUTE ON FUNCTION heartbeat_scrape_tasks(text, uuid[], integer) TO service_role;
+GRANT EXECUTE ON FUNCTION complete_scrape_task(uuid, text, integer, text) TO service_role;
+GRANT EXECUTE ON FUNCTION claim_pending_scrape_run() TO service_role;
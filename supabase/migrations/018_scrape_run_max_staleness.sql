@@ -0,0 +1,10 @@
+-- Fresh-result cache for manual runs
+-- The worker keeps recently parsed source results in memory. A manual run
+-- reuses results younger than each source's freshness TTL; max_staleness_seconds
+-- caps that further for a single run (0 = always fetch fresh).
+
+ALTER TABLE public.scrape_runs
+ADD COLUMN IF NOT EXISTS max_staleness_seconds integer DEFAULT NULL
+CHECK (max_staleness_seconds IS NULL OR max_staleness_seconds >= 0);
+
+COMMENT ON COLUMN public.scrape_runs.max_staleness_seconds IS 'Oldest cached source results (seconds) a manual run may reuse, NULL means each source''s default freshness TTL';
@@ -0,0 +1,33 @@
+-- Scrape Run Cancellation
+-- A run can be cancelled from the UI while it is scraping. In-process cycles
+-- notice the status change, stop scraping and keep what they already parsed;
+-- in task-queue mode the run's queued tasks are dropped so no replica starts
+-- them (tasks already leased finish normally).
+
+ALTER TYPE scrape_status ADD VALUE IF NOT EXISTS 'cancelled';
+
+CREATE OR REPLACE FUNCTION drop_tasks_of_cancelled_run()
+RETURNS trigger
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE public.scrape_tasks
+    SET
+        status = 'failed',
+        error = 'run cancelled',
+        completed_at = now()
+    WHERE run_id = NEW.id AND status = 'queued';
+
+    NEW.completed_at := COALESCE(NEW.completed_at, now());
+    RETURN NEW;
+END;
+$$;
+
+-- Compare as text: the new enum value can't be referenced in this transaction
+DROP TRIGGER IF EXISTS scrape_run_cancelled ON public.scrape_runs;
+CREATE TRIGGER scrape_run_cancelled
+BEFORE UPDATE OF status ON public.scrape_runs
+FOR EACH ROW
+WHEN (NEW.status::text = 'cancelled' AND OLD.status::text IS DISTINCT FROM 'cancelled')
+EXECUTE FUNCTION drop_tasks_of_cancelled_run();
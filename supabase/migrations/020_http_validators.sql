@@ -0,0 +1,23 @@
+-- HTTP Validator Cache
+-- ETag / Last-Modified per feed URL, so scheduled cycles can send conditional
+-- requests and skip parsing feeds that answer 304 Not Modified. Kept in the
+-- database so the cache survives worker restarts and deploys.
+
+CREATE TABLE IF NOT EXISTS public.http_validators (
+    url text PRIMARY KEY,
+    source text NOT NULL,
+
+    -- Hash of the scraper parameters (target companies, keywords) the
+    -- response was processed with; validators only apply to the same set
+    fingerprint text NOT NULL,
+
+    etag text,
+    last_modified text,
+
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_http_validators_updated_at ON public.http_validators(updated_at);
+
+-- Only the worker (service role, which bypasses RLS) reads or writes validators
+ALTER TABLE public.http_validators ENABLE ROW LEVEL SECURITY;
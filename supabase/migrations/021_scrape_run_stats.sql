@@ -0,0 +1,8 @@
+-- Scrape run summary statistics
+-- Free-form numbers the worker reports when a run finishes, e.g. the adaptive
+-- per-host concurrency limits it ended with ({"host_concurrency": {...}}).
+
+ALTER TABLE public.scrape_runs
+ADD COLUMN IF NOT EXISTS stats jsonb DEFAULT NULL;
+
+COMMENT ON COLUMN public.scrape_runs.stats IS 'Run summary reported by the worker (host concurrency limits, ...)';
@@ -0,0 +1,5 @@
+-- Feed Resume Points
+-- Key (guid or link) of the newest item processed from each feed, so shared
+-- cycles stop parsing a changed feed once they reach items already seen.
+
+ALTER TABLE public.http_validators ADD COLUMN IF NOT EXISTS last_item text;
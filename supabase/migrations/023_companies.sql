@@ -0,0 +1,141 @@
+-- Company Entities
+-- One row per real company, plus the normalized names and domains that refer
+-- to it ("acme", "acme.com"), so signals about "Acme", "Acme, Inc." and
+-- "ACME Corp." share one company_id. The worker keeps the aliases in memory
+-- and refreshes them incrementally by updated_at; aliases can be repointed
+-- to merge companies.
+
+-- =====================
+-- COMPANIES
+-- =====================
+
+CREATE TABLE IF NOT EXISTS public.companies (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    name text NOT NULL,  -- Display name: the first spelling seen
+    domain text,         -- Registrable domain, once known
+    created_at timestamptz DEFAULT now(),
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS public.company_aliases (
+    kind text NOT NULL CHECK (kind IN ('name', 'domain')),
+    alias text NOT NULL,  -- Normalized by the worker (lowercase, no legal suffix)
+    company_id uuid NOT NULL REFERENCES public.companies(id) ON DELETE CASCADE,
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (kind, alias)
+);
+
+CREATE INDEX IF NOT EXISTS idx_company_aliases_updated_at ON public.company_aliases(updated_at);
+CREATE INDEX IF NOT EXISTS idx_company_aliases_company ON public.company_aliases(company_id);
+
+DROP TRIGGER IF EXISTS companies_updated_at ON public.companies;
+CREATE TRIGGER companies_updated_at
+    BEFORE UPDATE ON public.companies
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+DROP TRIGGER IF EXISTS company_aliases_updated_at ON public.company_aliases;
+CREATE TRIGGER company_aliases_updated_at
+    BEFORE UPDATE ON public.company_aliases
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+-- A renamed company (or one that gained a domain) must reach the worker's
+-- index, which only re-reads aliases
+CREATE OR REPLACE FUNCTION touch_company_aliases()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE public.company_aliases SET updated_at = now() WHERE company_id = NEW.id;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS companies_touch_aliases ON public.companies;
+CREATE TRIGGER companies_touch_aliases
+    AFTER UPDATE OF name, domain ON public.companies
+    FOR EACH ROW EXECUTE FUNCTION touch_company_aliases();
+
+ALTER TABLE public.companies ENABLE ROW LEVEL SECURITY;
+-- Only the worker (service role, which bypasses RLS) reads or writes aliases
+ALTER TABLE public.company_aliases ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Authenticated users can view companies"
+    ON public.companies FOR SELECT
+    TO authenticated
+    USING (true);
+
+-- =====================
+-- SIGNALS
+-- =====================
+
+ALTER TABLE public.signals
+ADD COLUMN IF NOT EXISTS company_id uuid REFERENCES public.companies(id) ON DELETE SET NULL;
+
+CREATE INDEX IF NOT EXISTS idx_signals_company_id ON public.signals(company_id);
+
+COMMENT ON COLUMN public.signals.company_id IS 'Canonical company resolved by the worker; NULL for generic or unresolved names';
+
+-- =====================
+-- RESOLUTION
+-- =====================
+
+-- The company one of p_aliases already belongs to (domains first), or a new
+-- one named p_name. Aliases nobody has claimed yet are claimed for it.
+-- Replicas creating the same company at once both insert one; whichever
+-- finds an alias claimed by the other hands its aliases over, drops its row
+-- and returns the other.
+-- p_aliases: [{"kind": "domain", "alias": "acme.com"}, {"kind": "name", "alias": "acme"}]
+CREATE OR REPLACE FUNCTION resolve_company(p_name text, p_domain text, p_aliases jsonb)
+RETURNS TABLE (id uuid, name text, domain text)
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+#variable_conflict use_column
+DECLARE
+    v_company_id uuid;
+    v_created_id uuid;
+BEGIN
+    SELECT a.company_id INTO v_company_id
+    FROM jsonb_to_recordset(p_aliases) AS x(kind text, alias text)
+    JOIN public.company_aliases a ON a.kind = x.kind AND a.alias = x.alias
+    ORDER BY (a.kind = 'domain') DESC
+    LIMIT 1;
+
+    IF v_company_id IS NULL THEN
+        INSERT INTO public.companies (name, domain)
+        VALUES (p_name, p_domain)
+        RETURNING companies.id INTO v_created_id;
+        v_company_id := v_created_id;
+    END IF;
+
+    INSERT INTO public.company_aliases (kind, alias, company_id)
+    SELECT x.kind, x.alias, v_company_id
+    FROM jsonb_to_recordset(p_aliases) AS x(kind text, alias text)
+    ON CONFLICT DO NOTHING;
+
+    IF v_created_id IS NOT NULL THEN
+        SELECT a.company_id INTO v_company_id
+        FROM jsonb_to_recordset(p_aliases) AS x(kind text, alias text)
+        JOIN public.company_aliases a ON a.kind = x.kind AND a.alias = x.alias
+        ORDER BY (a.kind = 'domain') DESC, (a.company_id = v_created_id)
+        LIMIT 1;
+        v_company_id := COALESCE(v_company_id, v_created_id);
+
+        IF v_company_id <> v_created_id THEN
+            UPDATE public.company_aliases a SET company_id = v_company_id WHERE a.company_id = v_created_id;
+            DELETE FROM public.companies c WHERE c.id = v_created_id;
+        END IF;
+    END IF;
+
+    -- Fill in a domain learned after the company was created
+    IF p_domain IS NOT NULL THEN
+        UPDATE public.companies c
+        SET domain = p_domain
+        WHERE c.id = v_company_id AND c.domain IS NULL;
+    END IF;
+
+    RETURN QUERY
+    SELECT c.id, c.name, c.domain FROM public.companies c WHERE c.id = v_company_id;
+END;
+$$;
@@ -0,0 +1,39 @@
+-- Result-cache staleness for queued scrape tasks
+-- A manual run's max_staleness_seconds (migration 018) has to reach whichever
+-- replica leases its tasks, so each task carries the oldest cached result
+-- its source may reuse: the run's cap already clamped to the source's
+-- freshness TTL. NULL means always fetch fresh (scheduled cycles).
+-- A unit that is already open keeps its own task, and with it its staleness.
+
+ALTER TABLE public.scrape_tasks
+ADD COLUMN IF NOT EXISTS max_staleness_seconds integer DEFAULT NULL
+CHECK (max_staleness_seconds IS NULL OR max_staleness_seconds >= 0);
+
+COMMENT ON COLUMN public.scrape_tasks.max_staleness_seconds IS 'Oldest cached results (seconds) this task may reuse, NULL means always fetch fresh';
+
+-- p_tasks: [{"source": "googlenews", "unit": "Stripe", "max_staleness_seconds": 600}, ...]
+CREATE OR REPLACE FUNCTION enqueue_scrape_tasks(
+    p_run_id uuid,
+    p_user_id uuid,
+    p_tasks jsonb,
+    p_max_attempts integer DEFAULT 3
+)
+RETURNS integer
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_inserted integer;
+BEGIN
+    INSERT INTO public.scrape_tasks (run_id, user_id, source, unit, max_attempts, max_staleness_seconds)
+    SELECT p_run_id, p_user_id, t.source, t.unit, p_max_attempts, t.max_staleness_seconds
+    FROM jsonb_to_recordset(p_tasks) AS t(source text, unit text, max_staleness_seconds integer)
+    ON CONFLICT DO NOTHING;
+
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+
+    -- A run whose units were all already queued elsewhere completes immediately
+    PERFORM refresh_scrape_run_from_tasks(p_run_id);
+    RETURN v_inserted;
+END;
+$$;
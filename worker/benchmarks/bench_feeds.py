@@ -0,0 +1,59 @@
+"""
+Feed parser benchmark: the old build-the-whole-tree approach against the
+shared incremental parser, on a synthetic feed.
+
+Run from worker/:  python -m benchmarks.bench_feeds [items] [limit]
+"""
+
+import sys
+import os
+import timeit
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.feeds import parse_feed
+
+
+def synthetic_feed(items: int) -> bytes:
+    entries = "".join(
+        f"<item><title>Company {i} raises Series B</title>"
+        f"<link>https://example.com/news/{i}</link>"
+        f"<description>&lt;p&gt;{'Funding news body. ' * 40}&lt;/p&gt;</description>"
+        f"<pubDate>Mon, 06 Jan 2025 10:00:00 GMT</pubDate>"
+        f"<guid>news-{i}</guid></item>"
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>{entries}</channel></rss>'.encode()
+
+
+def full_tree(content: bytes, limit: int) -> list:
+    # What each scraper used to do
+    root = ET.fromstring(content)
+    return [
+        (item.findtext("title"), item.findtext("link"), item.findtext("description"))
+        for item in root.findall(".//item")[:limit]
+    ]
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    content = synthetic_feed(items)
+    resume_at = f"news-{limit // 2}"
+
+    cases = {
+        "fromstring + findall": lambda: full_tree(content, limit),
+        f"parse_feed(limit={limit})": lambda: parse_feed(content, limit=limit),
+        f"parse_feed(stop_at={resume_at})": lambda: parse_feed(content, limit=limit, stop_at=resume_at),
+        "parse_feed(no limit)": lambda: parse_feed(content),
+    }
+    print(f"{items} items, {len(content) / 1024:.0f} KB")
+    for name, fn in cases.items():
+        runs = 20
+        seconds = min(timeit.repeat(fn, number=runs, repeat=3)) / runs
+        print(f"  {name:<32} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
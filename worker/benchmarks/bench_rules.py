@@ -0,0 +1,81 @@
+"""
+Rule classifier benchmark: the old per-scraper keyword chains against the
+compiled rules table, over a batch of synthetic titles.
+
+Run from worker/:  python -m benchmarks.bench_rules [titles]
+"""
+
+import sys
+import os
+import random
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai.rules import signal_rules
+
+SUBJECTS = ["Acme", "Globex Corp", "Initech", "Umbrella AI", "Hooli", "Stark Cloud"]
+VERBS = [
+    "raises $40M Series B", "launches a developer platform", "partners with Salesforce",
+    "expands into Europe", "appoints a new CFO", "is hiring across sales", "acquires Pied Piper",
+    "posts quarterly earnings", "updates its pricing", "opens a Tokyo office",
+]
+TAILS = ["", " led by Sequoia", " to scale growth", " amid record revenue", " after a $1 billion valuation"]
+
+
+def titles(count: int) -> list[str]:
+    rng = random.Random(7)
+    return [f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)}{rng.choice(TAILS)}" for _ in range(count)]
+
+
+def keyword_chains(title: str) -> tuple[str, str]:
+    # The shape of the old _detect_signal_type / _assess_priority pairs
+    title = title.lower()
+    if any(w in title for w in ["hiring", "jobs", "recruit", "talent"]):
+        signal_type = "hiring"
+    elif any(w in title for w in ["raised", "funding", "series", "seed", "investment", "valuation"]):
+        signal_type = "funding"
+    elif any(w in title for w in ["launch", "release", "announce", "unveil", "introduce"]):
+        signal_type = "product_launch"
+    elif any(w in title for w in ["partner", "acquisition", "acquire", "merge", "deal"]):
+        signal_type = "partnership"
+    elif any(w in title for w in ["expand", "growth", "scale", "international"]):
+        signal_type = "expansion"
+    elif any(w in title for w in ["ceo", "cto", "founder", "executive", "appoint"]):
+        signal_type = "leadership_change"
+    else:
+        signal_type = "product_launch"
+
+    if any(w in title for w in ["billion", "unicorn", "ipo", "$100m", "$50m"]):
+        priority = "high"
+    elif any(w in title for w in ["million", "series b", "series c", "acquisition"]):
+        priority = "high"
+    elif any(w in title for w in ["series a", "seed", "funding", "raised"]):
+        priority = "medium"
+    else:
+        priority = "low"
+    return signal_type, priority
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    batch = titles(count)
+    rules = signal_rules()
+
+    # Every rule checked with a substring test, which is what scoring all
+    # rules (rather than stopping at the first hit) costs without an automaton
+    keywords = [k.rstrip("*").lower() for k in rules.keywords]
+
+    cases = {
+        "keyword chains": lambda: [keyword_chains(t) for t in batch],
+        "substring per rule": lambda: [[k for k in keywords if k in t] for t in map(str.lower, batch)],
+        "RuleSet.classify_many": lambda: rules.classify_many(batch),
+    }
+    print(f"{count} titles, {len(rules.keywords)} rule keywords")
+    for name, fn in cases.items():
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        print(f"  {name:<24} {seconds * 1000:8.1f} ms  {count / seconds:10,.0f} titles/s")
+
+
+if __name__ == "__main__":
+    main()
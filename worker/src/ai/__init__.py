@@ -1,4 +1,14 @@
 from .extract import extract_entities
 from .classify import classify_signal, score_priority
+from .rules import RuleSet, Classification, signal_rules, role_rules, product_rules
 
-__all__ = ["extract_entities", "classify_signal", "score_priority"]
+__all__ = [
+    "extract_entities",
+    "classify_signal",
+    "score_priority",
+    "RuleSet",
+    "Classification",
+    "signal_rules",
+    "role_rules",
+    "product_rules",
+]
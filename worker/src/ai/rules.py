@@ -0,0 +1,193 @@
+"""
+Rule-based signal classification.
+
+Keyword rules live in the tables below rather than in each scraper: type
+rules weight keywords towards a signal type, priority rules add or take
+away points. A RuleSet compiles a table into one keyword automaton, so a
+text is scanned once however many rules there are, and returns the type,
+the priority and a confidence the enrichment step uses to decide whether
+the LLM classifier is worth calling at all.
+
+Keywords match whole words, case-insensitively; a trailing "*" lets one
+run on into longer words ("launch*" matches "launched").
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Mapping
+
+from ..matching import KeywordAutomaton, fold_case
+from .classify import SignalType, Priority
+
+# Keyword weights per signal type; ties go to the type listed first
+SIGNAL_TYPE_RULES: dict[str, dict[str, float]] = {
+    "funding": {
+        "raise*": 2, "funding": 2, "funded": 1.5, "series": 1.5, "seed": 1.5,
+        "pre-seed": 1.5, "valuation": 1.5, "ipo": 1.5, "investment*": 1,
+        "unicorn": 1, "capital": 0.5, "round": 0.5, "backed": 0.5,
+    },
+    "hiring": {
+        "hiring": 2, "join our team": 2, "recruit*": 1.5, "headcount": 1.5,
+        "jobs": 1, "job": 1, "careers": 1, "talent": 1, "looking for": 0.5,
+    },
+    "product_launch": {
+        "launch*": 2, "unveil*": 2, "introduc*": 1.5, "release*": 1.5,
+        "debut*": 1.5, "rolls out": 1.5, "new product*": 1.5,
+        "now available": 1.5, "announc*": 0.5,
+    },
+    "partnership": {
+        "partner*": 2, "collaborat*": 2, "teams with": 2, "teams up": 2,
+        "acquir*": 2, "acquisition*": 2, "merge*": 2, "alliance": 1.5,
+        "agreement": 1, "integration": 1, "deal": 0.5,
+    },
+    "expansion": {
+        "expand*": 2, "expansion": 2, "new office*": 2, "new market*": 2,
+        "opens": 1, "enters": 1, "international*": 1, "growth": 0.5,
+        "scaling": 0.5, "milestone": 0.5, "revenue": 0.5, "earnings": 0.5,
+    },
+    "leadership_change": {
+        "appoint*": 2, "joins as": 2, "steps down": 2, "successor": 1.5,
+        "new head": 1.5, "ceo": 1.5, "cto": 1.5, "cfo": 1.5, "coo": 1.5,
+        "names": 1, "promotes": 1, "promoted": 1, "chief": 1,
+        "executive": 1, "leadership": 1, "founder": 0.5,
+    },
+}
+
+# Sales priority points for news-style signals
+SIGNAL_PRIORITY_RULES: dict[str, float] = {
+    "billion": 3, "unicorn": 3, "ipo": 3, "$100m": 3, "100 million": 3,
+    "million": 2, "$50m": 2, "50 million": 2, "series b": 2, "series c": 2,
+    "series d": 2, "series e": 2, "acquir*": 2, "acquisition*": 2,
+    "raise*": 1, "funding": 1, "series a": 1, "launch*": 1, "expansion": 1,
+    "partnership": 1, "appoint*": 1, "ceo": 1, "cto": 1, "cfo": 1, "coo": 1,
+    "seed": -1, "pre-seed": -1, "angel": -1, "update*": -1,
+}
+
+# Seniority of a job title or position: budget holders are high priority
+ROLE_PRIORITY_RULES: dict[str, float] = {
+    "vp": 2, "svp": 2, "evp": 2, "vice president": 2, "president": 2,
+    "director*": 2, "head of": 2, "chief": 2, "cro": 2, "cmo": 2, "cso": 2,
+    "ceo": 2, "founder*": 2,
+}
+
+# Sales fit of a product launch: B2B and developer products first
+PRODUCT_PRIORITY_RULES: dict[str, float] = {
+    "enterprise": 2, "b2b": 2, "saas": 2, "ai": 2, "artificial intelligence": 2,
+    "automation": 2, "api*": 2, "developer*": 2, "infrastructure": 2,
+    "backed by": 2, "funded": 2, "yc": 2, "y combinator": 2,
+    "productivity": 0.5, "workflow*": 0.5, "analytics": 0.5, "integration*": 0.5,
+    "platform": 0.5, "tool*": 0.5, "app": 0.5, "apps": 0.5, "software": 0.5,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Classification:
+    """What the rules make of one text."""
+    signal_type: SignalType | None  # None when no type rule matched
+    priority: Priority
+    # 0-1: how clearly the best type beat the others, growing with evidence
+    confidence: float
+    keywords: tuple[str, ...]  # Matched, in order of appearance
+
+
+class RuleSet:
+    """A rules table compiled into one automaton."""
+
+    def __init__(
+        self,
+        type_rules: Mapping[str, Mapping[str, float]] | None = None,
+        priority_rules: Mapping[str, float] | None = None,
+        default_priority: Priority = "low",
+        high_at: float = 2.0,
+        medium_at: float = 1.0,
+        low_at: float = -1.0,
+    ):
+        self.types = list(type_rules or {})
+        self.default_priority = default_priority
+        self.high_at = high_at
+        self.medium_at = medium_at
+        self.low_at = low_at
+
+        # Keyword -> (type weights, priority points); one automaton entry each
+        effects: dict[str, tuple[dict[int, float], list[float]]] = {}
+        for type_index, (_, rules) in enumerate((type_rules or {}).items()):
+            for keyword, weight in rules.items():
+                effects.setdefault(keyword, ({}, [0.0]))[0][type_index] = weight
+        for keyword, points in (priority_rules or {}).items():
+            effects.setdefault(keyword, ({}, [0.0]))[1][0] = points
+
+        keywords = list(effects)
+        self._keywords = tuple(keywords)
+        self._type_weights = [tuple(effects[k][0].items()) for k in keywords]
+        self._points = [effects[k][1][0] for k in keywords]
+        self._automaton = KeywordAutomaton(
+            [fold_case(k.rstrip("*")) for k in keywords],
+            prefixes={i for i, k in enumerate(keywords) if k.endswith("*")},
+        )
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        """Every rule keyword as written (a trailing "*" matches word prefixes)."""
+        return self._keywords
+
+    def classify(self, text: str, default_priority: Priority | None = None) -> Classification:
+        """Type, priority and confidence for one text, in a single scan."""
+        scores = [0.0] * len(self.types)
+        points = 0.0
+        seen: dict[int, None] = {}
+        for index, _, _ in self._automaton.scan(fold_case(text)):
+            # Repeating a keyword adds no evidence
+            if index in seen:
+                continue
+            seen[index] = None
+            for type_index, weight in self._type_weights[index]:
+                scores[type_index] += weight
+            points += self._points[index]
+
+        signal_type = None
+        confidence = 0.0
+        if scores and max(scores) > 0:
+            ranked = sorted(range(len(scores)), key=lambda i: -scores[i])
+            best = scores[ranked[0]]
+            runner_up = scores[ranked[1]] if len(ranked) > 1 else 0.0
+            signal_type = self.types[ranked[0]]
+            confidence = round((best - runner_up) / (best + 1), 3)
+
+        if points >= self.high_at:
+            priority = "high"
+        elif points >= self.medium_at:
+            priority = "medium"
+        elif points <= self.low_at:
+            priority = "low"
+        else:
+            priority = default_priority or self.default_priority
+
+        return Classification(
+            signal_type=signal_type,
+            priority=priority,
+            confidence=confidence,
+            keywords=tuple(self._automaton.keywords[i] for i in seen),
+        )
+
+    def classify_many(self, texts: Iterable[str], default_priority: Priority | None = None) -> list[Classification]:
+        """classify() over a batch of texts."""
+        classify = self.classify
+        return [classify(text, default_priority) for text in texts]
+
+
+@lru_cache
+def signal_rules() -> RuleSet:
+    """Signal type and priority of news, press releases and posts."""
+    return RuleSet(SIGNAL_TYPE_RULES, SIGNAL_PRIORITY_RULES, default_priority="low")
+
+
+@lru_cache
+def role_rules() -> RuleSet:
+    """Priority of a hiring or people signal by the role's seniority."""
+    return RuleSet(priority_rules=ROLE_PRIORITY_RULES, default_priority="medium")
+
+
+@lru_cache
+def product_rules() -> RuleSet:
+    """Priority of a product launch by its fit for B2B sales."""
+    return RuleSet(priority_rules=PRODUCT_PRIORITY_RULES, default_priority="low", medium_at=0.5)
@@ -0,0 +1,74 @@
+"""
+In-process cache of parsed scrape results.
+
+Every unit a scraper fetches (one feed, one company) is stored as parsed
+signals keyed by scraper name, unit and the scraper's parameters. Manual
+runs reuse entries younger than the source's freshness TTL (or the run's
+max_staleness) instead of going back to the network; scheduled cycles
+always fetch and keep the cache warm.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable
+import threading
+
+from .config import get_settings
+from .models import Signal
+
+
+@dataclass
+class CachedResult:
+    """Parsed signals from one fetch of a unit."""
+    signals: tuple[Signal, ...]
+    fetched_at: float
+
+
+class ResultCache:
+    """LRU map of unit key -> parsed signals."""
+
+    def __init__(self, max_entries: int = 2000):
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[Hashable, CachedResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, max_age: float) -> list[Signal] | None:
+        """Copies of the cached signals if younger than max_age seconds."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry.fetched_at > max_age:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # The pipeline mutates signals (hashes, enrichment), so hand out copies
+        return [signal.model_copy(deep=True) for signal in entry.signals]
+
+    def put(self, key: Hashable, signals: list[Signal]):
+        entry = CachedResult(signals=tuple(signals), fetched_at=time.monotonic())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_cache: ResultCache | None = None
+
+
+def get_result_cache() -> ResultCache:
+    """Process-wide result cache, created on first use."""
+    global _cache
+    if _cache is None:
+        _cache = ResultCache(max_entries=get_settings().result_cache_max_entries)
+    return _cache
@@ -0,0 +1,134 @@
+"""
+Adaptive per-source polling cadence.
+
+Each source keeps its own interval within configured min/max bounds. A run
+that produced new (non-duplicate) signals halves the interval so busy sources
+are polled faster; an empty run backs the interval off exponentially so quiet
+sources stop costing fetches and LLM calls.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import structlog
+from .config import get_settings
+
+log = structlog.get_logger()
+
+
+@dataclass
+class SourceCadence:
+    """Polling state for one source."""
+    source: str
+    min_minutes: float
+    max_minutes: float
+    interval_minutes: float
+    next_due_at: datetime
+    last_run_at: datetime | None = None
+    last_new_signals: int | None = None
+    empty_streak: int = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "interval_minutes": round(self.interval_minutes, 1),
+            "min_minutes": self.min_minutes,
+            "max_minutes": self.max_minutes,
+            "next_due_at": self.next_due_at.isoformat(),
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_new_signals": self.last_new_signals,
+            "empty_streak": self.empty_streak,
+        }
+
+
+class CadenceTracker:
+    """Tracks when each source is next due and adapts intervals to yield."""
+
+    def __init__(self, initial_minutes: float, backoff_factor: float = 2.0):
+        self.initial_minutes = initial_minutes
+        self.backoff_factor = max(1.0, backoff_factor)
+        self.sources: dict[str, SourceCadence] = {}
+
+    def register(self, source: str, min_minutes: float, max_minutes: float):
+        """Add a source (due immediately) or update the bounds of a known one."""
+        min_minutes, max_minutes = min(min_minutes, max_minutes), max(min_minutes, max_minutes)
+        state = self.sources.get(source)
+        if state is None:
+            self.sources[source] = SourceCadence(
+                source=source,
+                min_minutes=min_minutes,
+                max_minutes=max_minutes,
+                interval_minutes=self._clamp(self.initial_minutes, min_minutes, max_minutes),
+                next_due_at=datetime.now(timezone.utc),
+            )
+            return
+        state.min_minutes = min_minutes
+        state.max_minutes = max_minutes
+        state.interval_minutes = self._clamp(state.interval_minutes, min_minutes, max_minutes)
+
+    def is_due(self, source: str, now: datetime | None = None) -> bool:
+        state = self.sources.get(source)
+        if state is None:
+            return True
+        return state.next_due_at <= (now or datetime.now(timezone.utc))
+
+    def due_sources(self, now: datetime | None = None) -> set[str]:
+        now = now or datetime.now(timezone.utc)
+        return {name for name in self.sources if self.is_due(name, now)}
+
+    def record(self, source: str, new_signals: int, now: datetime | None = None):
+        """Adapt a source's interval after a run and schedule its next poll."""
+        state = self.sources.get(source)
+        if state is None:
+            return
+        now = now or datetime.now(timezone.utc)
+        previous = state.interval_minutes
+
+        if new_signals > 0:
+            state.interval_minutes /= self.backoff_factor
+            state.empty_streak = 0
+        else:
+            state.interval_minutes *= self.backoff_factor
+            state.empty_streak += 1
+
+        state.interval_minutes = self._clamp(state.interval_minutes, state.min_minutes, state.max_minutes)
+        state.last_run_at = now
+        state.last_new_signals = new_signals
+        state.next_due_at = now + timedelta(minutes=state.interval_minutes)
+
+        if state.interval_minutes != previous:
+            log.info(
+                "source_cadence_updated",
+                source=source,
+                new_signals=new_signals,
+                interval_minutes=round(state.interval_minutes, 1),
+                previous_minutes=round(previous, 1),
+            )
+
+    def defer(self, source: str, now: datetime | None = None):
+        """Push a source's next poll out by its current interval (e.g. disabled)."""
+        state = self.sources.get(source)
+        if state is None:
+            return
+        now = now or datetime.now(timezone.utc)
+        state.next_due_at = now + timedelta(minutes=state.interval_minutes)
+
+    def snapshot(self) -> dict:
+        return {name: state.snapshot() for name, state in sorted(self.sources.items())}
+
+    @staticmethod
+    def _clamp(value: float, low: float, high: float) -> float:
+        return max(low, min(high, value))
+
+
+_tracker: CadenceTracker | None = None
+
+
+def get_cadence() -> CadenceTracker:
+    """Process-wide cadence tracker, created on first use."""
+    global _tracker
+    if _tracker is None:
+        settings = get_settings()
+        _tracker = CadenceTracker(
+            initial_minutes=settings.scrape_interval_minutes,
+            backoff_factor=settings.cadence_backoff_factor,
+        )
+    return _tracker
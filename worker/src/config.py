@@ -1,5 +1,6 @@
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -9,9 +10,156 @@ class Settings(BaseSettings):
     scrape_interval_minutes: int = 30
     log_level: str = "INFO"
 
+    # Scheduler: random delay added to each cycle, what to do when a cycle
+    # is still running at its next tick (skip, queue, coalesce), and how
+    # often to poll for manual runs
+    scrape_jitter_seconds: int = 5
+    scrape_overlap_policy: Literal["skip", "queue", "coalesce"] = "coalesce"
+    pending_run_poll_seconds: int = 30
+
+    # Adaptive per-source cadence: how often to check which sources are due,
+    # the factor intervals shrink/grow by, and optional per-source
+    # [min, max] interval bounds in minutes, e.g. {"reddit": [5, 60]}.
+    # scrape_interval_minutes is each source's starting interval.
+    cadence_tick_seconds: int = 60
+    cadence_backoff_factor: float = 2.0
+    source_interval_bounds: dict[str, tuple[float, float]] = {}
+
+    # Concurrency: max scrapers running at once, plus optional per-source
+    # caps on units (companies/feeds) in flight, e.g. {"googlenews": 5}
+    scraper_concurrency: int = 4
+    source_concurrency: dict[str, int] = {}
+
+    # Fetching budget per source per run; once it runs out the source's
+    # fetches are aborted and it is cut short, but what it already parsed
+    # still goes through the pipeline. Time spent waiting on a backed-up
+    # pipeline doesn't count. Optional per-source overrides by scraper name.
+    scraper_time_budget_seconds: float = 300
+    source_time_budgets: dict[str, float] = {}
+
+    # How often an in-process cycle checks whether its run was cancelled
+    cancel_poll_seconds: float = 5
+
+    # scrape_runs progress is buffered and written at most this often
+    # (terminal statuses are written immediately)
+    progress_flush_seconds: float = 2.0
+
+    # Shared HTTP clients: default User-Agent and timeouts, HTTP/2 where the
+    # host supports it, and connection pool / keep-alive limits
+    http_user_agent: str = "Axidex Signal Scraper 1.0"
+    http_timeout_seconds: float = 30.0
+    http_connect_timeout_seconds: float = 10.0
+    http2_enabled: bool = True
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    # Most a scraper reads of one response body (decoded), with optional
+    # per-source overrides by scraper name; bigger responses are aborted
+    http_max_response_bytes: int = 5_000_000
+    source_response_budgets: dict[str, int] = {}
+    # Identical GETs in flight at the same time share one request
+    http_singleflight_enabled: bool = True
+
+    # Per-host token buckets (requests/second and burst); HOST_RATE_LIMITS
+    # overrides individual hosts, e.g. {"www.reddit.com": [0.5, 1]}.
+    # Retry-After pauses a host for at most http_max_retry_after_seconds.
+    http_rate_per_host: float = 2.0
+    http_burst_per_host: int = 4
+    host_rate_limits: dict[str, tuple[float, int]] = {}
+    http_max_retry_after_seconds: float = 300
+
+    # Adaptive (AIMD) requests in flight per host: start/max limits, the
+    # factor a 429/503 or latency spike shrinks the limit by, and how far
+    # above a host's usual latency counts as a spike
+    aimd_initial_concurrency: int = 4
+    aimd_max_concurrency: int = 32
+    aimd_backoff_factor: float = 0.5
+    aimd_latency_factor: float = 3.0
+
+    # Retries for failed requests (attempts include the first, with jittered
+    # exponential backoff), and per-host circuit breakers that fail fast
+    # after consecutive failures and let a trial request through later
+    http_retry_attempts: int = 3
+    http_retry_base_delay_seconds: float = 0.5
+    http_retry_max_delay_seconds: float = 10.0
+    breaker_failure_threshold: int = 5
+    breaker_reset_seconds: float = 60.0
+
+    # Conditional GETs (ETag / Last-Modified) for feeds in shared cycles;
+    # validators are flushed to the database this often and dropped once
+    # unused for this many days
+    http_validators_enabled: bool = True
+    http_validator_flush_seconds: int = 60
+    http_validator_max_age_days: int = 7
+
+    # Record every outbound response into http_cassette_dir ("record"), or
+    # answer requests from it without the network ("replay"). Replayed
+    # responses wait their recorded latency times the scale (0 = instantly).
+    # Only scraper traffic goes through the cassette, not the OpenAI client,
+    # so replay turns AI enrichment off (ai_enabled is forced False) rather
+    # than calling the LLM live.
+    http_cassette_mode: Literal["off", "record", "replay"] = "off"
+    http_cassette_dir: str = "cassettes"
+    http_cassette_latency_scale: float = 0.0
+
+    # robots.txt for requests that opt in (company sites, job boards):
+    # policies are cached this long, or the shorter negative TTL when
+    # robots.txt couldn't be fetched; Crawl-delay is capped at the max
+    robots_enabled: bool = True
+    robots_user_agent: str = "AxidexBot"
+    robots_ttl_seconds: float = 86400
+    robots_negative_ttl_seconds: float = 3600
+    robots_max_crawl_delay_seconds: float = 60
+
+    # Feed / HTML parsing off the event loop: in a thread pool, a process
+    # pool (for CPU-heavy cycles) or inline, with this many workers; bodies
+    # up to parse_inline_max_bytes are always parsed inline
+    parse_executor: Literal["inline", "thread", "process"] = "thread"
+    parse_workers: int = 2
+    parse_inline_max_bytes: int = 16_384
+
+    # Parsed results kept for reuse by manual runs (units, LRU)
+    result_cache_max_entries: int = 2000
+
+    # Merged scraper_config snapshot: seconds before checking the table's
+    # max(updated_at) for changes again
+    config_snapshot_ttl_seconds: int = 60
+
+    # Leased task queue for running several replicas: cycles enqueue one
+    # task per (source, unit) and every replica leases batches to run.
+    # Requires migration 017. worker_id defaults to hostname:pid.
+    task_queue_enabled: bool = False
+    worker_id: Optional[str] = None
+    task_claim_batch: int = 4
+    task_lease_seconds: int = 120
+    task_poll_seconds: int = 5
+    task_max_attempts: int = 3
+
+    # Streaming pipeline: bounded queue size between stages, workers per stage
+    pipeline_queue_size: int = 100
+    dedup_workers: int = 4
+    enrich_workers: int = 4
+    insert_workers: int = 2
+
+    # Company entity resolution (migration 023): signals are pointed at a
+    # canonical company through an in-memory alias index, which each run
+    # tops up with aliases changed in the database at most this often
+    entity_resolution_enabled: bool = True
+    entity_refresh_seconds: float = 300
+
     # Bright Data proxy (optional - for job boards)
     bright_data_username: Optional[str] = None
     bright_data_password: Optional[str] = None
+    # Proxy pool: explicit PROXY_URLS, else this many Bright Data sessions
+    # (separate exit nodes). Requests go to the healthiest proxy by latency
+    # and error rate and stick to it per host for proxy_sticky_seconds;
+    # proxy_failure_threshold failures in a row bench a proxy for
+    # proxy_cooldown_seconds.
+    proxy_urls: list[str] = []
+    proxy_sessions: int = 1
+    proxy_sticky_seconds: float = 300
+    proxy_failure_threshold: int = 3
+    proxy_cooldown_seconds: float = 120
 
     # Bright Data API token (for LinkedIn SDK)
     bright_data_api_token: Optional[str] = None
@@ -21,6 +169,10 @@ class Settings(BaseSettings):
     openai_api_base: Optional[str] = "https://openrouter.ai/api/v1"  # OpenRouter by default
     openai_model: str = "google/gemini-2.0-pro-exp-02-05"  # Gemini Pro for extraction/scraping
     ai_enabled: bool = True  # Can disable AI for testing
+    # Skip the LLM (entity extraction and classification) when the keyword
+    # rules agree with a signal's type at least this confidently (0-1; above
+    # 1 never skips); such signals are marked rule_classified, not ai_enriched
+    rule_confidence_threshold: float = 0.8
 
     # Sentry
     sentry_dsn: Optional[str] = None
@@ -28,6 +180,12 @@ class Settings(BaseSettings):
     # Health check endpoint
     health_port: int = 8080
 
+    @model_validator(mode="after")
+    def _no_ai_in_replay(self) -> "Settings":
+        if self.http_cassette_mode == "replay":
+            self.ai_enabled = False
+        return self
+
     @property
     def proxy_url(self) -> Optional[str]:
         if self.bright_data_username and self.bright_data_password:
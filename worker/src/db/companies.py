@@ -0,0 +1,64 @@
+"""
+Canonical companies and their aliases (companies / company_aliases tables,
+migration 023).
+
+Aliases are read in pages for the in-memory index; resolving a new alias
+goes through a SQL function so replicas meeting the same new company at
+once still end up with a single row for it.
+"""
+
+from datetime import datetime
+import structlog
+
+from .supabase import get_client
+
+log = structlog.get_logger()
+
+ALIAS_COLUMNS = "kind, alias, company_id, updated_at, companies(name, domain)"
+ALIAS_PAGE_SIZE = 1000
+
+
+def load_company_aliases(since: datetime | None = None) -> list[dict] | None:
+    """Aliases updated at or after `since` (all if None), oldest first. None on error."""
+    rows: list[dict] = []
+    try:
+        client = get_client()
+        while True:
+            query = client.table("company_aliases").select(ALIAS_COLUMNS)
+            if since is not None:
+                query = query.gte("updated_at", since.isoformat())
+            # (kind, alias) is the primary key, so pages never tie on the
+            # sort order and the offsets can't skip or repeat a row
+            result = (
+                query.order("updated_at")
+                .order("kind")
+                .order("alias")
+                .range(len(rows), len(rows) + ALIAS_PAGE_SIZE - 1)
+                .execute()
+            )
+            page = result.data or []
+            rows.extend(page)
+            if len(page) < ALIAS_PAGE_SIZE:
+                return rows
+    except Exception as e:
+        log.error("load_company_aliases_failed", error=str(e), loaded=len(rows))
+        return None
+
+
+def resolve_company(name: str, domain: str | None, aliases: list[dict]) -> dict | None:
+    """
+    The company one of `aliases` ({kind, alias}) belongs to, created as
+    `name` if none does; the aliases not yet taken are claimed for it.
+    Returns {id, name, domain}, or None on error.
+    """
+    try:
+        client = get_client()
+        result = client.rpc("resolve_company", {
+            "p_name": name,
+            "p_domain": domain,
+            "p_aliases": aliases,
+        }).execute()
+        return result.data[0] if result.data else None
+    except Exception as e:
+        log.error("resolve_company_failed", error=str(e), company=name)
+        return None
@@ -15,12 +15,26 @@ def compute_content_hash(title: str, company: str) -> str:
     return hashlib.sha256(content.encode()).hexdigest()[:32]
 
 
-def is_duplicate(title: str, company_name: str, source_url: str) -> bool:
+def is_duplicate(
+    title: str,
+    company_name: str,
+    source_url: str,
+    content_hash: str | None = None,
+    company_id: str | None = None,
+    company_alias: str | None = None,
+) -> bool:
     """
     Check if this signal is a duplicate using multiple strategies:
     1. Exact URL match (already in supabase.signal_exists)
     2. Content hash match (same title + company)
     3. Fuzzy title match (future: vector similarity)
+
+    Pass content_hash when the stored hash was computed from a raw title
+    that differs from the signal's display title, and company_id once the
+    company is resolved, so the title check covers all of its spellings.
+    Rows stored before companies were resolved have no company_id, so they
+    are still matched by name: company_name and the spelling it replaced
+    (company_alias).
     """
     client = get_client()
 
@@ -33,7 +47,7 @@ def is_duplicate(title: str, company_name: str, source_url: str) -> bool:
         return True
 
     # Strategy 2: Content hash - check metadata for hash
-    content_hash = compute_content_hash(title, company_name)
+    content_hash = content_hash or compute_content_hash(title, company_name)
 
     # We store hash in metadata.content_hash
     hash_result = (
@@ -50,14 +64,15 @@ def is_duplicate(title: str, company_name: str, source_url: str) -> bool:
     # Strategy 3: Title similarity (simple approach - check for near-identical titles)
     # For the same company, if title starts the same way, likely duplicate
     title_prefix = title[:50].lower()
-    prefix_result = (
-        client.table("signals")
-        .select("id")
-        .ilike("title", f"{title_prefix}%")
-        .eq("company_name", company_name)
-        .limit(1)
-        .execute()
-    )
+    prefix_query = client.table("signals").select("id").ilike("title", f"{title_prefix}%")
+    names = [_quote(name) for name in dict.fromkeys(filter(None, (company_name, company_alias)))]
+    if company_id is not None and names:
+        prefix_query = prefix_query.or_(f"company_id.eq.{company_id},company_name.in.({','.join(names)})")
+    elif company_id is not None:
+        prefix_query = prefix_query.eq("company_id", company_id)
+    else:
+        prefix_query = prefix_query.eq("company_name", company_name)
+    prefix_result = prefix_query.limit(1).execute()
     if prefix_result.data:
         log.debug("duplicate_found", strategy="prefix", title=title[:50])
         return True
@@ -65,6 +80,12 @@ def is_duplicate(title: str, company_name: str, source_url: str) -> bool:
     return False
 
 
+def _quote(value: str) -> str:
+    """Quote a value for a PostgREST or/in filter (names may hold commas or parens)."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
 def get_content_hash(title: str, company: str) -> dict:
     """Return metadata dict with content hash for storage."""
     return {"content_hash": compute_content_hash(title, company)}
@@ -1,14 +1,31 @@
 from supabase import create_client, Client
 from ..config import get_settings
 from ..models import Signal
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
+from typing import Mapping
+import threading
+import time
 import structlog
 
 log = structlog.get_logger()
 
 _client: Client | None = None
 
+# Only the columns the worker needs, instead of select("*")
+SCRAPER_CONFIG_COLUMNS = (
+    "user_id, target_companies, signal_keywords, source_techcrunch, "
+    "source_indeed, source_linkedin, source_company_newsrooms"
+)
+
+DEFAULT_ENABLED_SOURCES = {
+    "techcrunch": False,
+    "indeed": False,
+    "linkedin": False,
+    "company": False,
+}
+
 
 @dataclass
 class ScraperConfig:
@@ -19,12 +36,35 @@ class ScraperConfig:
     sources: dict[str, bool]
 
 
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Immutable merged view of all active scraper configs.
+
+    Built from one projected query and shared by every scraper in a cycle.
+    Companies and keywords are deduplicated case-insensitively; their
+    normalized (lowercase) sets are computed once here and handed to the
+    scrapers instead of each one lowercasing its own copy.
+    """
+    target_companies: tuple[str, ...] = ()
+    signal_keywords: tuple[str, ...] = ()
+    enabled_sources: Mapping[str, bool] = field(
+        default_factory=lambda: MappingProxyType(dict(DEFAULT_ENABLED_SOURCES))
+    )
+    normalized_companies: frozenset[str] = frozenset()
+    normalized_keywords: frozenset[str] = frozenset()
+    # Change marker from the table: (max updated_at, active row count)
+    version: tuple[str | None, int] = (None, 0)
+
+
 @dataclass
 class ScrapeRun:
     """Tracks a scrape run's progress."""
     id: str
     user_id: str | None
     status: str
+    # Oldest cached source results (seconds) this run accepts; None = source default
+    max_staleness_seconds: int | None = None
 
 
 def get_client() -> Client:
@@ -42,6 +82,9 @@ def insert_signal(signal: Signal, user_id: str | None = None) -> dict | None:
     try:
         client = get_client()
         data = signal.model_dump()
+        if data["company_id"] is None:
+            # Unresolved: leave the column out, so inserts work without migration 023
+            del data["company_id"]
         if user_id is not None:
             data["user_id"] = user_id
         # user_id will be NULL for shared signals
@@ -69,34 +112,128 @@ def get_scraper_configs() -> list[ScraperConfig]:
     """
     client = get_client()
     try:
-        result = client.table("scraper_config").select("*").eq("auto_scrape_enabled", True).execute()
-
-        configs = []
-        for row in result.data:
-            configs.append(ScraperConfig(
-                user_id=row.get("user_id"),
-                target_companies=row.get("target_companies", []),
-                signal_keywords=row.get("signal_keywords", []),
-                sources={
-                    "techcrunch": row.get("source_techcrunch", True),
-                    "indeed": row.get("source_indeed", True),
-                    "linkedin": row.get("source_linkedin", False),
-                    "company": row.get("source_company_newsrooms", True),
-                }
-            ))
-        return configs
+        result = (
+            client.table("scraper_config")
+            .select(SCRAPER_CONFIG_COLUMNS)
+            .eq("auto_scrape_enabled", True)
+            .execute()
+        )
+        return [_row_to_config(row) for row in result.data]
     except Exception as e:
         log.error("get_scraper_configs_failed", error=str(e))
         return []
 
 
+def _row_to_config(row: dict) -> ScraperConfig:
+    return ScraperConfig(
+        user_id=row.get("user_id"),
+        target_companies=row.get("target_companies") or [],
+        signal_keywords=row.get("signal_keywords") or [],
+        sources={
+            "techcrunch": row.get("source_techcrunch", True),
+            "indeed": row.get("source_indeed", True),
+            "linkedin": row.get("source_linkedin", False),
+            "company": row.get("source_company_newsrooms", True),
+        }
+    )
+
+
+def build_config_snapshot(
+    configs: list[ScraperConfig],
+    version: tuple[str | None, int] = (None, 0),
+) -> ConfigSnapshot:
+    """Merge per-user configs into one snapshot."""
+    # Lowercased -> first spelling seen
+    company_lookup: dict[str, str] = {}
+    keyword_lookup: dict[str, str] = {}
+    sources = dict(DEFAULT_ENABLED_SOURCES)
+
+    for config in configs:
+        for company in config.target_companies:
+            if company and company.strip():
+                company_lookup.setdefault(company.strip().lower(), company.strip())
+        for keyword in config.signal_keywords:
+            if keyword and keyword.strip():
+                keyword_lookup.setdefault(keyword.strip().lower(), keyword.strip())
+        # A source is enabled if ANY user has it enabled
+        for source, enabled in config.sources.items():
+            if enabled:
+                sources[source] = True
+
+    return ConfigSnapshot(
+        target_companies=tuple(sorted(company_lookup.values(), key=str.lower)),
+        signal_keywords=tuple(sorted(keyword_lookup.values(), key=str.lower)),
+        enabled_sources=MappingProxyType(sources),
+        normalized_companies=frozenset(company_lookup),
+        normalized_keywords=frozenset(keyword_lookup),
+        version=version,
+    )
+
+
+_snapshot: ConfigSnapshot | None = None
+_snapshot_checked_at = 0.0
+_snapshot_lock = threading.Lock()
+
+
+def _config_version() -> tuple[str | None, int]:
+    """Latest updated_at and row count of active configs, in one small query."""
+    client = get_client()
+    result = (
+        client.table("scraper_config")
+        .select("updated_at", count="exact")
+        .eq("auto_scrape_enabled", True)
+        .order("updated_at", desc=True)
+        .limit(1)
+        .execute()
+    )
+    latest = result.data[0]["updated_at"] if result.data else None
+    return latest, result.count or 0
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    """
+    Cached merged config snapshot.
+
+    Within CONFIG_SNAPSHOT_TTL_SECONDS the cached snapshot is returned as-is.
+    After that, a cheap version probe (max updated_at + row count) decides
+    whether the full projected query has to run again. On errors the last
+    good snapshot is kept.
+    """
+    global _snapshot, _snapshot_checked_at
+    ttl = get_settings().config_snapshot_ttl_seconds
+
+    with _snapshot_lock:
+        now = time.monotonic()
+        if _snapshot is not None and now - _snapshot_checked_at < ttl:
+            return _snapshot
+
+        try:
+            version = _config_version()
+            if _snapshot is None or version != _snapshot.version:
+                configs = get_scraper_configs()
+                _snapshot = build_config_snapshot(configs, version)
+                log.info(
+                    "config_snapshot_refreshed",
+                    configs=len(configs),
+                    target_companies=len(_snapshot.target_companies),
+                    signal_keywords=len(_snapshot.signal_keywords),
+                )
+            _snapshot_checked_at = now
+        except Exception as e:
+            log.error("config_snapshot_refresh_failed", error=str(e))
+            if _snapshot is None:
+                return ConfigSnapshot()
+
+        return _snapshot
+
+
 def get_pending_scrape_run() -> ScrapeRun | None:
     """Check for a pending scrape run triggered manually from the UI."""
     client = get_client()
     try:
         result = (
             client.table("scrape_runs")
-            .select("id, user_id, status")
+            .select("id, user_id, status, max_staleness_seconds")
             .eq("status", "pending")
             .order("created_at", desc=False)
             .limit(1)
@@ -107,7 +244,8 @@ def get_pending_scrape_run() -> ScrapeRun | None:
             return ScrapeRun(
                 id=row["id"],
                 user_id=row.get("user_id"),
-                status=row["status"]
+                status=row["status"],
+                max_staleness_seconds=row.get("max_staleness_seconds"),
             )
         return None
     except Exception as e:
@@ -137,6 +275,17 @@ def create_scrape_run(user_id: str | None = None) -> str | None:
         return None
 
 
+def get_scrape_run_statuses(run_ids: list[str]) -> dict[str, str]:
+    """Current status of each run, e.g. to notice runs cancelled from the UI."""
+    client = get_client()
+    try:
+        result = client.table("scrape_runs").select("id, status").in_("id", run_ids).execute()
+        return {row["id"]: row["status"] for row in result.data or []}
+    except Exception as e:
+        log.error("get_scrape_run_statuses_failed", error=str(e))
+        return {}
+
+
 def update_scrape_run(
     run_id: str,
     status: str | None = None,
@@ -146,6 +295,8 @@ def update_scrape_run(
     ai_enriched_count: int | None = None,
     error_message: str | None = None,
     estimated_duration_seconds: int | None = None,
+    error_details: dict | None = None,
+    stats: dict | None = None,
 ) -> bool:
     """Update a scrape run with progress or completion status."""
     client = get_client()
@@ -165,7 +316,11 @@ def update_scrape_run(
             data["error_message"] = error_message
         if estimated_duration_seconds is not None:
             data["estimated_duration_seconds"] = estimated_duration_seconds
-        if status == "completed" or status == "failed":
+        if error_details is not None:
+            data["error_details"] = error_details
+        if stats is not None:
+            data["stats"] = stats
+        if status in ("completed", "failed", "cancelled"):
             data["completed_at"] = datetime.utcnow().isoformat()
 
         client.table("scrape_runs").update(data).eq("id", run_id).execute()
@@ -180,11 +335,7 @@ def get_merged_target_companies() -> list[str]:
     Get a merged list of all target companies from all active configs.
     Removes duplicates and returns a unique list.
     """
-    configs = get_scraper_configs()
-    all_companies = set()
-    for config in configs:
-        all_companies.update(config.target_companies)
-    return list(all_companies)
+    return list(get_config_snapshot().target_companies)
 
 
 def get_merged_signal_keywords() -> list[str]:
@@ -192,11 +343,7 @@ def get_merged_signal_keywords() -> list[str]:
     Get a merged list of all signal keywords from all active configs.
     Removes duplicates and returns a unique list.
     """
-    configs = get_scraper_configs()
-    all_keywords = set()
-    for config in configs:
-        all_keywords.update(config.signal_keywords)
-    return list(all_keywords)
+    return list(get_config_snapshot().signal_keywords)
 
 
 def get_enabled_sources() -> dict[str, bool]:
@@ -204,15 +351,4 @@ def get_enabled_sources() -> dict[str, bool]:
     Get merged enabled sources from all active configs.
     A source is enabled if ANY user has it enabled.
     """
-    configs = get_scraper_configs()
-    sources = {
-        "techcrunch": False,
-        "indeed": False,
-        "linkedin": False,
-        "company": False,
-    }
-    for config in configs:
-        for source, enabled in config.sources.items():
-            if enabled:
-                sources[source] = True
-    return sources
+    return dict(get_config_snapshot().enabled_sources)
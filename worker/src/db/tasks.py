@@ -0,0 +1,147 @@
+"""
+Leased scrape task queue (scrape_tasks table, migration 017).
+
+Every call goes through a SQL function so claiming, heartbeats and the
+run rollup stay atomic across worker replicas.
+"""
+
+from dataclasses import dataclass
+import structlog
+
+from .supabase import get_client, ScrapeRun
+
+log = structlog.get_logger()
+
+
+@dataclass
+class ScrapeTask:
+    """One leased unit of scrape work."""
+    id: str
+    run_id: str
+    user_id: str | None
+    source: str
+    unit: str
+    attempts: int
+    # Oldest cached results the unit may reuse; None always fetches
+    max_staleness_seconds: int | None = None
+
+
+@dataclass
+class TaskCompletion:
+    """Outcome of completing a task: whether its source and run are finished."""
+    source_done: bool
+    source_signals: int
+    run_done: bool
+
+
+def enqueue_scrape_tasks(
+    run_id: str,
+    tasks: list[tuple[str, str, int | None]],
+    user_id: str | None = None,
+    max_attempts: int = 3,
+) -> int:
+    """Queue (source, unit, max_staleness_seconds) tasks for a run. Returns how many were new."""
+    client = get_client()
+    try:
+        result = client.rpc("enqueue_scrape_tasks", {
+            "p_run_id": run_id,
+            "p_user_id": user_id,
+            "p_tasks": [
+                {"source": source, "unit": unit, "max_staleness_seconds": max_staleness}
+                for source, unit, max_staleness in tasks
+            ],
+            "p_max_attempts": max_attempts,
+        }).execute()
+        return result.data or 0
+    except Exception as e:
+        log.error("enqueue_scrape_tasks_failed", error=str(e), run_id=run_id)
+        return 0
+
+
+def claim_scrape_tasks(worker_id: str, limit: int, lease_seconds: int) -> list[ScrapeTask]:
+    """Lease up to `limit` tasks for this worker."""
+    client = get_client()
+    try:
+        result = client.rpc("claim_scrape_tasks", {
+            "p_worker_id": worker_id,
+            "p_limit": limit,
+            "p_lease_seconds": lease_seconds,
+        }).execute()
+        return [
+            ScrapeTask(
+                id=row["id"],
+                run_id=row["run_id"],
+                user_id=row.get("user_id"),
+                source=row["source"],
+                unit=row["unit"],
+                attempts=row.get("attempts", 1),
+                max_staleness_seconds=row.get("max_staleness_seconds"),
+            )
+            for row in result.data or []
+        ]
+    except Exception as e:
+        log.error("claim_scrape_tasks_failed", error=str(e))
+        return []
+
+
+def heartbeat_scrape_tasks(worker_id: str, task_ids: list[str], lease_seconds: int) -> set[str] | None:
+    """Extend leases; returns the task ids still held, or None if the call failed."""
+    client = get_client()
+    try:
+        result = client.rpc("heartbeat_scrape_tasks", {
+            "p_worker_id": worker_id,
+            "p_task_ids": task_ids,
+            "p_lease_seconds": lease_seconds,
+        }).execute()
+        return {row["id"] for row in result.data or []}
+    except Exception as e:
+        log.error("heartbeat_scrape_tasks_failed", error=str(e))
+        return None
+
+
+def complete_scrape_task(
+    task_id: str,
+    worker_id: str,
+    signals: int,
+    error: str | None = None,
+) -> TaskCompletion | None:
+    """Finish a task; with an error it is requeued until attempts run out."""
+    client = get_client()
+    try:
+        result = client.rpc("complete_scrape_task", {
+            "p_task_id": task_id,
+            "p_worker_id": worker_id,
+            "p_signals": signals,
+            "p_error": error,
+        }).execute()
+        if not result.data:
+            # Lease expired and another worker took the task over
+            return None
+        row = result.data[0]
+        return TaskCompletion(
+            source_done=row["source_done"],
+            source_signals=row["source_signals"],
+            run_done=row["run_done"],
+        )
+    except Exception as e:
+        log.error("complete_scrape_task_failed", error=str(e), task_id=task_id)
+        return None
+
+
+def claim_pending_scrape_run() -> ScrapeRun | None:
+    """Atomically take the oldest pending run so replicas never share one."""
+    client = get_client()
+    try:
+        result = client.rpc("claim_pending_scrape_run", {}).execute()
+        if result.data:
+            row = result.data[0]
+            return ScrapeRun(
+                id=row["id"],
+                user_id=row.get("user_id"),
+                status=row["status"],
+                max_staleness_seconds=row.get("max_staleness_seconds"),
+            )
+        return None
+    except Exception as e:
+        log.error("claim_pending_scrape_run_failed", error=str(e))
+        return None
@@ -0,0 +1,47 @@
+"""
+Persisted HTTP validators (http_validators table, migrations 020 and 022).
+
+ETag / Last-Modified values and each feed's newest processed item survive
+worker restarts, so the first cycle after a deploy can still send
+conditional requests and resume feeds.
+"""
+
+from datetime import datetime, timedelta
+import structlog
+
+from .supabase import get_client
+
+log = structlog.get_logger()
+
+VALIDATOR_COLUMNS = "url, source, fingerprint, etag, last_modified, last_item, updated_at"
+
+
+def load_http_validators(max_age_days: int) -> list[dict]:
+    """Validators used within the last max_age_days."""
+    client = get_client()
+    cutoff = (datetime.utcnow() - timedelta(days=max_age_days)).isoformat()
+    try:
+        result = (
+            client.table("http_validators")
+            .select(VALIDATOR_COLUMNS)
+            .gte("updated_at", cutoff)
+            .execute()
+        )
+        return result.data or []
+    except Exception as e:
+        log.error("load_http_validators_failed", error=str(e))
+        return []
+
+
+def save_http_validators(rows: list[dict], max_age_days: int) -> bool:
+    """Upsert validators by URL and drop ones that haven't been used in a while."""
+    client = get_client()
+    cutoff = (datetime.utcnow() - timedelta(days=max_age_days)).isoformat()
+    try:
+        if rows:
+            client.table("http_validators").upsert(rows, on_conflict="url").execute()
+        client.table("http_validators").delete().lt("updated_at", cutoff).execute()
+        return True
+    except Exception as e:
+        log.error("save_http_validators_failed", error=str(e), count=len(rows))
+        return False
@@ -0,0 +1,282 @@
+"""
+Company entity resolution.
+
+Scrapers extract company names with whatever their source allows (title
+regexes, a feed's publisher, a configured target), so one company turns
+up as "Acme", "Acme, Inc." and "ACME Corp." and dedup and per-company
+queries see three companies. Names and domains are normalised into alias
+keys (case, punctuation, accents, "&", a leading "The" and legal suffixes
+dropped; domains reduced to the registrable domain), and the
+company_aliases table (migration 023) maps each key to one canonical
+company.
+
+CompanyIndex keeps that table in memory: BaseScraper.stream canonicalises
+every signal against it, and the pipeline's dedup stage resolves the rest.
+Only names trustworthy enough to be a company get a new one (configured
+target companies, or names that come with a domain); names a scraper
+guessed from a headline are looked up but never create a company. The
+index is refreshed incrementally, loading only aliases changed since the
+last refresh.
+"""
+
+import asyncio
+import re
+import time
+import unicodedata
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+import structlog
+
+from .models import Signal
+from .db.companies import load_company_aliases, resolve_company
+
+log = structlog.get_logger()
+
+AliasKey = tuple[str, str]  # (kind, alias): ("name", "acme") or ("domain", "acme.com")
+
+# Trailing words that say what kind of legal entity a company is, not which
+LEGAL_SUFFIXES = frozenset({
+    "inc", "incorporated", "llc", "llp", "lp", "ltd", "limited", "corp",
+    "corporation", "co", "company", "plc", "gmbh", "ag", "sa", "sas", "sarl",
+    "srl", "spa", "bv", "nv", "oy", "ab", "as", "aps", "pty", "pte", "kk",
+})
+
+# Second-level labels under which countries register domains (acme.co.uk)
+SECOND_LEVEL_LABELS = frozenset({"co", "com", "net", "org", "gov", "ac", "edu", "ltd", "plc"})
+
+# Hosts that hand out subdomains to unrelated customers (acme.github.io)
+SHARED_HOSTS = frozenset({
+    "github.io", "gitlab.io", "herokuapp.com", "vercel.app", "netlify.app",
+    "pages.dev", "webflow.io", "notion.site", "substack.com", "medium.com",
+    "blogspot.com", "wordpress.com", "myshopify.com",
+})
+
+# Incremental refreshes re-read this far back, for transactions that
+# committed after a refresh but stamped their rows before it
+REFRESH_OVERLAP = timedelta(minutes=1)
+# Full reloads drop aliases and companies deleted since
+FULL_RELOAD_SECONDS = 24 * 3600
+CREATE_RETRY_SECONDS = 300
+
+_DOTTED_INITIAL_RE = re.compile(r"\b([a-z0-9])\.(?=[a-z0-9]\b)")
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+_DOMAIN_LIKE_RE = re.compile(r"^[a-z0-9-]+(\.[a-z0-9-]+)+$")
+
+
+def normalize_company(name: str) -> str:
+    """
+    Alias key of a company name: "The Acme Co., Ltd." -> "acme",
+    "Procter & Gamble" -> "procter and gamble". Empty if nothing is left.
+    """
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(c for c in text if not unicodedata.combining(c)).casefold()
+    text = text.replace("&", " and ").replace("'", "").replace("’", "")
+    # "L.L.C." and "U.S." are one word, not several initials
+    text = _DOTTED_INITIAL_RE.sub(r"\1", text)
+    words = _NON_WORD_RE.sub(" ", text).split()
+
+    if len(words) > 1 and words[0] == "the":
+        words = words[1:]
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def normalize_domain(value: str) -> str:
+    """
+    Registrable domain of a URL or host: "https://www.blog.acme.co.uk/x" ->
+    "acme.co.uk". Empty if value isn't a domain.
+    """
+    value = value.strip().lower()
+    if not value:
+        return ""
+    host = urlsplit(value if "//" in value else f"//{value}").hostname or ""
+    host = host.rstrip(".")
+    labels = host.split(".")
+    if len(labels) < 2 or not all(labels) or labels[-1].isdigit():
+        return ""
+
+    keep = 2
+    if len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL_LABELS:
+        keep = 3
+    if ".".join(labels[-2:]) in SHARED_HOSTS:
+        keep = 3
+    return ".".join(labels[-keep:]) if len(labels) >= keep else ""
+
+
+# Fallbacks scrapers use when they can't tell the company; never entities
+GENERIC_NAMES = frozenset(
+    normalize_company(name) for name in ("Startup", "Tech Company", "Tech Industry", "Unknown")
+)
+
+
+def alias_keys(name: str | None, domain: str | None = None) -> list[AliasKey]:
+    """Alias keys for a company, strongest (domain) first."""
+    keys: list[AliasKey] = []
+    if domain and (host := normalize_domain(domain)):
+        keys.append(("domain", host))
+
+    name = (name or "").strip()
+    # "Booking.com" names the company by its domain
+    if _DOMAIN_LIKE_RE.match(name.lower()) and (host := normalize_domain(name)):
+        keys.append(("domain", host))
+    key = normalize_company(name)
+    if key and key not in GENERIC_NAMES:
+        keys.append(("name", key))
+    return list(dict.fromkeys(keys))
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyRef:
+    """A canonical company."""
+    id: str
+    name: str
+    domain: str | None = None
+
+
+class CompanyIndex:
+    """
+    In-memory alias -> company table. Lookups never touch the database;
+    refresh() and resolve() do, off the event loop.
+    """
+
+    def __init__(self):
+        self._aliases: dict[AliasKey, str] = {}
+        self._companies: dict[str, CompanyRef] = {}
+        self._cursor: datetime | None = None  # Newest alias updated_at loaded
+        self._refreshed_at = 0.0
+        self._reloaded_at = 0.0
+        self._refresh_lock: asyncio.Lock | None = None
+        # Creating companies stops for a while after a failure (e.g. the
+        # migration isn't applied yet) instead of failing once per signal
+        self._create_paused_until = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.resolved = 0  # Misses the database resolved (found or created)
+
+    def __len__(self) -> int:
+        return len(self._companies)
+
+    def add(self, company: CompanyRef, keys: list[AliasKey]):
+        """Point alias keys at a company. A key keeps the company it had."""
+        self._companies[company.id] = company
+        for key in keys:
+            self._aliases.setdefault(key, company.id)
+
+    def load(self, rows: list[dict]):
+        """Apply alias rows ({kind, alias, company_id, updated_at, companies})."""
+        for row in rows:
+            company = row.get("companies") or {}
+            self._companies[row["company_id"]] = CompanyRef(
+                id=row["company_id"], name=company.get("name") or row["alias"], domain=company.get("domain")
+            )
+            # Rows win over what resolve() cached: aliases can be repointed (merges)
+            self._aliases[(row["kind"], row["alias"])] = row["company_id"]
+            updated_at = datetime.fromisoformat(row["updated_at"])
+            if self._cursor is None or updated_at > self._cursor:
+                self._cursor = updated_at
+
+    def lookup(self, name: str | None, domain: str | None = None) -> CompanyRef | None:
+        """The company a name or domain is known to belong to, if any."""
+        return self._find(alias_keys(name, domain))
+
+    def _find(self, keys: list[AliasKey]) -> CompanyRef | None:
+        for key in keys:
+            company_id = self._aliases.get(key)
+            if company_id is not None:
+                return self._companies.get(company_id)
+        return None
+
+    def canonicalize(self, signal: Signal) -> Signal:
+        """Point a signal at its company if the index knows it. Updates it in place."""
+        company = self.lookup(signal.company_name, signal.company_domain)
+        if company is not None:
+            self.apply(signal, company)
+        return signal
+
+    @staticmethod
+    def apply(signal: Signal, company: CompanyRef):
+        if signal.company_name != company.name:
+            signal.metadata = {**signal.metadata, "company_alias": signal.company_name}
+            signal.company_name = company.name
+        signal.company_domain = signal.company_domain or company.domain
+        signal.company_id = company.id
+
+    async def refresh(self, max_age: float = 300):
+        """Load aliases changed since the last refresh, if it's older than max_age seconds."""
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            now = time.monotonic()
+            if self._refreshed_at and now - self._refreshed_at < max_age:
+                return
+
+            full = not self._reloaded_at or now - self._reloaded_at >= FULL_RELOAD_SECONDS
+            since = None if full else self._cursor and self._cursor - REFRESH_OVERLAP
+            rows = await asyncio.to_thread(load_company_aliases, since)
+            if rows is None:
+                # Keep serving what we have; try again next time
+                return
+            if full:
+                self._aliases.clear()
+                self._companies.clear()
+                self._cursor = None
+                self._reloaded_at = now
+            self.load(rows)
+            self._refreshed_at = now
+            log.info("company_index_refreshed", full=full, aliases=len(rows), companies=len(self._companies))
+
+    async def resolve(self, name: str | None, domain: str | None = None, create: bool = True) -> CompanyRef | None:
+        """
+        The company a name or domain belongs to, creating it if no alias is
+        known yet and `create` is set. None for generic or unknown names, or
+        while creating is failing.
+        """
+        keys = alias_keys(name, domain)
+        if not keys:
+            return None
+        company = self._find(keys)
+        if company is not None:
+            self.hits += 1
+            return company
+
+        self.misses += 1
+        if not create or time.monotonic() < self._create_paused_until:
+            return None
+        host = next((alias for kind, alias in keys if kind == "domain"), None)
+        row = await asyncio.to_thread(
+            resolve_company,
+            (name or "").strip() or host,
+            host,
+            [{"kind": kind, "alias": alias} for kind, alias in keys],
+        )
+        if row is None:
+            self._create_paused_until = time.monotonic() + CREATE_RETRY_SECONDS
+            return None
+
+        company = CompanyRef(id=row["id"], name=row["name"], domain=row.get("domain"))
+        self.add(company, keys)
+        self.resolved += 1
+        return company
+
+    def snapshot(self) -> dict:
+        return {
+            "companies": len(self._companies),
+            "aliases": len(self._aliases),
+            "hits": self.hits,
+            "misses": self.misses,
+            "resolved": self.resolved,
+            "cursor": self._cursor.isoformat() if self._cursor else None,
+        }
+
+
+_index: CompanyIndex | None = None
+
+
+def get_company_index() -> CompanyIndex:
+    """Process-wide company index, empty until first refreshed."""
+    global _index
+    if _index is None:
+        _index = CompanyIndex()
+    return _index
@@ -0,0 +1,131 @@
+"""
+Incremental RSS / Atom feed parsing shared by the feed scrapers.
+
+Feeds are read with iterparse, one item at a time, and parsing stops as
+soon as the caller has enough items or reaches the newest item it already
+processed, so the rest of the document is never built. RSS 2.0, RSS 1.0
+(RDF) and Atom entries are normalised into the same compact FeedItem.
+"""
+
+import io
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from html import unescape
+from typing import Iterator
+import structlog
+
+log = structlog.get_logger()
+
+ITEM_TAGS = {"item", "entry"}
+SUMMARY_TAGS = ("description", "summary", "content", "encoded")
+PUBLISHED_TAGS = ("pubDate", "published", "updated", "date")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@dataclass(slots=True)
+class FeedItem:
+    """One feed entry, whatever the feed format."""
+    title: str
+    link: str
+    summary: str = ""  # Plain text, markup stripped
+    published: str | None = None  # As given by the feed
+    source: str | None = None  # RSS <source>, e.g. the publisher on Google News
+    guid: str | None = None
+
+    @property
+    def key(self) -> str:
+        """Stable identity of the item within its feed."""
+        return self.guid or self.link
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _text(value: str | None) -> str:
+    # Feeds often escape HTML twice, so unescape what ElementTree left over
+    return _SPACE_RE.sub(" ", unescape(value or "")).strip()
+
+
+def _plain(value: str | None) -> str:
+    return _text(_TAG_RE.sub(" ", unescape(value or "")))
+
+
+def _atom_link(element: ET.Element) -> str:
+    href = element.get("href")
+    rel = element.get("rel", "alternate")
+    return href if href and rel == "alternate" else ""
+
+
+def _item(element: ET.Element) -> FeedItem:
+    fields: dict[str, str] = {}
+    link = ""
+    for child in element:
+        name = _local(child.tag)
+        if name == "link":
+            # RSS puts the URL in the text, Atom in href (one per rel)
+            link = link or (child.text or "").strip() or _atom_link(child)
+        elif name not in fields:
+            fields[name] = child.text or ""
+
+    summary = next((fields[tag] for tag in SUMMARY_TAGS if fields.get(tag)), "")
+    published = next((fields[tag].strip() for tag in PUBLISHED_TAGS if fields.get(tag)), None)
+    guid = (fields.get("guid") or fields.get("id") or "").strip() or None
+    if not link and guid and guid.startswith("http"):
+        link = guid
+
+    return FeedItem(
+        title=_text(fields.get("title")),
+        link=link,
+        summary=_plain(summary),
+        published=published,
+        source=_text(fields["source"]) if fields.get("source") else None,
+        guid=guid,
+    )
+
+
+@dataclass(slots=True)
+class FeedPage:
+    """Items read from a feed, and whether reading stopped at a seen item."""
+    items: list[FeedItem]
+    caught_up: bool = False
+
+
+def iter_feed(content: bytes) -> Iterator[FeedItem]:
+    """
+    Yield a feed's items in document order, parsing only as far as the
+    caller reads. A malformed document yields the items before the error.
+    """
+    count = 0
+    try:
+        for _, element in ET.iterparse(io.BytesIO(content), events=("end",)):
+            if _local(element.tag) not in ITEM_TAGS:
+                continue
+            item = _item(element)
+            # Items are done with once read; don't keep them in the tree
+            element.clear()
+            yield item
+            count += 1
+    except ET.ParseError as e:
+        log.warning("feed_parse_failed", error=str(e), items=count)
+
+
+def parse_feed(content: bytes, limit: int | None = None, stop_at: str | None = None) -> FeedPage:
+    """
+    Read at most `limit` items, stopping before the item whose key is
+    `stop_at` (the newest one processed last time).
+    """
+    page = FeedPage(items=[])
+    if limit is not None and limit <= 0:
+        return page
+    for item in iter_feed(content):
+        if stop_at is not None and item.key == stop_at:
+            page.caught_up = True
+            break
+        page.items.append(item)
+        if limit is not None and len(page.items) >= limit:
+            break
+    return page
@@ -2,7 +2,7 @@ import json
 import threading
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Optional
 import structlog
 
 log = structlog.get_logger()
@@ -16,6 +16,9 @@ _health_state = {
     "error_count": 0,
 }
 
+# Extra sections for /health output, e.g. scheduler jobs
+_health_providers: dict[str, Callable[[], dict]] = {}
+
 
 def update_health(success: bool, scrape_count: int = 0):
     """Update health state after a scrape cycle."""
@@ -34,6 +37,11 @@ def set_status(status: str):
     _health_state["status"] = status
 
 
+def register_health_provider(name: str, provider: Callable[[], dict]):
+    """Add a named section to /health output, computed on each request."""
+    _health_providers[name] = provider
+
+
 class HealthHandler(BaseHTTPRequestHandler):
     """HTTP handler for health check requests."""
 
@@ -67,6 +75,11 @@ class HealthHandler(BaseHTTPRequestHandler):
             "error_count": _health_state["error_count"],
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
+        for name, provider in _health_providers.items():
+            try:
+                response[name] = provider()
+            except Exception as e:
+                response[name] = {"error": str(e)}
 
         self.send_response(http_code)
         self.send_header("Content-Type", "application/json")
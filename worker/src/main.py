@@ -1,11 +1,36 @@
 import asyncio
-import schedule
-import time
+import math
+import os
+import signal
+import socket
+from contextlib import suppress
+from dataclasses import dataclass
 import structlog
 import sentry_sdk
 from .config import get_settings
-from .health import HealthServer, update_health, set_status
+from .health import HealthServer, update_health, set_status, register_health_provider
+from .scheduler import Scheduler
+from .cadence import get_cadence
+from .cache import get_result_cache
+from .parsing import get_parse_executor
+from .entities import get_company_index
 from .sentry_setup import init_sentry
+from .pipeline import SignalPipeline, PipelineStats
+from .progress import ProgressReporter
+from .task_queue import TaskWorker
+from .net import (
+    close_http_clients,
+    get_validator_cache,
+    get_rate_limiter,
+    get_concurrency_limiter,
+    get_breakers,
+    singleflight_snapshot,
+    get_cassette,
+    get_proxy_pool,
+    get_robots_cache,
+    get_download_stats,
+)
+from .scrapers.base import BaseScraper
 from .scrapers.news import TechCrunchScraper
 from .scrapers.jobs import JobBoardScraper
 from .scrapers.company import CompanyWebsiteScraper
@@ -18,14 +43,15 @@ from .scrapers.producthunt import ProductHuntScraper
 from .scrapers.reddit import RedditScraper
 from .scrapers.globenewswire import GlobeNewswireScraper
 from .db.supabase import (
-    insert_signal,
-    get_merged_target_companies,
-    get_merged_signal_keywords,
-    get_enabled_sources,
+    get_config_snapshot,
+    ConfigSnapshot,
     get_pending_scrape_run,
+    get_scrape_run_statuses,
     create_scrape_run,
     update_scrape_run,
+    ScrapeRun,
 )
+from .db.tasks import enqueue_scrape_tasks, claim_pending_scrape_run
 
 structlog.configure(
     processors=[
@@ -42,187 +68,348 @@ SYSTEM_USER_ID = None  # NULL = shared signal visible to all users
 ESTIMATED_TIME_PER_SOURCE = 30
 
 
-async def run_scrapers(run_id: str | None = None, user_id: str | None = None):
-    """Run all scrapers, enrich with AI, and store results."""
-    settings = get_settings()
+@dataclass
+class ActiveCycle:
+    """An in-process scrape that pending runs can be coalesced into."""
+    run_id: str | None
+    user_id: str | None
+    pipeline: SignalPipeline
+    reporter: ProgressReporter
 
-    # Get configuration from database
-    target_companies = get_merged_target_companies()
-    signal_keywords = get_merged_signal_keywords()
-    enabled_sources = get_enabled_sources()
 
-    log.info(
-        "scrape_cycle_start",
-        ai_enabled=settings.ai_enabled,
-        target_companies=len(target_companies),
-        enabled_sources=enabled_sources,
-        run_id=run_id,
-    )
+# Cycles currently scraping in this process
+_active_cycles: list[ActiveCycle] = []
+
+
+async def load_scraper_config() -> ConfigSnapshot:
+    """Cached merged config (blocking client, so off the loop)."""
+    return await asyncio.to_thread(get_config_snapshot)
+
 
-    # Build list of scrapers based on enabled sources
+def create_scrapers(config: ConfigSnapshot) -> list[BaseScraper]:
+    """Build the list of scrapers based on enabled sources."""
+    target_companies = list(config.target_companies)
+    signal_keywords = list(config.signal_keywords)
+    # Precomputed lowercase sets, so scrapers don't re-normalize per cycle
+    companies = config.normalized_companies or None
+    keywords = config.normalized_keywords or None
+    enabled_sources = config.enabled_sources
     scrapers = []
 
     # Original sources (configurable)
     if enabled_sources.get("techcrunch", True):
         scrapers.append(TechCrunchScraper())
     if enabled_sources.get("indeed", True):
-        scrapers.append(JobBoardScraper(target_companies=target_companies, signal_keywords=signal_keywords))
+        scrapers.append(JobBoardScraper(
+            target_companies=target_companies,
+            signal_keywords=signal_keywords,
+            normalized_keywords=keywords,
+        ))
     if enabled_sources.get("company", True):
         scrapers.append(CompanyWebsiteScraper(target_companies=target_companies))
     if enabled_sources.get("linkedin", False):
-        scrapers.append(LinkedInScraper(target_companies=target_companies, signal_keywords=signal_keywords))
+        scrapers.append(LinkedInScraper(
+            target_companies=target_companies,
+            signal_keywords=signal_keywords,
+            normalized_keywords=keywords,
+        ))
 
     # New sources - always enabled (free, no API keys needed)
-    scrapers.append(HackerNewsScraper(target_companies=target_companies))
+    scrapers.append(HackerNewsScraper(target_companies=target_companies, normalized_companies=companies))
     scrapers.append(GoogleNewsScraper(target_companies=target_companies))
-    scrapers.append(PRNewswireScraper(target_companies=target_companies))
-    scrapers.append(TechBlogsScraper(target_companies=target_companies))
-    scrapers.append(ProductHuntScraper(target_companies=target_companies))
-    scrapers.append(RedditScraper(target_companies=target_companies))
-    scrapers.append(GlobeNewswireScraper(target_companies=target_companies))
+    scrapers.append(PRNewswireScraper(target_companies=target_companies, normalized_companies=companies))
+    scrapers.append(TechBlogsScraper(target_companies=target_companies, normalized_companies=companies))
+    scrapers.append(ProductHuntScraper(target_companies=target_companies, normalized_companies=companies))
+    scrapers.append(RedditScraper(target_companies=target_companies, normalized_companies=companies))
+    scrapers.append(GlobeNewswireScraper(target_companies=target_companies, normalized_companies=companies))
 
-    if not scrapers:
-        log.warning("no_scrapers_enabled")
-        if run_id:
-            update_scrape_run(run_id, status="completed", total_signals=0)
-        return
+    cadence = get_cadence()
+    for scraper in scrapers:
+        cadence.register(scraper.name, *scraper.interval_bounds())
+    return scrapers
+
+
+async def build_scrapers() -> list[BaseScraper]:
+    """Load the current config and build scrapers from it."""
+    return create_scrapers(await load_scraper_config())
+
+
+def select_due(scrapers: list[BaseScraper]) -> list[BaseScraper]:
+    """Scrapers whose adaptive cadence says they are due."""
+    cadence = get_cadence()
+    enabled_names = {scraper.name for scraper in scrapers}
+    # Sources disabled since they were last polled shouldn't stay due forever
+    for name in cadence.due_sources() - enabled_names:
+        cadence.defer(name)
+    due = [scraper for scraper in scrapers if cadence.is_due(scraper.name)]
+    log.info("due_sources", sources=[scraper.name for scraper in due])
+    return due
 
-    # Estimate total duration
-    estimated_duration = len(scrapers) * ESTIMATED_TIME_PER_SOURCE
-    if run_id:
-        update_scrape_run(run_id, estimated_duration_seconds=estimated_duration)
 
-    total_signals = 0
-    enriched_signals = 0
-    signals_by_source: dict[str, int] = {}
-    progress: dict[str, dict] = {}
+async def enqueue_run(run_id: str, scrapers: list[BaseScraper], user_id: str | None = None):
+    """Queue every unit of the given scrapers as leased tasks for any replica."""
+    settings = get_settings()
+    tasks = []
+    for scraper in scrapers:
+        # Whichever replica leases a unit needs this run's cache allowance
+        max_age = scraper.cache_max_age()
+        max_staleness = None if max_age is None else int(max_age)
+        tasks.extend((scraper.name, unit, max_staleness) for unit in scraper.units())
+    queued = await asyncio.to_thread(
+        enqueue_scrape_tasks, run_id, tasks, user_id, settings.task_max_attempts
+    )
+    # Not due again until the tasks have run and reported their yield
+    cadence = get_cadence()
+    for scraper in scrapers:
+        cadence.defer(scraper.name)
+    log.info("scrape_tasks_enqueued", run_id=run_id, units=len(tasks), queued=queued)
+
 
-    # Initialize progress for all scrapers
+async def watch_cancellation(cycle: ActiveCycle):
+    """
+    Poll the cycle's runs for cancellation from the UI. A cancelled run that
+    was coalesced into the cycle is detached; once every run is cancelled the
+    pipeline stops scraping and finishes with what it already parsed.
+    """
+    interval = get_settings().cancel_poll_seconds
+    while True:
+        await asyncio.sleep(interval)
+        run_ids = list(cycle.reporter.run_ids)
+        if not run_ids:
+            return
+        statuses = await asyncio.to_thread(get_scrape_run_statuses, run_ids)
+        cancelled = [run_id for run_id in run_ids if statuses.get(run_id) == "cancelled"]
+        if not cancelled:
+            continue
+
+        if len(cancelled) == len(run_ids):
+            log.info("scrape_run_cancelled", run_ids=cancelled)
+            cycle.pipeline.cancel("run_cancelled")
+            return
+
+        for run_id in cancelled:
+            cycle.reporter.detach(run_id)
+            await asyncio.to_thread(update_scrape_run, run_id, status="cancelled")
+        log.info("coalesced_runs_cancelled", run_ids=cancelled, cycle_run_id=cycle.run_id)
+
+
+def manual_run_staleness(run: ScrapeRun) -> float:
+    """How stale cached results a manual run accepts (source TTLs still cap it)."""
+    if run.max_staleness_seconds is None:
+        return math.inf
+    return run.max_staleness_seconds
+
+
+async def run_scrapers(
+    run_id: str | None = None,
+    user_id: str | None = None,
+    due_only: bool = False,
+    max_staleness_seconds: float | None = None,
+):
+    """
+    Run scrapers, enrich with AI, and store results.
+    With due_only, only sources whose adaptive cadence says they are due run.
+    With max_staleness_seconds, units fetched recently enough are served from
+    the result cache instead of the network.
+    """
+    settings = get_settings()
+    config = await load_scraper_config()
+
+    log.info(
+        "scrape_cycle_start",
+        ai_enabled=settings.ai_enabled,
+        target_companies=len(config.target_companies),
+        enabled_sources=dict(config.enabled_sources),
+        run_id=run_id,
+    )
+
+    scrapers = create_scrapers(config)
+    if due_only:
+        scrapers = select_due(scrapers)
     for scraper in scrapers:
-        progress[scraper.name] = {"status": "pending", "signals": 0}
+        scraper.max_staleness_seconds = max_staleness_seconds
+
+    if settings.task_queue_enabled and run_id:
+        await enqueue_run(run_id, scrapers, user_id=user_id)
+        return
+
+    # Progress writes are buffered and flushed at most every few seconds
+    reporter = ProgressReporter(run_id)
+
+    if not scrapers:
+        log.warning("no_scrapers_enabled")
+        await reporter.close(status="completed", total_signals=0)
+        return
 
-    if run_id:
-        update_scrape_run(run_id, progress=progress)
+    # Estimate total duration (scrapers run in waves of scraper_concurrency)
+    waves = -(-len(scrapers) // max(1, settings.scraper_concurrency))
+    estimated_duration = waves * ESTIMATED_TIME_PER_SOURCE
+    reporter.update(estimated_duration_seconds=estimated_duration)
+
+    def report_progress(stats: PipelineStats):
+        reporter.update(
+            progress=stats.progress,
+            total_signals=stats.total_signals,
+            signals_by_source=stats.signals_by_source,
+            ai_enriched_count=stats.ai_enriched,
+        )
+
+    # Insert with user_id if this was a user-triggered scrape
+    pipeline = SignalPipeline(scrapers, user_id=user_id or SYSTEM_USER_ID, on_progress=report_progress)
 
     # Add Sentry context for this scraper run
     with sentry_sdk.configure_scope() as scope:
         scope.set_context("scraper_run", {
             "ai_enabled": settings.ai_enabled,
             "model": settings.openai_model,
-            "target_companies": target_companies[:10],  # First 10 for context
-            "enabled_sources": enabled_sources,
+            "target_companies": list(config.target_companies[:10]),  # First 10 for context
+            "enabled_sources": dict(config.enabled_sources),
         })
 
-        for scraper in scrapers:
-            # Update progress to running
-            progress[scraper.name]["status"] = "running"
-            if run_id:
-                update_scrape_run(run_id, progress=progress)
-
-            try:
-                signals = await scraper.scrape()
-                scraper_count = 0
-
-                for signal in signals:
-                    # Enrich with AI before inserting
-                    enriched_signal = scraper.enrich_signal(signal)
-
-                    if enriched_signal.metadata.get('ai_enriched'):
-                        enriched_signals += 1
-
-                    # Insert with user_id if this was a user-triggered scrape
-                    result = insert_signal(enriched_signal, user_id or SYSTEM_USER_ID)
-                    if result:
-                        total_signals += 1
-                        scraper_count += 1
-
-                signals_by_source[scraper.name] = scraper_count
-                progress[scraper.name] = {"status": "completed", "signals": scraper_count}
-
-            except Exception as e:
-                sentry_sdk.capture_exception(e)
-                log.error("scraper_failed", scraper=scraper.name, error=str(e))
-                signals_by_source[scraper.name] = 0
-                progress[scraper.name] = {"status": "failed", "signals": 0, "error": str(e)}
-
-            # Update progress after each scraper
-            if run_id:
-                update_scrape_run(
-                    run_id,
-                    progress=progress,
-                    total_signals=total_signals,
-                    signals_by_source=signals_by_source,
-                    ai_enriched_count=enriched_signals,
-                )
+        cycle = ActiveCycle(run_id=run_id, user_id=user_id, pipeline=pipeline, reporter=reporter)
+        _active_cycles.append(cycle)
+        watcher = asyncio.create_task(watch_cancellation(cycle)) if run_id else None
+        try:
+            stats = await pipeline.run()
+        except asyncio.CancelledError:
+            # Worker shutting down (Scheduler.stop): close every mirrored run
+            # too, or they'd be left "running"
+            log.warning("scrape_cycle_cancelled", run_id=run_id)
+            await reporter.close(status="cancelled", error_message="Worker shut down during the run")
+            raise
+        except Exception as e:
+            # Fail every run mirrored from this cycle, not just our own
+            await reporter.close(status="failed", error_message=str(e))
+            raise
+        finally:
+            _active_cycles.remove(cycle)
+            if watcher:
+                watcher.cancel()
+                with suppress(asyncio.CancelledError):
+                    await watcher
+
+    # Adaptive per-host concurrency as it stands after this cycle
+    host_limits = get_concurrency_limiter().limits()
+
+    # Adapt each source's polling interval to how many new signals it yielded
+    cadence = get_cadence()
+    for scraper in scrapers:
+        cadence.record(scraper.name, stats.signals_by_source.get(scraper.name, 0))
 
     log.info(
         "scrape_cycle_complete",
-        total_signals=total_signals,
-        ai_enriched=enriched_signals,
-        by_source=signals_by_source
+        total_signals=stats.total_signals,
+        ai_enriched=stats.ai_enriched,
+        duplicates=stats.duplicates,
+        first_signal_seconds=stats.first_signal_seconds,
+        by_source=stats.signals_by_source,
+        cut_short=stats.cut_short,
+        host_concurrency=host_limits,
+        bytes_by_source=stats.bytes_by_source,
     )
 
-    # Mark run as completed
-    if run_id:
-        update_scrape_run(
-            run_id,
-            status="completed",
-            progress=progress,
-            total_signals=total_signals,
-            signals_by_source=signals_by_source,
-            ai_enriched_count=enriched_signals,
-        )
+    # Mark run as completed (or cancelled), keeping whatever was scraped
+    await reporter.close(
+        status="cancelled" if stats.cancelled else "completed",
+        progress=stats.progress,
+        total_signals=stats.total_signals,
+        signals_by_source=stats.signals_by_source,
+        ai_enriched_count=stats.ai_enriched,
+        error_details={"cut_short": stats.cut_short} if stats.cut_short else None,
+        stats={"host_concurrency": host_limits, "bytes_by_source": stats.bytes_by_source},
+    )
 
     # Update health status
-    update_health(success=True, scrape_count=total_signals)
+    update_health(success=True, scrape_count=stats.total_signals)
 
 
-def job():
-    """Wrapper to run async scrapers from sync scheduler."""
-    # Check for pending manual scrape runs
-    pending_run = get_pending_scrape_run()
-    if pending_run:
-        log.info("processing_pending_run", run_id=pending_run.id, user_id=pending_run.user_id)
-        # Update to running
-        update_scrape_run(pending_run.id, status="running")
-        try:
-            asyncio.run(run_scrapers(run_id=pending_run.id, user_id=pending_run.user_id))
-        except Exception as e:
-            log.error("pending_run_failed", run_id=pending_run.id, error=str(e))
-            update_scrape_run(pending_run.id, status="failed", error_message=str(e))
-            update_health(success=False, scrape_count=0)
+async def coalesce_pending_run(pending_run: ScrapeRun) -> bool:
+    """
+    Attach a pending run to a cycle already scraping in this process.
+
+    The run mirrors the cycle's progress, and only sources or units the
+    cycle doesn't cover are added to it, so repeated "scrape now" clicks
+    don't refetch everything. Shared cycles (no user) can absorb any run
+    since their signals are visible to every user.
+    """
+    cycles = [c for c in _active_cycles if c.user_id in (None, pending_run.user_id)]
+    if not cycles:
+        return False
+
+    scrapers = await build_scrapers()
+    for scraper in scrapers:
+        scraper.max_staleness_seconds = manual_run_staleness(pending_run)
+    for cycle in cycles:
+        joined = cycle.pipeline.add_scrapers(scrapers)
+        if joined is None:
+            # Finished scraping while we were loading config
+            continue
+        cycle.reporter.attach(pending_run.id)
+        log.info(
+            "pending_run_coalesced",
+            run_id=pending_run.id,
+            cycle_run_id=cycle.run_id,
+            added_sources=joined,
+        )
+        return True
+    return False
+
+
+async def run_pending_run(pending_run: ScrapeRun):
+    """Process a scrape run triggered manually from the UI."""
+    log.info("processing_pending_run", run_id=pending_run.id, user_id=pending_run.user_id)
+    # Update to running (a claimed run already is)
+    if pending_run.status != "running":
+        await asyncio.to_thread(update_scrape_run, pending_run.id, status="running")
+
+    try:
+        if await coalesce_pending_run(pending_run):
+            return
+        await run_scrapers(
+            run_id=pending_run.id,
+            user_id=pending_run.user_id,
+            max_staleness_seconds=manual_run_staleness(pending_run),
+        )
+    except Exception as e:
+        log.error("pending_run_failed", run_id=pending_run.id, error=str(e))
+        await asyncio.to_thread(update_scrape_run, pending_run.id, status="failed", error_message=str(e))
+        update_health(success=False, scrape_count=0)
+
+
+async def scheduled_cycle():
+    """Regular scheduled scrape of the sources that are currently due."""
+    cadence = get_cadence()
+    # Nothing registered yet means the first cycle, which runs everything
+    if cadence.sources and not cadence.due_sources():
         return
 
-    # Regular scheduled scrape
-    run_id = create_scrape_run()
+    run_id = await asyncio.to_thread(create_scrape_run)
     try:
-        asyncio.run(run_scrapers(run_id=run_id))
+        await run_scrapers(run_id=run_id, due_only=True)
     except Exception as e:
         log.error("scrape_cycle_failed", error=str(e))
         if run_id:
-            update_scrape_run(run_id, status="failed", error_message=str(e))
+            await asyncio.to_thread(update_scrape_run, run_id, status="failed", error_message=str(e))
         update_health(success=False, scrape_count=0)
         raise
 
 
-def check_pending_runs():
+async def check_pending_runs():
     """Check for pending runs more frequently than full scrapes."""
-    pending_run = get_pending_scrape_run()
-    if pending_run:
+    # With several replicas, claim runs atomically so each is processed once
+    fetch = claim_pending_scrape_run if get_settings().task_queue_enabled else get_pending_scrape_run
+    while pending_run := await asyncio.to_thread(fetch):
         log.info("found_pending_run", run_id=pending_run.id)
-        job()
+        await run_pending_run(pending_run)
 
 
-def main():
-    # Initialize Sentry before any operations
-    init_sentry()
-
+async def run_worker():
+    """Run all jobs on one long-lived event loop until SIGTERM/SIGINT."""
     settings = get_settings()
     linkedin_enabled = bool(settings.bright_data_api_token)
 
     # Get initial config info
-    target_companies = get_merged_target_companies()
-    enabled_sources = get_enabled_sources()
+    config = await load_scraper_config()
 
     log.info(
         "worker_starting",
@@ -230,8 +417,8 @@ def main():
         ai_enabled=settings.ai_enabled,
         model=settings.openai_model,
         linkedin_enabled=linkedin_enabled,
-        target_companies_count=len(target_companies),
-        enabled_sources=enabled_sources,
+        target_companies_count=len(config.target_companies),
+        enabled_sources=dict(config.enabled_sources),
     )
 
     # Start health check server
@@ -239,18 +426,81 @@ def main():
     health_server.start()
     set_status("healthy")
 
-    # Run immediately on start
-    job()
+    scheduler = Scheduler()
+    register_health_provider("jobs", scheduler.snapshot)
+
+    register_health_provider("sources", get_cadence().snapshot)
+    register_health_provider("result_cache", get_result_cache().snapshot)
+    register_health_provider("http_validators", get_validator_cache().snapshot)
+    register_health_provider("rate_limits", get_rate_limiter().snapshot)
+    register_health_provider("host_concurrency", get_concurrency_limiter().snapshot)
+    register_health_provider("circuit_breakers", get_breakers().snapshot)
+    register_health_provider("singleflight", singleflight_snapshot)
+    register_health_provider("robots", get_robots_cache().snapshot)
+    register_health_provider("downloads", get_download_stats().snapshot)
+    register_health_provider("parsing", get_parse_executor().snapshot)
+    if settings.entity_resolution_enabled:
+        register_health_provider("companies", get_company_index().snapshot)
+    if (proxy_pool := get_proxy_pool()) is not None:
+        register_health_provider("proxies", proxy_pool.snapshot)
+    if settings.http_cassette_mode != "off":
+        register_health_provider("cassette", get_cassette().snapshot)
+
+    # Regular runs, starting immediately; each tick scrapes only due sources
+    scheduler.add_job(
+        "scrape_cycle",
+        scheduled_cycle,
+        interval_seconds=settings.cadence_tick_seconds,
+        jitter_seconds=settings.scrape_jitter_seconds,
+        overlap=settings.scrape_overlap_policy,
+        run_immediately=True,
+    )
+    # Check for pending runs more frequently; runs alongside a long cycle
+    scheduler.add_job(
+        "pending_runs",
+        check_pending_runs,
+        interval_seconds=settings.pending_run_poll_seconds,
+        overlap="skip",
+    )
+    # Persist ETag / Last-Modified validators so they survive restarts
+    scheduler.add_job(
+        "http_validators",
+        get_validator_cache().persist,
+        interval_seconds=settings.http_validator_flush_seconds,
+        overlap="skip",
+    )
+    if settings.task_queue_enabled:
+        worker_id = settings.worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        task_worker = TaskWorker(worker_id, build_scrapers)
+        log.info("task_queue_enabled", worker_id=worker_id)
+        # Lease and run queued units, whichever replica enqueued them
+        scheduler.add_job(
+            "scrape_tasks",
+            task_worker.drain,
+            interval_seconds=settings.task_poll_seconds,
+            overlap="skip",
+            run_immediately=True,
+        )
 
-    # Schedule regular runs
-    schedule.every(settings.scrape_interval_minutes).minutes.do(job)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, lambda: asyncio.create_task(scheduler.stop()))
 
-    # Check for pending runs more frequently (every 30 seconds)
-    schedule.every(30).seconds.do(check_pending_runs)
+    # Returns once running cycles have finished, so nothing below pulls
+    # clients or pools out from under them
+    await scheduler.run()
+    await get_validator_cache().persist()
+    await close_http_clients()
+    get_parse_executor().shutdown()
 
-    while True:
-        schedule.run_pending()
-        time.sleep(10)  # Check every 10 seconds for better responsiveness
+    set_status("stopped")
+    health_server.stop()
+
+
+def main():
+    # Initialize Sentry before any operations
+    init_sentry()
+    asyncio.run(run_worker())
 
 
 if __name__ == "__main__":
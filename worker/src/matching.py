@@ -0,0 +1,175 @@
+"""
+Company mentions in scraped text.
+
+Scrapers used to test every target company against every title with a
+substring check, which costs O(companies x title) per item and matches
+"box" inside "Dropbox" or "Xbox". CompanyMatcher compiles all names into
+one Aho-Corasick automaton instead, so a title is scanned once whatever
+the number of companies, and only mentions on word boundaries count.
+
+Matchers are built once per company list (the config snapshot shares one
+tuple across a cycle's scrapers) and cached by get_company_matcher. The
+automaton itself (KeywordAutomaton) also drives the rule classifier.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Collection, Iterable, Iterator, Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class Mention:
+    """One company name found in a text, as text[start:end]."""
+    company: str  # As configured, not as written in the text
+    start: int
+    end: int
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text, keeping every character at its offset."""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # A few characters (e.g. "İ") lengthen when lowercased; keep offsets aligned
+        lowered = "".join(c.lower()[:1] for c in text)
+    return lowered
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over lowercase keywords, which only match on word
+    boundaries. Keywords listed in `prefixes` (by index) may run on into a
+    longer word ("launch" matching "launches").
+    """
+
+    def __init__(self, keywords: Sequence[str], prefixes: Collection[int] = ()):
+        self.keywords = list(keywords)
+        self._lengths = [len(keyword) for keyword in self.keywords]
+        self._prefix = [index in prefixes for index in range(len(self.keywords))]
+
+        # Trie: per node, child transitions, suffix (failure) link, and the
+        # keywords ending there, including those of its suffixes
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for index, keyword in enumerate(self.keywords):
+            node = 0
+            for ch in keyword:
+                next_node = self._goto[node].get(ch)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][ch] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = next_node
+            self._out[node] += (index,)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] += self._out[self._fail[child]]
+                queue.append(child)
+
+        # Transitions including failure-link hops, filled in as texts need them
+        self._delta: list[dict[str, int]] = [dict(row) for row in self._goto]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _step(self, node: int, ch: str) -> int:
+        state = node
+        while state and ch not in self._goto[state]:
+            state = self._fail[state]
+        next_node = self._delta[node][ch] = self._goto[state].get(ch, 0)
+        return next_node
+
+    def scan(self, lowered: str) -> Iterator[tuple[int, int, int]]:
+        """(keyword index, start, end) of each keyword in fold_case()d text."""
+        delta, out, lengths, prefix = self._delta, self._out, self._lengths, self._prefix
+        node = 0
+        for i, ch in enumerate(lowered):
+            next_node = delta[node].get(ch)
+            node = self._step(node, ch) if next_node is None else next_node
+            if out[node]:
+                for index in out[node]:
+                    start = i + 1 - lengths[index]
+                    if _bounded(lowered, start, i + 1, prefix[index]):
+                        yield index, start, i + 1
+
+
+def _bounded(text: str, start: int, end: int, prefix: bool = False) -> bool:
+    """Whether text[start:end] doesn't continue a word on either side."""
+    # Keywords starting or ending in punctuation ("C3.ai", "X (Twitter)")
+    # only need the boundary where they have a word character
+    if text[start].isalnum() and start > 0 and text[start - 1].isalnum():
+        return False
+    if not prefix and text[end - 1].isalnum() and end < len(text) and text[end].isalnum():
+        return False
+    return True
+
+
+class CompanyMatcher:
+    """Company names, matched case-insensitively as whole words."""
+
+    def __init__(self, companies: Iterable[str]):
+        # Lowercased name -> first spelling seen
+        names: dict[str, str] = {}
+        for company in companies:
+            name = company.strip()
+            if name:
+                names.setdefault(fold_case(name), name)
+        self.companies = list(names.values())
+        self._automaton = KeywordAutomaton(list(names))
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+    def __bool__(self) -> bool:
+        return bool(self.companies)
+
+    def matches(self, text: str) -> list[Mention]:
+        """
+        Company mentions in text, left to right. Overlapping mentions
+        resolve to the leftmost, then longest ("Acme Cloud" over "Acme").
+        """
+        if not self.companies or not text:
+            return []
+        found = sorted((start, -end, index) for index, start, end in self._automaton.scan(fold_case(text)))
+
+        mentions = []
+        last_end = 0
+        for start, neg_end, index in found:
+            if start >= last_end:
+                mentions.append(Mention(self.companies[index], start, -neg_end))
+                last_end = -neg_end
+        return mentions
+
+    def first(self, text: str) -> Mention | None:
+        """The leftmost company mention in text, if any."""
+        found = self.matches(text)
+        return found[0] if found else None
+
+    def mentioned(self, text: str) -> list[str]:
+        """Companies mentioned in text, each once, in order of appearance."""
+        return list(dict.fromkeys(mention.company for mention in self.matches(text)))
+
+
+def normalize_terms(terms: Iterable[str]) -> frozenset[str]:
+    """Trimmed, lowercase forms of company names or keywords, blanks dropped."""
+    return frozenset(term.strip().lower() for term in terms if term and term.strip())
+
+
+@lru_cache(maxsize=16)
+def _matcher(companies: tuple[str, ...]) -> CompanyMatcher:
+    return CompanyMatcher(companies)
+
+
+def get_company_matcher(companies: Iterable[str]) -> CompanyMatcher:
+    """Shared matcher for a company list, built the first time it's seen."""
+    return _matcher(tuple(companies))
@@ -15,6 +15,7 @@ Priority = Literal["high", "medium", "low"]
 class Signal(BaseModel):
     company_name: str
     company_domain: str | None = None
+    company_id: str | None = None  # Canonical company (companies table), once resolved
     signal_type: SignalType
     title: str
     summary: str
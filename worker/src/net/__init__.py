@@ -0,0 +1,65 @@
+# Shared HTTP layer for scrapers
+from .client import get_http_client, close_http_clients, singleflight_snapshot, BROWSER_HEADERS
+from .ratelimit import get_rate_limiter
+from .aimd import get_concurrency_limiter
+from .breaker import get_breakers, CircuitOpenError
+from .cassette import get_cassette, CassetteMissError
+from .proxies import get_proxy_pool
+from .budget import (
+    get_limited,
+    request_limited,
+    get_download_stats,
+    download_tally,
+    ResponseBudgetError,
+    SourceDeadline,
+    source_deadline,
+    FetchDeadlineError,
+)
+from .robots import get_robots_cache, RobotsDisallowedError, RESPECT_ROBOTS
+from .validators import (
+    conditional_get,
+    conditional_requests,
+    track_unit_fetch,
+    fail_unit_fetch,
+    commit_unit_fetch,
+    unit_handoff,
+    UnitFetch,
+    feed_cursor,
+    mark_feed_read,
+    get_validator_cache,
+)
+
+__all__ = [
+    "get_http_client",
+    "close_http_clients",
+    "singleflight_snapshot",
+    "BROWSER_HEADERS",
+    "get_rate_limiter",
+    "get_concurrency_limiter",
+    "get_breakers",
+    "CircuitOpenError",
+    "get_cassette",
+    "CassetteMissError",
+    "get_proxy_pool",
+    "get_limited",
+    "request_limited",
+    "get_download_stats",
+    "download_tally",
+    "ResponseBudgetError",
+    "SourceDeadline",
+    "source_deadline",
+    "FetchDeadlineError",
+    "get_robots_cache",
+    "RobotsDisallowedError",
+    "RESPECT_ROBOTS",
+    "conditional_get",
+    "conditional_requests",
+    "track_unit_fetch",
+    "fail_unit_fetch",
+    "commit_unit_fetch",
+    "unit_handoff",
+    "UnitFetch",
+    "feed_cursor",
+    "mark_feed_read",
+    "get_validator_cache",
+]
@@ -0,0 +1,180 @@
+"""
+Adaptive (AIMD) concurrency limits per host.
+
+Each host starts with a small number of requests allowed in flight. Fast,
+successful responses grow the limit additively (about +1 per limit's worth
+of requests); a 429/503 or a latency spike well above the host's usual
+latency halves it. Fast APIs like the HN Firebase endpoint end up with many
+requests in flight, while hosts that push back (Indeed) stay at one or two.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+import structlog
+
+from ..config import get_settings
+
+log = structlog.get_logger()
+
+# (initial, max) requests in flight for hosts with known behaviour; others
+# use AIMD_INITIAL_CONCURRENCY / AIMD_MAX_CONCURRENCY
+DEFAULT_HOST_CONCURRENCY: dict[str, tuple[int, int]] = {
+    "hacker-news.firebaseio.com": (10, 64),
+    "www.indeed.com": (1, 4),
+    "api.brightdata.com": (1, 4),
+}
+
+BACKOFF_STATUSES = {429, 503}
+
+# At most one decrease per this many seconds, so one burst of 429s from
+# requests that were already in flight doesn't collapse the limit to 1
+DECREASE_COOLDOWN_SECONDS = 1.0
+
+# Weight of a latency spike in the host's baseline latency (healthy
+# responses weigh 0.1)
+SPIKE_WEIGHT = 0.02
+
+
+@dataclass
+class AdaptiveLimit:
+    """One host's concurrency limit and the requests waiting on it."""
+    limit: float
+    max_limit: int
+    backoff: float = 0.5
+    latency_factor: float = 3.0
+    in_flight: int = 0
+    baseline_latency: float | None = None
+    decreases: int = 0
+    _last_decrease: float = 0.0
+    _waiters: deque = field(default_factory=deque)
+
+    @property
+    def capacity(self) -> int:
+        return max(1, int(self.limit))
+
+    async def acquire(self):
+        if self.in_flight < self.capacity and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # release() hands the slot over, already counted in in_flight
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def observe(self, status_code: int | None, latency: float):
+        """Adjust the limit after a response (None: the request failed)."""
+        if status_code in BACKOFF_STATUSES:
+            self._decrease("throttled")
+            return
+        if status_code is None or status_code >= 500:
+            return
+
+        baseline = self.baseline_latency
+        if baseline is None:
+            self.baseline_latency = latency
+        elif latency > baseline * self.latency_factor:
+            # Spikes move the baseline too, only slower, so a host that has
+            # become slower for good stops counting as spiking once the
+            # baseline catches up instead of pinning the limit at 1
+            self.baseline_latency = baseline * (1 - SPIKE_WEIGHT) + latency * SPIKE_WEIGHT
+            self._decrease("latency")
+            return
+        else:
+            self.baseline_latency = baseline * 0.9 + latency * 0.1
+
+        if self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.capacity)
+            self._wake()
+
+    def _decrease(self, reason: str):
+        now = time.monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        self.decreases += 1
+        self.limit = max(1.0, self.limit * self.backoff)
+        log.debug("host_concurrency_decreased", reason=reason, limit=self.capacity)
+
+    def _wake(self):
+        while self._waiters and self.in_flight < self.capacity:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": self.capacity,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "decreases": self.decreases,
+            "baseline_latency_ms": round(self.baseline_latency * 1000) if self.baseline_latency else None,
+        }
+
+
+class ConcurrencyLimiter:
+    """Adaptive limits keyed by host."""
+
+    def __init__(
+        self,
+        initial: int = 4,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        latency_factor: float = 3.0,
+    ):
+        self.initial = initial
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_factor = latency_factor
+        self._hosts: dict[str, AdaptiveLimit] = {}
+
+    def host(self, host: str) -> AdaptiveLimit:
+        limit = self._hosts.get(host)
+        if limit is None:
+            initial, max_limit = DEFAULT_HOST_CONCURRENCY.get(host, (self.initial, self.max_limit))
+            limit = self._hosts[host] = AdaptiveLimit(
+                limit=float(max(1, initial)),
+                max_limit=max(1, max_limit),
+                backoff=self.backoff,
+                latency_factor=self.latency_factor,
+            )
+        return limit
+
+    def limits(self) -> dict[str, int]:
+        """Current limit per host, for run summaries."""
+        return {host: limit.capacity for host, limit in sorted(self._hosts.items())}
+
+    def snapshot(self) -> dict:
+        return {host: limit.snapshot() for host, limit in self._hosts.items()}
+
+
+_limiter: ConcurrencyLimiter | None = None
+
+
+def get_concurrency_limiter() -> ConcurrencyLimiter:
+    """Process-wide adaptive limits shared by every pooled client."""
+    global _limiter
+    if _limiter is None:
+        settings = get_settings()
+        _limiter = ConcurrencyLimiter(
+            initial=settings.aimd_initial_concurrency,
+            max_limit=settings.aimd_max_concurrency,
+            backoff=settings.aimd_backoff_factor,
+            latency_factor=settings.aimd_latency_factor,
+        )
+    return _limiter
@@ -0,0 +1,127 @@
+"""
+Per-host circuit breakers.
+
+After BREAKER_FAILURE_THRESHOLD consecutive failures (connection errors,
+timeouts, 5xx) a host's breaker opens and requests to it fail immediately
+with CircuitOpenError instead of each waiting out a timeout. After
+BREAKER_RESET_SECONDS one trial request is let through (half-open): success
+closes the breaker, failure opens it again.
+"""
+
+import time
+from dataclasses import dataclass
+import httpx
+import structlog
+
+from ..config import get_settings
+
+log = structlog.get_logger()
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request to a host whose breaker is open."""
+
+
+@dataclass
+class CircuitBreaker:
+    """Breaker state for one host."""
+    failure_threshold: int = 5
+    reset_seconds: float = 60.0
+    state: str = "closed"
+    failures: int = 0
+    opened_at: float = 0.0
+    trips: int = 0
+    rejected: int = 0
+    _trial_in_flight: bool = False
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (claims the half-open trial)."""
+        if self.state == "closed":
+            return True
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_seconds:
+            self.state = "half_open"
+        if self.state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self._trial_in_flight = False
+        self.state = "closed"
+
+    def abandon(self):
+        """A request ended without an outcome; let another trial through."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True if it opened the breaker."""
+        self.failures += 1
+        trial = self._trial_in_flight
+        self._trial_in_flight = False
+        if trial or (self.state == "closed" and self.failures >= self.failure_threshold):
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            self.trips += 1
+            return True
+        return False
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
+
+
+class BreakerRegistry:
+    """Circuit breakers keyed by host."""
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def host(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                failure_threshold=self.failure_threshold,
+                reset_seconds=self.reset_seconds,
+            )
+        return breaker
+
+    def check(self, request: httpx.Request):
+        """Raise CircuitOpenError if the request's host is failing fast."""
+        if not self.host(request.url.host).allow():
+            raise CircuitOpenError(f"circuit open for {request.url.host}", request=request)
+
+    def record(self, host: str, failed: bool | None):
+        """Record an attempt's outcome (None: cancelled before it had one)."""
+        breaker = self.host(host)
+        if failed is None:
+            breaker.abandon()
+        elif not failed:
+            breaker.record_success()
+        elif breaker.record_failure():
+            log.warning("circuit_opened", host=host, failures=breaker.failures, reset_seconds=self.reset_seconds)
+
+    def snapshot(self) -> dict:
+        return {host: breaker.snapshot() for host, breaker in self._breakers.items()}
+
+
+_breakers: BreakerRegistry | None = None
+
+
+def get_breakers() -> BreakerRegistry:
+    """Process-wide breakers shared by every pooled client."""
+    global _breakers
+    if _breakers is None:
+        settings = get_settings()
+        _breakers = BreakerRegistry(
+            failure_threshold=settings.breaker_failure_threshold,
+            reset_seconds=settings.breaker_reset_seconds,
+        )
+    return _breakers
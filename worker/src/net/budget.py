@@ -0,0 +1,284 @@
+"""
+Streaming requests with per-source byte and time budgets.
+
+Instead of buffering whatever a host sends, responses are streamed: the
+Content-Type and Content-Length are checked before any of the body is
+read, and the decoded body is counted as it arrives, so an oversized page
+(or a small gzip that inflates into a huge one) is aborted as soon as it
+crosses the budget instead of after it has filled memory.
+
+Bytes downloaded are recorded per source, process-wide and for the
+pipeline run the fetch belongs to (download_tally).
+
+A source's time budget for a run (SourceDeadline) only stops its fetches:
+once it runs out, fetches in flight are aborted and new ones fail at once,
+while whatever was already fetched is still parsed and passed on.
+"""
+
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterator
+import httpx
+import structlog
+
+log = structlog.get_logger()
+
+# Per-source bytes downloaded by the current pipeline run, if it tracks them
+download_tally: ContextVar[dict[str, int] | None] = ContextVar("download_tally", default=None)
+
+# Never worth parsing, whatever the scraper expects
+BINARY_CONTENT_TYPES = (
+    "image/",
+    "audio/",
+    "video/",
+    "font/",
+    "application/pdf",
+    "application/zip",
+    "application/octet-stream",
+)
+
+
+class ResponseBudgetError(httpx.RequestError):
+    """A response was abandoned before its body was fully read."""
+
+
+class ResponseTooLargeError(ResponseBudgetError):
+    pass
+
+
+class UnexpectedContentTypeError(ResponseBudgetError):
+    pass
+
+
+class FetchDeadlineError(httpx.RequestError):
+    """The source's time budget ran out before the fetch finished."""
+
+
+class SourceDeadline:
+    """
+    A source's time budget for one run. Time spent paused (blocked on a
+    backed-up pipeline) doesn't count. Once the budget is spent, fetches
+    in flight are aborted and new ones fail with FetchDeadlineError; stop()
+    additionally cancels the tasks fetching for the source (track).
+    """
+
+    def __init__(self, seconds: float):
+        self._loop = asyncio.get_running_loop()
+        self.at = self._loop.time() + seconds
+        self.expired = False
+        self._paused_at: float | None = None
+        self._scopes: set[asyncio.Timeout] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    def remaining(self) -> float:
+        now = self._paused_at if self._paused_at is not None else self._loop.time()
+        return self.at - now
+
+    def _reschedule(self):
+        when = None if self._paused_at is not None else self.at
+        for scope in self._scopes:
+            if not scope.expired():
+                scope.reschedule(when)
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """Don't count the time spent in this block."""
+        if self._paused_at is not None or self.expired:
+            yield
+            return
+        self._paused_at = self._loop.time()
+        self._reschedule()
+        try:
+            yield
+        finally:
+            self.at += self._loop.time() - self._paused_at
+            self._paused_at = None
+            self._reschedule()
+
+    @asynccontextmanager
+    async def fetching(self, request: httpx.Request) -> AsyncIterator[None]:
+        """Abort the block with FetchDeadlineError once the budget is spent."""
+        if self.expired or self.remaining() <= 0:
+            self.expired = True
+            raise FetchDeadlineError("Source time budget spent", request=request)
+        scope = asyncio.timeout_at(None if self._paused_at is not None else self.at)
+        try:
+            async with scope:
+                self._scopes.add(scope)
+                try:
+                    yield
+                finally:
+                    self._scopes.discard(scope)
+        except TimeoutError:
+            if not scope.expired():
+                raise
+            self.expired = True
+            raise FetchDeadlineError("Source time budget spent", request=request) from None
+
+    def track(self, task: asyncio.Task):
+        """Cancel `task` on stop()."""
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stop(self) -> bool:
+        """Cancel the tracked fetching tasks. Returns whether there were any."""
+        self.expired = True
+        tasks, self._tasks = self._tasks, set()
+        for task in tasks:
+            task.cancel()
+        return bool(tasks)
+
+
+# Time budget of the source the current task fetches for, if it has one
+source_deadline: ContextVar[SourceDeadline | None] = ContextVar("source_deadline", default=None)
+
+
+class DownloadStats:
+    """Bytes and aborted responses per source, since the worker started."""
+
+    def __init__(self):
+        self.bytes: dict[str, int] = defaultdict(int)
+        self.responses: dict[str, int] = defaultdict(int)
+        self.aborted: dict[str, int] = defaultdict(int)
+
+    def record(self, source: str, downloaded: int, aborted: bool):
+        self.bytes[source] += downloaded
+        self.responses[source] += 1
+        if aborted:
+            self.aborted[source] += 1
+        tally = download_tally.get()
+        if tally is not None:
+            tally[source] = tally.get(source, 0) + downloaded
+
+    def snapshot(self) -> dict:
+        return {
+            source: {
+                "bytes": self.bytes[source],
+                "responses": self.responses[source],
+                "aborted": self.aborted[source],
+            }
+            for source in self.bytes
+        }
+
+
+def check_content_type(response: httpx.Response, content_types: tuple[str, ...] | None):
+    """Raise unless the response's Content-Type is one the caller can parse."""
+    content_type = response.headers.get("Content-Type", "").lower()
+    if not content_type:
+        return
+    if content_types is None:
+        if content_type.startswith(BINARY_CONTENT_TYPES):
+            raise UnexpectedContentTypeError(f"Unexpected content type {content_type}", request=response.request)
+    elif not any(expected in content_type for expected in content_types):
+        raise UnexpectedContentTypeError(f"Unexpected content type {content_type}", request=response.request)
+
+
+async def get_limited(
+    client: httpx.AsyncClient,
+    url: str,
+    source: str,
+    max_bytes: int | None = None,
+    content_types: tuple[str, ...] | None = None,
+    **kwargs,
+) -> httpx.Response:
+    """
+    GET `url`, reading at most `max_bytes` of decoded body. content_types are
+    substrings one of which a successful response's Content-Type must
+    contain (default: anything but binary types). Returns a fully read
+    response.
+    """
+    return await request_limited(client, "GET", url, source, max_bytes, content_types, **kwargs)
+
+
+async def request_limited(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    source: str,
+    max_bytes: int | None = None,
+    content_types: tuple[str, ...] | None = None,
+    **kwargs,
+) -> httpx.Response:
+    """get_limited() for any method, e.g. POSTs to scraping APIs."""
+    # Lets layers that buffer bodies themselves (singleflight) stop early too
+    extensions = {
+        **(kwargs.pop("extensions", None) or {}),
+        "max_bytes": max_bytes,
+        "content_types": content_types,
+    }
+    request = client.build_request(method, url, extensions=extensions, **kwargs)
+    deadline = source_deadline.get()
+    if deadline is None:
+        return await _send_limited(client, request, source, max_bytes, content_types)
+    try:
+        async with deadline.fetching(request):
+            return await _send_limited(client, request, source, max_bytes, content_types)
+    except FetchDeadlineError:
+        log.info("fetch_deadline_exceeded", source=source, url=url)
+        raise
+
+
+async def _send_limited(
+    client: httpx.AsyncClient,
+    request: httpx.Request,
+    source: str,
+    max_bytes: int | None,
+    content_types: tuple[str, ...] | None,
+) -> httpx.Response:
+    url = str(request.url)
+    try:
+        response = await client.send(request, stream=True)
+    except ResponseBudgetError as e:
+        log.warning("response_aborted", source=source, url=url, reason=str(e))
+        get_download_stats().record(source, 0, aborted=True)
+        raise
+
+    aborted = False
+    body = bytearray()
+    try:
+        if response.is_success:
+            check_content_type(response, content_types)
+        declared = response.headers.get("Content-Length")
+        if max_bytes is not None and declared and declared.isdigit() and int(declared) > max_bytes:
+            raise ResponseTooLargeError(
+                f"Content-Length {declared} over the {max_bytes} byte budget", request=request
+            )
+
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if max_bytes is not None and len(body) > max_bytes:
+                raise ResponseTooLargeError(f"Body over the {max_bytes} byte budget", request=request)
+    except ResponseBudgetError as e:
+        aborted = True
+        log.warning("response_aborted", source=source, url=url, reason=str(e))
+        raise
+    finally:
+        await response.aclose()
+        # Responses built in memory (e.g. tests) report no wire bytes
+        get_download_stats().record(source, response.num_bytes_downloaded or len(body), aborted)
+
+    # Hand back a plain buffered response; the body is already decoded
+    return httpx.Response(
+        response.status_code,
+        headers=[
+            (k, v) for k, v in response.headers.raw
+            if k.lower() not in (b"content-encoding", b"content-length", b"transfer-encoding")
+        ],
+        content=bytes(body),
+        request=response.request,
+        history=response.history,
+        extensions=response.extensions,
+    )
+
+
+_stats: DownloadStats | None = None
+
+
+def get_download_stats() -> DownloadStats:
+    """Process-wide download counters."""
+    global _stats
+    if _stats is None:
+        _stats = DownloadStats()
+    return _stats
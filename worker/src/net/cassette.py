@@ -0,0 +1,187 @@
+"""
+Record/replay of outbound HTTP for offline, deterministic cycles.
+
+In record mode every response the scrapers get back (status, headers, raw
+body and how long it took) is written to an on-disk cassette store as it
+arrives. In replay mode the same requests are answered from that store
+without touching the network, optionally after their recorded latency, so
+a whole cycle can be profiled or regression-tested against a frozen
+snapshot.
+
+Requests are matched on method, URL and body. A request made several
+times (retries, polling) replays its responses in recorded order and then
+keeps returning the last one. A request with no recording fails like an
+unreachable host.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+import httpx
+import structlog
+
+from ..config import get_settings
+
+log = structlog.get_logger()
+
+
+class CassetteMissError(httpx.TransportError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+class Cassette:
+    """
+    Directory of recorded responses: one gzipped JSON file per request,
+    grouped by host, holding every response recorded for it in order.
+    """
+
+    def __init__(self, path: str | os.PathLike, latency_scale: float = 0.0):
+        self.path = Path(path)
+        self.latency_scale = max(0.0, latency_scale)
+        # Responses recorded by this process, and loaded recordings (None = absent)
+        self._recorded: dict[str, list[dict]] = {}
+        self._loaded: dict[str, list[dict] | None] = {}
+        self._played: dict[str, int] = {}
+        self._write_lock = asyncio.Lock()
+        self.recorded = 0
+        self.replayed = 0
+        self.missed = 0
+
+    @staticmethod
+    def key(request: httpx.Request) -> str:
+        digest = hashlib.sha1()
+        digest.update(request.method.encode())
+        digest.update(b" ")
+        digest.update(str(request.url).encode())
+        digest.update(b"\n")
+        digest.update(request.content)
+        return digest.hexdigest()
+
+    def file(self, request: httpx.Request, key: str) -> Path:
+        host = request.url.host or "_"
+        return self.path / host / f"{key[:20]}.json.gz"
+
+    async def record(self, request: httpx.Request, response: dict):
+        """Append one response for a request and rewrite its file."""
+        key = self.key(request)
+        # The first response recorded in this process replaces an older recording
+        responses = self._recorded.setdefault(key, [])
+        responses.append(response)
+        self.recorded += 1
+        document = {"method": request.method, "url": str(request.url), "responses": list(responses)}
+        # One write at a time, so a file never ends up with an older list
+        async with self._write_lock:
+            await asyncio.to_thread(_write, self.file(request, key), document)
+
+    async def replay(self, request: httpx.Request) -> dict | None:
+        """The next recorded response for a request, or None if there is none."""
+        key = self.key(request)
+        if key not in self._loaded:
+            self._loaded[key] = await asyncio.to_thread(_read, self.file(request, key))
+        responses = self._loaded[key]
+        if not responses:
+            self.missed += 1
+            return None
+        played = self._played.get(key, 0)
+        self._played[key] = played + 1
+        self.replayed += 1
+        return responses[min(played, len(responses) - 1)]
+
+    def snapshot(self) -> dict:
+        return {
+            "path": str(self.path),
+            "recorded": self.recorded,
+            "replayed": self.replayed,
+            "missed": self.missed,
+        }
+
+
+def _write(path: Path, document: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump(document, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def _read(path: Path) -> list[dict] | None:
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)["responses"]
+    except FileNotFoundError:
+        return None
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """
+    Records responses from `transport` into a cassette, or, without a
+    transport, replays them from it.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None, cassette: Cassette):
+        self._transport = transport
+        self.cassette = cassette
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        if self._transport is None:
+            return await self._replay(request)
+
+        started = time.monotonic()
+        response = await self._transport.handle_async_request(request)
+        try:
+            content = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        elapsed = time.monotonic() - started
+
+        headers = response.headers.raw
+        await self.cassette.record(request, {
+            "status": response.status_code,
+            "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in headers],
+            "body": base64.b64encode(content).decode("ascii"),
+            "elapsed": round(elapsed, 4),
+        })
+        # Raw (still encoded) body, so the client decodes it as usual
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            stream=httpx.ByteStream(content),
+            extensions={k: v for k, v in response.extensions.items() if k in ("http_version", "reason_phrase")},
+        )
+
+    async def _replay(self, request: httpx.Request) -> httpx.Response:
+        recorded = await self.cassette.replay(request)
+        if recorded is None:
+            log.warning("cassette_miss", method=request.method, url=str(request.url))
+            raise CassetteMissError(f"No recording for {request.method} {request.url}", request=request)
+
+        delay = recorded.get("elapsed", 0.0) * self.cassette.latency_scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return httpx.Response(
+            recorded["status"],
+            headers=[(k.encode("latin-1"), v.encode("latin-1")) for k, v in recorded["headers"]],
+            stream=httpx.ByteStream(base64.b64decode(recorded["body"])),
+        )
+
+    async def aclose(self):
+        if self._transport is not None:
+            await self._transport.aclose()
+
+
+_cassette: Cassette | None = None
+
+
+def get_cassette() -> Cassette:
+    """Process-wide cassette store, created on first use."""
+    global _cassette
+    if _cassette is None:
+        settings = get_settings()
+        _cassette = Cassette(settings.http_cassette_dir, settings.http_cassette_latency_scale)
+    return _cassette
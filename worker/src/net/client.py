@@ -0,0 +1,135 @@
+"""
+Worker-wide pooled HTTP clients.
+
+Scrapers borrow a long-lived httpx.AsyncClient instead of opening one per
+unit, so connections (and their TLS sessions and DNS lookups) are reused
+across units and cycles. httpcore keeps a separate connection pool per
+origin inside each client, and HTTP/2 is negotiated via ALPN wherever the
+host supports it, multiplexing a source's requests over one connection.
+
+There is one client per outbound proxy or proxy pool; per-request headers and timeouts
+still override the defaults here. All clients share the per-host rate
+and adaptive concurrency limits, circuit breakers and retry policy (see
+transport), requests that opt in follow robots.txt (see robots), and
+identical in-flight GETs share one request (see singleflight). With a cassette mode set, the network transport is recorded
+or replaced by recorded responses (see cassette).
+"""
+
+import asyncio
+import httpx
+import structlog
+
+from ..config import get_settings
+from .ratelimit import get_rate_limiter
+from .aimd import get_concurrency_limiter
+from .breaker import get_breakers
+from .retry import get_retry_policy
+from .transport import PoliteTransport
+from .singleflight import SingleflightTransport
+from .cassette import CassetteTransport, get_cassette
+from .proxies import ProxyPool, ProxyPoolTransport
+from .robots import RobotsTransport, get_robots_cache
+
+log = structlog.get_logger()
+
+# For sites that serve bots a different (or no) page
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+# A proxy URL, a pool of proxies, or None to connect directly
+Proxy = str | ProxyPool | None
+
+_clients: dict[Proxy, httpx.AsyncClient] = {}
+_singleflight: dict[Proxy, SingleflightTransport] = {}
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _network_transport(proxy: str | None) -> httpx.AsyncHTTPTransport:
+    settings = get_settings()
+    # The client ignores http2/limits/proxy once a transport is given
+    return httpx.AsyncHTTPTransport(
+        http2=settings.http2_enabled,
+        proxy=proxy,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+    )
+
+
+def _build_client(proxy: Proxy) -> httpx.AsyncClient:
+    settings = get_settings()
+    transport: httpx.AsyncBaseTransport
+    if settings.http_cassette_mode == "replay":
+        transport = CassetteTransport(None, get_cassette())
+    else:
+        if isinstance(proxy, ProxyPool):
+            # Each attempt (retries included) goes out via the healthiest proxy
+            transport = ProxyPoolTransport(
+                proxy, {url: _network_transport(url) for url in proxy.proxies}
+            )
+        else:
+            transport = _network_transport(proxy)
+        if settings.http_cassette_mode == "record":
+            # Innermost, so every attempt the network answers is recorded
+            transport = CassetteTransport(transport, get_cassette())
+
+    # Every request goes through its host's breaker, rate and concurrency
+    # limits, and the shared retry policy
+    transport = PoliteTransport(
+        transport,
+        get_rate_limiter(),
+        get_concurrency_limiter(),
+        get_breakers(),
+        get_retry_policy(),
+    )
+    if settings.robots_enabled:
+        # Above the limits, so disallowed requests never take a slot
+        transport = RobotsTransport(transport, get_robots_cache(), get_rate_limiter())
+    if settings.http_singleflight_enabled:
+        # Outermost, so requests that piggyback don't use up any limits
+        transport = _singleflight[proxy] = SingleflightTransport(transport)
+    return httpx.AsyncClient(
+        transport=transport,
+        headers={"User-Agent": settings.http_user_agent},
+        timeout=httpx.Timeout(
+            settings.http_timeout_seconds,
+            connect=settings.http_connect_timeout_seconds,
+        ),
+        follow_redirects=True,
+    )
+
+
+def get_http_client(proxy: Proxy = None) -> httpx.AsyncClient:
+    """Shared client for the running event loop, optionally through a proxy or proxy pool."""
+    global _loop
+    loop = asyncio.get_running_loop()
+    if loop is not _loop:
+        # Connections belong to the loop that opened them
+        _clients.clear()
+        _singleflight.clear()
+        _loop = loop
+
+    client = _clients.get(proxy)
+    if client is None or client.is_closed:
+        client = _clients[proxy] = _build_client(proxy)
+        log.debug("http_client_created", proxied=proxy is not None)
+    return client
+
+
+def singleflight_snapshot() -> dict:
+    """Coalescing counters per pooled client."""
+    return {
+        "proxied" if proxy else "direct": transport.snapshot()
+        for proxy, transport in _singleflight.items()
+    }
+
+
+async def close_http_clients():
+    """Close every pooled client, e.g. on worker shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,211 @@
+"""
+Pool of outbound proxies with health scoring.
+
+Job boards used to go through one static Bright Data URL, so a slow or
+blocked exit node hurt every request of a cycle. The pool holds several
+proxies (explicit PROXY_URLS, or Bright Data sessions on the super-proxy,
+each of which is its own exit node) and scores each by its latency and
+recent error rate; every request goes to the healthiest one.
+
+Requests to a host stick to the proxy that last served it well, so a site
+sees one consistent client per session. A proxy that keeps failing (errors,
+or block statuses like 403/407/429) loses its sticky hosts and sits out a
+cooldown before it is tried again.
+"""
+
+import time
+from dataclasses import dataclass
+import httpx
+import structlog
+
+from ..config import get_settings
+
+log = structlog.get_logger()
+
+# Statuses that mean the exit node was refused, not that the page is missing
+BLOCKED_STATUSES = {403, 407, 429, 503}
+
+# Weight of the newest sample in the latency and error moving averages
+EWMA_ALPHA = 0.3
+
+
+@dataclass
+class ProxyHealth:
+    """Latency and error scoring for one proxy."""
+    url: str
+    latency: float | None = None  # EWMA seconds to response headers
+    error_rate: float = 0.0  # EWMA of failures (0..1)
+    failures: int = 0  # Consecutive
+    cooldown_until: float = 0.0
+    in_flight: int = 0
+    requests: int = 0
+
+    def score(self) -> float:
+        """Lower is better; untried proxies score 0 so each gets a turn."""
+        if self.latency is None:
+            return 0.0
+        return self.latency * (1 + 4 * self.error_rate) * (1 + self.in_flight)
+
+    def observe(self, latency: float | None, failed: bool):
+        self.requests += 1
+        self.error_rate += EWMA_ALPHA * ((1.0 if failed else 0.0) - self.error_rate)
+        if latency is not None:
+            self.latency = latency if self.latency is None else (
+                self.latency + EWMA_ALPHA * (latency - self.latency)
+            )
+        self.failures = self.failures + 1 if failed else 0
+
+    def snapshot(self, now: float) -> dict:
+        return {
+            "latency_ms": None if self.latency is None else round(self.latency * 1000),
+            "error_rate": round(self.error_rate, 3),
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "cooling_down": self.cooldown_until > now,
+        }
+
+
+class ProxyPool:
+    """Picks the healthiest proxy per request, sticky per host."""
+
+    def __init__(
+        self,
+        urls: list[str],
+        sticky_seconds: float = 300,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 120,
+    ):
+        if not urls:
+            raise ValueError("ProxyPool needs at least one proxy URL")
+        self.proxies = {url: ProxyHealth(url) for url in dict.fromkeys(urls)}
+        self.sticky_seconds = sticky_seconds
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        # host -> (proxy url, sticky until)
+        self._sticky: dict[str, tuple[str, float]] = {}
+
+    def choose(self, host: str) -> str:
+        """Proxy URL for the next request to `host`."""
+        now = time.monotonic()
+        sticky = self._sticky.get(host)
+        if sticky is not None:
+            url, until = sticky
+            if until > now and self.proxies[url].cooldown_until <= now:
+                return url
+
+        available = [p for p in self.proxies.values() if p.cooldown_until <= now]
+        if not available:
+            # Everything is benched: use whichever comes back soonest
+            best = min(self.proxies.values(), key=lambda p: p.cooldown_until)
+        else:
+            best = min(available, key=ProxyHealth.score)
+        self._sticky[host] = (best.url, now + self.sticky_seconds)
+        return best.url
+
+    def started(self, url: str):
+        self.proxies[url].in_flight += 1
+
+    def record(self, url: str, host: str, latency: float | None, failed: bool):
+        """Score a finished request; failures move the host off the proxy."""
+        proxy = self.proxies[url]
+        proxy.in_flight = max(0, proxy.in_flight - 1)
+        proxy.observe(latency, failed)
+        if not failed:
+            return
+
+        if self._sticky.get(host, (None, 0))[0] == url:
+            del self._sticky[host]
+        if proxy.failures >= self.failure_threshold:
+            proxy.cooldown_until = time.monotonic() + self.cooldown_seconds
+            proxy.failures = 0
+            self._sticky = {h: s for h, s in self._sticky.items() if s[0] != url}
+            log.warning("proxy_cooling_down", proxy=_redact(url), seconds=self.cooldown_seconds)
+
+    def abandon(self, url: str):
+        """A request was cancelled before finishing; it says nothing about health."""
+        proxy = self.proxies[url]
+        proxy.in_flight = max(0, proxy.in_flight - 1)
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        return {_redact(url): proxy.snapshot(now) for url, proxy in self.proxies.items()}
+
+
+def _redact(url: str) -> str:
+    """Proxy URL without its password, for logs and health output."""
+    parsed = httpx.URL(url)
+    if not parsed.password:
+        return url
+    return str(parsed.copy_with(userinfo=f"{parsed.username}:***".encode()))
+
+
+class ProxyPoolTransport(httpx.AsyncBaseTransport):
+    """
+    Sends each request through the proxy the pool picks, on one pooled
+    transport per proxy, and scores the proxy with the outcome.
+    """
+
+    def __init__(self, pool: ProxyPool, transports: dict[str, httpx.AsyncBaseTransport]):
+        self.pool = pool
+        self._transports = transports
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        url = self.pool.choose(host)
+        self.pool.started(url)
+        started = time.monotonic()
+        try:
+            response = await self._transports[url].handle_async_request(request)
+        except httpx.TransportError:
+            self.pool.record(url, host, None, failed=True)
+            raise
+        except BaseException:
+            self.pool.abandon(url)
+            raise
+        self.pool.record(
+            url, host, time.monotonic() - started, failed=response.status_code in BLOCKED_STATUSES
+        )
+        return response
+
+    async def aclose(self):
+        for transport in self._transports.values():
+            await transport.aclose()
+
+
+def pool_urls() -> list[str]:
+    """Configured proxy URLs: PROXY_URLS, else Bright Data sessions."""
+    settings = get_settings()
+    if settings.proxy_urls:
+        return list(settings.proxy_urls)
+    if not settings.proxy_url:
+        return []
+    if settings.proxy_sessions <= 1:
+        return [settings.proxy_url]
+    # The super-proxy pins an exit node per "-session-<id>" username suffix
+    base = httpx.URL(settings.proxy_url)
+    return [
+        str(base.copy_with(
+            userinfo=f"{settings.bright_data_username}-session-{i}:{settings.bright_data_password}".encode()
+        ))
+        for i in range(settings.proxy_sessions)
+    ]
+
+
+_pool: ProxyPool | None = None
+_pool_loaded = False
+
+
+def get_proxy_pool() -> ProxyPool | None:
+    """Process-wide proxy pool, or None when no proxy is configured."""
+    global _pool, _pool_loaded
+    if not _pool_loaded:
+        settings = get_settings()
+        urls = pool_urls()
+        _pool = ProxyPool(
+            urls,
+            sticky_seconds=settings.proxy_sticky_seconds,
+            failure_threshold=settings.proxy_failure_threshold,
+            cooldown_seconds=settings.proxy_cooldown_seconds,
+        ) if urls else None
+        _pool_loaded = True
+    return _pool
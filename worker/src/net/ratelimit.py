@@ -0,0 +1,178 @@
+"""
+Per-host token-bucket rate limiting for every request on the shared clients.
+
+Each host gets a bucket with a sustained rate (requests per second) and a
+burst size. Requests reserve a slot and sleep only as long as needed, so a
+host is used at the highest rate it allows and concurrently running
+scrapers that hit the same host share its budget. A 429 or 503 with
+Retry-After pauses the host for that long, and a robots.txt Crawl-delay
+(see robots) slows its bucket down for good.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import httpx
+import structlog
+
+from ..config import get_settings
+
+log = structlog.get_logger()
+
+# (requests per second, burst) for hosts the scrapers hit most; everything
+# else uses HTTP_RATE_PER_HOST / HTTP_BURST_PER_HOST. Overridable via
+# HOST_RATE_LIMITS.
+DEFAULT_HOST_LIMITS: dict[str, tuple[float, int]] = {
+    "www.reddit.com": (0.5, 1),
+    "news.google.com": (3.0, 5),
+    "hacker-news.firebaseio.com": (50.0, 20),
+    "api.brightdata.com": (0.5, 2),
+}
+
+THROTTLE_STATUSES = {429, 503}
+
+
+@dataclass
+class TokenBucket:
+    """
+    Token bucket kept as a theoretical arrival time (GCRA): no lock or
+    background refill, and reservations are handed out in call order.
+    """
+    rate: float
+    burst: int
+    _tat: float = 0.0
+    requests: int = 0
+    delayed: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    throttled: int = 0
+
+    @property
+    def interval(self) -> float:
+        return 1.0 / self.rate
+
+    def reserve(self) -> float:
+        """Take a slot; returns how long to wait before using it."""
+        now = time.monotonic()
+        tat = max(self._tat, now)
+        wait = max(0.0, tat - (self.burst - 1) * self.interval - now)
+        self._tat = tat + self.interval
+
+        self.requests += 1
+        if wait > 0:
+            self.delayed += 1
+            self.wait_seconds += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        return wait
+
+    def pause(self, seconds: float):
+        """Hand out no slots for the next `seconds` (Retry-After)."""
+        self.throttled += 1
+        resume_at = time.monotonic() + seconds
+        self._tat = max(self._tat, resume_at + (self.burst - 1) * self.interval)
+
+    def slow_to(self, interval: float):
+        """Space requests at least `interval` seconds apart, without bursts."""
+        if interval > self.interval:
+            self.rate = 1.0 / interval
+        self.burst = 1
+
+    def snapshot(self) -> dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "throttled": self.throttled,
+        }
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After as seconds from now: delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostRateLimiter:
+    """Token buckets keyed by host, applied by the pooled clients' transport."""
+
+    def __init__(
+        self,
+        default_rate: float,
+        default_burst: int,
+        overrides: dict[str, tuple[float, int]] | None = None,
+        max_retry_after: float = 300.0,
+    ):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.limits = {**DEFAULT_HOST_LIMITS, **(overrides or {})}
+        self.max_retry_after = max_retry_after
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self.limits.get(host, (self.default_rate, self.default_burst))
+            bucket = self._buckets[host] = TokenBucket(rate=max(rate, 1e-6), burst=max(1, int(burst)))
+        return bucket
+
+    async def acquire(self, host: str):
+        wait = self.bucket(host).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def on_request(self, request: httpx.Request):
+        await self.acquire(request.url.host)
+
+    async def on_response(self, request: httpx.Request, response: httpx.Response):
+        if response.status_code not in THROTTLE_STATUSES:
+            return
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return
+        host = request.url.host
+        retry_after = min(retry_after, self.max_retry_after)
+        self.bucket(host).pause(retry_after)
+        log.warning("host_throttled", host=host, status=response.status_code, retry_after=retry_after)
+
+    def crawl_delay(self, host: str, seconds: float):
+        """Honour a robots.txt Crawl-delay for the host."""
+        bucket = self.bucket(host)
+        if seconds > 0 and (bucket.burst > 1 or seconds > bucket.interval):
+            bucket.slow_to(seconds)
+            log.info("host_crawl_delay", host=host, seconds=seconds)
+
+    def snapshot(self) -> dict:
+        return {host: bucket.snapshot() for host, bucket in self._buckets.items()}
+
+
+_limiter: HostRateLimiter | None = None
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Process-wide limiter shared by every pooled client."""
+    global _limiter
+    if _limiter is None:
+        settings = get_settings()
+        _limiter = HostRateLimiter(
+            default_rate=settings.http_rate_per_host,
+            default_burst=settings.http_burst_per_host,
+            overrides=settings.host_rate_limits,
+            max_retry_after=settings.http_max_retry_after_seconds,
+        )
+    return _limiter
@@ -0,0 +1,65 @@
+"""
+Shared retry policy for outbound requests.
+
+Requests that never reached the host (connection errors) are retried for
+any method; idempotent requests are also retried on read timeouts, broken
+connections and 429/502/503/504. Delays use exponential backoff with full
+jitter, or the response's Retry-After when that is longer. A Retry-After
+beyond HTTP_RETRY_MAX_DELAY_SECONDS isn't waited out here: the response is
+returned and the host's rate limiter pauses it instead.
+"""
+
+import random
+from dataclasses import dataclass
+import httpx
+
+from ..config import get_settings
+from .ratelimit import parse_retry_after
+from .cassette import CassetteMissError
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# Nothing was sent, so retrying can't repeat a side effect
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass
+class RetryPolicy:
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def retry_error(self, request: httpx.Request, error: Exception, attempt: int) -> float | None:
+        """Seconds to wait before retrying after a transport error, or None."""
+        if attempt >= self.attempts or isinstance(error, CassetteMissError):
+            return None
+        if isinstance(error, UNSENT_ERRORS) or (
+            request.method in IDEMPOTENT_METHODS and isinstance(error, httpx.TransportError)
+        ):
+            return self.backoff(attempt)
+        return None
+
+    def retry_response(self, request: httpx.Request, response: httpx.Response, attempt: int) -> float | None:
+        """Seconds to wait before retrying a response, or None to return it."""
+        if attempt >= self.attempts:
+            return None
+        if response.status_code not in RETRY_STATUSES or request.method not in IDEMPOTENT_METHODS:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None and retry_after > self.max_delay:
+            return None
+        return max(self.backoff(attempt), retry_after or 0.0)
+
+    def backoff(self, attempt: int) -> float:
+        """Full jitter: uniform in [0, min(max_delay, base * 2^(attempt-1))]."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def get_retry_policy() -> RetryPolicy:
+    settings = get_settings()
+    return RetryPolicy(
+        attempts=max(1, settings.http_retry_attempts),
+        base_delay=settings.http_retry_base_delay_seconds,
+        max_delay=settings.http_retry_max_delay_seconds,
+    )
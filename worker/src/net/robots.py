@@ -0,0 +1,199 @@
+"""
+robots.txt policy per host, shared by every pooled client.
+
+Scrapers that crawl arbitrary sites (company newsrooms, job boards) mark
+their requests with the RESPECT_ROBOTS extension. Before such a request the
+host's robots.txt is fetched once (through the same limits as any other
+request) and cached: disallowed paths fail fast with RobotsDisallowedError
+instead of earning a block, and a Crawl-delay slows the host's rate-limit
+bucket down to match.
+
+Policies are kept for ROBOTS_TTL_SECONDS. Hosts without a robots.txt (4xx)
+are cached as allow-all for as long; when robots.txt can't be fetched
+(5xx, network errors) everything is allowed and it's tried again after the
+shorter ROBOTS_NEGATIVE_TTL_SECONDS.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from urllib.robotparser import RobotFileParser
+import httpx
+import structlog
+
+from ..config import get_settings
+from .ratelimit import HostRateLimiter
+
+log = structlog.get_logger()
+
+# Request extension that opts a request into robots.txt checks
+RESPECT_ROBOTS = {"robots": True}
+
+# Ignore anything past this much of a robots.txt, as the big crawlers do
+MAX_ROBOTS_BYTES = 500 * 1024
+MAX_REDIRECTS = 5
+
+
+class RobotsDisallowedError(httpx.TransportError):
+    """The host's robots.txt disallows the requested path."""
+
+
+@dataclass
+class RobotsPolicy:
+    """Parsed robots.txt of one origin; no parser means allow everything."""
+    parser: RobotFileParser | None
+    expires_at: float
+    status: str  # "ok", "missing" or "unavailable"
+
+    def allows(self, user_agent: str, url: str) -> bool:
+        return self.parser is None or self.parser.can_fetch(user_agent, url)
+
+    def crawl_delay(self, user_agent: str) -> float | None:
+        if self.parser is None:
+            return None
+        delay = self.parser.crawl_delay(user_agent)
+        if delay is None:
+            rate = self.parser.request_rate(user_agent)
+            if rate is not None and rate.requests > 0:
+                return rate.seconds / rate.requests
+            return None
+        return float(delay)
+
+
+class RobotsCache:
+    """robots.txt policies keyed by origin (scheme://host:port)."""
+
+    def __init__(
+        self,
+        user_agent: str,
+        ttl: float = 86400,
+        negative_ttl: float = 3600,
+        max_crawl_delay: float = 60,
+    ):
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_crawl_delay = max_crawl_delay
+        self._policies: dict[str, RobotsPolicy] = {}
+        self._fetching: dict[str, asyncio.Future] = {}
+        self.disallowed = 0
+
+    @staticmethod
+    def origin(url: httpx.URL) -> str:
+        return f"{url.scheme}://{url.netloc.decode('ascii')}"
+
+    def cached(self, url: httpx.URL) -> RobotsPolicy | None:
+        policy = self._policies.get(self.origin(url))
+        if policy is None or policy.expires_at <= time.monotonic():
+            return None
+        return policy
+
+    async def policy(self, url: httpx.URL, transport: httpx.AsyncBaseTransport) -> RobotsPolicy:
+        """The origin's policy, fetching robots.txt once when it isn't cached."""
+        origin = self.origin(url)
+        loop = asyncio.get_running_loop()
+        while (policy := self.cached(url)) is None:
+            fetching = self._fetching.get(origin)
+            if fetching is None or fetching.get_loop() is not loop:
+                break
+            # Someone is already fetching it; look again once they're done
+            await asyncio.shield(fetching)
+        else:
+            return policy
+
+        future = self._fetching[origin] = loop.create_future()
+        try:
+            policy = self._policies[origin] = await self._fetch(origin, transport)
+            return policy
+        finally:
+            if self._fetching.get(origin) is future:
+                del self._fetching[origin]
+            future.set_result(None)
+
+    async def _fetch(self, origin: str, transport: httpx.AsyncBaseTransport) -> RobotsPolicy:
+        url = httpx.URL(f"{origin}/robots.txt")
+        now = time.monotonic()
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                request = httpx.Request("GET", url, headers={"User-Agent": self.user_agent})
+                response = await transport.handle_async_request(request)
+                try:
+                    body = b""
+                    async for chunk in response.stream:
+                        body += chunk
+                        if len(body) >= MAX_ROBOTS_BYTES:
+                            break
+                finally:
+                    await response.aclose()
+
+                location = response.headers.get("Location")
+                if response.status_code in (301, 302, 303, 307, 308) and location:
+                    url = url.join(location)
+                    continue
+                break
+        except httpx.TransportError as e:
+            log.debug("robots_unavailable", origin=origin, error=type(e).__name__)
+            return RobotsPolicy(None, now + self.negative_ttl, "unavailable")
+
+        status = response.status_code
+        if 200 <= status < 300:
+            parser = RobotFileParser()
+            parser.parse(body[:MAX_ROBOTS_BYTES].decode("utf-8", errors="replace").splitlines())
+            return RobotsPolicy(parser, now + self.ttl, "ok")
+        if 400 <= status < 500 and status != 429:
+            return RobotsPolicy(None, now + self.ttl, "missing")
+        return RobotsPolicy(None, now + self.negative_ttl, "unavailable")
+
+    def snapshot(self) -> dict:
+        by_status: dict[str, int] = {}
+        for policy in self._policies.values():
+            by_status[policy.status] = by_status.get(policy.status, 0) + 1
+        return {"origins": len(self._policies), "by_status": by_status, "disallowed": self.disallowed}
+
+
+class RobotsTransport(httpx.AsyncBaseTransport):
+    """
+    Checks requests marked with RESPECT_ROBOTS against their host's robots.txt
+    and applies its crawl delay to the host's rate limit.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, robots: RobotsCache, rate_limiter: HostRateLimiter):
+        self._transport = transport
+        self._robots = robots
+        self._rate_limiter = rate_limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not request.extensions.get("robots"):
+            return await self._transport.handle_async_request(request)
+
+        robots = self._robots
+        policy = await robots.policy(request.url, self._transport)
+        if not policy.allows(robots.user_agent, str(request.url)):
+            robots.disallowed += 1
+            log.info("robots_disallowed", host=request.url.host, path=request.url.path)
+            raise RobotsDisallowedError(f"robots.txt disallows {request.url}", request=request)
+
+        delay = policy.crawl_delay(robots.user_agent)
+        if delay:
+            self._rate_limiter.crawl_delay(request.url.host, min(delay, robots.max_crawl_delay))
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+_cache: RobotsCache | None = None
+
+
+def get_robots_cache() -> RobotsCache:
+    """Process-wide robots.txt cache shared by every pooled client."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = RobotsCache(
+            user_agent=settings.robots_user_agent,
+            ttl=settings.robots_ttl_seconds,
+            negative_ttl=settings.robots_negative_ttl_seconds,
+            max_crawl_delay=settings.robots_max_crawl_delay_seconds,
+        )
+    return _cache
@@ -0,0 +1,123 @@
+"""
+Singleflight coalescing of identical in-flight GETs.
+
+When several scrapers or overlapping runs request the same URL with the same
+headers while a request for it is already in flight, they wait for that
+request and each get a copy of its response instead of going to the network
+again. Only requests that overlap are shared; nothing is cached afterwards.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import httpx
+
+from .budget import ResponseTooLargeError, check_content_type
+
+# URL, headers, and the byte budget and content types the caller accepts
+Key = tuple[str, tuple[tuple[str, str], ...], int | None, tuple[str, ...] | None]
+
+
+@dataclass
+class _Captured:
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    content: bytes
+    extensions: dict
+
+    def response(self) -> httpx.Response:
+        # Raw (still encoded) body as a stream, so the client decodes each
+        # copy as usual and only as far as the caller reads it
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.content),
+            extensions=self.extensions,
+        )
+
+
+async def _read_raw(request: httpx.Request, response: httpx.Response) -> bytes:
+    # The body is buffered here for sharing, so enforce the caller's limits
+    # (see budget) now: a body of the wrong type isn't read at all, and raw
+    # bytes never exceed the decoded size
+    if "content_types" in request.extensions and response.is_success:
+        # Transports hand back responses the client hasn't tied to a request yet
+        response.request = request
+        check_content_type(response, request.extensions["content_types"])
+    max_bytes = request.extensions.get("max_bytes")
+    content = bytearray()
+    async for chunk in response.stream:
+        content += chunk
+        if max_bytes is not None and len(content) > max_bytes:
+            raise ResponseTooLargeError(f"Body over the {max_bytes} byte budget", request=request)
+    return bytes(content)
+
+
+class SingleflightTransport(httpx.AsyncBaseTransport):
+    """Shares one upstream request between identical concurrent GETs."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self._in_flight: dict[Key, asyncio.Future] = {}
+        self.requests = 0
+        self.shared = 0
+
+    @staticmethod
+    def key(request: httpx.Request) -> Key:
+        headers = tuple(sorted((k.lower(), v) for k, v in request.headers.multi_items()))
+        # Callers with different limits would fail on each other's errors
+        content_types = request.extensions.get("content_types")
+        return (
+            str(request.url),
+            headers,
+            request.extensions.get("max_bytes"),
+            tuple(content_types) if content_types is not None else None,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        key = self.key(request)
+        self.requests += 1
+        while (leader := self._in_flight.get(key)) is not None:
+            captured = await asyncio.shield(leader)
+            if captured is not None:
+                self.shared += 1
+                return captured.response()
+            # The leader was cancelled (e.g. its source hit a deadline); go again
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await self._transport.handle_async_request(request)
+            try:
+                content = await _read_raw(request, response)
+            finally:
+                await response.aclose()
+            captured = _Captured(
+                status_code=response.status_code,
+                headers=response.headers.raw,
+                content=content,
+                extensions={
+                    k: v for k, v in response.extensions.items() if k in ("http_version", "reason_phrase")
+                },
+            )
+        except asyncio.CancelledError:
+            future.set_result(None)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an error nobody else waited for isn't logged
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        future.set_result(captured)
+        return captured.response()
+
+    def snapshot(self) -> dict:
+        return {"requests": self.requests, "shared": self.shared, "in_flight": len(self._in_flight)}
+
+    async def aclose(self):
+        await self._transport.aclose()
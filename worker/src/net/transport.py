@@ -0,0 +1,89 @@
+"""
+Transport wrapper that applies the worker's per-host policies to every
+request made on the pooled clients. Each attempt checks the host's circuit
+breaker, waits for its rate limit and then its adaptive concurrency limit
+(which learns from the response); failed attempts are retried under the
+shared retry policy.
+"""
+
+import asyncio
+import time
+import httpx
+import structlog
+
+from .ratelimit import HostRateLimiter
+from .aimd import ConcurrencyLimiter
+from .breaker import BreakerRegistry, CircuitOpenError
+from .retry import RetryPolicy
+
+log = structlog.get_logger()
+
+
+class PoliteTransport(httpx.AsyncBaseTransport):
+    """Wraps a real transport with per-host limits, breakers and retries."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        rate_limiter: HostRateLimiter,
+        concurrency: ConcurrencyLimiter,
+        breakers: BreakerRegistry,
+        retry: RetryPolicy,
+    ):
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+        self._concurrency = concurrency
+        self._breakers = breakers
+        self._retry = retry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._attempt(request)
+            except CircuitOpenError:
+                raise
+            except httpx.TransportError as e:
+                delay = self._retry.retry_error(request, e, attempt)
+                if delay is None:
+                    raise
+                log.debug("http_retry", host=request.url.host, attempt=attempt, error=type(e).__name__, delay=delay)
+                await asyncio.sleep(delay)
+                continue
+
+            delay = self._retry.retry_response(request, response, attempt)
+            if delay is None:
+                return response
+            await response.aclose()
+            log.debug("http_retry", host=request.url.host, attempt=attempt, status=response.status_code, delay=delay)
+            await asyncio.sleep(delay)
+
+    async def _attempt(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self._breakers.check(request)
+        limit = self._concurrency.host(host)
+
+        await self._rate_limiter.on_request(request)
+        await limit.acquire()
+        started = time.monotonic()
+        status_code = None
+        failed = None  # Unknown if cancelled, e.g. by a source's deadline
+        try:
+            response = await self._transport.handle_async_request(request)
+            status_code = response.status_code
+            failed = status_code >= 500
+        except httpx.TransportError:
+            failed = True
+            raise
+        finally:
+            # The slot is freed once headers arrive; bodies are small feeds
+            limit.observe(status_code, time.monotonic() - started)
+            limit.release()
+            self._breakers.record(host, failed)
+
+        await self._rate_limiter.on_response(request, response)
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
@@ -0,0 +1,296 @@
+"""
+Conditional GET cache for feeds.
+
+Stores each URL's ETag / Last-Modified and sends If-None-Match /
+If-Modified-Since on the next fetch. A 304 means the feed is unchanged since
+it was last processed, so the unit yields nothing and skips parsing and
+dedup entirely. For a feed that did change, the newest item processed is
+kept too, so the next read can stop where this one started (see feeds).
+
+Validators are only used where skipping unchanged content is safe:
+pipelines inserting shared signals turn them on per scrape task
+(conditional_requests), and a unit's new validators are only kept once the
+unit has been fetched completely, without a failed fetch, and every signal
+it handed on has been inserted (UnitFetch / commit_unit_fetch).
+"""
+
+import asyncio
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator
+import httpx
+import structlog
+
+from ..config import get_settings
+from ..db.validators import load_http_validators, save_http_validators
+from .budget import get_limited
+
+log = structlog.get_logger()
+
+# Whether fetches in the current scrape task may be conditional
+conditional_requests: ContextVar[bool] = ContextVar("conditional_requests", default=False)
+
+# Set by a consumer that settles signals itself (the pipeline, once they are
+# inserted): id(signal) -> the unit fetch that handed it on
+unit_handoff: ContextVar[dict[int, "UnitFetch"] | None] = ContextVar("unit_handoff", default=None)
+
+
+@dataclass
+class Validators:
+    """What a URL's last processed response can be revalidated with."""
+    source: str
+    fingerprint: str
+    etag: str | None = None
+    last_modified: str | None = None
+    # Key of the newest feed item processed, for resuming (see feeds)
+    last_item: str | None = None
+
+
+@dataclass
+class UnitFetch:
+    """Conditional-request state for one unit being fetched."""
+    conditional: bool
+    not_modified: bool = False
+    # A feed was only read up to the newest item processed last time
+    caught_up: bool = False
+    seen: dict[str, Validators] = field(default_factory=dict)
+    # A fetch raised (scrapers often log that and carry on), or a signal
+    # never made it into the database: nothing is kept
+    failed: bool = False
+    # Signals handed on that the consumer hasn't settled yet
+    pending: int = 0
+    fetched: bool = False
+    committed: bool = False
+
+    @property
+    def complete(self) -> bool:
+        """Whether the unit yielded everything it has, not just what's new."""
+        return not (self.not_modified or self.caught_up or self.failed)
+
+    def hand_off(self, signal: object):
+        """Hold the commit until the consumer settles `signal`, if it settles signals."""
+        handoff = unit_handoff.get()
+        if handoff is not None:
+            self.pending += 1
+            handoff[id(signal)] = self
+
+    def settle(self, ok: bool = True):
+        """One signal handed on is done with; ok=False if it was lost."""
+        self.pending -= 1
+        self.failed = self.failed or not ok
+        self._commit_when_settled()
+
+    def _commit_when_settled(self):
+        if not self.fetched or self.pending > 0 or self.failed or self.committed:
+            return
+        self.committed = True
+        if self.seen:
+            get_validator_cache().commit(self)
+
+
+_unit_fetch: ContextVar[UnitFetch | None] = ContextVar("unit_fetch", default=None)
+
+
+@contextmanager
+def track_unit_fetch() -> Iterator[UnitFetch]:
+    """Track the conditional requests made while fetching one unit."""
+    state = UnitFetch(conditional=conditional_requests.get())
+    token = _unit_fetch.set(state)
+    try:
+        yield state
+    finally:
+        _unit_fetch.reset(token)
+
+
+class ValidatorCache:
+    """URL -> validators, loaded from and flushed to http_validators."""
+
+    def __init__(self, max_age_days: int = 7):
+        self.max_age_days = max_age_days
+        self._entries: dict[str, Validators] = {}
+        self._dirty: set[str] = set()
+        self._loaded = False
+        self.stats: dict[str, dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+    async def ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        rows = await asyncio.to_thread(load_http_validators, self.max_age_days)
+        for row in rows:
+            # Anything recorded while loading is newer
+            self._entries.setdefault(row["url"], Validators(
+                source=row["source"],
+                fingerprint=row["fingerprint"],
+                etag=row.get("etag"),
+                last_modified=row.get("last_modified"),
+                last_item=row.get("last_item"),
+            ))
+        log.info("http_validators_loaded", count=len(rows))
+
+    def conditional_headers(self, url: str, fingerprint: str) -> dict[str, str]:
+        entry = self._entries.get(url)
+        if entry is None or entry.fingerprint != fingerprint:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def last_item(self, url: str, fingerprint: str) -> str | None:
+        entry = self._entries.get(url)
+        if entry is None or entry.fingerprint != fingerprint:
+            return None
+        return entry.last_item
+
+    def observe(self, source: str, url: str, fingerprint: str, response: httpx.Response, state: UnitFetch):
+        """Count a hit or miss and stage the response's validators on the unit."""
+        if response.status_code == 304:
+            self.stats[source]["hits"] += 1
+            state.not_modified = True
+            if url in self._entries:
+                # Still in use; keeps it from being pruned
+                self._dirty.add(url)
+            return
+
+        self.stats[source]["misses"] += 1
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200:
+            # Staged even without validators: the feed's newest item may be kept
+            state.seen[url] = Validators(source, fingerprint, etag, last_modified)
+
+    def mark_last_item(self, url: str, key: str, state: UnitFetch):
+        """Stage the newest item read from a feed fetched in this unit."""
+        staged = state.seen.get(url)
+        if staged is not None:
+            staged.last_item = key
+
+    def commit(self, state: UnitFetch):
+        """Keep the validators of a completely fetched unit."""
+        for url, validators in state.seen.items():
+            if not (validators.etag or validators.last_modified or validators.last_item):
+                continue
+            previous = self._entries.get(url)
+            if validators.last_item is None and previous is not None and previous.fingerprint == validators.fingerprint:
+                # Nothing new was read, so the newest item is still the old one
+                validators.last_item = previous.last_item
+            self._entries[url] = validators
+            self._dirty.add(url)
+
+    async def persist(self):
+        """Write validators changed or used since the last call."""
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        now = datetime.utcnow().isoformat()
+        rows = [
+            {
+                "url": url,
+                "source": entry.source,
+                "fingerprint": entry.fingerprint,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "last_item": entry.last_item,
+                "updated_at": now,
+            }
+            for url in dirty
+            if (entry := self._entries.get(url)) is not None
+        ]
+        if not await asyncio.to_thread(save_http_validators, rows, self.max_age_days):
+            self._dirty |= dirty
+
+    def snapshot(self) -> dict:
+        return {"entries": len(self._entries), "by_source": dict(self.stats)}
+
+
+def _conditional_unit() -> UnitFetch | None:
+    """The current unit's state, if its fetches may be conditional."""
+    state = _unit_fetch.get()
+    settings = get_settings()
+    # Cassettes hold full responses, so recording and replaying skip revalidation
+    if (
+        state is None
+        or not state.conditional
+        or not settings.http_validators_enabled
+        or settings.http_cassette_mode != "off"
+    ):
+        return None
+    return state
+
+
+async def conditional_get(
+    client: httpx.AsyncClient,
+    source: str,
+    url: str,
+    fingerprint: str,
+    **kwargs,
+) -> httpx.Response:
+    """
+    GET (streamed within the byte budget in kwargs, see budget) that
+    revalidates with stored validators when the current unit allows it.
+    """
+    state = _conditional_unit()
+    if state is None:
+        return await get_limited(client, url, source, **kwargs)
+
+    cache = get_validator_cache()
+    await cache.ensure_loaded()
+    headers = {**(kwargs.pop("headers", None) or {}), **cache.conditional_headers(url, fingerprint)}
+    response = await get_limited(client, url, source, headers=headers, **kwargs)
+    cache.observe(source, url, fingerprint, response, state)
+    return response
+
+
+def feed_cursor(url: str, fingerprint: str) -> str | None:
+    """Key of the newest item of the feed processed before, if resuming is allowed."""
+    if _conditional_unit() is None:
+        return None
+    return get_validator_cache().last_item(url, fingerprint)
+
+
+def mark_feed_read(url: str, newest: str | None, caught_up: bool):
+    """
+    Record what was read of a feed fetched by this unit: the key of its
+    newest item (None if nothing new), and whether reading stopped at the
+    item processed last time.
+    """
+    state = _conditional_unit()
+    if state is None:
+        return
+    state.caught_up = state.caught_up or caught_up
+    if newest is not None:
+        get_validator_cache().mark_last_item(url, newest, state)
+
+
+def fail_unit_fetch():
+    """Mark the current unit's fetch failed, even if its scraper carries on."""
+    state = _unit_fetch.get()
+    if state is not None:
+        state.failed = True
+
+
+def commit_unit_fetch(state: UnitFetch):
+    """
+    Mark a unit fetched to the end. Its validators (and feed cursors) are
+    kept once every signal it handed on is settled, and never if a fetch or
+    a signal failed.
+    """
+    state.fetched = True
+    state._commit_when_settled()
+
+
+_cache: ValidatorCache | None = None
+
+
+def get_validator_cache() -> ValidatorCache:
+    """Process-wide validator cache, created on first use."""
+    global _cache
+    if _cache is None:
+        _cache = ValidatorCache(max_age_days=get_settings().http_validator_max_age_days)
+    return _cache
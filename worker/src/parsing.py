@@ -0,0 +1,109 @@
+"""
+Off-loop parsing of fetched documents.
+
+Parsing a feed or a full HTML page is CPU work, and on the event loop it
+stalls every other in-flight request for as long as it runs, inflating
+their latency once several scrapers run at once. Scrapers hand parse jobs
+to a shared executor instead: a module-level function called with the raw
+body (plus plain arguments), returning compact records (tuples,
+dataclasses) rather than parser trees, so the job can run in a thread or,
+with PARSE_EXECUTOR=process, in another process.
+
+Bodies up to PARSE_INLINE_MAX_BYTES are parsed inline, as handing them
+off would cost more than parsing them.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, TypeVar
+import structlog
+
+from .config import get_settings
+
+log = structlog.get_logger()
+
+T = TypeVar("T")
+
+
+class ParseExecutor:
+    """Runs parse jobs inline, in a thread pool or in a process pool."""
+
+    def __init__(self, mode: str = "thread", max_workers: int = 2, inline_max_bytes: int = 16_384):
+        if mode not in ("inline", "thread", "process"):
+            raise ValueError(f"Unknown parse executor mode {mode!r}")
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self.inline_max_bytes = inline_max_bytes
+        self._pool: Executor | None = None
+        self.inline = 0
+        self.offloaded = 0
+        self.in_flight = 0
+        self.seconds = 0.0
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            if self.mode == "process":
+                # Not fork: the worker's threads (supabase, to_thread) would be
+                # copied mid-flight into the children
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="parse")
+        return self._pool
+
+    async def run(self, parser: Callable[..., T], content: bytes, *args) -> T:
+        """parser(content, *args), off the event loop unless it's small."""
+        if self.mode == "inline" or len(content) <= self.inline_max_bytes:
+            self.inline += 1
+            return parser(content, *args)
+
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        self.in_flight += 1
+        try:
+            return await loop.run_in_executor(self._executor(), functools.partial(parser, content, *args))
+        except BrokenProcessPool:
+            # A child died (OOM, segfault); start a fresh pool for the next job
+            log.error("parse_pool_broken", parser=parser.__name__)
+            self.shutdown()
+            raise
+        finally:
+            self.in_flight -= 1
+            self.offloaded += 1
+            self.seconds += time.monotonic() - started
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def snapshot(self) -> dict:
+        return {
+            "mode": self.mode,
+            "workers": self.max_workers,
+            "inline": self.inline,
+            "offloaded": self.offloaded,
+            "in_flight": self.in_flight,
+            "offloaded_seconds": round(self.seconds, 3),
+        }
+
+
+_executor: ParseExecutor | None = None
+
+
+def get_parse_executor() -> ParseExecutor:
+    """Process-wide parse executor, created on first use."""
+    global _executor
+    if _executor is None:
+        settings = get_settings()
+        _executor = ParseExecutor(
+            mode=settings.parse_executor,
+            max_workers=settings.parse_workers,
+            inline_max_bytes=settings.parse_inline_max_bytes,
+        )
+    return _executor
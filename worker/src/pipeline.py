@@ -0,0 +1,464 @@
+"""
+Streaming signal pipeline: scrape -> dedup -> enrich -> insert.
+
+Stages are connected by bounded asyncio queues with a configurable number
+of workers each. A slow stage applies backpressure upstream instead of
+buffering whole result sets, so signals land in the database as soon as
+they are parsed and memory stays flat regardless of source size.
+"""
+
+import asyncio
+import time
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Optional
+import sentry_sdk
+import structlog
+
+from .config import get_settings
+from .models import Signal
+from .scrapers.base import BaseScraper
+from .db.dedup import is_duplicate, compute_content_hash
+from .db.supabase import insert_signal
+from .entities import AliasKey, alias_keys, get_company_index
+from .net import (
+    conditional_requests,
+    download_tally,
+    track_unit_fetch,
+    commit_unit_fetch,
+    unit_handoff,
+    UnitFetch,
+    SourceDeadline,
+    source_deadline,
+)
+
+log = structlog.get_logger()
+
+# Queue sentinel telling a stage worker to exit
+_DONE = object()
+
+# Past its deadline a source's fetches fail, but it keeps passing on what it
+# parsed; one still busy after as long again (up to this) is stopped outright
+DRAIN_GRACE_SECONDS = 30
+
+StageHandler = Callable[[BaseScraper, Signal], Awaitable[Optional[Signal]]]
+
+
+class InsertFailedError(Exception):
+    """A signal couldn't be inserted (insert_signal has logged why)."""
+
+
+@dataclass
+class PipelineStats:
+    """Counters for one pipeline run, in the shape scrape_runs expects."""
+    total_signals: int = 0
+    ai_enriched: int = 0
+    duplicates: int = 0
+    signals_by_source: dict[str, int] = field(default_factory=dict)
+    progress: dict[str, dict] = field(default_factory=dict)
+    first_signal_seconds: float | None = None
+    # Sources stopped before finishing -> reason ("deadline", "run_cancelled")
+    cut_short: dict[str, str] = field(default_factory=dict)
+    cancelled: bool = False
+    bytes_by_source: dict[str, int] = field(default_factory=dict)
+
+
+class SignalPipeline:
+    """
+    Runs scrapers through dedup, AI enrichment and insertion concurrently.
+
+    on_progress is called with the live stats whenever a source changes
+    status (running, completed, failed). units optionally restricts a source
+    to specific units (e.g. the ones leased from the task queue); unlike a
+    full stream, a failing explicit unit fails the source so it can be retried.
+    More scrapers can join with add_scrapers() until scraping has finished.
+
+    Each source gets its own time budget; a source that runs out (or a run
+    that is cancelled) is cut short, but whatever it already parsed still
+    goes through dedup, enrichment and insertion.
+    """
+
+    def __init__(
+        self,
+        scrapers: list[BaseScraper],
+        user_id: str | None = None,
+        on_progress: Callable[[PipelineStats], None] | None = None,
+        units: dict[str, list[str]] | None = None,
+    ):
+        settings = get_settings()
+        self.scrapers = scrapers
+        self.user_id = user_id
+        self.on_progress = on_progress or (lambda stats: None)
+        self.units = units or {}
+        self.scraper_concurrency = max(1, settings.scraper_concurrency)
+        self.queue_size = max(1, settings.pipeline_queue_size)
+        self.dedup_workers = max(1, settings.dedup_workers)
+        self.enrich_workers = max(1, settings.enrich_workers)
+        self.insert_workers = max(1, settings.insert_workers)
+        self.companies = get_company_index() if settings.entity_resolution_enabled else None
+        self.entity_refresh_seconds = settings.entity_refresh_seconds
+
+        self.stats = PipelineStats()
+        self._started_at = 0.0
+        self._seen: set[str] = set()
+        # Alias keys of the scrapers' target companies, which may create companies
+        self._targets: set[AliasKey] = set()
+        self._in_flight: dict[str, int] = {}
+        self._scraping: dict[str, int] = {}
+        self._covered: dict[str, set[str]] = {}
+        self._scrape_tasks: list[asyncio.Task] = []
+        self._accepting = False
+        self._cancel_reason: str | None = None
+        self._dedup_q: asyncio.Queue | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def run(self) -> PipelineStats:
+        """Run every scraper to completion and drain all stages."""
+        self._started_at = time.monotonic()
+        if self.companies is not None:
+            await self.companies.refresh(self.entity_refresh_seconds)
+
+        self._dedup_q = asyncio.Queue(maxsize=self.queue_size)
+        enrich_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        insert_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._semaphore = asyncio.Semaphore(self.scraper_concurrency)
+
+        scrapers, self.scrapers = self.scrapers, []
+        for scraper in scrapers:
+            self._add_source(scraper)
+        self.on_progress(self.stats)
+
+        for scraper in self.scrapers:
+            self._start_scrape(scraper, self.units.get(scraper.name))
+        self._accepting = True
+
+        dedup_tasks = self._start_workers(self.dedup_workers, self._dedup_q, enrich_q, self._dedup)
+        enrich_tasks = self._start_workers(self.enrich_workers, enrich_q, insert_q, self._enrich)
+        insert_tasks = self._start_workers(self.insert_workers, insert_q, None, self._insert)
+
+        try:
+            # Shut stages down in order once everything upstream has drained
+            await self._finish_scraping(len(dedup_tasks))
+            await self._finish(dedup_tasks, enrich_q, len(enrich_tasks))
+            await self._finish(enrich_tasks, insert_q, len(insert_tasks))
+            await asyncio.gather(*insert_tasks)
+        finally:
+            self._accepting = False
+            for task in self._scrape_tasks + dedup_tasks + enrich_tasks + insert_tasks:
+                task.cancel()
+
+        return self.stats
+
+    def add_scrapers(self, scrapers: list[BaseScraper]) -> list[str] | None:
+        """
+        Join scrapers to a running pipeline, scraping only what it doesn't
+        already cover: new sources in full, known sources for their missing
+        units. Returns the sources that got new work, or None if scraping
+        has already finished and nothing can join.
+        """
+        if not self._accepting:
+            return None
+
+        joined = []
+        for scraper in scrapers:
+            if scraper.name not in self.stats.progress:
+                self._add_source(scraper)
+                self._start_scrape(scraper, None)
+                joined.append(scraper.name)
+                continue
+
+            missing = [u for u in scraper.units() if u not in self._covered[scraper.name]]
+            if missing:
+                self._start_scrape(scraper, missing)
+                joined.append(scraper.name)
+
+        if joined:
+            self.on_progress(self.stats)
+        return joined
+
+    def cancel(self, reason: str = "run_cancelled"):
+        """
+        Stop all scraping now. Signals already parsed are still processed,
+        and every unfinished source is recorded as cut short.
+        """
+        if self._cancel_reason is not None:
+            return
+        self._cancel_reason = reason
+        self._accepting = False
+        self.stats.cancelled = True
+
+        for name, entry in self.stats.progress.items():
+            if entry["status"] in ("pending", "running"):
+                self._cut_short(name, reason)
+        for task in self._scrape_tasks:
+            task.cancel()
+
+    def _add_source(self, scraper: BaseScraper):
+        self.scrapers.append(scraper)
+        self.stats.progress[scraper.name] = {"status": "pending", "signals": 0}
+        self.stats.signals_by_source[scraper.name] = 0
+        self._in_flight[scraper.name] = 0
+        self._scraping[scraper.name] = 0
+        self._covered[scraper.name] = set()
+        for company in getattr(scraper, "target_companies", None) or ():
+            self._targets.update(alias_keys(company))
+
+    def _start_scrape(self, scraper: BaseScraper, units: list[str] | None):
+        covered = units if units is not None else scraper.units()
+        self._covered[scraper.name].update(covered)
+        self._scrape_tasks.append(
+            asyncio.create_task(self._scrape(scraper, self._dedup_q, self._semaphore, units))
+        )
+
+    async def _finish_scraping(self, next_workers: int):
+        # Scrapers can join while others run; stop once no new ones arrived
+        while True:
+            tasks = list(self._scrape_tasks)
+            # Cancelled scrapes (see cancel) must not abort the drain
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if len(tasks) == len(self._scrape_tasks):
+                break
+        self._accepting = False
+        for _ in range(next_workers):
+            await self._dedup_q.put(_DONE)
+
+    def _start_workers(
+        self,
+        count: int,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue | None,
+        handler: StageHandler,
+    ) -> list[asyncio.Task]:
+        return [
+            asyncio.create_task(self._stage_worker(inbox, outbox, handler))
+            for _ in range(count)
+        ]
+
+    async def _finish(self, tasks: list[asyncio.Task], next_q: asyncio.Queue, next_workers: int):
+        await asyncio.gather(*tasks)
+        for _ in range(next_workers):
+            await next_q.put(_DONE)
+
+    async def _scrape(
+        self,
+        scraper: BaseScraper,
+        outbox: asyncio.Queue,
+        semaphore: asyncio.Semaphore,
+        units: list[str] | None = None,
+    ):
+        name = scraper.name
+        # Skipping unchanged (304) feeds is only safe when their items were
+        # already inserted as shared signals, not for one user's run
+        conditional_requests.set(self.user_id is None)
+        download_tally.set(self.stats.bytes_by_source)
+
+        async with semaphore:
+            self._scraping[name] += 1
+            self._set_status(name, "running")
+
+            if name in self.units and units == self.units[name]:
+                signals = self._stream_units(scraper, units)
+            elif units is not None:
+                signals = scraper.stream(units)
+            else:
+                signals = scraper.stream()
+
+            # The budget starts once the source gets a slot, not while queued
+            budget = scraper.time_budget()
+            deadline = SourceDeadline(budget)
+            source_deadline.set(deadline)
+            # Units keep their validators only once their signals are inserted
+            handoff: dict[int, UnitFetch] = {}
+            unit_handoff.set(handoff)
+            pump = asyncio.create_task(self._pump(scraper, signals, outbox, deadline, handoff))
+            grace = min(budget, DRAIN_GRACE_SECONDS)
+            stopped = False
+            try:
+                while not pump.done():
+                    left = deadline.remaining() + grace
+                    if left <= 0 and not stopped:
+                        # Stuck on something other than a fetch: cancel its
+                        # fetching outright, letting stream() drain its queue,
+                        # or the whole stream if it has none
+                        stopped = True
+                        if not deadline.stop():
+                            pump.cancel()
+                    await asyncio.wait({pump}, timeout=None if stopped else left)
+                if not pump.cancelled():
+                    pump.result()
+            except asyncio.CancelledError:
+                pump.cancel()
+                await asyncio.gather(pump, return_exceptions=True)
+                self._scraping[name] -= 1
+                if self._cancel_reason is None:
+                    raise
+                return
+            except Exception as e:
+                sentry_sdk.capture_exception(e)
+                log.error("scraper_failed", scraper=name, error=str(e))
+                self._scraping[name] -= 1
+                self._set_status(name, "failed", error=str(e))
+                return
+
+            self._scraping[name] -= 1
+            if deadline.expired:
+                log.warning("scraper_deadline_exceeded", scraper=name, budget_seconds=budget)
+                self._cut_short(name, "deadline")
+                return
+            self._maybe_complete(name)
+
+    async def _pump(
+        self,
+        scraper: BaseScraper,
+        signals: AsyncIterator[Signal],
+        outbox: asyncio.Queue,
+        deadline: SourceDeadline,
+        handoff: dict[int, UnitFetch],
+    ):
+        """Move a source's signals, with the units they came from, into the dedup queue."""
+        name = scraper.name
+        async with aclosing(signals):
+            async for signal in signals:
+                unit = handoff.pop(id(signal), None)
+                self._in_flight[name] += 1
+                try:
+                    if outbox.full():
+                        # Waiting on a backed-up pipeline isn't the source's time
+                        with deadline.paused():
+                            await outbox.put((scraper, signal, unit))
+                    else:
+                        outbox.put_nowait((scraper, signal, unit))
+                except BaseException:
+                    self._in_flight[name] -= 1
+                    if unit is not None:
+                        unit.settle(ok=False)
+                    raise
+
+    @staticmethod
+    async def _stream_units(scraper: BaseScraper, units: list[str]) -> AsyncIterator[Signal]:
+        for unit in units:
+            with track_unit_fetch() as fetch_state:
+                async for signal in scraper.stream_unit(unit):
+                    fetch_state.hand_off(signal)
+                    yield signal
+            commit_unit_fetch(fetch_state)
+
+    async def _stage_worker(
+        self,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue | None,
+        handler: StageHandler,
+    ):
+        while (item := await inbox.get()) is not _DONE:
+            scraper, signal, unit = item
+            ok = True
+            try:
+                result = await handler(scraper, signal)
+            except InsertFailedError:
+                result, ok = None, False
+            except Exception as e:
+                log.error("pipeline_stage_failed", stage=handler.__name__, scraper=scraper.name, error=str(e))
+                result, ok = None, False
+
+            if result is not None and outbox is not None:
+                await outbox.put((scraper, result, unit))
+            else:
+                self._release(scraper.name, unit, ok)
+
+    async def _dedup(self, scraper: BaseScraper, signal: Signal) -> Signal | None:
+        content_hash = signal.metadata.get("content_hash") or compute_content_hash(
+            signal.title, signal.company_name
+        )
+        signal.metadata = {**signal.metadata, "content_hash": content_hash}
+
+        # Cheap in-cycle check first: the same story often arrives from several sources
+        keys = [signal.source_url, content_hash]
+        if signal.company_id is not None:
+            keys.append(compute_content_hash(signal.title, signal.company_id))
+        if any(key in self._seen for key in keys):
+            self.stats.duplicates += 1
+            return None
+        self._seen.update(keys)
+
+        # Then resolve the company (a database round trip on a miss), so
+        # every spelling of it dedups as one
+        if self.companies is not None and signal.company_id is None:
+            await self._resolve_company(signal)
+            if signal.company_id is not None:
+                company_key = compute_content_hash(signal.title, signal.company_id)
+                if company_key in self._seen:
+                    self.stats.duplicates += 1
+                    return None
+                self._seen.add(company_key)
+
+        if await asyncio.to_thread(
+            is_duplicate,
+            signal.title,
+            signal.company_name,
+            signal.source_url,
+            content_hash,
+            signal.company_id,
+            signal.metadata.get("company_alias"),
+        ):
+            self.stats.duplicates += 1
+            return None
+        return signal
+
+    async def _resolve_company(self, signal: Signal):
+        # Names scrapers pull out of headlines ("first three words") are
+        # often not companies; only configured targets and names that come
+        # with a domain may create one, the rest are looked up only
+        create = bool(signal.company_domain) or any(
+            key in self._targets for key in alias_keys(signal.company_name)
+        )
+        company = await self.companies.resolve(signal.company_name, signal.company_domain, create=create)
+        if company is not None:
+            self.companies.apply(signal, company)
+
+    async def _enrich(self, scraper: BaseScraper, signal: Signal) -> Signal:
+        enriched_signal = await asyncio.to_thread(scraper.enrich_signal, signal)
+        if enriched_signal.metadata.get('ai_enriched'):
+            self.stats.ai_enriched += 1
+        return enriched_signal
+
+    async def _insert(self, scraper: BaseScraper, signal: Signal) -> None:
+        result = await asyncio.to_thread(insert_signal, signal, self.user_id)
+        if not result:
+            raise InsertFailedError(signal.source_url)
+
+        name = scraper.name
+        self.stats.total_signals += 1
+        self.stats.signals_by_source[name] += 1
+        self.stats.progress[name]["signals"] = self.stats.signals_by_source[name]
+
+        if self.stats.first_signal_seconds is None:
+            self.stats.first_signal_seconds = round(time.monotonic() - self._started_at, 2)
+            log.info("first_signal_inserted", scraper=name, seconds=self.stats.first_signal_seconds)
+        return None
+
+    def _release(self, name: str, unit: UnitFetch | None = None, ok: bool = True):
+        """Mark one signal from a source as fully processed (ok: not lost on the way)."""
+        self._in_flight[name] -= 1
+        if unit is not None:
+            unit.settle(ok)
+        self._maybe_complete(name)
+
+    def _maybe_complete(self, name: str):
+        # A source is done once it stopped scraping and its last signal drained
+        if self._scraping[name] > 0 or self._in_flight[name] > 0:
+            return
+        if self.stats.progress[name]["status"] == "running":
+            self._set_status(name, "completed")
+
+    def _cut_short(self, name: str, reason: str):
+        self.stats.cut_short[name] = reason
+        self._set_status(name, "cancelled", reason=reason)
+
+    def _set_status(self, name: str, status: str, error: str | None = None, reason: str | None = None):
+        entry = {"status": status, "signals": self.stats.signals_by_source[name]}
+        if error:
+            entry["error"] = error
+        if reason:
+            entry["reason"] = reason
+        self.stats.progress[name] = entry
+        self.on_progress(self.stats)
@@ -0,0 +1,169 @@
+"""
+Debounced progress writer for scrape_runs.
+
+Pipeline progress changes on every source status transition, and once
+sources report per-company progress that becomes a flood of blocking
+PostgREST round trips. ProgressReporter keeps the latest value of each
+field in memory and writes at most once per flush interval, immediately on
+terminal statuses, and never two writes at once so an older snapshot can't
+land after a newer one. Runs coalesced into an in-flight cycle are attached
+to its reporter and receive the same progress.
+"""
+
+import asyncio
+import copy
+import time
+import structlog
+
+from .config import get_settings
+from .db.supabase import update_scrape_run
+
+log = structlog.get_logger()
+
+TERMINAL_STATUSES = {"completed", "failed", "cancelled"}
+
+# Backoff between retries of a failed write, doubling up to the cap
+RETRY_BASE_SECONDS = 1.0
+RETRY_MAX_SECONDS = 30.0
+# Extra attempts close() makes before giving up on the final write
+CLOSE_RETRIES = 3
+
+
+class ProgressReporter:
+    """Buffers update_scrape_run fields for one or more runs and flushes them off the loop."""
+
+    def __init__(self, run_id: str | None, flush_interval: float | None = None):
+        self.run_ids: list[str] = [run_id] if run_id else []
+        self.flush_interval = (
+            get_settings().progress_flush_seconds if flush_interval is None else flush_interval
+        )
+        # Everything reported so far, and what each run hasn't received yet
+        self._latest: dict = {}
+        self._pending: dict[str, dict] = {}
+        self._last_flush = 0.0
+        self._write_lock = asyncio.Lock()
+        self._timer: asyncio.TimerHandle | None = None
+        self._writes: set[asyncio.Task] = set()
+        self._failures = 0
+        self._closed = False
+
+    def update(self, **fields):
+        """
+        Record new values for update_scrape_run fields.
+        Later values replace earlier ones; terminal statuses flush right away.
+        """
+        if self._closed:
+            return
+        self._buffer(fields)
+
+        if fields.get("status") in TERMINAL_STATUSES:
+            self._cancel_timer()
+            self._start_write()
+        else:
+            self._schedule()
+
+    def attach(self, run_id: str, **fields) -> bool:
+        """
+        Mirror this reporter into another run: it gets everything reported
+        so far (plus `fields`) on the next flush and every update after that.
+        """
+        if self._closed or run_id in self.run_ids:
+            return False
+        self.run_ids.append(run_id)
+        self._pending[run_id] = {**copy.deepcopy(self._latest), **copy.deepcopy(fields)}
+        self._schedule()
+        return True
+
+    def detach(self, run_id: str):
+        """Stop writing to a run, dropping anything still buffered for it."""
+        if run_id in self.run_ids:
+            self.run_ids.remove(run_id)
+        self._pending.pop(run_id, None)
+
+    async def flush(self):
+        """Write everything buffered so far."""
+        self._cancel_timer()
+        await self._write()
+
+    async def close(self, **fields):
+        """
+        Record final fields, flush, and ignore any later updates.
+        A failed final write is retried a few times with backoff, since no
+        later update will come along to carry it.
+        """
+        if self._closed:
+            return
+        self._buffer(fields)
+        self._closed = True
+        await self.flush()
+        if self._writes:
+            await asyncio.gather(*self._writes)
+
+        for _ in range(CLOSE_RETRIES):
+            if not self._pending:
+                return
+            await asyncio.sleep(self._retry_delay())
+            await self._write()
+        if self._pending:
+            log.error("scrape_progress_close_failed", run_ids=sorted(self._pending))
+
+    def _buffer(self, fields: dict):
+        # Callers pass live dicts (pipeline stats) that keep changing
+        fields = copy.deepcopy(fields)
+        self._latest.update(fields)
+        for run_id in self.run_ids:
+            self._pending.setdefault(run_id, {}).update(fields)
+
+    def _schedule(self):
+        if self._timer is None and self._pending:
+            wait = self._last_flush + self.flush_interval - time.monotonic()
+            self._timer = asyncio.get_running_loop().call_later(max(0.0, wait), self._on_timer)
+
+    def _retry_delay(self) -> float:
+        return min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** max(0, self._failures - 1))
+
+    def _schedule_retry(self):
+        # Replaces any regular timer; the retry carries newer values too
+        self._cancel_timer()
+        self._timer = asyncio.get_running_loop().call_later(self._retry_delay(), self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self._start_write()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _start_write(self):
+        task = asyncio.create_task(self._write())
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(self):
+        async with self._write_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+
+            failed = False
+            for run_id, fields in pending.items():
+                if not fields:
+                    continue
+                ok = await asyncio.to_thread(update_scrape_run, run_id, **fields)
+                if not ok:
+                    # Keep the failed values unless something newer arrived meanwhile
+                    self._pending[run_id] = {**fields, **self._pending.get(run_id, {})}
+                    failed = True
+                    log.warning("scrape_progress_flush_failed", run_id=run_id, fields=sorted(fields))
+
+            if not failed:
+                self._failures = 0
+                return
+            self._failures += 1
+            # Nothing else may flush again (a terminal status is the last
+            # update), so re-arm; close() does its own bounded retries
+            if not self._closed:
+                self._schedule_retry()
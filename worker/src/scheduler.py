@@ -0,0 +1,185 @@
+"""
+Async-native job scheduler for the long-lived worker event loop.
+
+Replaces the `schedule` library + per-job `asyncio.run`: every job runs as a
+task on one persistent loop, so clients, pools and caches survive between
+cycles and a long scrape no longer blocks other jobs.
+"""
+
+import asyncio
+import random
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Literal
+import sentry_sdk
+import structlog
+
+log = structlog.get_logger()
+
+# What to do when a job comes due while its previous run is still going:
+#   skip     - drop the tick
+#   queue    - run once more per missed tick (up to max_queued)
+#   coalesce - collapse all missed ticks into a single follow-up run
+OverlapPolicy = Literal["skip", "queue", "coalesce"]
+
+
+@dataclass
+class ScheduledJob:
+    """A recurring job and its runtime state."""
+    name: str
+    func: Callable[[], Awaitable[None]]
+    interval_seconds: float
+    jitter_seconds: float = 0.0
+    overlap: OverlapPolicy = "skip"
+    max_queued: int = 10
+
+    running: bool = False
+    pending_runs: int = 0
+    next_run_at: float = 0.0
+    run_count: int = 0
+    skipped_count: int = 0
+    last_started_at: str | None = None
+    last_finished_at: str | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    def snapshot(self) -> dict:
+        """JSON-safe view of the job for health output."""
+        return {
+            "interval_seconds": self.interval_seconds,
+            "overlap": self.overlap,
+            "running": self.running,
+            "pending_runs": self.pending_runs,
+            "run_count": self.run_count,
+            "skipped_count": self.skipped_count,
+            "last_started_at": self.last_started_at,
+            "last_finished_at": self.last_finished_at,
+        }
+
+
+class Scheduler:
+    """Runs ScheduledJobs on the current event loop until stopped."""
+
+    def __init__(self):
+        self.jobs: dict[str, ScheduledJob] = {}
+        self._wake = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._drain: asyncio.Task | None = None
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[None]],
+        interval_seconds: float,
+        *,
+        jitter_seconds: float = 0.0,
+        overlap: OverlapPolicy = "skip",
+        run_immediately: bool = False,
+    ) -> ScheduledJob:
+        job = ScheduledJob(
+            name=name,
+            func=func,
+            interval_seconds=interval_seconds,
+            jitter_seconds=jitter_seconds,
+            overlap=overlap,
+        )
+        now = asyncio.get_running_loop().time()
+        job.next_run_at = now if run_immediately else now + self._next_delay(job)
+        self.jobs[name] = job
+        self._wake.set()
+        return job
+
+    def trigger(self, name: str):
+        """Run a job now (subject to its overlap policy) without moving its schedule."""
+        self._fire(self.jobs[name], reschedule=False)
+
+    def reschedule(self, name: str, interval_seconds: float):
+        """Change a job's interval; takes effect from now."""
+        job = self.jobs[name]
+        job.interval_seconds = interval_seconds
+        job.next_run_at = asyncio.get_running_loop().time() + self._next_delay(job)
+        self._wake.set()
+
+    def snapshot(self) -> dict:
+        return {name: job.snapshot() for name, job in self.jobs.items()}
+
+    async def run(self):
+        """
+        Fire due jobs until stop() is called, then return once running jobs
+        have finished (or been cancelled), so callers can tear down what
+        the jobs use.
+        """
+        loop = asyncio.get_running_loop()
+        log.info("scheduler_started", jobs=list(self.jobs))
+
+        while not self._stopping.is_set():
+            now = loop.time()
+            for job in list(self.jobs.values()):
+                if job.next_run_at <= now:
+                    self._fire(job)
+
+            delay = min((job.next_run_at for job in self.jobs.values()), default=now + 60) - now
+            self._wake.clear()
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=max(0.0, delay))
+
+        if self._drain is not None:
+            await self._drain
+        log.info("scheduler_stopped")
+
+    async def stop(self, timeout: float = 10.0):
+        """Stop firing jobs and give running ones `timeout` seconds to finish."""
+        if self._drain is None:
+            self._drain = asyncio.create_task(self._drain_jobs(timeout))
+        self._stopping.set()
+        self._wake.set()
+        await asyncio.shield(self._drain)
+
+    async def _drain_jobs(self, timeout: float):
+        tasks = [job.task for job in self.jobs.values() if job.task and not job.task.done()]
+        if not tasks:
+            return
+        _, still_running = await asyncio.wait(tasks, timeout=timeout)
+        for task in still_running:
+            task.cancel()
+        with suppress(asyncio.CancelledError):
+            await asyncio.gather(*still_running, return_exceptions=True)
+
+    def _next_delay(self, job: ScheduledJob) -> float:
+        return job.interval_seconds + random.uniform(0, job.jitter_seconds)
+
+    def _fire(self, job: ScheduledJob, reschedule: bool = True):
+        if reschedule:
+            job.next_run_at = asyncio.get_running_loop().time() + self._next_delay(job)
+
+        if not job.running:
+            job.running = True
+            job.task = asyncio.create_task(self._run_job(job), name=f"job:{job.name}")
+            return
+
+        if job.overlap == "queue":
+            job.pending_runs = min(job.pending_runs + 1, job.max_queued)
+        elif job.overlap == "coalesce":
+            job.pending_runs = 1
+        else:
+            job.skipped_count += 1
+            log.info("scheduled_job_skipped", job=job.name, reason="still_running")
+
+    async def _run_job(self, job: ScheduledJob):
+        try:
+            while True:
+                job.last_started_at = datetime.now(timezone.utc).isoformat()
+                try:
+                    await job.func()
+                except Exception as e:
+                    sentry_sdk.capture_exception(e)
+                    log.error("scheduled_job_failed", job=job.name, error=str(e))
+
+                job.run_count += 1
+                job.last_finished_at = datetime.now(timezone.utc).isoformat()
+
+                if job.pending_runs == 0 or self._stopping.is_set():
+                    break
+                job.pending_runs -= 1
+        finally:
+            job.running = False
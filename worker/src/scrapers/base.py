@@ -1,32 +1,316 @@
+import asyncio
+import hashlib
 from abc import ABC, abstractmethod
+from contextlib import suppress
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+import httpx
 from ..models import Signal
-from ..ai import extract_entities, classify_signal, score_priority
+from ..ai import extract_entities, classify_signal, score_priority, signal_rules
 from ..config import get_settings
+from ..cache import get_result_cache
+from ..entities import get_company_index
+from ..feeds import FeedItem, parse_feed
+from ..parsing import get_parse_executor
+from ..net import (
+    get_http_client,
+    get_limited,
+    request_limited,
+    conditional_get,
+    feed_cursor,
+    mark_feed_read,
+    track_unit_fetch,
+    fail_unit_fetch,
+    commit_unit_fetch,
+    source_deadline,
+)
 import structlog
 
 log = structlog.get_logger()
 
+T = TypeVar("T")
+
 
 class BaseScraper(ABC):
     name: str = "base"
 
+    # Max units of work (companies, feeds, subreddits) fetched at once.
+    # Can be overridden per source via SOURCE_CONCURRENCY.
+    max_concurrency: int = 1
+
+    # Bounds for the adaptive polling interval, in minutes.
+    # Can be overridden per source via SOURCE_INTERVAL_BOUNDS.
+    min_interval_minutes: float = 15
+    max_interval_minutes: float = 240
+
+    # How long a unit's parsed results can be reused by manual runs, in
+    # seconds; sources opt in, 0 disables caching. max_staleness_seconds is
+    # set per run: None (scheduled cycles) always fetches but still
+    # refreshes the cache.
+    result_ttl_seconds: float = 0
+    max_staleness_seconds: float | None = None
+
+    # Wall-clock budget for one run of this source, in seconds; None uses
+    # SCRAPER_TIME_BUDGET_SECONDS. Overridable via SOURCE_TIME_BUDGETS.
+    time_budget_seconds: float | None = None
+
+    # Largest response body this source reads, in bytes; None uses
+    # HTTP_MAX_RESPONSE_BYTES. Overridable via SOURCE_RESPONSE_BUDGETS.
+    # content_types are Content-Type substrings the source can parse
+    # (None accepts anything but binary types).
+    max_response_bytes: int | None = None
+    content_types: tuple[str, ...] | None = None
+
+    def units(self) -> list[str]:
+        """
+        Independent units of work for one scrape.
+        Sources that fan out over companies or feeds return one unit each;
+        single-endpoint sources keep the default single unit.
+        """
+        return [self.name]
+
     @abstractmethod
-    async def scrape(self) -> list[Signal]:
-        """Scrape source and return list of signals."""
+    def stream_unit(self, unit: str) -> AsyncIterator[Signal]:
+        """Scrape a single unit of work, yielding signals as they are parsed."""
         pass
 
-    def log_result(self, signals: list[Signal]):
-        log.info("scrape_complete", scraper=self.name, signal_count=len(signals))
+    def interval_bounds(self) -> tuple[float, float]:
+        """Min/max polling interval in minutes, honouring settings overrides."""
+        overrides = get_settings().source_interval_bounds
+        return overrides.get(self.name, (self.min_interval_minutes, self.max_interval_minutes))
+
+    def params(self) -> tuple:
+        """The scraper parameters that shape which signals a response yields."""
+        companies = getattr(self, "target_companies", None) or ()
+        keywords = getattr(self, "signal_keywords", None) or ()
+        # Sorted: sets have no stable order, and order doesn't shape results
+        return (tuple(sorted(companies)), tuple(sorted(keywords)))
+
+    def cache_key(self, unit: str) -> tuple:
+        """Result cache key: source, unit and the parameters that shape results."""
+        return (self.name, unit, *self.params())
+
+    def params_fingerprint(self) -> str:
+        """Stable hash of params(), stored alongside HTTP validators."""
+        return hashlib.sha1(repr(self.params()).encode()).hexdigest()[:16]
+
+    def cache_max_age(self) -> float | None:
+        """Oldest cached result this run may reuse, or None to always fetch."""
+        if self.max_staleness_seconds is None or self.result_ttl_seconds <= 0:
+            return None
+        return min(self.result_ttl_seconds, self.max_staleness_seconds)
+
+    def cached_result(self, unit: str) -> list[Signal] | None:
+        """Fresh cached signals for a unit, if this run allows reusing them."""
+        max_age = self.cache_max_age()
+        if max_age is None:
+            return None
+        return get_result_cache().get(self.cache_key(unit), max_age)
+
+    def time_budget(self) -> float:
+        """Seconds this source may scrape per run, honouring settings overrides."""
+        settings = get_settings()
+        budget = settings.source_time_budgets.get(self.name, self.time_budget_seconds)
+        return budget if budget is not None else settings.scraper_time_budget_seconds
+
+    def response_budget(self) -> int:
+        """Max bytes of one response body, honouring settings overrides."""
+        settings = get_settings()
+        budget = settings.source_response_budgets.get(self.name, self.max_response_bytes)
+        return budget if budget is not None else settings.http_max_response_bytes
+
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled client shared by every scraper (don't close it)."""
+        return get_http_client()
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        GET a page through the pooled client, streamed and aborted with
+        ResponseBudgetError if it's over budget or of the wrong type.
+        """
+        return await self._unit_request(get_limited(
+            self.http_client(),
+            url,
+            self.name,
+            max_bytes=self.response_budget(),
+            content_types=self.content_types,
+            **kwargs,
+        ))
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """POST through the pooled client with the same budgets as get()."""
+        return await self._unit_request(request_limited(
+            self.http_client(),
+            "POST",
+            url,
+            self.name,
+            max_bytes=self.response_budget(),
+            content_types=self.content_types,
+            **kwargs,
+        ))
+
+    async def fetch(self, url: str, **kwargs) -> httpx.Response:
+        """
+        GET a feed like get(). In shared cycles this is a conditional
+        request, and a 304 response means the feed hasn't changed since it
+        was last processed, so callers should stop there.
+        """
+        return await self._unit_request(conditional_get(
+            self.http_client(),
+            self.name,
+            url,
+            self.params_fingerprint(),
+            max_bytes=self.response_budget(),
+            content_types=self.content_types,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def _unit_request(request: Awaitable[httpx.Response]) -> httpx.Response:
+        try:
+            return await request
+        except Exception:
+            # Most stream_units log fetch errors and carry on, so the unit
+            # finishing doesn't mean it was fetched completely
+            fail_unit_fetch()
+            raise
+
+    async def fetch_feed(self, url: str, limit: int | None = None, resume: bool = True, **kwargs) -> list[FeedItem]:
+        """
+        Fetch an RSS/Atom feed and parse at most `limit` items. Unchanged
+        (304) feeds have none. With `resume`, for feeds listing newest items
+        first, reading in shared cycles stops at the newest item processed
+        last time; the feed's resume point only moves once the unit's items
+        have all been inserted. Raises for error statuses.
+        """
+        resp = await self.fetch(url, **kwargs)
+        if resp.status_code == 304:
+            return []
+        resp.raise_for_status()
+
+        stop_at = feed_cursor(url, self.params_fingerprint()) if resume else None
+        page = await self.parse(parse_feed, resp.content, limit, stop_at)
+        if resume:
+            mark_feed_read(url, page.items[0].key if page.items else None, page.caught_up)
+        return page.items
+
+    async def parse(self, parser: Callable[..., T], content: bytes, *args) -> T:
+        """
+        Run parser(content, *args) on the shared parse executor, off the
+        event loop. parser must be a module-level function returning plain
+        records, so it can run in another process.
+        """
+        return await get_parse_executor().run(parser, content, *args)
+
+    def concurrency_limit(self) -> int:
+        """Per-source concurrency cap, honouring settings overrides."""
+        overrides = get_settings().source_concurrency
+        return max(1, overrides.get(self.name, self.max_concurrency))
+
+    async def stream(self, units: list[str] | None = None) -> AsyncIterator[Signal]:
+        """
+        Stream signals from all units (or the given subset) concurrently,
+        bounded per source. Units feed a bounded queue, so a slow consumer
+        applies backpressure to fetching instead of buffering the whole
+        result set.
+        """
+        units = self.units() if units is None else units
+        if not units:
+            return
+
+        settings = get_settings()
+        companies = get_company_index() if settings.entity_resolution_enabled else None
+        semaphore = asyncio.Semaphore(self.concurrency_limit())
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.pipeline_queue_size)
+        done = object()
+
+        async def run_unit(unit: str):
+            try:
+                cached = self.cached_result(unit)
+                if cached is not None:
+                    log.debug("scrape_unit_cached", scraper=self.name, unit=unit, signal_count=len(cached))
+                    for signal in cached:
+                        await queue.put(signal)
+                    return
+
+                fetched = []
+                with track_unit_fetch() as fetch_state:
+                    async with semaphore:
+                        async for signal in self.stream_unit(unit):
+                            if self.result_ttl_seconds > 0:
+                                fetched.append(signal.model_copy(deep=True))
+                            fetch_state.hand_off(signal)
+                            await queue.put(signal)
+
+                # Only complete fetches are cached, never partial or failed
+                # ones; an unchanged (304) or caught-up feed yields only
+                # what's new, so its old results stand. Validators are kept
+                # once the consumer has settled (inserted) what was yielded.
+                commit_unit_fetch(fetch_state)
+                if self.result_ttl_seconds > 0 and fetch_state.complete:
+                    get_result_cache().put(self.cache_key(unit), fetched)
+            except Exception as e:
+                log.error("scrape_unit_failed", scraper=self.name, unit=unit, error=str(e))
+
+        closing = False
+
+        async def run_units():
+            try:
+                await asyncio.gather(*(run_unit(u) for u in units))
+            finally:
+                # Also when the source's deadline stops fetching: what's
+                # queued is still yielded
+                if not closing:
+                    await queue.put(done)
+
+        producer = asyncio.create_task(run_units())
+        if (deadline := source_deadline.get()) is not None:
+            deadline.track(producer)
+        signal_count = 0
+        try:
+            while (signal := await queue.get()) is not done:
+                signal_count += 1
+                # Known companies get their canonical name and ID here; the
+                # pipeline resolves the rest
+                yield companies.canonicalize(signal) if companies is not None else signal
+        finally:
+            # Stop fetching if the consumer bails out early
+            closing = True
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+
+        self.log_result(signal_count)
+
+    async def scrape(self) -> list[Signal]:
+        """Scrape all units and return the collected signals."""
+        return [signal async for signal in self.stream()]
+
+    def log_result(self, signal_count: int):
+        log.info("scrape_complete", scraper=self.name, signal_count=signal_count)
 
     def enrich_signal(self, signal: Signal) -> Signal:
         """
-        Enrich a signal with AI-extracted entities and classification.
-        Updates signal in place and returns it.
+        Enrich a signal with AI-extracted entities and classification,
+        unless the keyword rules confidently agree with its type (then it is
+        only marked rule_classified). Updates signal in place and returns it.
         """
         settings = get_settings()
         if not settings.ai_enabled:
             return signal
 
+        # Rules first: when they are already confident of the type the
+        # scraper gave the signal, no model is needed at all
+        rules = signal_rules().classify(f"{signal.title} {signal.summary}")
+        signal.metadata['rule_confidence'] = rules.confidence
+        if (
+            rules.signal_type == signal.signal_type
+            and rules.confidence >= settings.rule_confidence_threshold
+        ):
+            log.debug("enrichment_skipped", type=signal.signal_type, rule_confidence=rules.confidence)
+            signal.metadata['ai_enriched'] = False
+            signal.metadata['rule_classified'] = True
+            return signal
+
         try:
             # Step 1: Extract entities
             entities = extract_entities(
@@ -1,9 +1,11 @@
-import httpx
 from selectolax.parser import HTMLParser
 from urllib.parse import urljoin
 from ..scrapers.base import BaseScraper
 from ..models import Signal
-from ..db.dedup import is_duplicate, get_content_hash
+from ..ai import signal_rules
+from ..db.dedup import get_content_hash
+from ..net import BROWSER_HEADERS, RESPECT_ROBOTS, RobotsDisallowedError
+from typing import AsyncIterator
 import structlog
 
 log = structlog.get_logger()
@@ -41,76 +43,76 @@ KNOWN_PRESS_URLS = {
 }
 
 
+def parse_press_links(content: bytes, encoding: str) -> list[tuple[str, str]]:
+    """(href, text) of the links on a press page long enough to be headlines."""
+    parser = HTMLParser(content.decode(encoding, errors="replace"))
+    links = []
+    for link in parser.css("a"):
+        href = link.attributes.get("href") or ""
+        text = link.text(strip=True)
+        if href and text and len(text) >= 20:
+            links.append((href, text))
+    return links
+
+
 class CompanyWebsiteScraper(BaseScraper):
     name = "company"
+    max_concurrency = 4
+    min_interval_minutes = 360
+    max_interval_minutes = 10080
+    result_ttl_seconds = 3600
+    max_response_bytes = 3_000_000
+    content_types = ("html",)
 
     def __init__(self, target_companies: list[str] | None = None):
         self.target_companies = target_companies or list(KNOWN_PRESS_URLS.keys())
 
-    def _get_company_sources(self) -> list[dict]:
-        """Build list of company sources from target companies."""
-        sources = []
+    def _get_company_sources(self) -> dict[str, dict]:
+        """Build company sources from target companies, keyed by company name."""
+        sources = {}
         for company in self.target_companies:
             company_lower = company.lower()
             if company_lower in KNOWN_PRESS_URLS:
                 info = KNOWN_PRESS_URLS[company_lower]
-                sources.append({
+                sources[company] = {
                     "name": company,
                     "domain": info["domain"],
                     "press_url": info["press_url"],
-                })
+                }
         return sources
 
-    async def scrape(self) -> list[Signal]:
-        signals = []
-        company_sources = self._get_company_sources()
-
-        if not company_sources:
+    def units(self) -> list[str]:
+        units = list(self._get_company_sources())
+        if not units:
             log.info("no_company_sources", target_companies=self.target_companies)
-            return signals
-
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            },
-            follow_redirects=True,
-        ) as client:
-            for company in company_sources:
-                try:
-                    # Scrape press releases
-                    press_signals = await self._scrape_press_releases(client, company)
-                    signals.extend(press_signals)
-                except Exception as e:
-                    log.error("press_scrape_failed", company=company["name"], error=str(e))
-
-        self.log_result(signals)
-        return signals
-
-    async def _scrape_press_releases(
-        self, client: httpx.AsyncClient, company: dict
-    ) -> list[Signal]:
-        """Scrape a company's press release page."""
-        signals = []
+        return units
+
+    async def stream_unit(self, company_name: str) -> AsyncIterator[Signal]:
+        company = self._get_company_sources()[company_name]
+
+        try:
+            # Scrape press releases
+            async for signal in self._scrape_press_releases(company):
+                yield signal
+        except Exception as e:
+            log.error("press_scrape_failed", company=company["name"], error=str(e))
 
+    async def _scrape_press_releases(self, company: dict) -> AsyncIterator[Signal]:
+        """Scrape a company's press release page."""
         try:
-            resp = await client.get(company["press_url"])
+            resp = await self.get(company["press_url"], headers=BROWSER_HEADERS, extensions=RESPECT_ROBOTS)
             resp.raise_for_status()
+        except RobotsDisallowedError:
+            return
         except Exception as e:
             log.warning("press_page_failed", url=company["press_url"], error=str(e))
-            return []
+            return
 
-        parser = HTMLParser(resp.text)
+        links = await self.parse(parse_press_links, resp.content, resp.encoding or "utf-8")
 
         # Generic approach: find links that look like press releases
         # Most press pages have article/news items with links and dates
-        for link in parser.css("a"):
-            href = link.attributes.get("href", "")
-            text = link.text(strip=True)
-
-            if not href or not text or len(text) < 20:
-                continue
-
+        for href, text in links:
             # Filter to likely press release links
             if not any(kw in href.lower() for kw in ["news", "press", "release", "announce"]):
                 if not any(
@@ -126,71 +128,19 @@ class CompanyWebsiteScraper(BaseScraper):
             if company["domain"] not in full_url:
                 continue
 
-            # Dedup
-            if is_duplicate(text, company["name"], full_url):
-                continue
-
             # Classify the signal
-            signal_type = self._classify_press_release(text)
-            if not signal_type:
+            rules = signal_rules().classify(text, default_priority="medium")
+            if not rules.signal_type:
                 continue
 
-            signal = Signal(
+            yield Signal(
                 company_name=company["name"],
                 company_domain=company["domain"],
-                signal_type=signal_type,
+                signal_type=rules.signal_type,
                 title=text[:200],
                 summary=f"Press release from {company['name']}: {text[:300]}",
                 source_url=full_url,
                 source_name=f"{company['name']} Newsroom",
-                priority=self._assess_priority(text),
+                priority=rules.priority,
                 metadata=get_content_hash(text, company["name"]),
             )
-            signals.append(signal)
-
-        return signals
-
-    def _classify_press_release(self, text: str) -> str | None:
-        """Classify press release text into signal type."""
-        text_lower = text.lower()
-
-        if any(
-            kw in text_lower
-            for kw in ["funding", "raises", "investment", "series", "valuation"]
-        ):
-            return "funding"
-        if any(
-            kw in text_lower
-            for kw in ["launch", "introduces", "unveils", "announces", "releases"]
-        ):
-            return "product_launch"
-        if any(
-            kw in text_lower
-            for kw in ["partner", "collaboration", "alliance", "teams with"]
-        ):
-            return "partnership"
-        if any(
-            kw in text_lower
-            for kw in ["expands", "opens", "new office", "new market", "international"]
-        ):
-            return "expansion"
-        if any(
-            kw in text_lower
-            for kw in ["appoints", "names", "joins", "promotes", "ceo", "cto"]
-        ):
-            return "leadership_change"
-
-        return None
-
-    def _assess_priority(self, text: str) -> str:
-        """Assess priority based on content."""
-        text_lower = text.lower()
-
-        # High priority: Major funding, C-suite changes
-        if any(
-            kw in text_lower
-            for kw in ["$100", "$50", "billion", "ceo", "cto", "acquisition"]
-        ):
-            return "high"
-
-        return "medium"
@@ -2,17 +2,16 @@
 GlobeNewswire RSS Scraper - Official press releases.
 """
 
-import asyncio
-import xml.etree.ElementTree as ET
-from html import unescape
-import httpx
 import structlog
-from typing import Optional
+from typing import AsyncIterator, Optional
 import re
 
 from .base import BaseScraper
-from ..models import Signal, Priority
-from ..db.dedup import is_duplicate, get_content_hash
+from ..models import Signal
+from ..matching import get_company_matcher, normalize_terms
+from ..ai import signal_rules
+from ..feeds import FeedItem
+from ..db.dedup import get_content_hash
 
 log = structlog.get_logger()
 
@@ -24,6 +23,10 @@ class GlobeNewswireScraper(BaseScraper):
     """
 
     name = "globenewswire"
+    max_concurrency = 3
+    min_interval_minutes = 15
+    max_interval_minutes = 240
+    result_ttl_seconds = 600
 
     RSS_FEEDS = [
         "https://www.globenewswire.com/RssFeed/subjectcode/25-Earnings/feedTitle/GlobeNewswire%20-%20Earnings",
@@ -33,75 +36,56 @@ class GlobeNewswireScraper(BaseScraper):
         "https://www.globenewswire.com/RssFeed/subjectcode/35-Funding%20Information/feedTitle/GlobeNewswire%20-%20Funding%20Information",
     ]
 
-    def __init__(self, target_companies: list[str] | None = None):
-        self.target_companies = [c.lower() for c in (target_companies or [])]
+    def __init__(
+        self,
+        target_companies: list[str] | None = None,
+        normalized_companies: frozenset[str] | None = None,
+    ):
+        # The config snapshot hands over its precomputed lowercase set
+        self.target_companies = normalized_companies or normalize_terms(target_companies or [])
+        self.company_matcher = get_company_matcher(target_companies or [])
 
-    async def scrape(self) -> list[Signal]:
-        signals = []
-
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            for feed_url in self.RSS_FEEDS:
-                try:
-                    feed_signals = await self._scrape_feed(client, feed_url)
-                    signals.extend(feed_signals)
-                    await asyncio.sleep(0.5)
-                except Exception as e:
-                    log.warning("globenewswire_feed_failed", error=str(e))
-
-        self.log_result(signals)
-        return signals
-
-    async def _scrape_feed(self, client: httpx.AsyncClient, feed_url: str) -> list[Signal]:
-        signals = []
+    def units(self) -> list[str]:
+        return self.RSS_FEEDS
 
+    async def stream_unit(self, feed_url: str) -> AsyncIterator[Signal]:
         try:
-            resp = await client.get(feed_url)
-            if resp.status_code != 200:
-                return []
-
-            root = ET.fromstring(resp.content)
-
-            for item in root.findall(".//item")[:15]:
-                signal = self._parse_item(item)
-                if signal:
-                    signals.append(signal)
+            async for signal in self._scrape_feed(feed_url):
+                yield signal
+        except Exception as e:
+            log.warning("globenewswire_feed_failed", error=str(e))
 
+    async def _scrape_feed(self, feed_url: str) -> AsyncIterator[Signal]:
+        try:
+            items = await self.fetch_feed(feed_url, limit=15)
         except Exception as e:
             log.debug("globenewswire_parse_failed", error=str(e))
+            return
 
-        return signals
-
-    def _parse_item(self, item: ET.Element) -> Optional[Signal]:
-        title_elem = item.find("title")
-        link_elem = item.find("link")
-        desc_elem = item.find("description")
-
-        if title_elem is None or link_elem is None:
-            return None
+        for item in items:
+            signal = self._parse_item(item)
+            if signal:
+                yield signal
 
-        title = unescape(title_elem.text or "")
-        url = link_elem.text or ""
-        description = unescape(desc_elem.text or "") if desc_elem is not None else ""
+    def _parse_item(self, item: FeedItem) -> Optional[Signal]:
+        title = item.title
+        url = item.link
+        description = item.summary
 
         if not title or not url:
             return None
 
         company_name = self._extract_company(title)
-        title_lower = title.lower()
 
         # Filter by target companies if specified
-        if self.target_companies:
-            if not any(tc in title_lower for tc in self.target_companies):
-                return None
-
-        # Dedup check
-        if is_duplicate(title, company_name, url):
+        if self.company_matcher and not self.company_matcher.first(title):
             return None
 
-        signal_type = self._detect_signal_type(title_lower)
-        priority = self._assess_priority(title_lower, description.lower())
+        rules = signal_rules().classify(f"{title} {description}")
+        signal_type = rules.signal_type or "product_launch"
+        priority = rules.priority
 
-        summary = re.sub(r'<[^>]+>', '', description)[:300]
+        summary = description[:300]
         if not summary:
             summary = title
 
@@ -130,28 +114,3 @@ class GlobeNewswireScraper(BaseScraper):
                 return match.group(1).strip()
         words = title.split()[:3]
         return " ".join(words)
-
-    def _detect_signal_type(self, title: str) -> str:
-        if any(w in title for w in ["hiring", "appoints", "names", "promotes"]):
-            return "leadership_change"
-        if any(w in title for w in ["raised", "funding", "investment", "capital"]):
-            return "funding"
-        if any(w in title for w in ["launch", "unveil", "introduce", "release"]):
-            return "product_launch"
-        if any(w in title for w in ["partner", "acquisition", "acquire", "agreement"]):
-            return "partnership"
-        if any(w in title for w in ["expand", "growth", "new office", "international"]):
-            return "expansion"
-        if any(w in title for w in ["revenue", "earnings", "results"]):
-            return "expansion"
-        return "product_launch"
-
-    def _assess_priority(self, title: str, description: str) -> Priority:
-        combined = title + " " + description
-        if any(w in combined for w in ["billion", "100 million", "50 million"]):
-            return "high"
-        if any(w in combined for w in ["million", "series", "acquisition"]):
-            return "high"
-        if any(w in combined for w in ["funding", "launch", "expansion"]):
-            return "medium"
-        return "low"
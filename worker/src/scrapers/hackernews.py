@@ -3,13 +3,14 @@ Hacker News Scraper - Free API, high-quality tech/startup news.
 """
 
 import asyncio
-import httpx
 import structlog
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from .base import BaseScraper
-from ..models import Signal, Priority
-from ..db.dedup import is_duplicate, get_content_hash
+from ..models import Signal
+from ..matching import get_company_matcher, normalize_terms
+from ..ai import signal_rules
+from ..db.dedup import get_content_hash
 
 log = structlog.get_logger()
 
@@ -35,52 +36,55 @@ class HackerNewsScraper(BaseScraper):
     """
 
     name = "hackernews"
-
-    def __init__(self, target_companies: list[str] | None = None):
-        self.target_companies = [c.lower() for c in (target_companies or TARGET_COMPANIES)]
+    min_interval_minutes = 5
+    max_interval_minutes = 60
+    result_ttl_seconds = 120
+
+    def __init__(
+        self,
+        target_companies: list[str] | None = None,
+        normalized_companies: frozenset[str] | None = None,
+    ):
+        # The config snapshot hands over its precomputed lowercase set
+        self.target_companies = normalized_companies or normalize_terms(target_companies or TARGET_COMPANIES)
+        self.company_matcher = get_company_matcher(target_companies or TARGET_COMPANIES)
         self.base_url = "https://hacker-news.firebaseio.com/v0"
 
-    async def scrape(self) -> list[Signal]:
-        signals = []
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Get top 100 stories
-            top_url = f"{self.base_url}/topstories.json"
-            new_url = f"{self.base_url}/newstories.json"
-
-            try:
-                top_resp = await client.get(top_url)
-                new_resp = await client.get(new_url)
-
-                top_ids = top_resp.json()[:50] if top_resp.status_code == 200 else []
-                new_ids = new_resp.json()[:50] if new_resp.status_code == 200 else []
-
-                all_ids = list(set(top_ids + new_ids))[:75]  # Dedupe and limit
-
-                # Fetch stories in parallel batches
-                for i in range(0, len(all_ids), 10):
-                    batch_ids = all_ids[i:i+10]
-                    tasks = [self._fetch_story(client, sid) for sid in batch_ids]
-                    stories = await asyncio.gather(*tasks, return_exceptions=True)
-
-                    for story in stories:
-                        if isinstance(story, dict):
-                            signal = self._parse_story(story)
-                            if signal:
-                                signals.append(signal)
+    async def stream_unit(self, unit: str) -> AsyncIterator[Signal]:
+        # Get top 100 stories
+        top_url = f"{self.base_url}/topstories.json"
+        new_url = f"{self.base_url}/newstories.json"
 
-                    await asyncio.sleep(0.5)  # Rate limit
+        try:
+            top_resp = await self.get(top_url)
+            new_resp = await self.get(new_url)
 
-            except Exception as e:
-                log.error("hackernews_scrape_failed", error=str(e))
+            top_ids = top_resp.json()[:50] if top_resp.status_code == 200 else []
+            new_ids = new_resp.json()[:50] if new_resp.status_code == 200 else []
 
-        self.log_result(signals)
-        return signals
+            all_ids = list(set(top_ids + new_ids))[:75]  # Dedupe and limit
 
-    async def _fetch_story(self, client: httpx.AsyncClient, story_id: int) -> Optional[dict]:
+            # Fetch all stories at once; the host's adaptive concurrency
+            # limit decides how many are actually in flight
+            tasks = [asyncio.ensure_future(self._fetch_story(sid)) for sid in all_ids]
+            try:
+                for next_story in asyncio.as_completed(tasks):
+                    story = await next_story
+                    if story:
+                        signal = self._parse_story(story)
+                        if signal:
+                            yield signal
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        except Exception as e:
+            log.error("hackernews_scrape_failed", error=str(e))
+
+    async def _fetch_story(self, story_id: int) -> Optional[dict]:
         try:
             url = f"{self.base_url}/item/{story_id}.json"
-            resp = await client.get(url)
+            resp = await self.get(url)
             if resp.status_code == 200:
                 return resp.json()
         except Exception:
@@ -98,11 +102,8 @@ class HackerNewsScraper(BaseScraper):
         title_lower = title.lower()
 
         # Check if it matches a target company
-        matched_company = None
-        for company in self.target_companies:
-            if company in title_lower:
-                matched_company = company.title()
-                break
+        mention = self.company_matcher.first(title)
+        matched_company = mention.company.title() if mention else None
 
         # Check if it has signal keywords
         has_signal = any(kw in title_lower for kw in SIGNAL_KEYWORDS)
@@ -111,18 +112,20 @@ class HackerNewsScraper(BaseScraper):
             return None
 
         # Determine signal type
-        signal_type = self._detect_signal_type(title_lower)
+        rules = signal_rules().classify(title)
+        signal_type = rules.signal_type or "product_launch"
 
         # Skip if no URL (text-only posts)
         if not url:
             url = f"https://news.ycombinator.com/item?id={story_id}"
 
-        # Dedup check
         company_name = matched_company or "Tech Industry"
-        if is_duplicate(title, company_name, url):
-            return None
-
-        priority = self._assess_priority(title_lower, story.get("score", 0))
+        priority = rules.priority
+        # High score = high visibility = high priority
+        if story.get("score", 0) > 200:
+            priority = "high"
+        elif story.get("score", 0) > 50 and priority == "low":
+            priority = "medium"
 
         return Signal(
             company_name=company_name,
@@ -139,28 +142,3 @@ class HackerNewsScraper(BaseScraper):
                 "comments": story.get("descendants", 0),
             },
         )
-
-    def _detect_signal_type(self, title: str) -> str:
-        if any(w in title for w in ["hiring", "job", "career", "engineer", "developer"]):
-            return "hiring"
-        if any(w in title for w in ["raised", "funding", "series", "seed", "investment", "ipo"]):
-            return "funding"
-        if any(w in title for w in ["launch", "released", "announcing", "introducing", "new product"]):
-            return "product_launch"
-        if any(w in title for w in ["acquired", "acquisition", "merge", "partnership"]):
-            return "partnership"
-        if any(w in title for w in ["expand", "growth", "scaling", "international"]):
-            return "expansion"
-        if any(w in title for w in ["ceo", "cto", "founder", "executive", "leadership"]):
-            return "leadership_change"
-        return "product_launch"
-
-    def _assess_priority(self, title: str, score: int) -> Priority:
-        # High score = high visibility = high priority
-        if score > 200:
-            return "high"
-        if any(w in title for w in ["raised", "funding", "acquired", "ipo"]):
-            return "high"
-        if score > 50:
-            return "medium"
-        return "low"
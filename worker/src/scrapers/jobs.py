@@ -3,8 +3,11 @@ from selectolax.parser import HTMLParser
 from urllib.parse import urlencode
 from ..scrapers.base import BaseScraper
 from ..models import Signal
-from ..config import get_settings
-from ..db.dedup import is_duplicate, get_content_hash
+from ..ai import role_rules
+from ..db.dedup import get_content_hash
+from ..matching import normalize_terms
+from ..net import get_http_client, get_proxy_pool, BROWSER_HEADERS, RESPECT_ROBOTS, RobotsDisallowedError
+from typing import AsyncIterator, NamedTuple
 import structlog
 
 log = structlog.get_logger()
@@ -30,45 +33,72 @@ DEFAULT_SIGNAL_KEYWORDS = [
 ]
 
 
+class JobCard(NamedTuple):
+    """The fields of one Indeed job card."""
+    title: str
+    company: str
+    href: str
+
+
+def parse_job_cards(content: bytes, encoding: str) -> list[JobCard]:
+    """Job cards on an Indeed search results page."""
+    parser = HTMLParser(content.decode(encoding, errors="replace"))
+    cards = []
+    for job_card in parser.css("div.job_seen_beacon"):
+        try:
+            title_el = job_card.css_first("h2.jobTitle span")
+            company_el = job_card.css_first("span[data-testid='company-name']")
+            link_el = job_card.css_first("a.jcs-JobTitle")
+
+            if not all([title_el, company_el, link_el]):
+                continue
+
+            cards.append(JobCard(
+                title=title_el.text(strip=True),
+                company=company_el.text(strip=True),
+                href=link_el.attributes.get("href") or "",
+            ))
+        except Exception as e:
+            log.warning("job_parse_failed", error=str(e))
+    return cards
+
+
 class JobBoardScraper(BaseScraper):
     name = "jobs"
+    max_concurrency = 2
+    min_interval_minutes = 60
+    max_interval_minutes = 1440
+    result_ttl_seconds = 1800
+    max_response_bytes = 2_000_000
+    content_types = ("html",)
 
     def __init__(
         self,
         target_companies: list[str] | None = None,
         signal_keywords: list[str] | None = None,
+        normalized_keywords: frozenset[str] | None = None,
     ):
-        settings = get_settings()
-        self.proxy = settings.proxy_url
+        self.proxy = get_proxy_pool()
         self.target_companies = target_companies or DEFAULT_TARGET_COMPANIES
         self.signal_keywords = signal_keywords or DEFAULT_SIGNAL_KEYWORDS
+        self.normalized_keywords = normalized_keywords or normalize_terms(self.signal_keywords)
 
-    async def scrape(self) -> list[Signal]:
-        signals = []
-
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            proxy=self.proxy,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            },
-        ) as client:
-            for company in self.target_companies:
-                try:
-                    company_signals = await self._scrape_company_jobs(client, company)
-                    signals.extend(company_signals)
-                except Exception as e:
-                    log.error("company_jobs_failed", company=company, error=str(e))
-
-        self.log_result(signals)
-        return signals
-
-    async def _scrape_company_jobs(
-        self, client: httpx.AsyncClient, company: str
-    ) -> list[Signal]:
-        """Scrape Indeed for a specific company's job postings."""
-        signals = []
+    def units(self) -> list[str]:
+        return self.target_companies
+
+    def http_client(self) -> httpx.AsyncClient:
+        # Job boards go through the Bright Data proxy pool when it's configured
+        return get_http_client(self.proxy)
+
+    async def stream_unit(self, company: str) -> AsyncIterator[Signal]:
+        try:
+            async for signal in self._scrape_company_jobs(company):
+                yield signal
+        except Exception as e:
+            log.error("company_jobs_failed", company=company, error=str(e))
 
+    async def _scrape_company_jobs(self, company: str) -> AsyncIterator[Signal]:
+        """Scrape Indeed for a specific company's job postings."""
         # Search Indeed for company jobs
         params = {
             "q": f'"{company}"',
@@ -78,41 +108,32 @@ class JobBoardScraper(BaseScraper):
         url = f"https://www.indeed.com/jobs?{urlencode(params)}"
 
         try:
-            resp = await client.get(url)
+            resp = await self.get(url, headers=BROWSER_HEADERS, extensions=RESPECT_ROBOTS)
             if resp.status_code == 403:
                 log.warning("rate_limited", source="indeed", company=company)
-                return []
+                return
             resp.raise_for_status()
+        except RobotsDisallowedError:
+            return
         except Exception as e:
             log.error("indeed_fetch_failed", company=company, error=str(e))
-            return []
+            return
 
-        parser = HTMLParser(resp.text)
+        cards = await self.parse(parse_job_cards, resp.content, resp.encoding or "utf-8")
 
-        # Indeed job cards
-        for job_card in parser.css("div.job_seen_beacon"):
+        for card in cards:
             try:
-                title_el = job_card.css_first("h2.jobTitle span")
-                company_el = job_card.css_first("span[data-testid='company-name']")
-                link_el = job_card.css_first("a.jcs-JobTitle")
-
-                if not all([title_el, company_el, link_el]):
-                    continue
-
-                title = title_el.text(strip=True)
-                detected_company = company_el.text(strip=True)
-                job_link = "https://www.indeed.com" + link_el.attributes.get("href", "")
+                title = card.title
+                detected_company = card.company
+                job_link = "https://www.indeed.com" + card.href
 
                 # Only process if it's a target company
                 if company.lower() not in detected_company.lower():
                     continue
 
                 # Check if job title indicates buying signal
-                if not any(kw.lower() in title.lower() for kw in self.signal_keywords):
-                    continue
-
-                # Dedup check
-                if is_duplicate(title, detected_company, job_link):
+                title_lower = title.lower()
+                if not any(kw in title_lower for kw in self.normalized_keywords):
                     continue
 
                 signal = Signal(
@@ -125,19 +146,12 @@ class JobBoardScraper(BaseScraper):
                     priority=self._assess_priority(title),
                     metadata=get_content_hash(title, detected_company),
                 )
-                signals.append(signal)
-
             except Exception as e:
                 log.warning("job_parse_failed", error=str(e))
+                continue
 
-        return signals
+            yield signal
 
     def _assess_priority(self, title: str) -> str:
         """VP/Director/Head = high priority, others = medium."""
-        title_lower = title.lower()
-        if any(
-            kw in title_lower
-            for kw in ["vp", "vice president", "director", "head of", "chief"]
-        ):
-            return "high"
-        return "medium"
+        return role_rules().classify(title).priority
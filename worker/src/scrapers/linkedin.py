@@ -6,16 +6,15 @@ Only scrapes publicly visible job listings (no login required).
 """
 
 import asyncio
-import random
-from typing import Optional, Literal
-import httpx
+from typing import AsyncIterator, Optional, Literal
 import structlog
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from ..scrapers.base import BaseScraper
 from ..models import Signal, Priority
+from ..ai import role_rules
 from ..config import get_settings
-from ..db.dedup import is_duplicate, get_content_hash
+from ..db.dedup import get_content_hash
+from ..matching import normalize_terms
 
 log = structlog.get_logger()
 
@@ -51,16 +50,22 @@ class LinkedInScraper(BaseScraper):
     Requires BRIGHT_DATA_API_TOKEN environment variable.
     If not set, scraper skips gracefully without crashing.
 
-    Rate limiting: 2-5 second random delays between company requests
+    Requests to Bright Data are paced by the shared per-host rate limiter
     to prevent detection and bans.
     """
 
     name = "linkedin"
+    min_interval_minutes = 120
+    max_interval_minutes = 1440
+    result_ttl_seconds = 3600
+    # Bright Data snapshots can take several minutes to become ready
+    time_budget_seconds = 600
 
     def __init__(
         self,
         target_companies: list[str] | None = None,
         signal_keywords: list[str] | None = None,
+        normalized_keywords: frozenset[str] | None = None,
     ):
         settings = get_settings()
         self.api_token = settings.bright_data_api_token
@@ -68,6 +73,7 @@ class LinkedInScraper(BaseScraper):
         self._enabled = bool(self.api_token)
         self.target_companies = target_companies or DEFAULT_TARGET_COMPANIES
         self.signal_keywords = signal_keywords or DEFAULT_SIGNAL_KEYWORDS
+        self.normalized_keywords = normalized_keywords or normalize_terms(self.signal_keywords)
 
         if not self._enabled:
             log.warning(
@@ -76,44 +82,27 @@ class LinkedInScraper(BaseScraper):
                 hint="Set BRIGHT_DATA_API_TOKEN in environment to enable LinkedIn scraping"
             )
 
-    async def scrape(self) -> list[Signal]:
+    def units(self) -> list[str]:
         """
-        Scrape LinkedIn jobs for target companies.
+        One unit per target company.
 
-        Returns empty list if Bright Data credentials are not configured.
+        Returns nothing if Bright Data credentials are not configured.
         """
         if not self._enabled:
             log.info("linkedin_scraper_skipped", reason="no credentials")
             return []
+        return self.target_companies
 
-        signals = []
-
-        for company in self.target_companies:
-            try:
-                company_signals = await self._scrape_company_jobs(company)
-                signals.extend(company_signals)
+    async def stream_unit(self, company: str) -> AsyncIterator[Signal]:
+        try:
+            # Bright Data returns the snapshot in one response, so each
+            # company's jobs are emitted together once polling completes
+            for signal in await self._scrape_company_jobs(company):
+                yield signal
 
-                # Rate limiting: random delay between company requests (2-5 seconds)
-                delay = random.uniform(2.0, 5.0)
-                log.debug("rate_limit_delay", company=company, delay_seconds=delay)
-                await asyncio.sleep(delay)
+        except Exception as e:
+            log.error("linkedin_company_failed", company=company, error=str(e))
 
-            except Exception as e:
-                log.error("linkedin_company_failed", company=company, error=str(e))
-
-        self.log_result(signals)
-        return signals
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
-        before_sleep=lambda retry_state: log.warning(
-            "linkedin_retry",
-            attempt=retry_state.attempt_number,
-            wait=getattr(retry_state.next_action, 'sleep', None) if retry_state.next_action else None
-        )
-    )
     async def _scrape_company_jobs(self, company: str) -> list[Signal]:
         """
         Scrape LinkedIn job listings for a specific company using Bright Data API.
@@ -144,45 +133,43 @@ class LinkedInScraper(BaseScraper):
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # Trigger the scrape
-            response = await client.post(api_url, json=payload, headers=headers)
+        # Trigger the scrape
+        response = await self.post(api_url, json=payload, headers=headers, timeout=60.0)
 
-            if response.status_code == 401:
-                log.error("linkedin_auth_failed", status=401, hint="Check BRIGHT_DATA_API_TOKEN")
-                return []
+        if response.status_code == 401:
+            log.error("linkedin_auth_failed", status=401, hint="Check BRIGHT_DATA_API_TOKEN")
+            return []
 
-            if response.status_code == 429:
-                log.warning("linkedin_rate_limited", company=company)
-                return []
+        if response.status_code == 429:
+            log.warning("linkedin_rate_limited", company=company)
+            return []
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            result = response.json()
-            snapshot_id = result.get("snapshot_id")
+        result = response.json()
+        snapshot_id = result.get("snapshot_id")
 
-            if not snapshot_id:
-                log.warning("linkedin_no_snapshot", company=company, response=result)
-                return []
+        if not snapshot_id:
+            log.warning("linkedin_no_snapshot", company=company, response=result)
+            return []
 
-            # Poll for results (Bright Data processes asynchronously)
-            jobs_data = await self._poll_for_results(client, snapshot_id, headers)
+        # Poll for results (Bright Data processes asynchronously)
+        jobs_data = await self._poll_for_results(snapshot_id, headers)
 
-            if not jobs_data:
-                log.info("linkedin_no_jobs", company=company)
-                return []
+        if not jobs_data:
+            log.info("linkedin_no_jobs", company=company)
+            return []
 
-            # Parse jobs into signals
-            for job in jobs_data:
-                signal = self._parse_job_to_signal(job, company)
-                if signal:
-                    signals.append(signal)
+        # Parse jobs into signals
+        for job in jobs_data:
+            signal = self._parse_job_to_signal(job, company)
+            if signal:
+                signals.append(signal)
 
         return signals
 
     async def _poll_for_results(
         self,
-        client: httpx.AsyncClient,
         snapshot_id: str,
         headers: dict,
         max_attempts: int = 10,
@@ -201,7 +188,7 @@ class LinkedInScraper(BaseScraper):
             await asyncio.sleep(poll_interval)
 
             # Check progress
-            progress_resp = await client.get(progress_url, headers=headers)
+            progress_resp = await self.get(progress_url, headers=headers)
             if progress_resp.status_code != 200:
                 continue
 
@@ -210,7 +197,7 @@ class LinkedInScraper(BaseScraper):
 
             if status == "ready":
                 # Fetch results
-                data_resp = await client.get(data_url, headers=headers, params={"format": "json"})
+                data_resp = await self.get(data_url, headers=headers, params={"format": "json"})
                 if data_resp.status_code == 200:
                     return data_resp.json()
                 break
@@ -226,7 +213,8 @@ class LinkedInScraper(BaseScraper):
         """
         Parse a Bright Data LinkedIn job result into a Signal.
 
-        Returns None if job doesn't match signal criteria or is a duplicate.
+        Returns None if job doesn't match signal criteria.
+        Duplicates are filtered later by the pipeline's dedup stage.
         """
         title = job.get("title") or job.get("job_title", "")
         company_name = job.get("company_name") or job.get("company", default_company)
@@ -239,12 +227,7 @@ class LinkedInScraper(BaseScraper):
 
         # Check if job title indicates buying signal
         title_lower = title.lower()
-        if not any(kw.lower() in title_lower for kw in self.signal_keywords):
-            return None
-
-        # Dedup check
-        if is_duplicate(title, company_name, job_url):
-            log.debug("linkedin_duplicate_skipped", title=title, company=company_name)
+        if not any(kw in title_lower for kw in self.normalized_keywords):
             return None
 
         # Truncate description for summary
@@ -276,19 +259,4 @@ class LinkedInScraper(BaseScraper):
         VP/Director/Head = high priority (budget authority)
         Others = medium (AI enrichment may adjust)
         """
-        title_lower = title.lower()
-        high_priority_keywords = [
-            "vp",
-            "vice president",
-            "director",
-            "head of",
-            "chief",
-            "cro",
-            "cmo",
-            "cso",
-            "svp",
-            "evp",
-        ]
-        if any(kw in title_lower for kw in high_priority_keywords):
-            return "high"
-        return "medium"
+        return role_rules().classify(title).priority
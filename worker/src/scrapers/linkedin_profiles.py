@@ -5,15 +5,15 @@ Collects profile data by URL for decision-maker identification and contact enric
 """
 
 import asyncio
-from typing import Optional
-import httpx
+from typing import AsyncIterator, Optional
 import structlog
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from ..scrapers.base import BaseScraper
 from ..models import Signal, Priority
+from ..ai import role_rules
 from ..config import get_settings
 from ..db.dedup import is_duplicate, get_content_hash
+from ..net import FetchDeadlineError
 
 log = structlog.get_logger()
 
@@ -42,7 +42,7 @@ class LinkedInProfilesScraper(BaseScraper):
                 reason="BRIGHT_DATA_API_TOKEN not set",
             )
 
-    async def scrape(self) -> list[Signal]:
+    def units(self) -> list[str]:
         """
         Placeholder for scheduled scraping.
 
@@ -50,9 +50,13 @@ class LinkedInProfilesScraper(BaseScraper):
         """
         if not self._enabled:
             log.info("linkedin_profiles_scraper_skipped", reason="no credentials")
-            return []
         return []
 
+    async def stream_unit(self, unit: str) -> AsyncIterator[Signal]:
+        """No scheduled units - profiles are collected on demand."""
+        return
+        yield
+
     async def scrape_profiles(self, profile_urls: list[str]) -> list[dict]:
         """
         Scrape LinkedIn profiles by URLs.
@@ -72,11 +76,6 @@ class LinkedInProfilesScraper(BaseScraper):
 
         return await self._collect_profiles(profile_urls)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
-    )
     async def _collect_profiles(self, profile_urls: list[str]) -> list[dict]:
         """
         Collect LinkedIn profiles using Bright Data API.
@@ -100,37 +99,35 @@ class LinkedInProfilesScraper(BaseScraper):
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(api_url, json=payload, headers=headers)
+        response = await self.post(api_url, json=payload, headers=headers, timeout=120.0)
 
-            if response.status_code == 401:
-                log.error("linkedin_profiles_auth_failed", status=401)
-                return []
+        if response.status_code == 401:
+            log.error("linkedin_profiles_auth_failed", status=401)
+            return []
 
-            if response.status_code == 429:
-                log.warning("linkedin_profiles_rate_limited")
-                return []
+        if response.status_code == 429:
+            log.warning("linkedin_profiles_rate_limited")
+            return []
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            result = response.json()
-            snapshot_id = result.get("snapshot_id")
+        result = response.json()
+        snapshot_id = result.get("snapshot_id")
 
-            if not snapshot_id:
-                log.warning("linkedin_profiles_no_snapshot", response=result)
-                return []
+        if not snapshot_id:
+            log.warning("linkedin_profiles_no_snapshot", response=result)
+            return []
 
-            log.info("linkedin_profiles_triggered", snapshot_id=snapshot_id, count=len(profile_urls))
+        log.info("linkedin_profiles_triggered", snapshot_id=snapshot_id, count=len(profile_urls))
 
-            # Poll for results
-            profiles = await self._poll_for_results(client, snapshot_id, headers)
+        # Poll for results
+        profiles = await self._poll_for_results(snapshot_id, headers)
 
-            log.info("linkedin_profiles_collected", count=len(profiles))
-            return profiles
+        log.info("linkedin_profiles_collected", count=len(profiles))
+        return profiles
 
     async def _poll_for_results(
         self,
-        client: httpx.AsyncClient,
         snapshot_id: str,
         headers: dict,
         max_attempts: int = 20,
@@ -149,7 +146,7 @@ class LinkedInProfilesScraper(BaseScraper):
             await asyncio.sleep(poll_interval)
 
             try:
-                progress_resp = await client.get(progress_url, headers=headers)
+                progress_resp = await self.get(progress_url, headers=headers)
                 if progress_resp.status_code != 200:
                     continue
 
@@ -157,7 +154,7 @@ class LinkedInProfilesScraper(BaseScraper):
                 status = progress.get("status")
 
                 if status == "ready":
-                    data_resp = await client.get(data_url, headers=headers, params={"format": "json"})
+                    data_resp = await self.get(data_url, headers=headers, params={"format": "json"})
                     if data_resp.status_code == 200:
                         return data_resp.json()
                     break
@@ -167,6 +164,9 @@ class LinkedInProfilesScraper(BaseScraper):
 
                 log.debug("linkedin_profiles_polling", attempt=attempt + 1, status=status)
 
+            except FetchDeadlineError:
+                # Out of time for this run; polling on would only sleep
+                raise
             except Exception as e:
                 log.warning("linkedin_profiles_poll_error", error=str(e))
 
@@ -219,8 +219,4 @@ class LinkedInProfilesScraper(BaseScraper):
         """
         Assess signal priority based on job position.
         """
-        position_lower = position.lower() if position else ""
-        high_priority = ["vp", "vice president", "director", "head of", "chief", "cro", "cmo", "cso", "svp", "evp", "founder", "ceo", "president"]
-        if any(kw in position_lower for kw in high_priority):
-            return "high"
-        return "medium"
+        return role_rules().classify(position or "").priority
@@ -3,18 +3,16 @@ Product Hunt Scraper - Daily top product launches.
 Uses the public RSS feed, no API key required.
 """
 
-import asyncio
-import xml.etree.ElementTree as ET
-from html import unescape
 import httpx
 import structlog
-from typing import Optional
-import re
-from datetime import datetime
+from typing import AsyncIterator, Optional
 
 from .base import BaseScraper
-from ..models import Signal, Priority
-from ..db.dedup import is_duplicate, get_content_hash
+from ..models import Signal
+from ..matching import get_company_matcher, normalize_terms
+from ..ai import product_rules
+from ..feeds import FeedItem
+from ..db.dedup import get_content_hash
 
 log = structlog.get_logger()
 
@@ -26,47 +24,41 @@ class ProductHuntScraper(BaseScraper):
     """
 
     name = "producthunt"
+    min_interval_minutes = 60
+    max_interval_minutes = 1440
+    result_ttl_seconds = 1800
 
     RSS_URL = "https://www.producthunt.com/feed"
 
-    def __init__(self, target_companies: list[str] | None = None):
-        self.target_companies = [c.lower() for c in (target_companies or [])]
-
-    async def scrape(self) -> list[Signal]:
-        signals = []
-
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            try:
-                resp = await client.get(self.RSS_URL)
-                if resp.status_code != 200:
-                    log.warning("producthunt_fetch_failed", status=resp.status_code)
-                    return []
-
-                root = ET.fromstring(resp.content)
-
-                for item in root.findall(".//item")[:30]:
-                    signal = self._parse_item(item)
-                    if signal:
-                        signals.append(signal)
-
-            except Exception as e:
-                log.error("producthunt_scrape_failed", error=str(e))
-
-        self.log_result(signals)
-        return signals
-
-    def _parse_item(self, item: ET.Element) -> Optional[Signal]:
-        title_elem = item.find("title")
-        link_elem = item.find("link")
-        desc_elem = item.find("description")
-        pub_date_elem = item.find("pubDate")
-
-        if title_elem is None or link_elem is None:
-            return None
-
-        title = unescape(title_elem.text or "")
-        url = link_elem.text or ""
-        description = unescape(desc_elem.text or "") if desc_elem is not None else ""
+    def __init__(
+        self,
+        target_companies: list[str] | None = None,
+        normalized_companies: frozenset[str] | None = None,
+    ):
+        # The config snapshot hands over its precomputed lowercase set
+        self.target_companies = normalized_companies or normalize_terms(target_companies or [])
+        self.company_matcher = get_company_matcher(target_companies or [])
+
+    async def stream_unit(self, unit: str) -> AsyncIterator[Signal]:
+        try:
+            # The feed is Atom
+            items = await self.fetch_feed(self.RSS_URL, limit=30)
+        except httpx.HTTPStatusError as e:
+            log.warning("producthunt_fetch_failed", status=e.response.status_code)
+            return
+        except Exception as e:
+            log.error("producthunt_scrape_failed", error=str(e))
+            return
+
+        for item in items:
+            signal = self._parse_item(item)
+            if signal:
+                yield signal
+
+    def _parse_item(self, item: FeedItem) -> Optional[Signal]:
+        title = item.title
+        url = item.link
+        description = item.summary
 
         if not title or not url:
             return None
@@ -77,20 +69,13 @@ class ProductHuntScraper(BaseScraper):
         tagline = parts[1].strip() if len(parts) > 1 else ""
 
         # Filter by target companies if specified
-        if self.target_companies:
-            title_lower = title.lower()
-            if not any(tc in title_lower for tc in self.target_companies):
-                return None
-
-        # Dedup check
-        if is_duplicate(title, product_name, url):
+        if self.company_matcher and not self.company_matcher.first(title):
             return None
 
         # All Product Hunt items are product launches
-        priority = self._assess_priority(title, description)
+        priority = product_rules().classify(f"{title} {description}").priority
 
-        # Clean description
-        summary = re.sub(r'<[^>]+>', '', description)[:300]
+        summary = description[:300]
         if tagline and tagline not in summary:
             summary = f"{tagline}. {summary}"
 
@@ -108,25 +93,3 @@ class ProductHuntScraper(BaseScraper):
                 "is_launch": True,
             },
         )
-
-    def _assess_priority(self, title: str, description: str) -> Priority:
-        combined = (title + " " + description).lower()
-
-        # High priority keywords (enterprise, B2B, AI, funding)
-        high_keywords = [
-            "enterprise", "b2b", "saas", "ai", "artificial intelligence",
-            "automation", "api", "developer", "infrastructure",
-            "backed by", "funded", "yc", "y combinator",
-        ]
-        if any(kw in combined for kw in high_keywords):
-            return "high"
-
-        # Medium priority (useful tools)
-        medium_keywords = [
-            "productivity", "workflow", "analytics", "integration",
-            "platform", "tool", "app", "software",
-        ]
-        if any(kw in combined for kw in medium_keywords):
-            return "medium"
-
-        return "low"
@@ -3,14 +3,14 @@ Reddit Scraper - Tech and startup subreddits for signals.
 Uses public JSON API, no auth required.
 """
 
-import asyncio
-import httpx
 import structlog
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from .base import BaseScraper
-from ..models import Signal, Priority
-from ..db.dedup import is_duplicate, get_content_hash
+from ..models import Signal
+from ..matching import get_company_matcher, normalize_terms
+from ..ai import signal_rules
+from ..db.dedup import get_content_hash
 
 log = structlog.get_logger()
 
@@ -22,6 +22,10 @@ class RedditScraper(BaseScraper):
     """
 
     name = "reddit"
+    min_interval_minutes = 5
+    max_interval_minutes = 60
+    result_ttl_seconds = 300
+    content_types = ("json",)
 
     SUBREDDITS = [
         "startups",
@@ -44,51 +48,44 @@ class RedditScraper(BaseScraper):
         "reached", "milestone", "customers", "revenue",
     ]
 
-    def __init__(self, target_companies: list[str] | None = None):
-        self.target_companies = [c.lower() for c in (target_companies or [])]
+    def __init__(
+        self,
+        target_companies: list[str] | None = None,
+        normalized_companies: frozenset[str] | None = None,
+    ):
+        # The config snapshot hands over its precomputed lowercase set
+        self.target_companies = normalized_companies or normalize_terms(target_companies or [])
+        self.company_matcher = get_company_matcher(target_companies or [])
 
-    async def scrape(self) -> list[Signal]:
-        signals = []
+    def units(self) -> list[str]:
+        return self.SUBREDDITS
 
-        headers = {
-            "User-Agent": "Axidex Signal Scraper 1.0"
-        }
-
-        async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-            for subreddit in self.SUBREDDITS:
-                try:
-                    sub_signals = await self._scrape_subreddit(client, subreddit)
-                    signals.extend(sub_signals)
-                    await asyncio.sleep(2.0)  # Reddit rate limit
-                except Exception as e:
-                    log.warning("reddit_subreddit_failed", subreddit=subreddit, error=str(e))
-
-        self.log_result(signals)
-        return signals
-
-    async def _scrape_subreddit(self, client: httpx.AsyncClient, subreddit: str) -> list[Signal]:
-        signals = []
+    async def stream_unit(self, subreddit: str) -> AsyncIterator[Signal]:
+        try:
+            async for signal in self._scrape_subreddit(subreddit):
+                yield signal
+        except Exception as e:
+            log.warning("reddit_subreddit_failed", subreddit=subreddit, error=str(e))
 
+    async def _scrape_subreddit(self, subreddit: str) -> AsyncIterator[Signal]:
         url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=25"
 
         try:
-            resp = await client.get(url)
+            resp = await self.fetch(url)
             if resp.status_code != 200:
-                return []
+                return
 
             data = resp.json()
             posts = data.get("data", {}).get("children", [])
-
-            for post_data in posts:
-                post = post_data.get("data", {})
-                signal = self._parse_post(post, subreddit)
-                if signal:
-                    signals.append(signal)
-
         except Exception as e:
             log.debug("reddit_parse_failed", subreddit=subreddit, error=str(e))
+            return
 
-        return signals
+        for post_data in posts:
+            post = post_data.get("data", {})
+            signal = self._parse_post(post, subreddit)
+            if signal:
+                yield signal
 
     def _parse_post(self, post: dict, subreddit: str) -> Optional[Signal]:
         title = post.get("title", "")
@@ -107,9 +104,8 @@ class RedditScraper(BaseScraper):
             return None
 
         # Filter by target companies if specified
-        if self.target_companies:
-            if not any(tc in title_lower for tc in self.target_companies):
-                return None
+        if self.company_matcher and not self.company_matcher.first(title):
+            return None
 
         # Minimum engagement threshold
         if score < 5:
@@ -121,12 +117,13 @@ class RedditScraper(BaseScraper):
         # Extract company name
         company_name = self._extract_company(title)
 
-        # Dedup check
-        if is_duplicate(title, company_name, full_url):
-            return None
-
-        signal_type = self._detect_signal_type(title_lower)
-        priority = self._assess_priority(title_lower, score)
+        rules = signal_rules().classify(title)
+        signal_type = rules.signal_type or "product_launch"
+        priority = rules.priority
+        if score > 500:
+            priority = "high"
+        elif score > 100 and priority == "low":
+            priority = "medium"
 
         # Create summary
         summary = selftext[:300] if selftext else f"Posted in r/{subreddit} with {score} upvotes."
@@ -162,23 +159,3 @@ class RedditScraper(BaseScraper):
                     return company
 
         return "Startup"
-
-    def _detect_signal_type(self, title: str) -> str:
-        if any(w in title for w in ["hiring", "job", "looking for", "recruit"]):
-            return "hiring"
-        if any(w in title for w in ["raised", "funding", "series", "seed", "investment"]):
-            return "funding"
-        if any(w in title for w in ["launched", "launch", "released", "announce"]):
-            return "product_launch"
-        if any(w in title for w in ["acquired", "acquisition", "partner", "collaboration"]):
-            return "partnership"
-        if any(w in title for w in ["expand", "growth", "scaling", "milestone"]):
-            return "expansion"
-        return "product_launch"
-
-    def _assess_priority(self, title: str, score: int) -> Priority:
-        if score > 500 or any(w in title for w in ["million", "billion", "acquired"]):
-            return "high"
-        if score > 100 or any(w in title for w in ["funding", "series", "raised"]):
-            return "medium"
-        return "low"
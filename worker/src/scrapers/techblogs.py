@@ -2,17 +2,16 @@
 Tech Blogs RSS Scraper - Aggregates signals from major tech publications.
 """
 
-import asyncio
-import xml.etree.ElementTree as ET
-from html import unescape
-import httpx
 import structlog
-from typing import Optional
+from typing import AsyncIterator, Optional
 import re
 
 from .base import BaseScraper
-from ..models import Signal, Priority
-from ..db.dedup import is_duplicate, get_content_hash
+from ..models import Signal
+from ..matching import get_company_matcher, normalize_terms
+from ..ai import signal_rules
+from ..feeds import FeedItem
+from ..db.dedup import get_content_hash
 
 log = structlog.get_logger()
 
@@ -24,6 +23,10 @@ class TechBlogsScraper(BaseScraper):
     """
 
     name = "techblogs"
+    max_concurrency = 5
+    min_interval_minutes = 30
+    max_interval_minutes = 480
+    result_ttl_seconds = 900
 
     RSS_FEEDS = {
         "TechCrunch": "https://techcrunch.com/feed/",
@@ -46,70 +49,44 @@ class TechBlogsScraper(BaseScraper):
         "ipo", "unicorn", "billion", "million",
     ]
 
-    def __init__(self, target_companies: list[str] | None = None):
-        self.target_companies = [c.lower() for c in (target_companies or [])]
+    def __init__(
+        self,
+        target_companies: list[str] | None = None,
+        normalized_companies: frozenset[str] | None = None,
+    ):
+        # The config snapshot hands over its precomputed lowercase set
+        self.target_companies = normalized_companies or normalize_terms(target_companies or [])
+        self.company_matcher = get_company_matcher(target_companies or [])
 
-    async def scrape(self) -> list[Signal]:
-        signals = []
+    def units(self) -> list[str]:
+        return list(self.RSS_FEEDS)
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            for source_name, feed_url in self.RSS_FEEDS.items():
-                try:
-                    feed_signals = await self._scrape_feed(client, feed_url, source_name)
-                    signals.extend(feed_signals)
-                    await asyncio.sleep(0.5)
-                except Exception as e:
-                    log.warning("techblogs_feed_failed", source=source_name, error=str(e))
-
-        self.log_result(signals)
-        return signals
-
-    async def _scrape_feed(self, client: httpx.AsyncClient, feed_url: str, source_name: str) -> list[Signal]:
-        signals = []
+    async def stream_unit(self, source_name: str) -> AsyncIterator[Signal]:
+        feed_url = self.RSS_FEEDS[source_name]
 
         try:
-            resp = await client.get(feed_url)
-            if resp.status_code != 200:
-                return []
-
-            # Try parsing as RSS or Atom
-            root = ET.fromstring(resp.content)
-
-            # Handle both RSS and Atom formats
-            items = root.findall(".//item") or root.findall(".//{http://www.w3.org/2005/Atom}entry")
-
-            for item in items[:15]:
-                signal = self._parse_item(item, source_name)
-                if signal:
-                    signals.append(signal)
+            async for signal in self._scrape_feed(feed_url, source_name):
+                yield signal
+        except Exception as e:
+            log.warning("techblogs_feed_failed", source=source_name, error=str(e))
 
+    async def _scrape_feed(self, feed_url: str, source_name: str) -> AsyncIterator[Signal]:
+        try:
+            # RSS or Atom
+            items = await self.fetch_feed(feed_url, limit=15)
         except Exception as e:
             log.debug("techblogs_parse_failed", source=source_name, error=str(e))
+            return
 
-        return signals
-
-    def _parse_item(self, item: ET.Element, source_name: str) -> Optional[Signal]:
-        # RSS format
-        title_elem = item.find("title")
-        link_elem = item.find("link")
-        desc_elem = item.find("description")
-
-        # Atom format fallback
-        if title_elem is None:
-            title_elem = item.find("{http://www.w3.org/2005/Atom}title")
-        if link_elem is None:
-            link_elem = item.find("{http://www.w3.org/2005/Atom}link")
-            if link_elem is not None:
-                link_elem = type('obj', (object,), {'text': link_elem.get('href')})()
-        if desc_elem is None:
-            desc_elem = item.find("{http://www.w3.org/2005/Atom}summary")
-
-        if title_elem is None:
-            return None
+        for item in items:
+            signal = self._parse_item(item, source_name)
+            if signal:
+                yield signal
 
-        title = unescape(title_elem.text or "")
-        url = link_elem.text if link_elem is not None else ""
-        description = unescape(desc_elem.text or "") if desc_elem is not None else ""
+    def _parse_item(self, item: FeedItem, source_name: str) -> Optional[Signal]:
+        title = item.title
+        url = item.link
+        description = item.summary
 
         if not title:
             return None
@@ -124,19 +101,14 @@ class TechBlogsScraper(BaseScraper):
         company_name = self._extract_company(title)
 
         # Filter by target companies if specified
-        if self.target_companies:
-            if not any(tc in title_lower for tc in self.target_companies):
-                return None
-
-        # Dedup check
-        if is_duplicate(title, company_name, url):
+        if self.company_matcher and not self.company_matcher.first(title):
             return None
 
-        signal_type = self._detect_signal_type(title_lower)
-        priority = self._assess_priority(title_lower)
+        rules = signal_rules().classify(f"{title} {description}")
+        signal_type = rules.signal_type or "product_launch"
+        priority = rules.priority
 
-        # Clean description
-        summary = re.sub(r'<[^>]+>', '', description)[:300]
+        summary = description[:300]
         if not summary:
             summary = f"From {source_name}: {title[:200]}"
 
@@ -177,27 +149,3 @@ class TechBlogsScraper(BaseScraper):
             else:
                 break
         return " ".join(company_words) if company_words else "Tech Company"
-
-    def _detect_signal_type(self, title: str) -> str:
-        if any(w in title for w in ["hiring", "jobs", "recruit", "talent"]):
-            return "hiring"
-        if any(w in title for w in ["raised", "funding", "series", "seed", "investment", "valuation"]):
-            return "funding"
-        if any(w in title for w in ["launch", "release", "announce", "unveil", "introduce"]):
-            return "product_launch"
-        if any(w in title for w in ["partner", "acquisition", "acquire", "merge", "deal"]):
-            return "partnership"
-        if any(w in title for w in ["expand", "growth", "scale", "international"]):
-            return "expansion"
-        if any(w in title for w in ["ceo", "cto", "founder", "executive", "appoint"]):
-            return "leadership_change"
-        return "product_launch"
-
-    def _assess_priority(self, title: str) -> Priority:
-        if any(w in title for w in ["billion", "unicorn", "ipo", "$100m", "$50m"]):
-            return "high"
-        if any(w in title for w in ["million", "series b", "series c", "acquisition"]):
-            return "high"
-        if any(w in title for w in ["series a", "seed", "funding", "raised"]):
-            return "medium"
-        return "low"
@@ -0,0 +1,131 @@
+"""
+Task-queue worker for running several worker replicas side by side.
+
+Cycles enqueue one row per (source, unit) instead of scraping in-process;
+every replica leases batches of those rows, runs them through the signal
+pipeline and heartbeats its leases while it works. If a replica dies, its
+leases expire and another replica picks the tasks up again.
+"""
+
+import asyncio
+import copy
+from contextlib import suppress
+from typing import Awaitable, Callable
+import structlog
+
+from .config import get_settings
+from .cadence import get_cadence
+from .pipeline import SignalPipeline
+from .scrapers.base import BaseScraper
+from .db.tasks import (
+    ScrapeTask,
+    claim_scrape_tasks,
+    heartbeat_scrape_tasks,
+    complete_scrape_task,
+)
+
+log = structlog.get_logger()
+
+ScraperFactory = Callable[[], Awaitable[list[BaseScraper]]]
+
+
+class TaskWorker:
+    """Leases scrape tasks in batches and runs them until the queue is empty."""
+
+    def __init__(self, worker_id: str, build_scrapers: ScraperFactory):
+        settings = get_settings()
+        self.worker_id = worker_id
+        self.build_scrapers = build_scrapers
+        self.batch_size = max(1, settings.task_claim_batch)
+        self.lease_seconds = max(1, settings.task_lease_seconds)
+        self._held: set[str] = set()
+
+    async def drain(self) -> int:
+        """Claim and run batches until none are left; returns tasks run."""
+        total = 0
+        while processed := await self.run_batch():
+            total += processed
+        return total
+
+    async def run_batch(self) -> int:
+        """Claim one batch of tasks and run it; returns how many were claimed."""
+        tasks = await asyncio.to_thread(
+            claim_scrape_tasks, self.worker_id, self.batch_size, self.lease_seconds
+        )
+        if not tasks:
+            return 0
+
+        log.info("scrape_tasks_claimed", worker_id=self.worker_id, count=len(tasks))
+        scrapers = {scraper.name: scraper for scraper in await self.build_scrapers()}
+
+        self._held = {task.id for task in tasks}
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            await asyncio.gather(*(self._run_task(task, scrapers) for task in tasks))
+        finally:
+            heartbeat.cancel()
+            with suppress(asyncio.CancelledError):
+                await heartbeat
+            self._held = set()
+        return len(tasks)
+
+    async def _run_task(self, task: ScrapeTask, scrapers: dict[str, BaseScraper]):
+        scraper = scrapers.get(task.source)
+        if scraper is None:
+            # Source was disabled after the task was queued
+            await self._complete(task, 0, None)
+            return
+        if task.max_staleness_seconds is not None:
+            # Batch tasks share scrapers but may come from runs with different caps
+            scraper = copy.copy(scraper)
+            scraper.max_staleness_seconds = task.max_staleness_seconds
+
+        pipeline = SignalPipeline([scraper], user_id=task.user_id, units={task.source: [task.unit]})
+        try:
+            stats = await pipeline.run()
+        except Exception as e:
+            log.error("scrape_task_failed", task_id=task.id, source=task.source, unit=task.unit, error=str(e))
+            await self._complete(task, 0, str(e))
+            return
+
+        error = stats.progress.get(task.source, {}).get("error")
+        await self._complete(task, stats.total_signals, error)
+
+    async def _complete(self, task: ScrapeTask, signals: int, error: str | None):
+        completion = await asyncio.to_thread(
+            complete_scrape_task, task.id, self.worker_id, signals, error
+        )
+        self._held.discard(task.id)
+
+        if completion is None:
+            log.warning("scrape_task_lease_lost", task_id=task.id, source=task.source, unit=task.unit)
+            return
+
+        log.info(
+            "scrape_task_completed",
+            task_id=task.id,
+            source=task.source,
+            unit=task.unit,
+            signals=signals,
+            error=error,
+            run_done=completion.run_done,
+        )
+        # Adapt the source's cadence once all of its units for the run are in
+        if completion.source_done:
+            get_cadence().record(task.source, completion.source_signals)
+
+    async def _heartbeat(self):
+        # Renew well before expiry so one slow round trip doesn't lose a lease
+        interval = self.lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            if not self._held:
+                continue
+            held = await asyncio.to_thread(
+                heartbeat_scrape_tasks, self.worker_id, list(self._held), self.lease_seconds
+            )
+            if held is None:
+                continue
+            lost = self._held - held
+            if lost:
+                log.warning("scrape_task_leases_lost", worker_id=self.worker_id, task_ids=sorted(lost))
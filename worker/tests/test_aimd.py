@@ -0,0 +1,106 @@
+"""Unit tests for adaptive per-host concurrency limits."""
+
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.net.aimd import AdaptiveLimit, ConcurrencyLimiter
+from src.net.ratelimit import HostRateLimiter
+from src.net.breaker import BreakerRegistry
+from src.net.retry import RetryPolicy
+from src.net.transport import PoliteTransport
+
+
+class TestAdaptiveLimit:
+    """Tests for additive increase / multiplicative decrease."""
+
+    def test_fast_successes_grow_the_limit(self):
+        limit = AdaptiveLimit(limit=2.0, max_limit=4)
+        for _ in range(5):
+            limit.observe(200, 0.1)
+        assert limit.capacity == 4
+
+        for _ in range(20):
+            limit.observe(200, 0.1)
+        assert limit.capacity == 4
+
+    def test_throttling_halves_the_limit_once_per_cooldown(self):
+        limit = AdaptiveLimit(limit=8.0, max_limit=32)
+        with patch('src.net.aimd.time.monotonic', return_value=100.0):
+            limit.observe(429, 0.1)
+            limit.observe(503, 0.1)
+        assert limit.capacity == 4
+
+        with patch('src.net.aimd.time.monotonic', return_value=102.0):
+            limit.observe(429, 0.1)
+        assert limit.capacity == 2
+        assert limit.decreases == 2
+
+    def test_latency_spike_shrinks_the_limit(self):
+        limit = AdaptiveLimit(limit=8.0, max_limit=32, latency_factor=3.0)
+        limit.observe(200, 0.1)
+        limit.observe(200, 1.0)
+        assert limit.capacity == 4
+
+    def test_baseline_follows_a_host_that_stays_slower(self):
+        limit = AdaptiveLimit(limit=8.0, max_limit=32, latency_factor=3.0)
+        for _ in range(10):
+            limit.observe(200, 0.1)
+
+        # The host is now ten times slower for good
+        for second in range(300):
+            with patch('src.net.aimd.time.monotonic', return_value=100.0 + second):
+                limit.observe(200, 1.0)
+
+        # A few decreases while it looked like a spike, then the baseline
+        # caught up and the limit grew back
+        assert limit.baseline_latency > 0.5
+        assert limit.decreases < 30
+        assert limit.capacity > 1
+
+    @pytest.mark.asyncio
+    async def test_waiters_get_slots_in_order(self):
+        limit = AdaptiveLimit(limit=1.0, max_limit=1)
+        await limit.acquire()
+        order = []
+
+        async def worker(name):
+            await limit.acquire()
+            order.append(name)
+            limit.release()
+
+        tasks = [asyncio.create_task(worker(n)) for n in ("a", "b")]
+        await asyncio.sleep(0)
+        assert limit.snapshot()["waiting"] == 2
+
+        limit.release()
+        await asyncio.gather(*tasks)
+        assert order == ["a", "b"]
+        assert limit.in_flight == 0
+
+
+class TestPoliteTransport:
+    """Tests for the limits applied to real requests."""
+
+    @pytest.mark.asyncio
+    async def test_429_lowers_the_hosts_limit(self):
+        concurrency = ConcurrencyLimiter(initial=4, max_limit=8)
+        transport = PoliteTransport(
+            httpx.MockTransport(lambda request: httpx.Response(429)),
+            HostRateLimiter(100.0, 10),
+            concurrency,
+            BreakerRegistry(),
+            RetryPolicy(attempts=1),
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("https://busy.example/jobs")
+
+        assert response.status_code == 429
+        assert concurrency.limits() == {"busy.example": 2}
+        assert concurrency.host("busy.example").in_flight == 0
@@ -0,0 +1,166 @@
+"""
+Unit tests for BaseScraper concurrent unit streaming.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models import Signal
+from src.scrapers.base import BaseScraper
+
+
+def make_signal(unit: str) -> Signal:
+    return Signal(
+        company_name=unit,
+        signal_type="funding",
+        title=f"{unit} raises Series A",
+        summary="Test signal",
+        source_url=f"https://example.com/{unit}",
+        source_name="Test",
+    )
+
+
+class FakeScraper(BaseScraper):
+    name = "fake"
+    max_concurrency = 2
+
+    def __init__(self, units: list[str], fail: set[str] | None = None):
+        self._units = units
+        self.fail = fail or set()
+        self.in_flight = 0
+        self.peak = 0
+
+    def units(self) -> list[str]:
+        return self._units
+
+    async def stream_unit(self, unit: str):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if unit in self.fail:
+            raise RuntimeError("boom")
+        yield make_signal(unit)
+
+
+@pytest.fixture
+def mock_settings():
+    settings = MagicMock()
+    settings.source_concurrency = {}
+    settings.pipeline_queue_size = 10
+    with patch('src.scrapers.base.get_settings', return_value=settings):
+        yield settings
+
+
+class TestBaseScraperConcurrency:
+    """Tests for BaseScraper.scrape fan-out over units."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_collects_all_units(self, mock_settings):
+        scraper = FakeScraper(["a", "b", "c"])
+        signals = await scraper.scrape()
+        assert sorted(s.company_name for s in signals) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_scrape_respects_per_source_cap(self, mock_settings):
+        scraper = FakeScraper([str(i) for i in range(8)])
+        await scraper.scrape()
+        assert scraper.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_settings_override_cap(self, mock_settings):
+        mock_settings.source_concurrency = {"fake": 4}
+        scraper = FakeScraper([str(i) for i in range(8)])
+        await scraper.scrape()
+        assert scraper.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_unit_does_not_drop_others(self, mock_settings):
+        scraper = FakeScraper(["a", "b", "c"], fail={"b"})
+        signals = await scraper.scrape()
+        assert sorted(s.company_name for s in signals) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_fetching_when_consumer_stops(self, mock_settings):
+        scraper = FakeScraper([str(i) for i in range(20)])
+        stream = scraper.stream()
+        first = await stream.__anext__()
+        await stream.aclose()
+        assert first.company_name in {"0", "1"}
+        assert scraper.in_flight == 0
+
+
+class CountingScraper(FakeScraper):
+    result_ttl_seconds = 60
+
+    def __init__(self, units: list[str], fail: set[str] | None = None):
+        super().__init__(units, fail)
+        self.fetches = 0
+
+    async def stream_unit(self, unit: str):
+        self.fetches += 1
+        async for signal in super().stream_unit(unit):
+            yield signal
+
+
+class TestResultCaching:
+    """Tests for reusing cached unit results on manual runs."""
+
+    @pytest.fixture
+    def cache(self):
+        from src.cache import ResultCache
+        cache = ResultCache(max_entries=100)
+        with patch('src.scrapers.base.get_result_cache', return_value=cache):
+            yield cache
+
+    @pytest.mark.asyncio
+    async def test_scheduled_run_fetches_and_fills_cache(self, mock_settings, cache):
+        scraper = CountingScraper(["a", "b"])
+        await scraper.scrape()
+        await scraper.scrape()
+
+        assert scraper.fetches == 4
+        assert cache.snapshot()["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_manual_run_reuses_fresh_results(self, mock_settings, cache):
+        await CountingScraper(["a", "b"]).scrape()
+
+        manual = CountingScraper(["a", "b", "c"])
+        manual.max_staleness_seconds = float("inf")
+        signals = await manual.scrape()
+
+        assert manual.fetches == 1  # only "c" went to the network
+        assert sorted(s.company_name for s in signals) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_zero_staleness_always_fetches(self, mock_settings, cache):
+        await CountingScraper(["a"]).scrape()
+
+        manual = CountingScraper(["a"])
+        manual.max_staleness_seconds = 0
+        await manual.scrape()
+
+        assert manual.fetches == 1
+
+    def test_cache_max_age_is_capped_by_source_ttl(self):
+        scraper = CountingScraper(["a"])
+        assert scraper.cache_max_age() is None
+
+        scraper.max_staleness_seconds = float("inf")
+        assert scraper.cache_max_age() == 60
+
+        scraper.max_staleness_seconds = 10
+        assert scraper.cache_max_age() == 10
+
+    @pytest.mark.asyncio
+    async def test_failed_units_are_not_cached(self, mock_settings, cache):
+        await CountingScraper(["a", "b"], fail={"b"}).scrape()
+
+        assert cache.snapshot()["entries"] == 1
@@ -0,0 +1,116 @@
+"""Unit tests for per-host circuit breakers and the shared retry policy."""
+
+import httpx
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.net.aimd import ConcurrencyLimiter
+from src.net.breaker import CircuitBreaker, BreakerRegistry, CircuitOpenError
+from src.net.ratelimit import HostRateLimiter
+from src.net.retry import RetryPolicy
+from src.net.transport import PoliteTransport
+
+
+def make_client(handler, breakers: BreakerRegistry, attempts: int = 3) -> httpx.AsyncClient:
+    transport = PoliteTransport(
+        httpx.MockTransport(handler),
+        HostRateLimiter(1000.0, 100),
+        ConcurrencyLimiter(initial=8, max_limit=8),
+        breakers,
+        RetryPolicy(attempts=attempts, base_delay=0.0, max_delay=0.0),
+    )
+    return httpx.AsyncClient(transport=transport)
+
+
+class TestCircuitBreaker:
+    """Tests for breaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        assert breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_half_opens_for_one_trial(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+        with patch('src.net.breaker.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+        with patch('src.net.breaker.time.monotonic', return_value=161.0):
+            assert breaker.allow()
+            assert not breaker.allow()
+            breaker.record_failure()
+            assert breaker.state == "open"
+        with patch('src.net.breaker.time.monotonic', return_value=222.0):
+            assert breaker.allow()
+            breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.snapshot()["trips"] == 2
+
+    def test_abandoned_trial_lets_another_through(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.abandon()
+        assert breaker.allow()
+
+
+class TestRetriesAndBreakers:
+    """Tests for the policies applied by the pooled clients' transport."""
+
+    @pytest.mark.asyncio
+    async def test_retries_idempotent_requests(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, text="ok")
+
+        async with make_client(handler, BreakerRegistry()) as client:
+            response = await client.get("https://flaky.example/feed")
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_does_not_resend_posts_that_reached_the_host(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        async with make_client(handler, BreakerRegistry()) as client:
+            response = await client.post("https://api.example/trigger", json={})
+
+        assert response.status_code == 503
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_dead_host_fails_fast_once_open(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        breakers = BreakerRegistry(failure_threshold=3, reset_seconds=60)
+        async with make_client(handler, breakers) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("https://down.example/a")
+            with pytest.raises(CircuitOpenError):
+                await client.get("https://down.example/b")
+
+        assert len(calls) == 3
+        assert breakers.snapshot()["down.example"]["state"] == "open"
+        assert breakers.snapshot()["down.example"]["rejected"] == 1
@@ -0,0 +1,242 @@
+"""Unit tests for streamed fetches with byte budgets."""
+
+import asyncio
+import gzip
+import httpx
+import pytest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.net import budget
+from src.net.budget import (
+    get_limited,
+    request_limited,
+    download_tally,
+    source_deadline,
+    SourceDeadline,
+    FetchDeadlineError,
+    ResponseTooLargeError,
+    UnexpectedContentTypeError,
+)
+from src.net.singleflight import SingleflightTransport
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats():
+    budget._stats = None
+    yield
+    budget._stats = None
+
+
+def client_for(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestGetLimited:
+    """Tests for budgets, content types and download accounting."""
+
+    @pytest.mark.asyncio
+    async def test_within_budget_returns_buffered_response(self):
+        async with client_for(lambda r: httpx.Response(200, text="<rss/>", headers={"Content-Type": "application/rss+xml"})) as client:
+            response = await get_limited(client, "https://example.com/feed", "feeds", max_bytes=100)
+
+        assert response.text == "<rss/>"
+        assert budget.get_download_stats().snapshot()["feeds"] == {"bytes": 6, "responses": 1, "aborted": 0}
+
+    @pytest.mark.asyncio
+    async def test_posts_share_budgets_and_stats(self):
+        def handler(request):
+            assert request.method == "POST"
+            return httpx.Response(200, json={"snapshot_id": "s1"})
+
+        async with client_for(handler) as client:
+            response = await request_limited(client, "POST", "https://api.example.com/trigger", "linkedin", max_bytes=100)
+            with pytest.raises(ResponseTooLargeError):
+                await request_limited(client, "POST", "https://api.example.com/trigger", "linkedin", max_bytes=5)
+
+        assert response.json() == {"snapshot_id": "s1"}
+        assert budget.get_download_stats().snapshot()["linkedin"]["responses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_oversized_stream_is_aborted_early(self):
+        sent = []
+
+        async def body():
+            for _ in range(100):
+                sent.append(1)
+                yield b"x" * 1000
+
+        async with client_for(lambda r: httpx.Response(200, content=body())) as client:
+            with pytest.raises(ResponseTooLargeError):
+                await get_limited(client, "https://example.com/page", "company", max_bytes=5000)
+
+        assert len(sent) < 10
+        assert budget.get_download_stats().snapshot()["company"]["aborted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_declared_length_over_budget_is_not_read(self):
+        async with client_for(lambda r: httpx.Response(200, content=b"x" * 2000)) as client:
+            with pytest.raises(ResponseTooLargeError, match="Content-Length"):
+                await get_limited(client, "https://example.com/page", "company", max_bytes=1000)
+
+    @pytest.mark.asyncio
+    async def test_decompression_counts_against_budget(self):
+        bomb = gzip.compress(b"\0" * 1_000_000)
+        assert len(bomb) < 10_000
+
+        def handler(request):
+            return httpx.Response(200, content=bomb, headers={"Content-Encoding": "gzip"})
+
+        async with client_for(handler) as client:
+            with pytest.raises(ResponseTooLargeError):
+                await get_limited(client, "https://example.com/page", "company", max_bytes=100_000)
+
+    @pytest.mark.asyncio
+    async def test_gzip_body_is_returned_decoded(self):
+        def handler(request):
+            return httpx.Response(200, content=gzip.compress(b"hello"), headers={"Content-Encoding": "gzip"})
+
+        async with client_for(handler) as client:
+            response = await get_limited(client, "https://example.com/page", "company", max_bytes=100)
+
+        assert response.text == "hello"
+        assert "Content-Encoding" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_content_type_checked_on_success_only(self):
+        def handler(request):
+            status = 200 if request.url.path == "/ok" else 429
+            return httpx.Response(status, text="<html/>", headers={"Content-Type": "text/html"})
+
+        async with client_for(handler) as client:
+            with pytest.raises(UnexpectedContentTypeError):
+                await get_limited(client, "https://example.com/ok", "reddit", content_types=("json",))
+            throttled = await get_limited(client, "https://example.com/busy", "reddit", content_types=("json",))
+
+        assert throttled.status_code == 429
+
+    @pytest.mark.asyncio
+    async def test_binary_types_rejected_by_default(self):
+        def handler(request):
+            return httpx.Response(200, content=b"%PDF", headers={"Content-Type": "application/pdf"})
+
+        async with client_for(handler) as client:
+            with pytest.raises(UnexpectedContentTypeError):
+                await get_limited(client, "https://example.com/report.pdf", "company")
+
+    @pytest.mark.asyncio
+    async def test_bytes_tallied_for_the_current_run(self):
+        tally: dict[str, int] = {}
+        token = download_tally.set(tally)
+        try:
+            async with client_for(lambda r: httpx.Response(200, content=b"x" * 10)) as client:
+                await get_limited(client, "https://example.com/a", "feeds")
+                await get_limited(client, "https://example.com/b", "feeds")
+        finally:
+            download_tally.reset(token)
+
+        assert tally == {"feeds": 20}
+
+
+class TestSingleflightBudget:
+    """The singleflight leader buffers bodies, so it enforces budgets too."""
+
+    @pytest.mark.asyncio
+    async def test_leader_stops_at_budget(self):
+        sent = []
+
+        async def body():
+            for _ in range(100):
+                sent.append(1)
+                yield b"x" * 1000
+
+        transport = SingleflightTransport(httpx.MockTransport(lambda r: httpx.Response(200, content=body())))
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(ResponseTooLargeError):
+                await get_limited(client, "https://example.com/page", "company", max_bytes=5000)
+
+        assert len(sent) < 10
+
+    @pytest.mark.asyncio
+    async def test_leader_rejects_content_type_before_reading(self):
+        sent = []
+
+        async def body():
+            for _ in range(100):
+                sent.append(1)
+                yield b"x" * 1000
+
+        transport = SingleflightTransport(httpx.MockTransport(
+            lambda r: httpx.Response(200, headers={"Content-Type": "application/pdf"}, content=body())
+        ))
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(UnexpectedContentTypeError):
+                await get_limited(client, "https://example.com/doc", "company", content_types=("html",))
+
+        assert sent == []
+
+    def test_limits_are_part_of_the_key(self):
+        client = httpx.AsyncClient()
+        html = client.build_request("GET", "https://example.com/", extensions={"content_types": ("html",)})
+        xml = client.build_request("GET", "https://example.com/", extensions={"content_types": ("xml",)})
+        assert SingleflightTransport.key(html) != SingleflightTransport.key(xml)
+
+
+async def slow_response(request):
+    await asyncio.sleep(0.2)
+    return httpx.Response(200, text="late")
+
+
+class TestSourceDeadline:
+    """Tests for aborting fetches once a source's time budget is spent."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_in_flight_is_aborted(self):
+        deadline = SourceDeadline(0.05)
+        token = source_deadline.set(deadline)
+        try:
+            async with client_for(slow_response) as client:
+                with pytest.raises(FetchDeadlineError):
+                    await get_limited(client, "https://example.com/slow", "slow")
+                # Later fetches fail at once
+                with pytest.raises(FetchDeadlineError):
+                    await get_limited(client, "https://example.com/next", "slow")
+        finally:
+            source_deadline.reset(token)
+        assert deadline.expired
+
+    @pytest.mark.asyncio
+    async def test_paused_time_does_not_count(self):
+        deadline = SourceDeadline(0.05)
+        with deadline.paused():
+            await asyncio.sleep(0.1)
+        assert deadline.remaining() > 0.03
+        assert not deadline.expired
+
+    @pytest.mark.asyncio
+    async def test_pause_holds_fetch_in_flight(self):
+        deadline = SourceDeadline(0.1)
+        token = source_deadline.set(deadline)
+        try:
+            async with client_for(slow_response) as client:
+                fetch = asyncio.ensure_future(get_limited(client, "https://example.com/slow", "slow"))
+                await asyncio.sleep(0.01)
+                with deadline.paused():
+                    await asyncio.sleep(0.15)
+                response = await fetch
+        finally:
+            source_deadline.reset(token)
+        assert response.text == "late"
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_tracked_tasks(self):
+        deadline = SourceDeadline(10)
+        task = asyncio.ensure_future(asyncio.sleep(10))
+        deadline.track(task)
+        assert deadline.stop()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert deadline.expired
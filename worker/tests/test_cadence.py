@@ -0,0 +1,76 @@
+"""Tests for adaptive per-source polling cadence."""
+
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.cadence import CadenceTracker
+
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class TestRegistration:
+    """Tests for adding sources to the tracker."""
+
+    def test_new_source_is_due_immediately(self):
+        tracker = CadenceTracker(initial_minutes=30)
+        tracker.register("reddit", 5, 60)
+
+        assert tracker.is_due("reddit")
+        assert tracker.due_sources() == {"reddit"}
+
+    def test_initial_interval_is_clamped_to_bounds(self):
+        tracker = CadenceTracker(initial_minutes=30)
+        tracker.register("company", 360, 10080)
+
+        assert tracker.sources["company"].interval_minutes == 360
+
+    def test_unknown_source_counts_as_due(self):
+        tracker = CadenceTracker(initial_minutes=30)
+
+        assert tracker.is_due("never_seen")
+
+
+class TestAdaptiveInterval:
+    """Tests for interval changes driven by yield."""
+
+    def test_empty_runs_back_off_until_max(self):
+        tracker = CadenceTracker(initial_minutes=30, backoff_factor=2.0)
+        tracker.register("techblogs", 15, 100)
+
+        tracker.record("techblogs", 0, now=NOW)
+        assert tracker.sources["techblogs"].interval_minutes == 60
+        tracker.record("techblogs", 0, now=NOW)
+        assert tracker.sources["techblogs"].interval_minutes == 100
+        assert tracker.sources["techblogs"].empty_streak == 2
+
+    def test_new_signals_speed_up_until_min(self):
+        tracker = CadenceTracker(initial_minutes=30, backoff_factor=2.0)
+        tracker.register("hackernews", 10, 60)
+
+        tracker.record("hackernews", 3, now=NOW)
+        assert tracker.sources["hackernews"].interval_minutes == 15
+        tracker.record("hackernews", 1, now=NOW)
+        assert tracker.sources["hackernews"].interval_minutes == 10
+        assert tracker.sources["hackernews"].empty_streak == 0
+
+    def test_record_schedules_next_poll(self):
+        tracker = CadenceTracker(initial_minutes=30, backoff_factor=2.0)
+        tracker.register("reddit", 5, 60)
+
+        tracker.record("reddit", 0, now=NOW)
+
+        assert not tracker.is_due("reddit", now=NOW + timedelta(minutes=59))
+        assert tracker.is_due("reddit", now=NOW + timedelta(minutes=60))
+
+    def test_defer_keeps_interval(self):
+        tracker = CadenceTracker(initial_minutes=30)
+        tracker.register("jobs", 5, 60)
+
+        tracker.defer("jobs", now=NOW)
+
+        assert tracker.sources["jobs"].interval_minutes == 30
+        assert not tracker.is_due("jobs", now=NOW + timedelta(minutes=29))
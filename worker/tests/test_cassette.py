@@ -0,0 +1,114 @@
+"""Unit tests for HTTP record/replay cassettes."""
+
+import gzip
+import json
+import time
+import httpx
+import pytest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config import Settings
+from src.net.cassette import Cassette, CassetteTransport, CassetteMissError
+
+
+def live_transport(calls: list):
+    """Stand-in for the network: answers with a counter so repeats differ."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, text=f"response {len(calls)}", headers={"ETag": f'"{len(calls)}"'})
+    return httpx.MockTransport(handler)
+
+
+async def record(cassette: Cassette, *requests: tuple[str, str, dict]) -> list:
+    calls = []
+    async with httpx.AsyncClient(transport=CassetteTransport(live_transport(calls), cassette)) as client:
+        for method, url, kwargs in requests:
+            await client.request(method, url, **kwargs)
+    return calls
+
+
+class TestCassette:
+    """Tests for recording and replaying responses."""
+
+    @pytest.mark.asyncio
+    async def test_replays_recorded_response_without_network(self, tmp_path):
+        await record(Cassette(tmp_path), ("GET", "https://example.com/feed", {}))
+
+        replay = Cassette(tmp_path)
+        async with httpx.AsyncClient(transport=CassetteTransport(None, replay)) as client:
+            response = await client.get("https://example.com/feed")
+
+        assert response.status_code == 200
+        assert response.text == "response 1"
+        assert response.headers["ETag"] == '"1"'
+        assert replay.snapshot()["replayed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_repeats_replay_in_order_then_stick_to_last(self, tmp_path):
+        get = ("GET", "https://example.com/poll", {})
+        await record(Cassette(tmp_path), get, get)
+
+        async with httpx.AsyncClient(transport=CassetteTransport(None, Cassette(tmp_path))) as client:
+            bodies = [(await client.get("https://example.com/poll")).text for _ in range(3)]
+
+        assert bodies == ["response 1", "response 2", "response 2"]
+
+    @pytest.mark.asyncio
+    async def test_requests_match_on_method_url_and_body(self, tmp_path):
+        await record(
+            Cassette(tmp_path),
+            ("POST", "https://api.example.com/scrape", {"json": {"url": "a"}}),
+            ("POST", "https://api.example.com/scrape", {"json": {"url": "b"}}),
+        )
+
+        async with httpx.AsyncClient(transport=CassetteTransport(None, Cassette(tmp_path))) as client:
+            b = await client.post("https://api.example.com/scrape", json={"url": "b"})
+            a = await client.post("https://api.example.com/scrape", json={"url": "a"})
+            with pytest.raises(CassetteMissError):
+                await client.get("https://api.example.com/scrape")
+
+        assert (a.text, b.text) == ("response 1", "response 2")
+
+    @pytest.mark.asyncio
+    async def test_rerecording_replaces_old_recording(self, tmp_path):
+        get = ("GET", "https://example.com/feed", {})
+        await record(Cassette(tmp_path), get, get)
+        await record(Cassette(tmp_path), get)
+
+        files = list(tmp_path.glob("example.com/*.json.gz"))
+        assert len(files) == 1
+        with gzip.open(files[0], "rt") as f:
+            stored = json.load(f)
+        assert stored["url"] == "https://example.com/feed"
+        assert len(stored["responses"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_waits_scaled_recorded_latency(self, tmp_path):
+        await record(Cassette(tmp_path), ("GET", "https://example.com/feed", {}))
+        path = next(tmp_path.glob("example.com/*.json.gz"))
+        with gzip.open(path, "rt") as f:
+            stored = json.load(f)
+        stored["responses"][0]["elapsed"] = 0.2
+        with gzip.open(path, "wt") as f:
+            json.dump(stored, f)
+
+        transport = CassetteTransport(None, Cassette(tmp_path, latency_scale=0.25))
+        started = time.monotonic()
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://example.com/feed")
+
+        assert time.monotonic() - started >= 0.05
+
+
+class TestReplaySettings:
+    """Tests for what replay mode changes outside the HTTP transport."""
+
+    def test_replay_turns_ai_off(self):
+        """The LLM client isn't recorded, so replay must not call it live."""
+        required = {"supabase_url": "https://db.example.com", "supabase_service_role_key": "key"}
+        assert Settings(**required, http_cassette_mode="replay", ai_enabled=True).ai_enabled is False
+        assert Settings(**required, http_cassette_mode="record", ai_enabled=True).ai_enabled is True
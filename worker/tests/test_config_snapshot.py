@@ -0,0 +1,124 @@
+"""
+Unit tests for the cached scraper config snapshot.
+
+The Supabase client is mocked; tests cover merging, TTL and version probes.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.db.supabase as db
+from src.db.supabase import ScraperConfig, build_config_snapshot, get_config_snapshot
+
+
+def make_config(companies, keywords=(), **sources) -> ScraperConfig:
+    return ScraperConfig(
+        user_id="user",
+        target_companies=list(companies),
+        signal_keywords=list(keywords),
+        sources=sources,
+    )
+
+
+class TestBuildConfigSnapshot:
+    """Tests for merging configs into a snapshot."""
+
+    def test_merges_companies_case_insensitively(self):
+        snapshot = build_config_snapshot([
+            make_config(["Stripe", "HubSpot"]),
+            make_config(["stripe", " Shopify "]),
+        ])
+
+        assert snapshot.target_companies == ("HubSpot", "Shopify", "Stripe")
+        assert snapshot.normalized_companies == frozenset({"hubspot", "shopify", "stripe"})
+
+    def test_normalizes_keywords_once(self):
+        snapshot = build_config_snapshot([
+            make_config([], keywords=["Hiring", " hiring "]),
+        ])
+
+        assert snapshot.signal_keywords == ("Hiring",)
+        assert snapshot.normalized_keywords == frozenset({"hiring"})
+
+    def test_source_enabled_if_any_user_enables_it(self):
+        snapshot = build_config_snapshot([
+            make_config([], techcrunch=False, linkedin=True),
+            make_config([], techcrunch=True, linkedin=False),
+        ])
+
+        assert snapshot.enabled_sources["techcrunch"] is True
+        assert snapshot.enabled_sources["linkedin"] is True
+        assert snapshot.enabled_sources["company"] is False
+
+    def test_snapshot_is_immutable(self):
+        snapshot = build_config_snapshot([make_config(["Stripe"], ["VP Sales"])])
+
+        with pytest.raises(TypeError):
+            snapshot.enabled_sources["company"] = True
+        with pytest.raises(AttributeError):
+            snapshot.target_companies = ()
+
+
+class TestGetConfigSnapshot:
+    """Tests for snapshot caching."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        db._snapshot = None
+        db._snapshot_checked_at = 0.0
+        yield
+        db._snapshot = None
+        db._snapshot_checked_at = 0.0
+
+    @pytest.fixture
+    def settings(self):
+        settings = MagicMock()
+        settings.config_snapshot_ttl_seconds = 60
+        with patch('src.db.supabase.get_settings', return_value=settings):
+            yield settings
+
+    def test_reuses_snapshot_within_ttl(self, settings):
+        with patch('src.db.supabase._config_version', return_value=("t1", 1)) as version, \
+                patch('src.db.supabase.get_scraper_configs', return_value=[make_config(["Stripe"])]) as load:
+            first = get_config_snapshot()
+            second = get_config_snapshot()
+
+        assert first is second
+        assert version.call_count == 1
+        assert load.call_count == 1
+
+    def test_unchanged_version_skips_full_load(self, settings):
+        settings.config_snapshot_ttl_seconds = 0
+        with patch('src.db.supabase._config_version', return_value=("t1", 1)) as version, \
+                patch('src.db.supabase.get_scraper_configs', return_value=[make_config(["Stripe"])]) as load:
+            get_config_snapshot()
+            get_config_snapshot()
+
+        assert version.call_count == 2
+        assert load.call_count == 1
+
+    def test_changed_version_reloads(self, settings):
+        settings.config_snapshot_ttl_seconds = 0
+        with patch('src.db.supabase._config_version', side_effect=[("t1", 1), ("t2", 1)]), \
+                patch('src.db.supabase.get_scraper_configs', side_effect=[
+                    [make_config(["Stripe"])],
+                    [make_config(["Stripe", "Twilio"])],
+                ]):
+            get_config_snapshot()
+            snapshot = get_config_snapshot()
+
+        assert snapshot.target_companies == ("Stripe", "Twilio")
+
+    def test_keeps_last_snapshot_on_error(self, settings):
+        settings.config_snapshot_ttl_seconds = 0
+        with patch('src.db.supabase._config_version', side_effect=[("t1", 1), RuntimeError("db down")]), \
+                patch('src.db.supabase.get_scraper_configs', return_value=[make_config(["Stripe"])]):
+            first = get_config_snapshot()
+            second = get_config_snapshot()
+
+        assert second is first
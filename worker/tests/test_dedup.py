@@ -157,6 +157,31 @@ class TestIsDuplicate:
 
         assert result is True
 
+    @patch("src.db.dedup.get_client")
+    def test_is_duplicate_prefix_matches_company_id_when_resolved(self, mock_get_client):
+        """Test that a resolved company's prefix check covers all its spellings."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        select_mock = MagicMock()
+        mock_client.table.return_value.select.return_value = select_mock
+
+        empty_result = MagicMock()
+        empty_result.data = []
+        select_mock.eq.return_value.limit.return_value.execute.return_value = empty_result
+        select_mock.contains.return_value.limit.return_value.execute.return_value = empty_result
+
+        prefix_chain = select_mock.ilike.return_value.or_.return_value
+        prefix_chain.limit.return_value.execute.return_value.data = [{"id": "789"}]
+
+        result = is_duplicate("Stripe raises $1B", "Stripe", "https://b/1", company_id="c1", company_alias="Stripe, Inc.")
+
+        assert result is True
+        # Rows stored before resolution have no company_id; they match by name
+        select_mock.ilike.return_value.or_.assert_called_with(
+            'company_id.eq.c1,company_name.in.("Stripe","Stripe, Inc.")'
+        )
+
     @patch("src.db.dedup.get_client")
     def test_is_duplicate_returns_false_when_no_match(self, mock_get_client):
         """Test that False is returned when no duplicate strategies match."""
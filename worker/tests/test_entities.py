@@ -0,0 +1,252 @@
+"""
+Unit tests for company entity resolution.
+
+Tests alias normalization, the in-memory index and its incremental refresh;
+database calls are mocked.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models import Signal
+from src.db.companies import load_company_aliases
+from src.entities import (
+    CompanyIndex,
+    CompanyRef,
+    alias_keys,
+    normalize_company,
+    normalize_domain,
+)
+
+
+def alias_row(alias: str, company_id: str, name: str, kind: str = "name", domain: str | None = None,
+              updated_at: str = "2026-01-01T00:00:00+00:00") -> dict:
+    return {
+        "kind": kind,
+        "alias": alias,
+        "company_id": company_id,
+        "updated_at": updated_at,
+        "companies": {"name": name, "domain": domain},
+    }
+
+
+def make_signal(company: str, domain: str | None = None) -> Signal:
+    return Signal(
+        company_name=company,
+        company_domain=domain,
+        signal_type="funding",
+        title=f"{company} raises Series A",
+        summary="Test signal",
+        source_url="https://example.com/a",
+        source_name="Test",
+    )
+
+
+class TestNormalizeCompany:
+    """Tests for name alias keys."""
+
+    def test_legal_suffixes_dropped(self):
+        assert normalize_company("Acme, Inc.") == "acme"
+        assert normalize_company("ACME Corp.") == "acme"
+        assert normalize_company("Acme Holdings Co., Ltd.") == "acme holdings"
+        assert normalize_company("Acme L.L.C.") == "acme"
+
+    def test_leading_the_and_ampersand(self):
+        assert normalize_company("The Procter & Gamble Company") == "procter and gamble"
+
+    def test_accents_and_apostrophes(self):
+        assert normalize_company("Nestlé S.A.") == "nestle"
+        assert normalize_company("McDonald's") == "mcdonalds"
+
+    def test_suffix_alone_is_kept(self):
+        """A name that is only a suffix word isn't reduced to nothing."""
+        assert normalize_company("Company") == "company"
+        assert normalize_company("  ") == ""
+
+
+class TestNormalizeDomain:
+    """Tests for domain alias keys."""
+
+    def test_url_reduced_to_registrable_domain(self):
+        assert normalize_domain("https://www.blog.acme.com/news?id=1") == "acme.com"
+        assert normalize_domain("Acme.com:443") == "acme.com"
+
+    def test_country_second_level(self):
+        assert normalize_domain("shop.acme.co.uk") == "acme.co.uk"
+
+    def test_shared_hosts_keep_the_customer(self):
+        assert normalize_domain("acme.github.io") == "acme.github.io"
+
+    def test_not_a_domain(self):
+        assert normalize_domain("localhost") == ""
+        assert normalize_domain("10.0.0.1") == ""
+
+
+class TestAliasKeys:
+    """Tests for alias_keys."""
+
+    def test_domain_first(self):
+        assert alias_keys("Acme Inc", "https://acme.com") == [("domain", "acme.com"), ("name", "acme")]
+
+    def test_domain_like_name(self):
+        assert ("domain", "booking.com") in alias_keys("Booking.com")
+
+    def test_generic_names_have_no_keys(self):
+        assert alias_keys("Tech Company") == []
+        assert alias_keys("Startup") == []
+
+
+class TestCompanyIndex:
+    """Tests for lookups and refreshes of the in-memory index."""
+
+    def test_lookup_by_any_spelling(self):
+        index = CompanyIndex()
+        index.load([alias_row("acme", "c1", "Acme")])
+        assert index.lookup("ACME, Inc.").id == "c1"
+        assert index.lookup("Acme Corporation").id == "c1"
+        assert index.lookup("Globex") is None
+
+    def test_domain_wins_over_name(self):
+        index = CompanyIndex()
+        index.load([
+            alias_row("acme", "c1", "Acme"),
+            alias_row("acme.io", "c2", "Acme Robotics", kind="domain"),
+        ])
+        assert index.lookup("Acme", "https://www.acme.io").id == "c2"
+
+    def test_canonicalize_rewrites_signal(self):
+        index = CompanyIndex()
+        index.load([alias_row("acme", "c1", "Acme", domain="acme.com")])
+        signal = index.canonicalize(make_signal("ACME Corp."))
+        assert signal.company_id == "c1"
+        assert signal.company_name == "Acme"
+        assert signal.company_domain == "acme.com"
+        assert signal.metadata["company_alias"] == "ACME Corp."
+
+    def test_canonicalize_leaves_unknown_alone(self):
+        index = CompanyIndex()
+        signal = index.canonicalize(make_signal("Globex"))
+        assert signal.company_id is None
+        assert signal.company_name == "Globex"
+        assert "company_alias" not in signal.metadata
+
+    def test_repointed_alias_overrides(self):
+        """A merge repoints an alias; the next load follows it."""
+        index = CompanyIndex()
+        index.load([alias_row("acme", "c1", "Acme")])
+        index.load([alias_row("acme", "c2", "Acme Global", updated_at="2026-01-02T00:00:00+00:00")])
+        assert index.lookup("Acme").id == "c2"
+
+    @pytest.mark.asyncio
+    async def test_refresh_is_incremental(self):
+        index = CompanyIndex()
+        calls = []
+
+        def fake_load(since):
+            calls.append(since)
+            if since is None:
+                return [alias_row("acme", "c1", "Acme", updated_at="2026-01-01T00:00:00+00:00")]
+            return [alias_row("globex", "c2", "Globex", updated_at="2026-01-02T00:00:00+00:00")]
+
+        with patch('src.entities.load_company_aliases', side_effect=fake_load):
+            await index.refresh(max_age=0)
+            await index.refresh(max_age=0)
+
+        assert calls[0] is None
+        # Only aliases since the newest one loaded (less a small overlap)
+        assert calls[1] is not None and calls[1].isoformat() < "2026-01-01T00:00:00+00:00"
+        assert index.lookup("Acme").id == "c1"
+        assert index.lookup("Globex").id == "c2"
+
+    @pytest.mark.asyncio
+    async def test_refresh_respects_max_age(self):
+        index = CompanyIndex()
+        with patch('src.entities.load_company_aliases', return_value=[]) as load:
+            await index.refresh(max_age=300)
+            await index.refresh(max_age=300)
+        assert load.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_index(self):
+        index = CompanyIndex()
+        index.load([alias_row("acme", "c1", "Acme")])
+        with patch('src.entities.load_company_aliases', return_value=None):
+            await index.refresh(max_age=0)
+        assert index.lookup("Acme").id == "c1"
+
+
+class TestResolve:
+    """Tests for CompanyIndex.resolve."""
+
+    @pytest.mark.asyncio
+    async def test_known_alias_skips_database(self):
+        index = CompanyIndex()
+        index.add(CompanyRef("c1", "Acme"), [("name", "acme")])
+        with patch('src.entities.resolve_company') as rpc:
+            company = await index.resolve("Acme Inc.")
+        assert company.id == "c1"
+        rpc.assert_not_called()
+        assert index.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_new_company_created_and_cached(self):
+        index = CompanyIndex()
+        row = {"id": "c9", "name": "Globex Corp", "domain": "globex.com"}
+        with patch('src.entities.resolve_company', return_value=row) as rpc:
+            company = await index.resolve("Globex Corp", "https://globex.com/about")
+            again = await index.resolve("GLOBEX")
+
+        assert company == again == CompanyRef("c9", "Globex Corp", "globex.com")
+        name, domain, aliases = rpc.call_args.args
+        assert (name, domain) == ("Globex Corp", "globex.com")
+        assert aliases == [{"kind": "domain", "alias": "globex.com"}, {"kind": "name", "alias": "globex"}]
+        assert rpc.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_generic_name_not_resolved(self):
+        index = CompanyIndex()
+        with patch('src.entities.resolve_company') as rpc:
+            assert await index.resolve("Tech Industry") is None
+        rpc.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failure_pauses_creation(self):
+        index = CompanyIndex()
+        with patch('src.entities.resolve_company', return_value=None) as rpc:
+            assert await index.resolve("Globex") is None
+            assert await index.resolve("Initech") is None
+        assert rpc.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_lookup_only_without_create(self):
+        index = CompanyIndex()
+        index.add(CompanyRef("c1", "Acme"), [("name", "acme")])
+        with patch('src.entities.resolve_company') as rpc:
+            assert (await index.resolve("Acme", create=False)).id == "c1"
+            assert await index.resolve("Big News Today", create=False) is None
+        rpc.assert_not_called()
+
+
+class TestLoadCompanyAliases:
+    """Tests for paging through company_aliases."""
+
+    @patch("src.db.companies.ALIAS_PAGE_SIZE", 2)
+    @patch("src.db.companies.get_client")
+    def test_pages_in_a_total_order(self, mock_get_client):
+        query = MagicMock()
+        query.order.return_value = query
+        query.range.return_value = query
+        pages = [[alias_row("a", "c1", "A"), alias_row("b", "c1", "A")], [alias_row("c", "c2", "C")]]
+        query.execute.side_effect = [MagicMock(data=page) for page in pages]
+        mock_get_client.return_value.table.return_value.select.return_value = query
+
+        rows = load_company_aliases()
+
+        assert [row["alias"] for row in rows] == ["a", "b", "c"]
+        assert [call.args for call in query.order.call_args_list[:3]] == [("updated_at",), ("kind",), ("alias",)]
+        assert [call.args for call in query.range.call_args_list] == [(0, 1), (2, 3)]
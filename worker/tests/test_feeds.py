@@ -0,0 +1,116 @@
+"""Unit tests for the shared RSS / Atom feed parser."""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.feeds import parse_feed, iter_feed
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Example News</title>
+    <link>https://example.com/</link>
+    <item>
+      <title>Acme raises $20M &amp;amp; expands</title>
+      <link>https://example.com/acme</link>
+      <description><![CDATA[<p>Acme <b>raised</b> a Series A.</p>]]></description>
+      <pubDate>Mon, 06 Jan 2025 10:00:00 GMT</pubDate>
+      <guid isPermaLink="false">acme-1</guid>
+      <source url="https://reuters.com">Reuters</source>
+    </item>
+    <item>
+      <title>Globex launches widgets</title>
+      <link>https://example.com/globex</link>
+      <content:encoded><![CDATA[Globex <i>widgets</i>]]></content:encoded>
+    </item>
+    <item>
+      <title>Initech hires a CTO</title>
+      <link>https://example.com/initech</link>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Launches</title>
+  <link href="https://example.com/"/>
+  <entry>
+    <id>tag:example.com,2025:1</id>
+    <title>Widgetly - Widgets for teams</title>
+    <link rel="self" href="https://example.com/self/1"/>
+    <link rel="alternate" href="https://example.com/posts/widgetly"/>
+    <updated>2025-01-06T10:00:00Z</updated>
+    <content type="html">&lt;p&gt;Widgets, finally.&lt;/p&gt;</content>
+  </entry>
+</feed>
+"""
+
+RDF = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <item rdf:about="https://example.com/rdf">
+    <title>RDF item</title>
+    <link>https://example.com/rdf</link>
+    <dc:date>2025-01-06</dc:date>
+  </item>
+</rdf:RDF>
+"""
+
+
+class TestParseFeed:
+    """Tests for normalising RSS and Atom items."""
+
+    def test_rss_items(self):
+        items = parse_feed(RSS).items
+
+        assert [i.link for i in items] == [
+            "https://example.com/acme",
+            "https://example.com/globex",
+            "https://example.com/initech",
+        ]
+        acme = items[0]
+        assert acme.title == "Acme raises $20M & expands"
+        assert acme.summary == "Acme raised a Series A."
+        assert acme.published == "Mon, 06 Jan 2025 10:00:00 GMT"
+        assert acme.source == "Reuters"
+        assert acme.key == "acme-1"
+        assert items[1].summary == "Globex widgets"
+        assert items[2].key == "https://example.com/initech"
+
+    def test_atom_entries(self):
+        [entry] = parse_feed(ATOM).items
+
+        assert entry.title == "Widgetly - Widgets for teams"
+        assert entry.link == "https://example.com/posts/widgetly"
+        assert entry.summary == "Widgets, finally."
+        assert entry.published == "2025-01-06T10:00:00Z"
+        assert entry.key == "tag:example.com,2025:1"
+
+    def test_rdf_items(self):
+        [item] = parse_feed(RDF).items
+
+        assert (item.title, item.link, item.published) == ("RDF item", "https://example.com/rdf", "2025-01-06")
+
+    def test_limit(self):
+        page = parse_feed(RSS, limit=2)
+
+        assert len(page.items) == 2
+        assert not page.caught_up
+
+    def test_stops_at_seen_item(self):
+        page = parse_feed(RSS, stop_at="https://example.com/globex")
+
+        assert [i.key for i in page.items] == ["acme-1"]
+        assert page.caught_up
+
+    def test_malformed_feed_keeps_items_before_the_error(self):
+        broken = RSS.split(b"<item>\n      <title>Initech")[0] + b"<item><title>oops</rss>"
+
+        assert [i.key for i in iter_feed(broken)] == ["acme-1", "https://example.com/globex"]
+
+    def test_not_xml(self):
+        assert parse_feed(b"<html><body>Not a feed").items == []
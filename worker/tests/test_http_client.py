@@ -0,0 +1,78 @@
+"""Unit tests for the shared HTTP client registry."""
+
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.net import client as http
+
+
+@pytest.fixture
+def mock_settings():
+    settings = MagicMock()
+    settings.http2_enabled = True
+    settings.http_user_agent = "Axidex Signal Scraper 1.0"
+    settings.http_timeout_seconds = 30.0
+    settings.http_connect_timeout_seconds = 10.0
+    settings.http_max_connections = 100
+    settings.http_max_keepalive_connections = 20
+    settings.http_keepalive_expiry_seconds = 30.0
+    settings.http_singleflight_enabled = True
+    settings.http_cassette_mode = "off"
+    settings.robots_enabled = True
+    settings.robots_user_agent = "AxidexBot"
+    settings.robots_ttl_seconds = 86400
+    settings.robots_negative_ttl_seconds = 3600
+    settings.robots_max_crawl_delay_seconds = 60
+    settings.http_rate_per_host = 2.0
+    settings.http_burst_per_host = 4
+    settings.host_rate_limits = {}
+    settings.http_max_retry_after_seconds = 300
+    settings.aimd_initial_concurrency = 4
+    settings.aimd_max_concurrency = 32
+    settings.aimd_backoff_factor = 0.5
+    settings.aimd_latency_factor = 3.0
+    settings.http_retry_attempts = 3
+    settings.http_retry_base_delay_seconds = 0.5
+    settings.http_retry_max_delay_seconds = 10.0
+    settings.breaker_failure_threshold = 5
+    settings.breaker_reset_seconds = 60.0
+    with patch('src.net.client.get_settings', return_value=settings), \
+            patch('src.net.ratelimit.get_settings', return_value=settings), \
+            patch('src.net.aimd.get_settings', return_value=settings), \
+            patch('src.net.breaker.get_settings', return_value=settings), \
+            patch('src.net.retry.get_settings', return_value=settings), \
+            patch('src.net.robots.get_settings', return_value=settings):
+        yield settings
+
+
+class TestHttpClientRegistry:
+    """Tests for borrowing pooled clients."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_one_client_per_proxy(self, mock_settings):
+        try:
+            shared = http.get_http_client()
+            assert http.get_http_client() is shared
+            assert http.get_http_client("http://proxy:8080") is not shared
+            assert shared.headers["User-Agent"] == "Axidex Signal Scraper 1.0"
+            assert shared.timeout.connect == 10.0
+        finally:
+            await http.close_http_clients()
+
+        assert shared.is_closed
+        assert http.get_http_client() is not shared
+        await http.close_http_clients()
+
+    def test_new_event_loop_gets_fresh_clients(self, mock_settings):
+        async def borrow():
+            return http.get_http_client()
+
+        first = asyncio.run(borrow())
+        second = asyncio.run(borrow())
+        assert first is not second
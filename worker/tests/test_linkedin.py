@@ -13,6 +13,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.models import Signal
+from src.db.dedup import compute_content_hash
 
 
 class TestLinkedInScraper:
@@ -38,9 +39,8 @@ class TestLinkedInScraper:
     def scraper(self, mock_settings):
         """Create a LinkedInScraper instance with mocked settings."""
         with patch('src.scrapers.linkedin.get_settings', return_value=mock_settings):
-            with patch('src.scrapers.linkedin.is_duplicate', return_value=False):
-                from src.scrapers.linkedin import LinkedInScraper
-                return LinkedInScraper()
+            from src.scrapers.linkedin import LinkedInScraper
+            return LinkedInScraper()
 
     @pytest.fixture
     def disabled_scraper(self, mock_settings_no_token):
@@ -59,8 +59,7 @@ class TestLinkedInScraper:
             "location": "San Francisco, CA"
         }
 
-        with patch('src.scrapers.linkedin.is_duplicate', return_value=False):
-            signal = scraper._parse_job_to_signal(mock_job, "Fallback Company")
+        signal = scraper._parse_job_to_signal(mock_job, "Fallback Company")
 
         assert signal is not None
         assert signal.company_name == "Acme Corp"
@@ -78,8 +77,7 @@ class TestLinkedInScraper:
             "location": "New York, NY"
         }
 
-        with patch('src.scrapers.linkedin.is_duplicate', return_value=False):
-            signal = scraper._parse_job_to_signal(mock_job, "Fallback Corp")
+        signal = scraper._parse_job_to_signal(mock_job, "Fallback Corp")
 
         assert signal is not None
         assert signal.company_name == "Fallback Corp"
@@ -120,8 +118,8 @@ class TestLinkedInScraper:
 
         assert signal is None
 
-    def test_parse_job_skips_duplicates(self, scraper):
-        """Test that duplicate jobs are skipped."""
+    def test_parse_job_attaches_content_hash(self, scraper):
+        """Test that parsed jobs carry the raw-title hash used by the dedup stage."""
         mock_job = {
             "title": "VP of Sales",
             "company_name": "Tech Corp",
@@ -130,10 +128,10 @@ class TestLinkedInScraper:
             "location": "Seattle, WA"
         }
 
-        with patch('src.scrapers.linkedin.is_duplicate', return_value=True):
-            signal = scraper._parse_job_to_signal(mock_job, "Tech Corp")
+        signal = scraper._parse_job_to_signal(mock_job, "Tech Corp")
 
-        assert signal is None
+        assert signal is not None
+        assert signal.metadata["content_hash"] == compute_content_hash("VP of Sales", "Tech Corp")
 
     def test_assess_priority_high_for_vp(self, scraper):
         """Test VP titles get high priority."""
@@ -192,8 +190,7 @@ class TestLinkedInScraper:
             "location": "NYC"
         }
 
-        with patch('src.scrapers.linkedin.is_duplicate', return_value=False):
-            signal = scraper._parse_job_to_signal(mock_job, "Acme Corp")
+        signal = scraper._parse_job_to_signal(mock_job, "Acme Corp")
 
         assert signal.signal_type == "hiring"
 
@@ -208,8 +205,7 @@ class TestLinkedInScraper:
             "location": "NYC"
         }
 
-        with patch('src.scrapers.linkedin.is_duplicate', return_value=False):
-            signal = scraper._parse_job_to_signal(mock_job, "Acme Corp")
+        signal = scraper._parse_job_to_signal(mock_job, "Acme Corp")
 
         assert len(signal.summary) == 303  # 300 chars + "..."
         assert signal.summary.endswith("...")
@@ -224,8 +220,7 @@ class TestLinkedInScraper:
             "location": "NYC"
         }
 
-        with patch('src.scrapers.linkedin.is_duplicate', return_value=False):
-            signal = scraper._parse_job_to_signal(mock_job, "Acme Corp")
+        signal = scraper._parse_job_to_signal(mock_job, "Acme Corp")
 
         assert "VP of Sales" in signal.summary
         assert "Acme Corp" in signal.summary
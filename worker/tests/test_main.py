@@ -0,0 +1,65 @@
+"""
+Unit tests for the scrape cycle entry points in main.
+
+The pipeline and progress reporter are mocked; tests cover how a cycle
+closes its runs when it ends abnormally.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.main as main
+from src.db.supabase import ConfigSnapshot
+
+
+@pytest.fixture
+def cycle():
+    """run_scrapers with a pipeline that blocks until cancelled."""
+    settings = MagicMock()
+    settings.task_queue_enabled = False
+    settings.scraper_concurrency = 2
+
+    pipeline = MagicMock()
+    started = asyncio.Event()
+
+    async def run():
+        started.set()
+        await asyncio.Event().wait()
+
+    pipeline.run = run
+    reporter = MagicMock()
+    reporter.close = AsyncMock()
+    scraper = MagicMock()
+    scraper.name = "news"
+
+    with patch('src.main.get_settings', return_value=settings), \
+            patch('src.main.load_scraper_config', AsyncMock(return_value=ConfigSnapshot())), \
+            patch('src.main.create_scrapers', return_value=[scraper]), \
+            patch('src.main.SignalPipeline', return_value=pipeline), \
+            patch('src.main.ProgressReporter', return_value=reporter), \
+            patch('src.main.sentry_sdk'):
+        yield started, reporter
+
+
+class TestRunScrapers:
+    """Tests for run_scrapers shutting down."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_cycle_closes_its_runs(self, cycle):
+        started, reporter = cycle
+        task = asyncio.create_task(main.run_scrapers())
+        await started.wait()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        reporter.close.assert_awaited_once()
+        assert reporter.close.await_args.kwargs["status"] == "cancelled"
+        assert main._active_cycles == []
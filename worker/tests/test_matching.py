@@ -0,0 +1,69 @@
+"""Unit tests for the company mention automaton."""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matching import CompanyMatcher, Mention, get_company_matcher
+from src.scrapers.reddit import RedditScraper
+
+
+class TestCompanyMatcher:
+    """Tests for word-boundary, case-insensitive company matching."""
+
+    def test_finds_companies_and_offsets(self):
+        matcher = CompanyMatcher(["Stripe", "HubSpot"])
+        text = "hubspot partners with STRIPE"
+
+        assert matcher.matches(text) == [Mention("HubSpot", 0, 7), Mention("Stripe", 22, 28)]
+        assert text[22:28] == "STRIPE"
+
+    def test_no_matches_inside_words(self):
+        matcher = CompanyMatcher(["Box"])
+
+        assert matcher.matches("Dropbox ships Xbox sync") == []
+        assert matcher.first("Box, Inc. raises $100M") == Mention("Box", 0, 3)
+
+    def test_longest_mention_wins_overlaps(self):
+        matcher = CompanyMatcher(["Acme", "Acme Cloud", "Cloud"])
+
+        assert matcher.matches("Acme Cloud and Cloud") == [Mention("Acme Cloud", 0, 10), Mention("Cloud", 15, 20)]
+
+    def test_suffix_patterns(self):
+        # "he" / "she" / "hers" share suffixes, so exercise the failure links
+        matcher = CompanyMatcher(["he", "she", "hers"])
+
+        assert matcher.mentioned("she said hers, not he") == ["she", "hers", "he"]
+        assert matcher.matches("ushers") == []
+
+    def test_names_with_punctuation(self):
+        matcher = CompanyMatcher(["C3.ai", "monday.com"])
+
+        assert matcher.mentioned("C3.ai's deal with Monday.com.") == ["C3.ai", "monday.com"]
+
+    def test_offsets_survive_lengthening_lowercase(self):
+        matcher = CompanyMatcher(["Box"])
+
+        assert matcher.first("İİ Box") == Mention("Box", 3, 6)
+
+    def test_empty(self):
+        matcher = CompanyMatcher(["", "  "])
+
+        assert not matcher
+        assert matcher.matches("anything") == []
+
+    def test_shared_per_company_list(self):
+        assert get_company_matcher(["Stripe", "Twilio"]) is get_company_matcher(("Stripe", "Twilio"))
+
+
+class TestScraperFiltering:
+    """Tests for scrapers filtering items by target company."""
+
+    def test_substring_no_longer_matches(self):
+        scraper = RedditScraper(target_companies=["Box"])
+        post = {"title": "Dropbox raises Series B funding", "score": 50, "num_comments": 10, "permalink": "/r/x/1"}
+
+        assert scraper._parse_post(post, "startups") is None
+        assert scraper._parse_post({**post, "title": "Box raises Series B funding"}, "startups") is not None
@@ -0,0 +1,106 @@
+"""Unit tests for the off-loop parse executor and the HTML parse jobs."""
+
+import threading
+import pytest
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import parsing
+from src.feeds import parse_feed
+from src.parsing import ParseExecutor
+from src.scrapers.company import parse_press_links
+from src.scrapers.jobs import JobCard, parse_job_cards
+
+
+def parsing_thread(content: bytes) -> str:
+    return threading.current_thread().name
+
+
+def feed(items: int) -> bytes:
+    entries = "".join(f"<item><title>Item {i}</title><link>https://example.com/{i}</link></item>" for i in range(items))
+    return f"<rss><channel>{entries}</channel></rss>".encode()
+
+
+class TestParseExecutor:
+    """Tests for choosing between inline and pooled parsing."""
+
+    @pytest.mark.asyncio
+    async def test_small_bodies_parse_inline(self):
+        executor = ParseExecutor("thread", inline_max_bytes=100)
+
+        assert await executor.run(parsing_thread, b"x" * 100) == threading.current_thread().name
+        assert executor.snapshot()["inline"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_large_bodies_parse_in_pool(self):
+        executor = ParseExecutor("thread", inline_max_bytes=100)
+
+        assert (await executor.run(parsing_thread, b"x" * 101)).startswith("parse")
+        assert executor.snapshot()["offloaded"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_inline_mode_never_offloads(self):
+        executor = ParseExecutor("inline", inline_max_bytes=0)
+
+        assert await executor.run(parsing_thread, b"x" * 10_000) == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_process_pool_returns_records(self):
+        executor = ParseExecutor("process", max_workers=1, inline_max_bytes=0)
+        try:
+            page = await executor.run(parse_feed, feed(50), 3, None)
+        finally:
+            executor.shutdown()
+
+        assert [item.title for item in page.items] == ["Item 0", "Item 1", "Item 2"]
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            ParseExecutor("fibers")
+
+    def test_built_from_settings(self):
+        settings = MagicMock(parse_executor="inline", parse_workers=3, parse_inline_max_bytes=10)
+        parsing._executor = None
+        try:
+            with patch("src.parsing.get_settings", return_value=settings):
+                executor = parsing.get_parse_executor()
+        finally:
+            parsing._executor = None
+
+        assert (executor.mode, executor.max_workers, executor.inline_max_bytes) == ("inline", 3, 10)
+
+
+INDEED = """
+<div class="job_seen_beacon">
+  <h2 class="jobTitle"><a class="jcs-JobTitle" href="/rc/clk?jk=1"><span>VP Sales – EMEA</span></a></h2>
+  <span data-testid="company-name">Stripe</span>
+</div>
+<div class="job_seen_beacon">
+  <h2 class="jobTitle"><span>No link</span></h2>
+  <span data-testid="company-name">Stripe</span>
+</div>
+"""
+
+
+class TestHtmlParseJobs:
+    """Tests for the parse jobs the HTML scrapers submit."""
+
+    def test_job_cards(self):
+        cards = parse_job_cards(INDEED.encode("utf-8"), "utf-8")
+
+        assert cards == [JobCard(title="VP Sales – EMEA", company="Stripe", href="/rc/clk?jk=1")]
+
+    def test_press_links_skip_short_and_empty_links(self):
+        html = (
+            '<a href="/news/acme-raises">Acme raises $20M to expand in Europe</a>'
+            '<a href="/about">About</a>'
+            '<a>A long headline without any link target</a>'
+        ).encode("latin-1")
+
+        assert parse_press_links(html, "latin-1") == [("/news/acme-raises", "Acme raises $20M to expand in Europe")]
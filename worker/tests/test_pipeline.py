@@ -0,0 +1,545 @@
+"""
+Unit tests for the streaming signal pipeline.
+
+Database and AI calls are mocked; tests cover stage wiring, dedup and progress.
+"""
+
+import asyncio
+import time
+import httpx
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models import Signal
+from src.scrapers.base import BaseScraper
+from src.pipeline import SignalPipeline
+from src.net import get_limited, FetchDeadlineError
+from src.net.validators import ValidatorCache
+from src.parsing import ParseExecutor
+from src.entities import CompanyIndex
+
+
+def make_signal(title: str, url: str, company: str = "Stripe") -> Signal:
+    return Signal(
+        company_name=company,
+        signal_type="funding",
+        title=title,
+        summary="Test signal",
+        source_url=url,
+        source_name="Test",
+    )
+
+
+class ListScraper(BaseScraper):
+    def __init__(self, name: str, signals: list[Signal], fail_after: int | None = None):
+        self.name = name
+        self.signals = signals
+        self.fail_after = fail_after
+
+    async def stream_unit(self, unit: str):
+        for i, signal in enumerate(self.signals):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("source down")
+            await asyncio.sleep(0)
+            yield signal
+
+    async def stream(self):
+        # Bypass per-unit error isolation so failures reach the pipeline
+        async for signal in self.stream_unit(self.name):
+            yield signal
+
+    def enrich_signal(self, signal: Signal) -> Signal:
+        return signal
+
+
+@pytest.fixture
+def mock_settings():
+    settings = MagicMock()
+    settings.scraper_concurrency = 2
+    settings.source_concurrency = {}
+    settings.scraper_time_budget_seconds = 5
+    settings.source_time_budgets = {}
+    settings.pipeline_queue_size = 2
+    settings.dedup_workers = 2
+    settings.enrich_workers = 2
+    settings.insert_workers = 1
+    settings.entity_resolution_enabled = False
+    with patch('src.pipeline.get_settings', return_value=settings), \
+            patch('src.scrapers.base.get_settings', return_value=settings):
+        yield settings
+
+
+@pytest.fixture
+def inserted():
+    rows = []
+
+    def fake_insert(signal, user_id=None):
+        rows.append((signal, user_id))
+        return {"id": str(len(rows))}
+
+    with patch('src.pipeline.insert_signal', side_effect=fake_insert):
+        yield rows
+
+
+class TestSignalPipeline:
+    """Tests for SignalPipeline.run."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_signals_from_all_sources(self, mock_settings, inserted):
+        scrapers = [
+            ListScraper("a", [make_signal(f"A {i}", f"https://a/{i}") for i in range(5)]),
+            ListScraper("b", [make_signal(f"B {i}", f"https://b/{i}") for i in range(3)]),
+        ]
+        with patch('src.pipeline.is_duplicate', return_value=False):
+            stats = await SignalPipeline(scrapers, user_id="user-1").run()
+
+        assert stats.total_signals == 8
+        assert stats.signals_by_source == {"a": 5, "b": 3}
+        assert stats.progress["a"] == {"status": "completed", "signals": 5}
+        assert stats.first_signal_seconds is not None
+        assert all(user_id == "user-1" for _, user_id in inserted)
+
+    @pytest.mark.asyncio
+    async def test_skips_database_duplicates(self, mock_settings, inserted):
+        scrapers = [ListScraper("a", [make_signal("VP of Sales", "https://a/1")])]
+        with patch('src.pipeline.is_duplicate', return_value=True):
+            stats = await SignalPipeline(scrapers).run()
+
+        assert stats.total_signals == 0
+        assert stats.duplicates == 1
+        assert inserted == []
+
+    @pytest.mark.asyncio
+    async def test_skips_in_cycle_duplicates_across_sources(self, mock_settings, inserted):
+        scrapers = [
+            ListScraper("a", [make_signal("Stripe raises $1B", "https://a/1")]),
+            ListScraper("b", [make_signal("Stripe raises $1B", "https://b/1")]),
+        ]
+        with patch('src.pipeline.is_duplicate', return_value=False):
+            stats = await SignalPipeline(scrapers).run()
+
+        assert stats.total_signals == 1
+        assert stats.duplicates == 1
+
+    @pytest.mark.asyncio
+    async def test_dedups_spellings_of_one_company(self, mock_settings, inserted):
+        mock_settings.entity_resolution_enabled = True
+        mock_settings.entity_refresh_seconds = 300
+        rows = [{
+            "kind": "name", "alias": "stripe", "company_id": "c1",
+            "updated_at": "2026-01-01T00:00:00+00:00",
+            "companies": {"name": "Stripe", "domain": "stripe.com"},
+        }]
+        scrapers = [
+            ListScraper("a", [make_signal("Stripe raises $1B", "https://a/1", company="Stripe, Inc.")]),
+            ListScraper("b", [make_signal("Stripe raises $1B", "https://b/1", company="STRIPE")]),
+        ]
+        with patch('src.pipeline.get_company_index', return_value=CompanyIndex()), \
+                patch('src.entities.load_company_aliases', return_value=rows), \
+                patch('src.pipeline.is_duplicate', return_value=False) as is_duplicate:
+            stats = await SignalPipeline(scrapers).run()
+
+        assert stats.total_signals == 1
+        assert stats.duplicates == 1
+        signal, _ = inserted[0]
+        assert (signal.company_id, signal.company_name, signal.company_domain) == ("c1", "Stripe", "stripe.com")
+        assert is_duplicate.call_args.args[4] == "c1"
+
+    @pytest.mark.asyncio
+    async def test_only_targets_and_domains_create_companies(self, mock_settings, inserted):
+        mock_settings.entity_resolution_enabled = True
+        mock_settings.entity_refresh_seconds = 300
+        guessed = make_signal("Big news today", "https://a/1", company="Big News Today")
+        domained = make_signal("Globex ships v2", "https://a/2", company="Globex")
+        domained.company_domain = "https://globex.com"
+        scraper = ListScraper("a", [guessed, domained, make_signal("Acme raises", "https://a/3", company="Acme Inc.")])
+        scraper.target_companies = ["Acme"]
+
+        def fake_resolve(name, domain, aliases):
+            return {"id": f"id-{name}", "name": name, "domain": domain}
+
+        with patch('src.pipeline.get_company_index', return_value=CompanyIndex()), \
+                patch('src.entities.load_company_aliases', return_value=[]), \
+                patch('src.entities.resolve_company', side_effect=fake_resolve) as rpc, \
+                patch('src.pipeline.is_duplicate', return_value=False):
+            await SignalPipeline([scraper]).run()
+
+        assert sorted(call.args[0] for call in rpc.call_args_list) == ["Acme Inc.", "Globex"]
+        by_url = {signal.source_url: signal for signal, _ in inserted}
+        assert by_url["https://a/1"].company_id is None
+
+    @pytest.mark.asyncio
+    async def test_in_cycle_duplicates_are_not_resolved(self, mock_settings, inserted):
+        mock_settings.entity_resolution_enabled = True
+        mock_settings.entity_refresh_seconds = 300
+        scraper = ListScraper("a", [
+            make_signal("Acme raises", "https://a/1", company="Acme"),
+            make_signal("Acme raises", "https://a/1", company="Acme"),
+        ])
+        scraper.target_companies = ["Acme"]
+        index = CompanyIndex()
+
+        with patch('src.pipeline.get_company_index', return_value=index), \
+                patch('src.entities.load_company_aliases', return_value=[]), \
+                patch('src.entities.resolve_company', return_value={"id": "c1", "name": "Acme"}), \
+                patch('src.pipeline.is_duplicate', return_value=False):
+            stats = await SignalPipeline([scraper]).run()
+
+        assert stats.duplicates == 1
+        assert index.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_source_keeps_signals_already_streamed(self, mock_settings, inserted):
+        scrapers = [
+            ListScraper("a", [make_signal(f"A {i}", f"https://a/{i}") for i in range(4)], fail_after=2),
+        ]
+        with patch('src.pipeline.is_duplicate', return_value=False), \
+                patch('src.pipeline.sentry_sdk'):
+            stats = await SignalPipeline(scrapers).run()
+
+        assert stats.total_signals == 2
+        assert stats.progress["a"]["status"] == "failed"
+        assert stats.progress["a"]["signals"] == 2
+
+    @pytest.mark.asyncio
+    async def test_reports_progress_on_status_changes(self, mock_settings, inserted):
+        statuses = []
+        scrapers = [ListScraper("a", [make_signal("A", "https://a/1")])]
+        with patch('src.pipeline.is_duplicate', return_value=False):
+            await SignalPipeline(
+                scrapers,
+                on_progress=lambda stats: statuses.append(stats.progress["a"]["status"]),
+            ).run()
+
+        assert statuses == ["pending", "running", "completed"]
+
+    @pytest.mark.asyncio
+    async def test_explicit_units_surface_failures(self, mock_settings, inserted):
+        scrapers = [
+            ListScraper("a", [make_signal(f"A {i}", f"https://a/{i}") for i in range(3)], fail_after=1),
+        ]
+        with patch('src.pipeline.is_duplicate', return_value=False), \
+                patch('src.pipeline.sentry_sdk'):
+            stats = await SignalPipeline(scrapers, units={"a": ["only-unit"]}).run()
+
+        assert stats.total_signals == 1
+        assert stats.progress["a"]["status"] == "failed"
+        assert stats.progress["a"]["error"] == "source down"
+
+
+class GatedScraper(ListScraper):
+    """Holds its signals back until the gate opens."""
+
+    def __init__(self, name: str, signals: list[Signal], gate: asyncio.Event):
+        super().__init__(name, signals)
+        self.gate = gate
+
+    async def stream_unit(self, unit: str):
+        await self.gate.wait()
+        async for signal in super().stream_unit(unit):
+            yield signal
+
+
+class TestAddScrapers:
+    """Tests for joining scrapers to a running pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_only_uncovered_sources_join(self, mock_settings, inserted):
+        gate = asyncio.Event()
+        pipeline = SignalPipeline([GatedScraper("a", [make_signal("A", "https://a/1")], gate)])
+
+        with patch('src.pipeline.is_duplicate', return_value=False):
+            run = asyncio.create_task(pipeline.run())
+            await asyncio.sleep(0)
+
+            joined = pipeline.add_scrapers([
+                ListScraper("a", [make_signal("A again", "https://a/2")]),
+                ListScraper("b", [make_signal("B", "https://b/1")]),
+            ])
+            gate.set()
+            stats = await run
+
+        assert joined == ["b"]
+        assert stats.signals_by_source == {"a": 1, "b": 1}
+        assert stats.progress["b"]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_cannot_join_after_scraping_finished(self, mock_settings, inserted):
+        pipeline = SignalPipeline([ListScraper("a", [make_signal("A", "https://a/1")])])
+        with patch('src.pipeline.is_duplicate', return_value=False):
+            await pipeline.run()
+
+        assert pipeline.add_scrapers([ListScraper("b", [])]) is None
+
+
+class StallingScraper(ListScraper):
+    """Yields its signals, then hangs like a stuck snapshot poll."""
+
+    async def stream_unit(self, unit: str):
+        async for signal in super().stream_unit(unit):
+            yield signal
+        await asyncio.Event().wait()
+
+
+class SlowEnrichScraper(ListScraper):
+    """Quick to scrape, slow to enrich (like an LLM call per signal)."""
+
+    def enrich_signal(self, signal: Signal) -> Signal:
+        time.sleep(0.02)
+        return signal
+
+
+class DetailFetchScraper(BaseScraper):
+    """Parses a listing, then fetches a (slow) detail page per item."""
+
+    name = "details"
+
+    def __init__(self, signals: list[Signal]):
+        self.signals = signals
+        self.failed_fetches = 0
+
+    def units(self) -> list[str]:
+        return ["listing"]
+
+    async def stream_unit(self, unit: str):
+        async def slow(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, text="detail")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(slow)) as client:
+            for signal in self.signals:
+                try:
+                    await get_limited(client, signal.source_url, self.name)
+                except FetchDeadlineError:
+                    self.failed_fetches += 1
+                yield signal
+
+    def enrich_signal(self, signal: Signal) -> Signal:
+        return signal
+
+
+FEED_URL = "https://example.com/feed.xml"
+
+
+class FeedScraper(BaseScraper):
+    """One conditional feed fetch per unit, then its signals."""
+
+    name = "feeds"
+
+    def __init__(self, signals: list[Signal], fail_detail: bool = False):
+        self.signals = signals
+        self.fail_detail = fail_detail
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/detail":
+                raise httpx.ConnectError("down", request=request)
+            return httpx.Response(200, text="<rss/>", headers={"ETag": '"v1"'})
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    def http_client(self) -> httpx.AsyncClient:
+        return self.client
+
+    async def stream_unit(self, unit: str):
+        await self.fetch(FEED_URL)
+        if self.fail_detail:
+            # Scrapers log failed fetches and carry on
+            try:
+                await self.get("https://example.com/detail")
+            except httpx.HTTPError:
+                pass
+        for signal in self.signals:
+            yield signal
+
+    def enrich_signal(self, signal: Signal) -> Signal:
+        return signal
+
+
+@pytest.fixture
+def validator_cache(mock_settings):
+    mock_settings.http_validators_enabled = True
+    mock_settings.http_cassette_mode = "off"
+    mock_settings.source_response_budgets = {}
+    mock_settings.http_max_response_bytes = 1_000_000
+    cache = ValidatorCache()
+    cache._loaded = True
+    with patch('src.net.validators.get_settings', return_value=mock_settings), \
+            patch('src.net.validators.get_validator_cache', return_value=cache):
+        yield cache
+
+
+class TestUnitValidators:
+    """A unit's validators are kept only once its signals are inserted."""
+
+    @pytest.mark.asyncio
+    async def test_committed_after_signals_are_inserted(self, mock_settings, validator_cache):
+        committed_at_insert = []
+
+        def fake_insert(signal, user_id=None):
+            committed_at_insert.append(FEED_URL in validator_cache._entries)
+            return {"id": "1"}
+
+        scraper = FeedScraper([make_signal(f"F {i}", f"https://f/{i}") for i in range(3)])
+        with patch('src.pipeline.insert_signal', side_effect=fake_insert), \
+                patch('src.pipeline.is_duplicate', return_value=False):
+            await SignalPipeline([scraper]).run()
+
+        assert committed_at_insert == [False, False, False]
+        assert validator_cache._entries[FEED_URL].etag == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_not_committed_when_an_insert_fails(self, mock_settings, validator_cache):
+        scraper = FeedScraper([make_signal(f"F {i}", f"https://f/{i}") for i in range(3)])
+        with patch('src.pipeline.insert_signal', side_effect=[{"id": "1"}, None, {"id": "3"}]), \
+                patch('src.pipeline.is_duplicate', return_value=False):
+            await SignalPipeline([scraper]).run()
+
+        assert FEED_URL not in validator_cache._entries
+
+    @pytest.mark.asyncio
+    async def test_not_committed_when_a_fetch_failed(self, mock_settings, validator_cache, inserted):
+        scraper = FeedScraper([make_signal("F 0", "https://f/0")], fail_detail=True)
+        with patch('src.pipeline.is_duplicate', return_value=False):
+            await SignalPipeline([scraper]).run()
+
+        assert len(inserted) == 1
+        assert FEED_URL not in validator_cache._entries
+
+    @pytest.mark.asyncio
+    async def test_committed_for_duplicates(self, mock_settings, validator_cache, inserted):
+        """Signals dropped as duplicates are settled, not lost."""
+        scraper = FeedScraper([make_signal("F 0", "https://f/0")])
+        with patch('src.pipeline.is_duplicate', return_value=True):
+            await SignalPipeline([scraper]).run()
+
+        assert inserted == []
+        assert FEED_URL in validator_cache._entries
+
+
+class RssScraper(BaseScraper):
+    """Reads one feed (resuming at the last item processed), a signal per item."""
+
+    name = "rss"
+
+    def __init__(self, bodies: list[bytes]):
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=bodies.pop(0), headers={"Content-Type": "application/rss+xml"})
+        ))
+
+    def http_client(self) -> httpx.AsyncClient:
+        return self.client
+
+    async def stream_unit(self, unit: str):
+        for item in await self.fetch_feed(FEED_URL):
+            yield make_signal(item.title, item.link)
+
+    def enrich_signal(self, signal: Signal) -> Signal:
+        return signal
+
+
+def rss(*guids: str) -> bytes:
+    items = "".join(f"<item><title>{g}</title><link>https://example.com/{g}</link><guid>{g}</guid></item>" for g in guids)
+    return f"<rss><channel>{items}</channel></rss>".encode()
+
+
+class TestFeedCursor:
+    """A feed's resume point moves only once its items are inserted."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_waits_for_inserts(self, mock_settings, validator_cache):
+        bodies = [rss("b", "a"), rss("b", "a"), rss("c", "b", "a")]
+        scraper = RssScraper(bodies)
+        titles = []
+
+        def insert(fail: str | None):
+            def fake_insert(signal, user_id=None):
+                titles.append(signal.title)
+                return None if signal.title == fail else {"id": signal.title}
+            return fake_insert
+
+        with patch('src.pipeline.is_duplicate', return_value=False), \
+                patch('src.scrapers.base.get_parse_executor', return_value=ParseExecutor("inline")):
+            # "a" isn't stored, so the next read mustn't stop before it
+            with patch('src.pipeline.insert_signal', side_effect=insert("a")):
+                await SignalPipeline([scraper]).run()
+            assert validator_cache.last_item(FEED_URL, scraper.params_fingerprint()) is None
+
+            with patch('src.pipeline.insert_signal', side_effect=insert(None)):
+                await SignalPipeline([scraper]).run()
+                await SignalPipeline([scraper]).run()
+
+        assert sorted(titles[:2]) == sorted(titles[2:4]) == ["a", "b"]
+        # Third read stopped at "b", the newest item inserted before
+        assert titles[4:] == ["c"]
+        assert validator_cache.last_item(FEED_URL, scraper.params_fingerprint()) == "c"
+
+
+class TestDeadlinesAndCancellation:
+    """Tests for per-source time budgets and cancelling a run."""
+
+    @pytest.mark.asyncio
+    async def test_deadline_keeps_signals_parsed_before_it(self, mock_settings, inserted):
+        mock_settings.source_time_budgets = {"slow": 0.05}
+        pipeline = SignalPipeline([
+            StallingScraper("slow", [make_signal("S1", "https://s/1"), make_signal("S2", "https://s/2")]),
+            ListScraper("fast", [make_signal("F", "https://f/1")]),
+        ])
+
+        with patch('src.pipeline.is_duplicate', return_value=False):
+            stats = await asyncio.wait_for(pipeline.run(), timeout=2)
+
+        assert stats.signals_by_source == {"slow": 2, "fast": 1}
+        assert stats.cut_short == {"slow": "deadline"}
+        assert stats.progress["slow"] == {"status": "cancelled", "signals": 2, "reason": "deadline"}
+        assert stats.progress["fast"]["status"] == "completed"
+        assert not stats.cancelled
+
+    @pytest.mark.asyncio
+    async def test_backpressure_does_not_count_against_deadline(self, mock_settings, inserted):
+        mock_settings.source_time_budgets = {"a": 0.1}
+        signals = [make_signal(f"A {i}", f"https://a/{i}") for i in range(30)]
+
+        with patch('src.pipeline.is_duplicate', return_value=False):
+            stats = await asyncio.wait_for(SignalPipeline([SlowEnrichScraper("a", signals)]).run(), timeout=5)
+
+        assert len(inserted) == 30
+        assert stats.cut_short == {}
+        assert stats.progress["a"]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_fetching_but_keeps_parsed_items(self, mock_settings, inserted):
+        mock_settings.source_time_budgets = {"details": 0.05}
+        scraper = DetailFetchScraper([make_signal(f"D {i}", f"https://d/{i}") for i in range(5)])
+
+        with patch('src.pipeline.is_duplicate', return_value=False):
+            stats = await asyncio.wait_for(SignalPipeline([scraper]).run(), timeout=2)
+
+        # The first detail fetch ran into the deadline and the rest failed at
+        # once, but every parsed item still came through
+        assert scraper.failed_fetches == 5
+        assert len(inserted) == 5
+        assert stats.cut_short == {"details": "deadline"}
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_scraping_and_records_sources(self, mock_settings, inserted):
+        pipeline = SignalPipeline([
+            StallingScraper("a", [make_signal("A", "https://a/1")]),
+            ListScraper("b", [make_signal("B", "https://b/1")]),
+        ])
+
+        with patch('src.pipeline.is_duplicate', return_value=False):
+            run = asyncio.create_task(pipeline.run())
+            while pipeline.stats.progress.get("b", {}).get("status") != "completed":
+                await asyncio.sleep(0.01)
+            pipeline.cancel()
+            stats = await asyncio.wait_for(run, timeout=2)
+
+        assert stats.cancelled
+        assert stats.cut_short == {"a": "run_cancelled"}
+        assert stats.signals_by_source == {"a": 1, "b": 1}
+        assert len(inserted) == 2
+        assert pipeline.add_scrapers([ListScraper("c", [])]) is None
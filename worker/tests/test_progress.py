@@ -0,0 +1,177 @@
+"""Unit tests for the debounced scrape_runs progress writer."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.progress import ProgressReporter
+
+
+@pytest.fixture
+def writes():
+    calls = []
+
+    def fake_update(run_id, **fields):
+        calls.append(fields)
+        return True
+
+    with patch('src.progress.update_scrape_run', side_effect=fake_update):
+        yield calls
+
+
+class TestProgressReporter:
+    """Tests for ProgressReporter buffering and flushing."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_updates_within_interval(self, writes):
+        reporter = ProgressReporter("run-1", flush_interval=0.05)
+        reporter.update(total_signals=1)
+        await asyncio.sleep(0.01)  # first write goes out immediately
+        for i in range(2, 10):
+            reporter.update(total_signals=i, progress={"a": {"signals": i}})
+
+        await asyncio.sleep(0.1)
+
+        assert writes == [
+            {"total_signals": 1},
+            {"total_signals": 9, "progress": {"a": {"signals": 9}}},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_terminal_status_flushes_immediately(self, writes):
+        reporter = ProgressReporter("run-1", flush_interval=60)
+        reporter.update(total_signals=1)
+        await asyncio.sleep(0.01)
+        reporter.update(total_signals=2)
+        reporter.update(status="failed", error_message="boom")
+
+        await asyncio.sleep(0.01)
+
+        assert writes[-1] == {"total_signals": 2, "status": "failed", "error_message": "boom"}
+
+    @pytest.mark.asyncio
+    async def test_snapshots_live_dicts_at_update_time(self, writes):
+        reporter = ProgressReporter("run-1", flush_interval=60)
+        progress = {"a": {"status": "running"}}
+        reporter.update(progress=progress)
+        progress["a"]["status"] = "completed"
+
+        await reporter.flush()
+
+        assert writes == [{"progress": {"a": {"status": "running"}}}]
+
+    @pytest.mark.asyncio
+    async def test_close_writes_final_fields_and_ignores_later_updates(self, writes):
+        reporter = ProgressReporter("run-1", flush_interval=60)
+        reporter.update(total_signals=3)
+
+        await reporter.close(status="completed", total_signals=4)
+        reporter.update(total_signals=99)
+        await asyncio.sleep(0.01)
+
+        assert writes == [{"total_signals": 4, "status": "completed"}]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_retried_without_clobbering_newer_values(self):
+        calls = []
+        results = iter([False, True])
+
+        def flaky_update(run_id, **fields):
+            calls.append(fields)
+            return next(results)
+
+        with patch('src.progress.update_scrape_run', side_effect=flaky_update):
+            reporter = ProgressReporter("run-1", flush_interval=60)
+            reporter.update(total_signals=1, ai_enriched_count=1)
+            await reporter.flush()
+            reporter.update(total_signals=2)
+            await reporter.flush()
+
+        assert calls[-1] == {"total_signals": 2, "ai_enriched_count": 1}
+
+    @pytest.mark.asyncio
+    async def test_failed_terminal_write_is_retried_on_its_own(self):
+        calls = []
+        results = iter([False, True])
+
+        def flaky_update(run_id, **fields):
+            calls.append(fields)
+            return next(results)
+
+        with patch('src.progress.update_scrape_run', side_effect=flaky_update), \
+                patch('src.progress.RETRY_BASE_SECONDS', 0.01):
+            reporter = ProgressReporter("run-1", flush_interval=60)
+            reporter.update(status="completed", total_signals=3)
+            await asyncio.sleep(0.1)
+
+        assert calls == [{"status": "completed", "total_signals": 3}] * 2
+        assert reporter._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_close_retries_failed_final_write(self):
+        calls = []
+        results = iter([False, False, True])
+
+        def flaky_update(run_id, **fields):
+            calls.append(fields)
+            return next(results)
+
+        with patch('src.progress.update_scrape_run', side_effect=flaky_update), \
+                patch('src.progress.RETRY_BASE_SECONDS', 0.01):
+            reporter = ProgressReporter("run-1", flush_interval=60)
+            await reporter.close(status="failed", error_message="boom")
+
+        assert len(calls) == 3
+        assert calls[-1] == {"status": "failed", "error_message": "boom"}
+        assert reporter._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_close_gives_up_after_bounded_retries(self):
+        calls = []
+
+        def failing_update(run_id, **fields):
+            calls.append(fields)
+            return False
+
+        with patch('src.progress.update_scrape_run', side_effect=failing_update), \
+                patch('src.progress.RETRY_BASE_SECONDS', 0.01), \
+                patch('src.progress.CLOSE_RETRIES', 2):
+            reporter = ProgressReporter("run-1", flush_interval=60)
+            await reporter.close(status="completed")
+
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_no_run_id_is_a_no_op(self, writes):
+        reporter = ProgressReporter(None, flush_interval=0)
+        reporter.update(total_signals=1)
+        await reporter.close(status="completed")
+
+        assert writes == []
+
+    @pytest.mark.asyncio
+    async def test_attached_run_receives_state_so_far_and_later_updates(self, writes):
+        calls = []
+
+        def fake_update(run_id, **fields):
+            calls.append((run_id, fields))
+            return True
+
+        with patch('src.progress.update_scrape_run', side_effect=fake_update):
+            reporter = ProgressReporter("cycle", flush_interval=60)
+            reporter.update(total_signals=5, progress={"a": {"status": "running"}})
+            await reporter.flush()
+
+            reporter.attach("manual")
+            await reporter.close(status="completed", total_signals=7)
+
+        assert calls[0] == ("cycle", {"total_signals": 5, "progress": {"a": {"status": "running"}}})
+        assert dict(calls[1:]) == {
+            "cycle": {"status": "completed", "total_signals": 7},
+            "manual": {"total_signals": 7, "progress": {"a": {"status": "running"}}, "status": "completed"},
+        }
@@ -0,0 +1,65 @@
+"""Unit tests for per-host token-bucket rate limiting."""
+
+import httpx
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.net.ratelimit import TokenBucket, HostRateLimiter, parse_retry_after
+
+
+class TestTokenBucket:
+    """Tests for slot reservations."""
+
+    def test_burst_is_free_then_requests_are_spaced(self):
+        bucket = TokenBucket(rate=2.0, burst=3)
+        with patch('src.net.ratelimit.time.monotonic', return_value=100.0):
+            waits = [bucket.reserve() for _ in range(5)]
+
+        assert waits == [0.0, 0.0, 0.0, 0.5, 1.0]
+        assert bucket.snapshot()["delayed"] == 2
+        assert bucket.snapshot()["max_wait_seconds"] == 1.0
+
+    def test_refills_over_time(self):
+        bucket = TokenBucket(rate=1.0, burst=1)
+        with patch('src.net.ratelimit.time.monotonic', return_value=100.0):
+            assert bucket.reserve() == 0.0
+        with patch('src.net.ratelimit.time.monotonic', return_value=101.0):
+            assert bucket.reserve() == 0.0
+
+    def test_pause_holds_back_the_whole_burst(self):
+        bucket = TokenBucket(rate=1.0, burst=5)
+        with patch('src.net.ratelimit.time.monotonic', return_value=100.0):
+            bucket.pause(30)
+            assert bucket.reserve() == 30.0
+        assert bucket.snapshot()["throttled"] == 1
+
+
+class TestHostRateLimiter:
+    """Tests for per-host buckets and Retry-After handling."""
+
+    def test_hosts_get_their_own_limits(self):
+        limiter = HostRateLimiter(2.0, 4, overrides={"slow.example": (0.1, 1)})
+        assert limiter.bucket("slow.example").rate == 0.1
+        assert limiter.bucket("www.reddit.com").burst == 1
+        assert limiter.bucket("other.example").rate == 2.0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_the_host(self):
+        limiter = HostRateLimiter(2.0, 4, max_retry_after=60)
+        request = httpx.Request("GET", "https://busy.example/feed")
+        response = httpx.Response(429, headers={"Retry-After": "600"})
+
+        with patch('src.net.ratelimit.time.monotonic', return_value=100.0):
+            await limiter.on_response(request, response)
+            assert limiter.bucket("busy.example").reserve() == 60.0
+
+    def test_parses_retry_after_formats(self):
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
@@ -0,0 +1,54 @@
+"""Unit tests for the parsed-result cache."""
+
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models import Signal
+from src.cache import ResultCache
+
+
+def make_signal(title: str) -> Signal:
+    return Signal(
+        company_name="Stripe",
+        signal_type="funding",
+        title=title,
+        summary="Test signal",
+        source_url=f"https://example.com/{title}",
+        source_name="Test",
+    )
+
+
+class TestResultCache:
+    """Tests for ResultCache freshness, copies and eviction."""
+
+    def test_returns_entries_younger_than_max_age(self):
+        cache = ResultCache()
+        with patch('src.cache.time.monotonic', return_value=100.0):
+            cache.put("key", [make_signal("a")])
+        with patch('src.cache.time.monotonic', return_value=130.0):
+            assert cache.get("key", max_age=60)[0].title == "a"
+            assert cache.get("key", max_age=10) is None
+
+    def test_hands_out_copies(self):
+        cache = ResultCache()
+        cache.put("key", [make_signal("a")])
+
+        first = cache.get("key", max_age=60)
+        first[0].metadata["ai_enriched"] = True
+
+        assert cache.get("key", max_age=60)[0].metadata == {}
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache(max_entries=2)
+        cache.put("a", [])
+        cache.put("b", [])
+        cache.get("a", max_age=60)
+        cache.put("c", [])
+
+        assert cache.get("b", max_age=60) is None
+        assert cache.get("a", max_age=60) == []
+        assert cache.snapshot()["entries"] == 2
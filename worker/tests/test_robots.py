@@ -0,0 +1,110 @@
+"""Unit tests for the robots.txt policy layer."""
+
+import asyncio
+import time
+import httpx
+import pytest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.net.ratelimit import HostRateLimiter
+from src.net.robots import RobotsCache, RobotsTransport, RobotsDisallowedError, RESPECT_ROBOTS
+
+ROBOTS_TXT = """
+User-agent: *
+Disallow: /private/
+Crawl-delay: 5
+
+User-agent: AxidexBot
+Disallow: /admin/
+Crawl-delay: 2
+"""
+
+
+def make_client(robots_status: int = 200, robots_txt: str = ROBOTS_TXT, calls: list | None = None):
+    """Client over a fake site; returns it with its robots cache and rate limiter."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if calls is not None:
+            calls.append(request.url.path)
+        if request.url.path == "/robots.txt":
+            await asyncio.sleep(0.01)
+            return httpx.Response(robots_status, text=robots_txt)
+        return httpx.Response(200, text="page")
+
+    robots = RobotsCache(user_agent="AxidexBot", ttl=60, negative_ttl=5)
+    limiter = HostRateLimiter(default_rate=10.0, default_burst=4)
+    transport = RobotsTransport(httpx.MockTransport(handler), robots, limiter)
+    return httpx.AsyncClient(transport=transport), robots, limiter
+
+
+class TestRobotsTransport:
+    """Tests for checking requests against robots.txt."""
+
+    @pytest.mark.asyncio
+    async def test_disallowed_path_fails_without_a_request(self):
+        calls = []
+        client, robots, _ = make_client(calls=calls)
+        async with client:
+            with pytest.raises(RobotsDisallowedError):
+                await client.get("https://example.com/admin/users", extensions=RESPECT_ROBOTS)
+            # Rules for other agents don't apply to ours
+            response = await client.get("https://example.com/private/page", extensions=RESPECT_ROBOTS)
+
+        assert response.status_code == 200
+        assert calls == ["/robots.txt", "/private/page"]
+        assert robots.snapshot()["disallowed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_crawl_delay_slows_the_host_bucket(self):
+        client, _, limiter = make_client()
+        async with client:
+            await client.get("https://example.com/news", extensions=RESPECT_ROBOTS)
+
+        bucket = limiter.bucket("example.com")
+        assert (bucket.rate, bucket.burst) == (0.5, 1)
+
+    @pytest.mark.asyncio
+    async def test_requests_without_opt_in_skip_robots(self):
+        calls = []
+        client, _, limiter = make_client(calls=calls)
+        async with client:
+            await client.get("https://example.com/admin/feed")
+
+        assert calls == ["/admin/feed"]
+        assert limiter.bucket("example.com").burst == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_fetch_robots_once(self):
+        calls = []
+        client, _, _ = make_client(calls=calls)
+        async with client:
+            await asyncio.gather(*(
+                client.get(f"https://example.com/news/{i}", extensions=RESPECT_ROBOTS) for i in range(5)
+            ))
+
+        assert calls.count("/robots.txt") == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_robots_allows_everything_and_is_cached(self):
+        calls = []
+        client, robots, _ = make_client(robots_status=404, calls=calls)
+        async with client:
+            await client.get("https://example.com/admin/a", extensions=RESPECT_ROBOTS)
+            await client.get("https://example.com/admin/b", extensions=RESPECT_ROBOTS)
+
+        assert calls.count("/robots.txt") == 1
+        assert robots.snapshot()["by_status"] == {"missing": 1}
+
+    @pytest.mark.asyncio
+    async def test_unavailable_robots_uses_negative_ttl(self):
+        client, robots, _ = make_client(robots_status=503)
+        async with client:
+            response = await client.get("https://example.com/admin/a", extensions=RESPECT_ROBOTS)
+
+        assert response.status_code == 200
+        policy = robots.cached(httpx.URL("https://example.com/"))
+        assert policy.status == "unavailable"
+        assert policy.expires_at - time.monotonic() <= robots.negative_ttl
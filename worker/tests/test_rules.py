@@ -0,0 +1,130 @@
+"""Unit tests for the rule-based signal classifier."""
+
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai.rules import RuleSet, signal_rules, role_rules, product_rules
+from src.models import Signal
+from src.scrapers.base import BaseScraper
+
+
+class TestRuleSet:
+    """Tests for compiling and applying a rules table."""
+
+    def test_type_priority_and_confidence(self):
+        result = signal_rules().classify("Acme raises $120 million Series B")
+
+        assert result.signal_type == "funding"
+        assert result.priority == "high"
+        assert 0.5 < result.confidence < 1
+        assert result.keywords[0] == "raise"
+
+    def test_no_evidence(self):
+        result = signal_rules().classify("A quiet week", default_priority="medium")
+
+        assert (result.signal_type, result.priority, result.confidence) == (None, "medium", 0.0)
+
+    def test_ambiguous_text_has_low_confidence(self):
+        clear = signal_rules().classify("Acme launches and unveils its new platform")
+        mixed = signal_rules().classify("Acme partners with Globex to expand")
+
+        assert clear.confidence > mixed.confidence
+        assert mixed.confidence == 0.0
+
+    def test_whole_words_and_prefixes(self):
+        rules = RuleSet({"launch": {"launch*": 1}, "other": {"ai": 1}})
+
+        assert rules.classify("Acme launched today").signal_type == "launch"
+        assert rules.classify("Relaunch of the email client").signal_type is None
+
+    def test_keywords_as_written(self):
+        rules = RuleSet({"launch": {"launch*": 1}}, {"urgent": 1})
+        assert rules.keywords == ("launch*", "urgent")
+
+    def test_repeated_keyword_counts_once(self):
+        rules = RuleSet(priority_rules={"million": 1})
+
+        assert rules.classify("million million million").priority == "medium"
+
+    def test_negative_points_lower_priority(self):
+        result = signal_rules().classify("Acme closes pre-seed round from angel investors", default_priority="medium")
+
+        assert result.priority == "low"
+
+    def test_batch_matches_single(self):
+        titles = ["Acme raises Series A", "Globex hiring VP Sales", "Nothing"]
+
+        assert signal_rules().classify_many(titles) == [signal_rules().classify(t) for t in titles]
+
+
+class TestDomainTables:
+    """Tests for the role and product tables."""
+
+    def test_role_seniority(self):
+        assert role_rules().classify("Co-Founder & CEO").priority == "high"
+        assert role_rules().classify("Directors of Sales").priority == "high"
+        # Acronyms only count as words
+        assert role_rules().classify("Microsoft Account Executive").priority == "medium"
+
+    def test_product_fit(self):
+        assert product_rules().classify("Mailbox — email for families").priority == "low"
+        assert product_rules().classify("Widgetly — an AI copilot").priority == "high"
+        assert product_rules().classify("Widgetly — a productivity app").priority == "medium"
+
+
+class RulesScraper(BaseScraper):
+    name = "rules"
+
+    async def stream_unit(self, unit: str):
+        yield
+
+
+def make_signal(signal_type: str, title: str) -> Signal:
+    return Signal(
+        company_name="Acme",
+        signal_type=signal_type,
+        title=title,
+        summary="",
+        source_url="https://example.com/acme",
+        source_name="Test",
+    )
+
+
+@pytest.fixture
+def enrich():
+    settings = MagicMock(ai_enabled=True, rule_confidence_threshold=0.8)
+    with patch("src.scrapers.base.get_settings", return_value=settings), \
+            patch("src.scrapers.base.extract_entities", return_value={}) as extract, \
+            patch("src.scrapers.base.classify_signal", return_value=("funding", "high", 0.9)) as classify:
+        yield extract, classify
+
+
+class TestEnrichmentGate:
+    """Tests for skipping the LLM classifier on confident rules."""
+
+    def test_confident_rules_skip_llm(self, enrich):
+        extract, classify = enrich
+        signal = RulesScraper().enrich_signal(
+            make_signal("funding", "Acme raises $40M Series B funding round led by Sequoia")
+        )
+
+        # Neither LLM call runs, and the signal isn't counted as AI-enriched
+        extract.assert_not_called()
+        classify.assert_not_called()
+        assert signal.metadata["rule_confidence"] >= 0.8
+        assert signal.metadata["ai_enriched"] is False
+        assert signal.metadata["rule_classified"] is True
+
+    def test_uncertain_rules_ask_llm(self, enrich):
+        extract, classify = enrich
+        signal = RulesScraper().enrich_signal(make_signal("product_launch", "Acme announces news"))
+
+        extract.assert_called_once()
+        classify.assert_called_once()
+        assert signal.signal_type == "funding"
+        assert signal.metadata["ai_enriched"] is True
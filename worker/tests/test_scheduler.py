@@ -0,0 +1,131 @@
+"""
+Unit tests for the async job scheduler.
+
+Uses short real intervals; each test runs the scheduler for well under a second.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.scheduler import Scheduler
+
+
+async def run_for(scheduler: Scheduler, seconds: float):
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(seconds)
+    await scheduler.stop(timeout=1.0)
+    await runner
+
+
+def slow_job(duration: float, calls: list):
+    async def job():
+        calls.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(duration)
+    return job
+
+
+class TestScheduler:
+    """Tests for Scheduler interval and overlap handling."""
+
+    @pytest.mark.asyncio
+    async def test_runs_job_on_interval(self):
+        calls = []
+        scheduler = Scheduler()
+        scheduler.add_job("tick", slow_job(0, calls), interval_seconds=0.05, run_immediately=True)
+
+        await run_for(scheduler, 0.22)
+
+        assert 4 <= len(calls) <= 6
+
+    @pytest.mark.asyncio
+    async def test_skip_policy_drops_overlapping_ticks(self):
+        calls = []
+        scheduler = Scheduler()
+        job = scheduler.add_job(
+            "slow", slow_job(0.2, calls), interval_seconds=0.05, overlap="skip", run_immediately=True
+        )
+
+        await run_for(scheduler, 0.15)
+
+        assert len(calls) == 1
+        assert job.skipped_count >= 1
+
+    @pytest.mark.asyncio
+    async def test_coalesce_policy_runs_once_after_overlap(self):
+        calls = []
+        scheduler = Scheduler()
+        scheduler.add_job(
+            "slow", slow_job(0.2, calls), interval_seconds=0.05, overlap="coalesce", run_immediately=True
+        )
+
+        await run_for(scheduler, 0.3)
+
+        # First run plus exactly one follow-up for all the missed ticks
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_policy_runs_once_per_missed_tick(self):
+        calls = []
+        scheduler = Scheduler()
+        job = scheduler.add_job(
+            "slow", slow_job(0.1, calls), interval_seconds=0.03, overlap="queue", run_immediately=True
+        )
+
+        await asyncio.sleep(0)
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.095)
+
+        assert job.pending_runs >= 2
+        await scheduler.stop(timeout=0.5)
+        await runner
+
+    @pytest.mark.asyncio
+    async def test_failing_job_keeps_schedule(self):
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        scheduler = Scheduler()
+        scheduler.add_job("fail", failing, interval_seconds=0.05, run_immediately=True)
+
+        await run_for(scheduler, 0.12)
+
+        assert len(calls) >= 2
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_concurrently(self):
+        fast_calls = []
+        scheduler = Scheduler()
+        scheduler.add_job("slow", slow_job(0.5, []), interval_seconds=10, run_immediately=True)
+        scheduler.add_job("fast", slow_job(0, fast_calls), interval_seconds=0.05, run_immediately=True)
+
+        await run_for(scheduler, 0.2)
+
+        assert len(fast_calls) >= 3
+
+    @pytest.mark.asyncio
+    async def test_run_waits_for_running_jobs_after_stop(self):
+        """run() only returns once jobs finished, even if stop() isn't awaited."""
+        finished = []
+
+        async def job():
+            await asyncio.sleep(0.1)
+            finished.append(1)
+
+        scheduler = Scheduler()
+        scheduler.add_job("slow", job, interval_seconds=10, run_immediately=True)
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.02)
+
+        # As the signal handler does: fire and forget
+        asyncio.get_running_loop().create_task(scheduler.stop(timeout=1.0))
+        await runner
+
+        assert finished == [1]
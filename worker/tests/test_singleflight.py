@@ -0,0 +1,82 @@
+"""Unit tests for singleflight coalescing of identical GETs."""
+
+import asyncio
+import gzip
+import httpx
+import pytest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.net.singleflight import SingleflightTransport
+
+
+class SlowTransport(httpx.AsyncBaseTransport):
+    """Answers every request with a gzipped body once the gate opens."""
+
+    def __init__(self):
+        self.calls = []
+        self.gate = asyncio.Event()
+
+    async def handle_async_request(self, request):
+        self.calls.append(request)
+        await self.gate.wait()
+        return httpx.Response(
+            200,
+            headers={"Content-Encoding": "gzip"},
+            content=gzip.compress(request.url.path.encode()),
+        )
+
+
+class TestSingleflight:
+    """Tests for sharing in-flight requests."""
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_request(self):
+        upstream = SlowTransport()
+        transport = SingleflightTransport(upstream)
+        async with httpx.AsyncClient(transport=transport) as client:
+            requests = [
+                asyncio.create_task(client.get("https://feeds.example/a")),
+                asyncio.create_task(client.get("https://feeds.example/a")),
+                asyncio.create_task(client.get("https://feeds.example/b")),
+            ]
+            await asyncio.sleep(0.01)
+            upstream.gate.set()
+            responses = await asyncio.gather(*requests)
+
+        assert [r.text for r in responses] == ["/a", "/a", "/b"]
+        assert len(upstream.calls) == 2
+        assert transport.snapshot() == {"requests": 3, "shared": 1, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_headers_are_not_shared(self):
+        upstream = SlowTransport()
+        upstream.gate.set()
+        transport = SingleflightTransport(upstream)
+        async with httpx.AsyncClient(transport=transport) as client:
+            await asyncio.gather(
+                client.get("https://feeds.example/a"),
+                client.get("https://feeds.example/a", headers={"If-None-Match": '"v1"'}),
+            )
+
+        assert len(upstream.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_followers_go_again_if_the_leader_is_cancelled(self):
+        upstream = SlowTransport()
+        transport = SingleflightTransport(upstream)
+        async with httpx.AsyncClient(transport=transport) as client:
+            leader = asyncio.create_task(client.get("https://feeds.example/a"))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(client.get("https://feeds.example/a"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            await asyncio.sleep(0.01)
+            upstream.gate.set()
+            response = await follower
+
+        assert response.text == "/a"
+        assert len(upstream.calls) == 2
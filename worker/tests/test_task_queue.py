@@ -0,0 +1,201 @@
+"""
+Unit tests for the leased task-queue worker.
+
+The queue's SQL functions are mocked; tests cover batching, completion
+reporting, retries on failure and lost leases.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models import Signal
+from src.scrapers.base import BaseScraper
+from src.cadence import CadenceTracker
+from src.db.tasks import ScrapeTask, TaskCompletion
+from src.task_queue import TaskWorker
+
+
+class UnitScraper(BaseScraper):
+    """Yields one signal per unit; units listed in `failing` raise."""
+
+    def __init__(self, name: str, failing: set[str] = frozenset()):
+        self.name = name
+        self.failing = failing
+        self.staleness: dict[str, float | None] = {}
+
+    async def stream_unit(self, unit: str):
+        self.staleness[unit] = self.max_staleness_seconds
+        if unit in self.failing:
+            raise RuntimeError(f"{unit} down")
+        await asyncio.sleep(0)
+        yield Signal(
+            company_name=unit,
+            signal_type="funding",
+            title=f"{unit} raises",
+            summary="Test signal",
+            source_url=f"https://{self.name}/{unit}",
+            source_name="Test",
+        )
+
+    def enrich_signal(self, signal: Signal) -> Signal:
+        return signal
+
+
+def make_task(
+    source: str,
+    unit: str,
+    task_id: str | None = None,
+    max_staleness_seconds: int | None = None,
+) -> ScrapeTask:
+    return ScrapeTask(
+        id=task_id or f"{source}:{unit}",
+        run_id="run-1",
+        user_id=None,
+        source=source,
+        unit=unit,
+        attempts=1,
+        max_staleness_seconds=max_staleness_seconds,
+    )
+
+
+@pytest.fixture
+def mock_settings():
+    settings = MagicMock()
+    settings.scraper_concurrency = 2
+    settings.source_concurrency = {}
+    settings.scraper_time_budget_seconds = 5
+    settings.source_time_budgets = {}
+    settings.pipeline_queue_size = 10
+    settings.dedup_workers = 1
+    settings.enrich_workers = 1
+    settings.insert_workers = 1
+    settings.task_claim_batch = 2
+    settings.task_lease_seconds = 60
+    settings.entity_resolution_enabled = False
+    with patch('src.task_queue.get_settings', return_value=settings), \
+            patch('src.pipeline.get_settings', return_value=settings), \
+            patch('src.scrapers.base.get_settings', return_value=settings):
+        yield settings
+
+
+@pytest.fixture
+def queue():
+    """Fake queue: claim hands out batches, complete records outcomes."""
+    state = {"batches": [], "completed": []}
+
+    def claim(worker_id, limit, lease_seconds):
+        return state["batches"].pop(0) if state["batches"] else []
+
+    def complete(task_id, worker_id, signals, error=None):
+        state["completed"].append((task_id, signals, error))
+        return TaskCompletion(source_done=True, source_signals=signals, run_done=False)
+
+    with patch('src.task_queue.claim_scrape_tasks', side_effect=claim), \
+            patch('src.task_queue.complete_scrape_task', side_effect=complete) as complete_mock, \
+            patch('src.task_queue.heartbeat_scrape_tasks', return_value=set()), \
+            patch('src.pipeline.is_duplicate', return_value=False), \
+            patch('src.pipeline.insert_signal', return_value={"id": "1"}), \
+            patch('src.pipeline.sentry_sdk'):
+        state["complete_mock"] = complete_mock
+        yield state
+
+
+class TestTaskWorker:
+    """Tests for TaskWorker batches."""
+
+    @pytest.mark.asyncio
+    async def test_drains_all_batches(self, mock_settings, queue):
+        queue["batches"] = [
+            [make_task("news", "Stripe"), make_task("news", "Shopify")],
+            [make_task("jobs", "Stripe")],
+        ]
+
+        async def build():
+            return [UnitScraper("news"), UnitScraper("jobs")]
+
+        with patch('src.task_queue.get_cadence', return_value=CadenceTracker(30)):
+            processed = await TaskWorker("w1", build).drain()
+
+        assert processed == 3
+        assert sorted(queue["completed"]) == [
+            ("jobs:Stripe", 1, None),
+            ("news:Shopify", 1, None),
+            ("news:Stripe", 1, None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_unit_reports_error_for_retry(self, mock_settings, queue):
+        queue["batches"] = [[make_task("news", "Stripe")]]
+
+        async def build():
+            return [UnitScraper("news", failing={"Stripe"})]
+
+        with patch('src.task_queue.get_cadence', return_value=CadenceTracker(30)):
+            await TaskWorker("w1", build).drain()
+
+        assert queue["completed"] == [("news:Stripe", 0, "Stripe down")]
+
+    @pytest.mark.asyncio
+    async def test_disabled_source_completes_without_scraping(self, mock_settings, queue):
+        queue["batches"] = [[make_task("linkedin", "Stripe")]]
+
+        async def build():
+            return [UnitScraper("news")]
+
+        with patch('src.task_queue.get_cadence', return_value=CadenceTracker(30)):
+            await TaskWorker("w1", build).drain()
+
+        assert queue["completed"] == [("linkedin:Stripe", 0, None)]
+
+    @pytest.mark.asyncio
+    async def test_task_staleness_is_applied_per_task(self, mock_settings, queue):
+        queue["batches"] = [[
+            make_task("news", "Stripe", max_staleness_seconds=60),
+            make_task("news", "Shopify"),
+        ]]
+        scraper = UnitScraper("news")
+
+        async def build():
+            return [scraper]
+
+        with patch('src.task_queue.get_cadence', return_value=CadenceTracker(30)):
+            await TaskWorker("w1", build).drain()
+
+        assert scraper.staleness == {"Stripe": 60, "Shopify": None}
+        assert scraper.max_staleness_seconds is None
+
+    @pytest.mark.asyncio
+    async def test_finished_source_updates_cadence(self, mock_settings, queue):
+        queue["batches"] = [[make_task("news", "Stripe")]]
+        cadence = CadenceTracker(30)
+        cadence.register("news", 5, 60)
+
+        async def build():
+            return [UnitScraper("news")]
+
+        with patch('src.task_queue.get_cadence', return_value=cadence):
+            await TaskWorker("w1", build).drain()
+
+        assert cadence.sources["news"].interval_minutes == 15
+        assert cadence.sources["news"].last_new_signals == 1
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_skips_cadence(self, mock_settings, queue):
+        queue["batches"] = [[make_task("news", "Stripe")]]
+        queue["complete_mock"].side_effect = lambda *args, **kwargs: None
+        cadence = CadenceTracker(30)
+        cadence.register("news", 5, 60)
+
+        async def build():
+            return [UnitScraper("news")]
+
+        with patch('src.task_queue.get_cadence', return_value=cadence):
+            await TaskWorker("w1", build).drain()
+
+        assert cadence.sources["news"].last_run_at is None
@@ -0,0 +1,258 @@
+"""
+Postgres tests for the scrape task queue SQL (migrations 017 and 024).
+
+Runs the real claim/heartbeat/complete functions against a database, with
+two connections acting as worker replicas. Skipped unless psycopg is
+installed and TEST_DATABASE_URL points at a server where the test may
+create (and afterwards drop) a scratch database.
+"""
+
+import json
+import os
+import uuid
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="TEST_DATABASE_URL not set")
+
+MIGRATIONS = os.path.join(os.path.dirname(__file__), "..", "..", "supabase", "migrations")
+
+# Just enough of migrations 001/012 (and Supabase's roles) for 017 to apply
+SCAFFOLD = """
+DO $$ BEGIN
+    CREATE ROLE service_role;
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+CREATE TABLE public.profiles (id uuid PRIMARY KEY);
+
+CREATE TYPE scrape_status AS ENUM ('pending', 'running', 'completed', 'failed');
+
+CREATE TABLE public.scrape_runs (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id uuid REFERENCES public.profiles(id) ON DELETE CASCADE,
+    status scrape_status DEFAULT 'pending',
+    started_at timestamptz,
+    completed_at timestamptz,
+    progress jsonb DEFAULT '{}'::jsonb,
+    total_signals integer DEFAULT 0,
+    signals_by_source jsonb DEFAULT '{}'::jsonb,
+    created_at timestamptz DEFAULT now()
+);
+"""
+
+
+def read_migration(name: str) -> str:
+    with open(os.path.join(MIGRATIONS, name)) as f:
+        return f.read()
+
+
+@pytest.fixture(scope="module")
+def database_url():
+    """A scratch database with the task queue migrations applied."""
+    name = f"scrape_tasks_test_{uuid.uuid4().hex[:8]}"
+    with psycopg.connect(DATABASE_URL, autocommit=True) as admin:
+        admin.execute(f'CREATE DATABASE "{name}"')
+    url = psycopg.conninfo.make_conninfo(DATABASE_URL, dbname=name)
+    try:
+        with psycopg.connect(url, autocommit=True) as conn:
+            conn.execute(SCAFFOLD)
+            conn.execute(read_migration("017_scrape_tasks.sql"))
+            conn.execute(read_migration("024_scrape_task_max_staleness.sql"))
+        yield url
+    finally:
+        with psycopg.connect(DATABASE_URL, autocommit=True) as admin:
+            admin.execute(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+
+
+@pytest.fixture
+def db(database_url):
+    """Autocommit connection on an emptied queue."""
+    with psycopg.connect(database_url, autocommit=True) as conn:
+        conn.execute("TRUNCATE public.scrape_tasks, public.scrape_runs")
+        yield conn
+
+
+@pytest.fixture
+def other(database_url):
+    """Second connection, standing in for another worker replica."""
+    with psycopg.connect(database_url, autocommit=True) as conn:
+        yield conn
+
+
+def create_run(conn, units: list[tuple[str, str]], max_attempts: int = 3) -> str:
+    run_id = conn.execute(
+        "INSERT INTO public.scrape_runs (status, started_at) VALUES ('running', now()) RETURNING id"
+    ).fetchone()[0]
+    tasks = [{"source": source, "unit": unit} for source, unit in units]
+    conn.execute(
+        "SELECT enqueue_scrape_tasks(%s, NULL, %s::jsonb, %s)",
+        (run_id, json.dumps(tasks), max_attempts),
+    )
+    return run_id
+
+
+def claim(conn, worker_id: str, limit: int = 10, lease_seconds: int = 60) -> list[dict]:
+    cursor = conn.cursor(row_factory=psycopg.rows.dict_row)
+    return cursor.execute(
+        "SELECT * FROM claim_scrape_tasks(%s, %s, %s)", (worker_id, limit, lease_seconds)
+    ).fetchall()
+
+
+def complete(conn, task_id, worker_id: str, signals: int = 0, error: str | None = None) -> dict | None:
+    cursor = conn.cursor(row_factory=psycopg.rows.dict_row)
+    return cursor.execute(
+        "SELECT * FROM complete_scrape_task(%s, %s, %s, %s)", (task_id, worker_id, signals, error)
+    ).fetchone()
+
+
+def expire_leases(conn):
+    conn.execute(
+        "UPDATE public.scrape_tasks SET lease_expires_at = now() - interval '1 second' WHERE status = 'leased'"
+    )
+
+
+def task_row(conn, task_id) -> dict:
+    cursor = conn.cursor(row_factory=psycopg.rows.dict_row)
+    return cursor.execute("SELECT * FROM public.scrape_tasks WHERE id = %s", (task_id,)).fetchone()
+
+
+def run_row(conn, run_id) -> dict:
+    cursor = conn.cursor(row_factory=psycopg.rows.dict_row)
+    return cursor.execute("SELECT * FROM public.scrape_runs WHERE id = %s", (run_id,)).fetchone()
+
+
+class TestClaim:
+    """Tests for leasing tasks across replicas."""
+
+    def test_concurrent_claims_skip_locked_rows(self, db, other):
+        create_run(db, [("news", "Stripe"), ("news", "Shopify"), ("jobs", "Stripe")])
+
+        # Replica a's claim is still uncommitted when replica b claims
+        with db.transaction():
+            first = claim(db, "a", limit=1)
+            second = claim(other, "b")
+
+        assert len(first) == 1
+        assert len(second) == 2
+        assert {t["id"] for t in first}.isdisjoint(t["id"] for t in second)
+        assert {t["leased_by"] for t in second} == {"b"}
+
+    def test_held_lease_is_not_claimed_again(self, db, other):
+        create_run(db, [("news", "Stripe")])
+
+        assert len(claim(db, "a")) == 1
+        assert claim(other, "b") == []
+
+    def test_expired_lease_is_reclaimed(self, db, other):
+        create_run(db, [("news", "Stripe")])
+        [task] = claim(db, "a")
+
+        expire_leases(db)
+        [retaken] = claim(other, "b")
+
+        assert retaken["id"] == task["id"]
+        assert retaken["attempts"] == 2
+        # The original holder finds its lease gone
+        assert complete(db, task["id"], "a", signals=3) is None
+        assert task_row(db, task["id"])["status"] == "leased"
+
+    def test_heartbeat_keeps_lease_alive(self, db, other):
+        create_run(db, [("news", "Stripe"), ("news", "Shopify")])
+        tasks = claim(db, "a", lease_seconds=1)
+        ids = [t["id"] for t in tasks]
+        expire_leases(db)
+
+        held = db.execute(
+            "SELECT id FROM heartbeat_scrape_tasks(%s, %s, %s)", ("a", ids[:1], 60)
+        ).fetchall()
+
+        assert [row[0] for row in held] == ids[:1]
+        assert [t["id"] for t in claim(other, "b")] == ids[1:]
+
+    def test_heartbeat_ignores_other_workers_tasks(self, db):
+        create_run(db, [("news", "Stripe")])
+        [task] = claim(db, "a")
+
+        held = db.execute(
+            "SELECT id FROM heartbeat_scrape_tasks(%s, %s, %s)", ("b", [task["id"]], 60)
+        ).fetchall()
+
+        assert held == []
+
+
+class TestAttempts:
+    """Tests for retries running out."""
+
+    def test_expired_lease_fails_once_attempts_run_out(self, db, other):
+        run_id = create_run(db, [("news", "Stripe")], max_attempts=2)
+        [task] = claim(db, "a")
+        expire_leases(db)
+        claim(other, "b")
+        expire_leases(db)
+
+        assert claim(db, "c") == []
+        row = task_row(db, task["id"])
+        assert row["status"] == "failed"
+        assert row["error"] == "lease expired"
+        # Nothing is left open, so the run is closed
+        assert run_row(db, run_id)["status"] == "completed"
+
+    def test_failed_task_is_requeued_until_attempts_run_out(self, db):
+        create_run(db, [("news", "Stripe")], max_attempts=2)
+
+        [task] = claim(db, "a")
+        complete(db, task["id"], "a", error="boom")
+        assert task_row(db, task["id"])["status"] == "queued"
+
+        [retry] = claim(db, "a")
+        assert retry["attempts"] == 2
+        complete(db, task["id"], "a", error="boom again")
+
+        row = task_row(db, task["id"])
+        assert row["status"] == "failed"
+        assert row["error"] == "boom again"
+        assert claim(db, "a") == []
+
+
+class TestCompletion:
+    """Tests for source_done/run_done and the run rollup."""
+
+    def test_source_and_run_done(self, db):
+        run_id = create_run(db, [("news", "Stripe"), ("news", "Shopify"), ("jobs", "Stripe")])
+        tasks = {(t["source"], t["unit"]): t["id"] for t in claim(db, "a")}
+
+        first = complete(db, tasks[("news", "Stripe")], "a", signals=2)
+        assert first == {"source_done": False, "source_signals": 2, "run_done": False}
+
+        jobs = complete(db, tasks[("jobs", "Stripe")], "a", signals=1)
+        assert jobs == {"source_done": True, "source_signals": 1, "run_done": False}
+        assert run_row(db, run_id)["status"] == "running"
+
+        last = complete(db, tasks[("news", "Shopify")], "a", signals=3)
+        assert last == {"source_done": True, "source_signals": 5, "run_done": True}
+
+        run = run_row(db, run_id)
+        assert run["status"] == "completed"
+        assert run["total_signals"] == 6
+        assert run["signals_by_source"] == {"news": 5, "jobs": 1}
+        assert run["progress"]["news"] == {"status": "completed", "signals": 5}
+
+    def test_requeued_task_keeps_its_source_open(self, db):
+        run_id = create_run(db, [("news", "Stripe")])
+        [task] = claim(db, "a")
+
+        result = complete(db, task["id"], "a", error="boom")
+
+        assert result == {"source_done": False, "source_signals": 0, "run_done": False}
+        assert run_row(db, run_id)["progress"]["news"]["status"] == "running"
+
+    def test_units_already_open_are_not_enqueued_twice(self, db):
+        create_run(db, [("news", "Stripe")])
+        run_id = create_run(db, [("news", "Stripe")])
+
+        # The second run had nothing of its own to do
+        assert run_row(db, run_id)["status"] == "completed"
+        assert len(claim(db, "a")) == 1
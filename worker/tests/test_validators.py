@@ -0,0 +1,145 @@
+"""Unit tests for conditional feed requests (ETag / Last-Modified)."""
+
+import httpx
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.net import validators
+from src.net.validators import ValidatorCache, conditional_get, conditional_requests, track_unit_fetch
+from src.feeds import parse_feed
+
+URL = "https://example.com/feed.xml"
+
+
+def feed_client(requests: list) -> httpx.AsyncClient:
+    """Client whose feed answers 304 when revalidated with its ETag."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="<rss/>", headers={"ETag": '"v1"'})
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def cache():
+    settings = MagicMock()
+    settings.http_validators_enabled = True
+    settings.http_cassette_mode = "off"
+    cache = ValidatorCache()
+    cache._loaded = True
+    with patch('src.net.validators.get_settings', return_value=settings), \
+            patch('src.net.validators.get_validator_cache', return_value=cache):
+        yield cache
+
+
+async def fetch_unit(client: httpx.AsyncClient, fingerprint: str = "fp"):
+    with track_unit_fetch() as state:
+        response = await conditional_get(client, "feeds", URL, fingerprint)
+    validators.commit_unit_fetch(state)
+    return response, state
+
+
+class TestConditionalGet:
+    """Tests for revalidating feeds with stored validators."""
+
+    @pytest.mark.asyncio
+    async def test_revalidates_after_a_complete_fetch(self, cache):
+        requests = []
+        conditional_requests.set(True)
+        async with feed_client(requests) as client:
+            first, _ = await fetch_unit(client)
+            second, state = await fetch_unit(client)
+
+        assert first.status_code == 200
+        assert "If-None-Match" not in requests[0].headers
+        assert second.status_code == 304
+        assert state.not_modified
+        assert cache.snapshot()["by_source"] == {"feeds": {"hits": 1, "misses": 1}}
+
+    @pytest.mark.asyncio
+    async def test_unconditional_outside_shared_runs(self, cache):
+        requests = []
+        conditional_requests.set(False)
+        async with feed_client(requests) as client:
+            await fetch_unit(client)
+            await fetch_unit(client)
+
+        assert all("If-None-Match" not in r.headers for r in requests)
+        assert cache.snapshot()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_changed_parameters_fetch_in_full(self, cache):
+        requests = []
+        conditional_requests.set(True)
+        async with feed_client(requests) as client:
+            await fetch_unit(client, fingerprint="old")
+            response, _ = await fetch_unit(client, fingerprint="new")
+
+        assert response.status_code == 200
+        assert "If-None-Match" not in requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_persist_retries_failed_writes(self, cache):
+        requests = []
+        conditional_requests.set(True)
+        async with feed_client(requests) as client:
+            await fetch_unit(client)
+
+        with patch('src.net.validators.save_http_validators', return_value=False) as save:
+            await cache.persist()
+        assert save.call_args[0][0][0]["etag"] == '"v1"'
+
+        with patch('src.net.validators.save_http_validators', return_value=True) as save:
+            await cache.persist()
+            await cache.persist()
+        assert save.call_count == 1
+
+
+def rss(*guids: str) -> bytes:
+    items = "".join(f"<item><title>{g}</title><link>https://example.com/{g}</link><guid>{g}</guid></item>" for g in guids)
+    return f"<rss><channel>{items}</channel></rss>".encode()
+
+
+async def read_feed_unit(client: httpx.AsyncClient):
+    with track_unit_fetch() as state:
+        response = await conditional_get(client, "feeds", URL, "fp")
+        page = parse_feed(response.content, stop_at=validators.feed_cursor(URL, "fp"))
+        validators.mark_feed_read(URL, page.items[0].key if page.items else None, page.caught_up)
+    validators.commit_unit_fetch(state)
+    return page, state
+
+
+class TestFeedResume:
+    """Tests for stopping at the newest feed item processed last time."""
+
+    @pytest.mark.asyncio
+    async def test_second_read_stops_at_previous_newest_item(self, cache):
+        bodies = [rss("b", "a"), rss("c", "b", "a"), rss("c", "b", "a")]
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200, content=bodies.pop(0))))
+        conditional_requests.set(True)
+        async with client:
+            first, first_state = await read_feed_unit(client)
+            second, second_state = await read_feed_unit(client)
+            third, _ = await read_feed_unit(client)
+
+        assert [i.key for i in first.items] == ["b", "a"] and first_state.complete
+        assert [i.key for i in second.items] == ["c"] and not second_state.complete
+        # Nothing new: the resume point stays where it was
+        assert third.items == [] and third.caught_up
+        assert cache.last_item(URL, "fp") == "c"
+
+    @pytest.mark.asyncio
+    async def test_no_resume_outside_shared_runs(self, cache):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200, content=rss("b", "a"))))
+        conditional_requests.set(False)
+        async with client:
+            await read_feed_unit(client)
+            page, state = await read_feed_unit(client)
+
+        assert len(page.items) == 2 and state.complete